@@ -0,0 +1,499 @@
+# ---------------------------------------------------------------------------------------
+# Biped Auto-Rig Tool – Analysis Script
+# Developed by Arrow Lyu
+#
+# ---------------------------------------------------------------------------------------
+# This script contains checking functions for a biped rig that is already built.
+# They do not change the rig, they only read it and print a report.
+#
+# Use this after running the run script: Biped_AutoRig_Creation.py
+#
+# How to Use:
+# 1. Build the rig with Biped_AutoRig_Creation.py.
+# 2. Run this script in Maya's script editor.
+# 3. Call the report functions with the root rig group (RootRigGrp in the run script).
+#    jly_rigGraphSelfCheck() checks the cycle finder on a tiny constrained control and IK chain.
+#
+# =======================
+#
+# Happy rigging!
+# ---------------------------------------------------------------------------------------
+# (c) 2025 by Arrow Lyu. All rights reserved. For portfolio and educational use only.
+# ---------------------------------------------------------------------------------------
+
+
+
+import sys; sys.dont_write_bytecode=True
+import maya.cmds as cmds
+import re
+import json
+
+
+# ---------------------------------------------------------------------------------------
+# Cost Model Settings
+
+# Estimated evaluation cost of one node of each type, the numbers are relative (a plain transform is 1.0)
+# Types not in the list use the default cost
+jlyNodeCosts = {
+    'transform': 1.0,
+    'joint': 1.5,
+    'nurbsCurve': 0.2,
+    'locator': 0.2,
+    'mesh': 2.0,
+    'parentConstraint': 4.0,
+    'orientConstraint': 3.0,
+    'pointConstraint': 2.5,
+    'scaleConstraint': 2.5,
+    'aimConstraint': 3.5,
+    'poleVectorConstraint': 2.5,
+    'ikHandle': 6.0,
+    'ikEffector': 0.5,
+    'pairBlend': 1.5,
+    'unitConversion': 0.3,
+    'clamp': 0.5,
+    'multiplyDivide': 0.6,
+    'plusMinusAverage': 0.6,
+    'reverse': 0.4,
+    'condition': 0.6,
+    'blendColors': 0.6,
+    'distanceBetween': 0.5,
+    'decomposeMatrix': 0.8,
+    'multMatrix': 0.8,
+    'skinCluster': 8.0,
+    }
+# Cost for types not in the list above
+jlyDefaultNodeCost = 1.0
+# Extra cost for every constraint target (each target is one more matrix to read and blend)
+jlyConstraintTargetCost = 1.5
+# Extra cost for every IK solver type, on top of the ikHandle cost
+jlyIKSolverCosts = { 'ikSCsolver': 1.0, 'ikRPsolver': 3.0, 'ikSplineSolver': 8.0 }
+# Extra cost for every outgoing connection (fan-out), a dirty plug has to tell every destination
+jlyFanOutCost = 0.05
+
+# DG (not DAG) utility node types that the builders create, they are counted for the module they connect to
+jlyUtilityTypes = [ 'pairBlend', 'unitConversion', 'clamp', 'multiplyDivide', 'plusMinusAverage', 'reverse', 'condition',
+                    'blendColors', 'distanceBetween', 'decomposeMatrix', 'multMatrix', 'skinCluster', 'tweak', 'objectSet',
+                    'groupId', 'groupParts', 'animCurveUA', 'animCurveUL', 'animCurveUU', 'animCurveUT' ]
+
+
+# ---------------------------------------------------------------------------------------
+# Collect Module Nodes
+
+# Find every node of one module: all DAG nodes under the module group, plus the utility nodes connected to them
+# claimed: utility nodes already counted for another module, so shared nodes are only counted once
+def jly_collectModuleNodes( moduleGrp='', claimed=None ):
+
+    # Start with an empty claimed set if nothing was passed in
+    if claimed is None:
+        claimed = set()
+
+    # All DAG nodes under the module group, including the group itself (full path, names can repeat in different modules)
+    DagNodes = [ moduleGrp ] + ( cmds.listRelatives( moduleGrp, allDescendents=True, fullPath=True ) or [] )
+    # Turn them into unique long names
+    DagNodes = cmds.ls( DagNodes, long=True )
+
+    # Walk the connections out from the DAG nodes, only keep walking through utility nodes
+    UtilNodes = []
+    ToVisit = list( DagNodes )
+    Seen = set( DagNodes )
+    while ToVisit:
+        node = ToVisit.pop()
+        # Both directions, no plugs, keep the unitConversion nodes in the list
+        for other in cmds.listConnections( node, source=True, destination=True, skipConversionNodes=False ) or []:
+            # Turn the name into the long name, so DAG names compare with the lists above
+            other = cmds.ls( other, long=True )[0]
+            if other in Seen or other in claimed:
+                continue
+            Seen.add( other )
+            # Only utility nodes belong to the module, stop at DAG nodes of other modules and shared nodes (time1, solvers...)
+            if cmds.nodeType( other ) in jlyUtilityTypes:
+                UtilNodes += [ other ]
+                ToVisit += [ other ]
+
+    # Mark the utility nodes as used by this module
+    claimed.update( UtilNodes )
+
+    return DagNodes, UtilNodes
+
+
+# ---------------------------------------------------------------------------------------
+# Module Cost
+
+# Work out the estimated cost of one module
+# Return a dictionary (one row of the report): node counts by type, connections, fan-out, constraint targets and the cost
+def jly_moduleCost( moduleGrp='', claimed=None ):
+
+    # Get all the nodes for this module
+    DagNodes, UtilNodes = jly_collectModuleNodes( moduleGrp, claimed )
+    AllNodes = DagNodes + UtilNodes
+
+    # Count nodes by type
+    TypeCounts = {}
+    # Count the outgoing connections (fan-out) and constraint targets
+    Connections = 0
+    MaxFanOut = 0
+    MaxFanOutNode = ''
+    ConstraintTargets = 0
+    Cost = 0.0
+    for node in AllNodes:
+        nodeType = cmds.nodeType( node )
+        TypeCounts[ nodeType ] = TypeCounts.get( nodeType, 0 ) + 1
+        # Add the cost of the node itself
+        Cost += jlyNodeCosts.get( nodeType, jlyDefaultNodeCost )
+
+        # Constraints: add the cost of every target
+        if nodeType.endswith( 'Constraint' ):
+            Targets = cmds.getAttr( node+'.target', multiIndices=True ) or []
+            ConstraintTargets += len( Targets )
+            Cost += len( Targets )*jlyConstraintTargetCost
+
+        # IK handles: add the cost of the solver they use
+        if nodeType == 'ikHandle':
+            Solver = cmds.listConnections( node+'.ikSolver', source=True, destination=False ) or []
+            if Solver:
+                Cost += jlyIKSolverCosts.get( cmds.nodeType( Solver[0] ), 0.0 )
+
+        # Outgoing connections, listed as pairs of plugs (source, destination)
+        OutPlugs = cmds.listConnections( node, source=False, destination=True, plugs=True, connections=True, skipConversionNodes=False ) or []
+        FanOut = len( OutPlugs )//2
+        Connections += FanOut
+        Cost += FanOut*jlyFanOutCost
+        # Remember which node has the biggest fan-out, it's usually the first thing to fix
+        if FanOut > MaxFanOut:
+            MaxFanOut = FanOut
+            MaxFanOutNode = node.split('|')[-1]
+
+    # Put everything in one report row
+    Row = { 'module': moduleGrp.split('|')[-1],
+            'nodes': len( AllNodes ),
+            'dagNodes': len( DagNodes ),
+            'utilityNodes': len( UtilNodes ),
+            'connections': Connections,
+            'maxFanOut': MaxFanOut,
+            'maxFanOutNode': MaxFanOutNode,
+            'constraints': sum( [ n for t,n in TypeCounts.items() if t.endswith('Constraint') ] ),
+            'constraintTargets': ConstraintTargets,
+            'ikHandles': TypeCounts.get( 'ikHandle', 0 ),
+            'cost': round( Cost, 2 ),
+            'types': TypeCounts }
+
+    return Row
+
+
+# ---------------------------------------------------------------------------------------
+# Rig Cost Report
+
+# Make the cost report for the whole rig, one row per module group under the root rig group (Base_Grp, Torso_Grp, L_Arm_Grp...)
+# sortBy: any key of the row (cost, nodes, connections, maxFanOut, constraintTargets, module...)
+# csvPath: also write the report to a csv file, so different builds can be compared in a spreadsheet
+def jly_rigCostReport( rigGrp='RigName_Rig_Grp', sortBy='cost', descending=True, csvPath='' ):
+
+    # Find the module groups, they are the children of the root rig group
+    ModuleGrps = cmds.listRelatives( rigGrp, children=True, type='transform', fullPath=True ) or []
+
+    # Make one row for every module, shared utility nodes only count for the first module that finds them
+    Claimed = set()
+    Rows = [ jly_moduleCost( grp, Claimed ) for grp in ModuleGrps ]
+    # Sort the rows
+    Rows.sort( key=lambda row: row[sortBy], reverse=descending )
+
+    # Print the report as a table
+    Columns = [ 'module', 'cost', 'nodes', 'dagNodes', 'utilityNodes', 'connections', 'maxFanOut', 'maxFanOutNode', 'constraints', 'constraintTargets', 'ikHandles' ]
+    print( ' | '.join( [ c.ljust(12) for c in Columns ] ) )
+    for row in Rows:
+        print( ' | '.join( [ str( row[c] ).ljust(12) for c in Columns ] ) )
+    # Print the total at the end
+    print( 'TOTAL cost: '+str( round( sum( [ row['cost'] for row in Rows ] ), 2 ) )+'  nodes: '+str( sum( [ row['nodes'] for row in Rows ] ) ) )
+
+    # Write the csv file, with one extra column for every node type
+    if csvPath:
+        AllTypes = sorted( set( [ t for row in Rows for t in row['types'] ] ) )
+        with open( csvPath, 'w' ) as f:
+            f.write( ','.join( Columns + AllTypes )+'\n' )
+            for row in Rows:
+                Values = [ str( row[c] ) for c in Columns ] + [ str( row['types'].get( t, 0 ) ) for t in AllTypes ]
+                f.write( ','.join( Values )+'\n' )
+        print( 'Cost report saved: '+csvPath )
+
+    return Rows
+
+
+# ---------------------------------------------------------------------------------------
+# Evaluation Graph Settings
+
+# Node types known to push the Evaluation Manager back to serial/untrusted scheduling, or to switch off cached playback
+jlyBlockingTypes = {
+    'expression': 'runs MEL/Python, scheduled globally serial',
+    'script': 'scene script node, runs code on open/close',
+    'unknown': 'missing plugin node, the Evaluation Manager cannot trust it',
+    'unknownDag': 'missing plugin node, the Evaluation Manager cannot trust it',
+    'unknownTransform': 'missing plugin node, the Evaluation Manager cannot trust it',
+    'HIKSolverNode': 'HumanIK solver, scheduled untrusted',
+    'HIKRetargeterNode': 'HumanIK retargeter, scheduled untrusted',
+    'nucleus': 'dynamics, not supported by cached playback',
+    'nCloth': 'dynamics, not supported by cached playback',
+    'nParticle': 'dynamics, not supported by cached playback',
+    'particle': 'legacy particles, not supported by cached playback',
+    'hairSystem': 'dynamics, not supported by cached playback',
+    'rigidBody': 'legacy rigid body, not supported by cached playback',
+    'dynamicConstraint': 'dynamics, not supported by cached playback',
+    }
+
+# Source attributes that are read by a constraint from the node it drives, they never depend on the driven channels
+# (parentInverseMatrix/parentMatrix are taken from the DAG parent instead, see jly_exportRigGraph)
+jlyStaticSourceAttrs = [ 'rotatePivot', 'rotatePivotTranslate', 'rotateOrder', 'jointOrient', 'segmentScaleCompensate', 'message' ]
+# Constraint inputs that take a driven channel only as a reference point, they are skipped like the source attributes above
+jlyStaticDestAttrs = [ 'constraintTranslate', 'constraintRotatePivot', 'constraintRotateTranslate', 'constraintRotateOrder', 'constraintJointOrient' ]
+# DAG children that only feed their parent (constraints drive it, effectors pass the chain end to the IK handle),
+# the parent does not drive them through the DAG, so they get no parent -> child edge
+jlyParentFeedTypes = [ 'constraint', 'ikEffector' ]
+
+# Which jly_make* function builds which nodes: node rules are checked against the node name first
+# (twists and splitters live inside other modules), then group rules against its top-level module group name only,
+# so inner groups like L_ArmSkel_Grp or L_HandCtrl_Grp are never matched on their own name
+jlyCreatorNodeRules = [
+    ( r'Twist\d*_(Jnt|Jx|Loc|Ctrl|Ikh|Eff)', 'jly_makeTwists' ),
+    ( r'Seat\d*_(Loc|Jnt)$', 'jly_makeAngleSplitter' ),
+    ( r'_Piv$', 'jly_make*Pivs' ),
+    ]
+# Module groups: side+prefix+name+'_Grp', the half muscle rig group (MuscleRigGrp) is any other module group
+jlyCreatorGroupRules = [
+    ( r'^Base_Grp$', 'jly_makeBaseRig' ),
+    ( r'Torso_Grp$', 'jly_makeBipedTorsoRig' ),
+    ( r'Arm_Grp$', 'jly_makeBipedArmRig' ),
+    ( r'Leg_Grp$', 'jly_makeBipedLegRig' ),
+    ( r'Hand_Grp$', 'jly_makeBipedHandRig2' ),
+    ( r'EyeRig_Grp$', 'jly_makeEyeRig' ),
+    ( r'_Grp$', 'jly_makeHalfMuscleRig' ),
+    ]
+
+
+# ---------------------------------------------------------------------------------------
+# Find Creator
+
+# Find which jly_make* function created a node, from its name and the module group it lives in
+# moduleGrp: the module group directly under the rig group, as collected by jly_exportRigGraph
+def jly_findCreator( node='', moduleGrp='' ):
+
+    for name,rules in [ ( node.split('|')[-1], jlyCreatorNodeRules ), ( moduleGrp.split('|')[-1], jlyCreatorGroupRules ) ]:
+        for pattern,creator in rules:
+            if name and re.search( pattern, name ):
+                return creator
+    # Not made by a builder, most likely by the run script (wiring between modules)
+    return 'Biped_AutoRig_Creation.py'
+
+
+# ---------------------------------------------------------------------------------------
+# Export Rig Graph
+
+# Export the dependency graph of the rig: one entry per node, one edge per data connection
+# Edges also include DAG parent -> child (world matrix), and IK chain <-> handle (the solver reads and writes them)
+# Constraints and effectors get no DAG edge from their parent, they only feed it
+# jsonPath: also save the graph to a json file
+def jly_exportRigGraph( rigGrp='RigName_Rig_Grp', jsonPath='' ):
+
+    # Collect nodes module by module, and remember where each node lives
+    Nodes = {}
+    Claimed = set()
+    ModuleGrps = cmds.listRelatives( rigGrp, children=True, type='transform', fullPath=True ) or []
+    for grp in ModuleGrps:
+        DagNodes, UtilNodes = jly_collectModuleNodes( grp, Claimed )
+        for node in DagNodes + UtilNodes:
+            Nodes[ node ] = { 'type': cmds.nodeType( node ), 'module': grp.split('|')[-1], 'creator': jly_findCreator( node, grp ) }
+    # Add the root rig group too
+    for node in cmds.ls( rigGrp, long=True ):
+        Nodes[ node ] = { 'type': cmds.nodeType( node ), 'module': '', 'creator': 'jly_makeBaseRig' }
+
+    # Use a set for the edges, many plugs can connect the same 2 nodes
+    Edges = set()
+    for node in Nodes:
+        # DAG parent drives the child's world matrix, not for children that only feed their parent
+        if Nodes[node]['type'] not in jlyUtilityTypes and not cmds.ls( node, type=jlyParentFeedTypes ):
+            Parent = cmds.listRelatives( node, parent=True, fullPath=True ) or []
+            if Parent and Parent[0] in Nodes:
+                Edges.add( ( Parent[0], node ) )
+
+        # Data connections, as pairs of (source plug on this node, destination plug)
+        Plugs = cmds.listConnections( node, source=False, destination=True, plugs=True, connections=True, skipConversionNodes=False ) or []
+        for srcPlug,dstPlug in zip( Plugs[0::2], Plugs[1::2] ):
+            srcAttr = srcPlug.split('.')[-1].split('[')[0]
+            # Skip attributes that do not depend on the node's own channels
+            if srcAttr in jlyStaticSourceAttrs or dstPlug.split('.')[-1].split('[')[0] in jlyStaticDestAttrs:
+                continue
+            Source = node
+            # Parent matrices really come from the DAG parent, not from the node itself
+            if srcAttr in [ 'parentInverseMatrix', 'parentMatrix' ]:
+                Parent = cmds.listRelatives( node, parent=True, fullPath=True ) or []
+                if not Parent:
+                    continue
+                Source = Parent[0]
+            Dest = cmds.ls( dstPlug.split('.')[0], long=True )[0]
+            # An effector only copies the end joint's position for its handle, the handle -> chain edges cover the solve
+            if Dest in Nodes and Nodes[Dest]['type'] == 'ikEffector':
+                continue
+            if Source in Nodes and Dest in Nodes and Source != Dest:
+                Edges.add( ( Source, Dest ) )
+
+        # IK handles: the solver reads the handle (its world position) and writes every joint in the chain
+        if Nodes[node]['type'] == 'ikHandle':
+            StartJnt = cmds.ikHandle( node, q=True, startJoint=True )
+            ChainJnts = cmds.ikHandle( node, q=True, jointList=True ) or []
+            for jnt in cmds.ls( ChainJnts + [ StartJnt ], long=True ):
+                if jnt in Nodes:
+                    Edges.add( ( node, jnt ) )
+
+    Graph = { 'nodes': Nodes, 'edges': sorted( Edges ) }
+
+    # Save the graph
+    if jsonPath:
+        with open( jsonPath, 'w' ) as f:
+            json.dump( Graph, f, indent=1 )
+        print( 'Rig graph saved: '+jsonPath )
+
+    return Graph
+
+
+# ---------------------------------------------------------------------------------------
+# Find Cycles (Tarjan)
+
+# Find strongly connected components with Tarjan's algorithm, written without recursion so big rigs don't hit the recursion limit
+# Return only the components that are cycles (more than 1 node)
+def jly_findCycles( nodes=[], edges=[] ):
+
+    # Build the list of next nodes for every node
+    Next = dict( [ ( n, [] ) for n in nodes ] )
+    for src,dst in edges:
+        Next[ src ].append( dst )
+
+    Index = {}
+    LowLink = {}
+    Stack = []
+    OnStack = set()
+    Cycles = []
+    Counter = 0
+
+    for root in nodes:
+        if root in Index:
+            continue
+        # Each work item is (node, position in its list of next nodes)
+        Work = [ ( root, 0 ) ]
+        while Work:
+            node,i = Work.pop()
+            # First time we see the node: give it an index
+            if i == 0:
+                Index[ node ] = Counter
+                LowLink[ node ] = Counter
+                Counter += 1
+                Stack.append( node )
+                OnStack.add( node )
+            # Go on with the next node that is not visited yet
+            Recurse = False
+            for j in range( i, len( Next[node] ) ):
+                other = Next[node][j]
+                if other not in Index:
+                    # Come back to this node later, at the next position
+                    Work.append( ( node, j+1 ) )
+                    Work.append( ( other, 0 ) )
+                    Recurse = True
+                    break
+                elif other in OnStack:
+                    LowLink[ node ] = min( LowLink[node], Index[other] )
+            if Recurse:
+                continue
+            # All next nodes are done: if the node is a root, pop its component
+            if LowLink[ node ] == Index[ node ]:
+                Component = []
+                while True:
+                    other = Stack.pop()
+                    OnStack.discard( other )
+                    Component.append( other )
+                    if other == node:
+                        break
+                if len( Component ) > 1:
+                    Cycles.append( Component )
+            # Pass the low link back up to the node that walked here
+            if Work:
+                caller = Work[-1][0]
+                LowLink[ caller ] = min( LowLink[caller], LowLink[node] )
+
+    return Cycles
+
+
+# ---------------------------------------------------------------------------------------
+# Rig Graph Health Check
+
+# Check if the rig is ready for parallel evaluation and cached playback: cycles, and node types that block it
+# Each finding tells which jly_make* function made the node, so it can be fixed in the builder
+def jly_rigGraphHealth( rigGrp='RigName_Rig_Grp', jsonPath='' ):
+
+    # Export the graph
+    Graph = jly_exportRigGraph( rigGrp, jsonPath )
+    Nodes = Graph['nodes']
+    Findings = []
+
+    # Cycles: every node in a cycle forces the Evaluation Manager to evaluate the whole cycle in serial
+    for cycle in jly_findCycles( list( Nodes ), Graph['edges'] ):
+        Creators = sorted( set( [ Nodes[n]['creator'] for n in cycle ] ) )
+        Findings.append( { 'kind': 'cycle',
+                           'nodes': [ n.split('|')[-1] for n in cycle ],
+                           'creator': ', '.join( Creators ),
+                           'message': 'cycle of '+str( len(cycle) )+' nodes' } )
+
+    # Node types that block parallel evaluation or cached playback
+    for node,info in Nodes.items():
+        if info['type'] in jlyBlockingTypes:
+            Findings.append( { 'kind': 'blocking',
+                               'nodes': [ node.split('|')[-1] ],
+                               'creator': info['creator'],
+                               'message': info['type']+' - '+jlyBlockingTypes[ info['type'] ] } )
+
+    # Print the findings
+    for f in Findings:
+        print( 'WARNING - '+f['kind']+': '+f['message']+' (made by '+f['creator']+')' )
+        print( '          '+' -> '.join( f['nodes'] ) )
+    if not Findings:
+        print( 'Rig graph is clean: no cycles, no blocking node types ('+str( len(Nodes) )+' nodes, '+str( len(Graph['edges']) )+' edges)' )
+
+    return Findings
+
+
+# ---------------------------------------------------------------------------------------
+# Rig Graph Self Check
+
+# Build a tiny rig in an empty group: a control parent constrained to a driver, and an IK chain with its handle,
+# export its graph and check that no cycle is found (constraints and effectors are children of what they drive)
+# The test nodes are deleted again. Returns True when the check passes
+def jly_rigGraphSelfCheck():
+
+    RigGrp = cmds.group( empty=True, name='jlySelfCheck_Rig_Grp' )
+    ModuleGrp = cmds.group( empty=True, name='jlySelfCheck_Grp', parent=RigGrp )
+    try:
+        # Plain constrained control: driver -> parentConstraint (child of the control zero) -> control zero
+        Driver = cmds.group( empty=True, name='jlySelfCheck_Driver', parent=ModuleGrp )
+        CtrlZero = cmds.group( empty=True, name='jlySelfCheck_CtrlZero', parent=ModuleGrp )
+        cmds.group( empty=True, name='jlySelfCheck_Ctrl', parent=CtrlZero )
+        cmds.xform( Driver, t=( 1.0, 2.0, 3.0 ) )
+        cmds.parentConstraint( Driver, CtrlZero, maintainOffset=True )
+        cmds.scaleConstraint( Driver, CtrlZero, maintainOffset=True )
+        # IK chain: the effector is a child of a chain joint
+        cmds.select( clear=True )
+        Root = cmds.joint( name='jlySelfCheck_Root_Jnt', position=( 0.0, 0.0, 0.0 ) )
+        cmds.joint( name='jlySelfCheck_Mid_Jnt', position=( 0.0, 5.0, 1.0 ) )
+        End = cmds.joint( name='jlySelfCheck_End_Jnt', position=( 0.0, 10.0, 0.0 ) )
+        cmds.parent( Root, ModuleGrp )
+        Ikh = cmds.ikHandle( startJoint=Root, endEffector=End, solver='ikRPsolver', name='jlySelfCheck_Ikh' )[0]
+        cmds.parent( Ikh, ModuleGrp )
+
+        Graph = jly_exportRigGraph( cmds.ls( RigGrp, long=True )[0] )
+        Cycles = jly_findCycles( list( Graph['nodes'] ), Graph['edges'] )
+    finally:
+        cmds.delete( RigGrp )
+
+    if Cycles:
+        print( 'ERROR - rig graph self check found '+str( len(Cycles) )+' cycle(s) in a plain constrained control and IK chain' )
+        for cycle in Cycles:
+            print( '          '+' -> '.join( [ n.split('|')[-1] for n in cycle ] ) )
+        return False
+    print( 'Rig graph self check passed: a constrained control and an IK chain have no cycle' )
+
+    return True
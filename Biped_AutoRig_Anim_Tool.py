@@ -0,0 +1,878 @@
+# ---------------------------------------------------------------------------------------
+# Biped Auto-Rig Tool – Animation Script
+# Developed by Arrow Lyu
+#
+# ---------------------------------------------------------------------------------------
+# This script contains animation functions for a biped rig that is already built.
+# FK/IK match and switch: the arm and leg controls are snapped to the pose the limb has now,
+# then the _FK_IK blend is flipped, so the limb does not pop.
+# Space switch bake: the IK wrist/ankle space is changed over a frame range and the control is baked so it does not pop.
+# Keyframe reduction: baked curves of all the rig controls are cut down to the fewest keys within a tolerance.
+# Mocap retarget: a mocap skeleton (e.g. HumanIK names) is mapped by role onto the FK and IK controls and keyed.
+#
+# Use this after running the run script: Biped_AutoRig_Creation.py
+#
+# How to Use:
+# 1. Build the rig with Biped_AutoRig_Creation.py (or reference a built rig, pass its namespace).
+# 2. Run this script in Maya's script editor.
+# 3. Match the current frame:      jly_matchLimb( limb='Arm', side='L_', to='FK' )
+#    Match a range of frames:      jly_matchLimbRange( limb='Leg', side='R_', to='IK', start=1, end=120 )
+#    Switch space over a range:    jly_switchSpaceRange( limb='Arm', side='L_', space='Head', start=40, end=120 )
+#    Undo the last bake:           ctrl+z (each bake is one undo chunk)
+#    Reduce all baked controls:    jly_reduceRig( tolerances={ 'translate': 0.01, 'rotate': 0.05, 'default': 0.001 } )
+#    Undo the last reduction:      ctrl+z (each reduction is one undo chunk)
+#    Retarget mocap (rig in rest): jly_retargetMocap( mapping=jlyRetargetHIK, start=1, end=300, restFrame=0, sourceNamespace='Mocap:' )
+#
+# =======================
+#
+# Happy rigging!
+# ---------------------------------------------------------------------------------------
+# (c) 2025 by Arrow Lyu. All rights reserved. For portfolio and educational use only.
+# ---------------------------------------------------------------------------------------
+
+
+
+import sys; sys.dont_write_bytecode=True
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import numpy as np
+
+import Biped_AutoRig_Python_Tool as jlyBR
+
+
+# ---------------------------------------------------------------------------------------
+# Match Settings
+
+# The nodes of each limb, names without side and prefix (the rig builders name them side+prefix+name)
+# fk:        ( FK control, FK joint it drives, bind joint ) from root to end, the control rotate is connected to the joint rotate
+# fkEnd:     ( FK control, node its 0 null follows in FK ) for an end control that is not in the FK chain (the arm's wrist)
+# ik:        IK control, ikFollow is a node that moves with it, ikTarget is where ikFollow has to end up
+#            ikTargetParent: use the parent (0 null) of ikTarget, not ikTarget itself
+# pole:      pole control, poleChain the bind joints of the limb plane, fallback the pole direction for a straight limb
+jlyMatchLimbs = {
+    'Arm': { 'fk': [ ('ShldFK_Ctrl','Shld_FK','Shld_Jnt'), ('ElbowFK_Ctrl','Elbow_FK','Elbow_Jnt') ],
+             'fkEnd': ('WristFK_Ctrl','WristFK_CtrlZeroA'),
+             'ik': 'Wrist_Ctrl', 'ikFollow': 'WristFK_CtrlZeroB', 'ikTarget': 'WristFK_Ctrl', 'ikTargetParent': True,
+             'pole': 'Elbow_Ctrl', 'poleChain': ('Shld_Jnt','Elbow_Jnt','Wrist_Jnt'), 'fallback': (0,0,-1) },
+    'Leg': { 'fk': [ ('HipFK_Ctrl','Hip_FK','Hip_Jnt'), ('KneeFK_Ctrl','Knee_FK','Knee_Jnt'), ('AnkleFK_Ctrl','Ankle_FK','Ankle_Jnt'), ('BallFK_Ctrl','Ball_FK','Ball_Jnt') ],
+             'fkEnd': None,
+             'ik': 'Ankle_Ctrl', 'ikFollow': 'Ankle_IK', 'ikTarget': 'Ankle_Jnt', 'ikTargetParent': False,
+             'pole': 'Knee_Ctrl', 'poleChain': ('Hip_Jnt','Knee_Jnt','Ankle_Jnt'), 'fallback': (0,0,1) },
+}
+
+# Blend value of each mode on the <side><prefix><name>_FK_IK attribute (pairBlend weight: 0 = FK, 1 = IK)
+jlyMatchModes = { 'FK': 0.0, 'IK': 1.0 }
+
+# Space switches: the control that changes space, and the spaces on the limb's utility control (<side><prefix><space>Space)
+jlySpaceSwitches = {
+    'Arm': { 'ctrl': 'Wrist_Ctrl', 'spaces': [ 'Head', 'Chest', 'Pelvis', 'Cog', 'All' ] },
+    'Leg': { 'ctrl': 'Ankle_Ctrl', 'spaces': [ 'Pelvis', 'Cog', 'All' ] },
+}
+
+# Joint orients and rotate orders never change after the build, they are read once per limb and kept here
+# Key: tuple of the limb's FK joint names, kept when the script is reloaded
+jlyMatchCache = globals().get( 'jlyMatchCache', {} )
+
+
+# ---------------------------------------------------------------------------------------
+# Limb Names
+
+# Find the real name of one limb node, None if it is not in the scene
+# Twist and ribbon setups rename bind joints from _Jnt to _Jx, so the _Jx name is tried too
+# warn: False for nodes that do not have to be there (e.g. a third spine joint)
+def jly_findLimbNode( scope='', node='', warn=True ):
+
+    for n in [ scope+node, scope+node.replace( '_Jnt', '_Jx' ) ]:
+        if cmds.objExists( n ):
+            return n
+    if warn:
+        print( 'ERROR - '+scope+node+' does not exist' )
+
+    return None
+
+
+# Find the real node names of one limb, returns None if the limb is not in the scene
+def jly_limbNames( limb='Arm', side='L_', prefix='', name='', namespace='' ):
+
+    Spec = jlyMatchLimbs[ limb ]
+    Scope = namespace+side+prefix
+    name = name or limb
+    Find = lambda node: jly_findLimbNode( Scope, node )
+
+    Names = { 'fk': [ ( Find(c), Find(j), Find(b) ) for c,j,b in Spec['fk'] ],
+              'fkEnd': ( Find( Spec['fkEnd'][0] ), Find( Spec['fkEnd'][1] ) ) if Spec['fkEnd'] else None,
+              'ik': Find( Spec['ik'] ),
+              'ikFollow': Find( Spec['ikFollow'] ),
+              'ikTarget': Find( Spec['ikTarget'] ),
+              'ikTargetParent': Spec['ikTargetParent'],
+              'pole': Find( Spec['pole'] ),
+              'poleChain': [ Find(j) for j in Spec['poleChain'] ],
+              'fallback': Spec['fallback'],
+              'blend': Scope+name+'Util_Ctrl.'+side+prefix+name+'_FK_IK' }
+
+    # Every node has to be there
+    Nodes = [ n for row in Names['fk'] for n in row ] + list( Names['fkEnd'] or [] ) + [ Names['ik'], Names['ikFollow'], Names['ikTarget'], Names['pole'] ] + Names['poleChain']
+    if None in Nodes:
+        print( 'ERROR - can not match the '+side+prefix+name+', nodes are missing' )
+        return None
+    if not cmds.objExists( Names['blend'] ):
+        print( 'ERROR - '+Names['blend']+' does not exist, can not match the '+side+prefix+name )
+        return None
+
+    return Names
+
+
+# All the nodes a match reads, in a fixed order, so every solve can index the matrix arrays the same way
+def jly_limbNodes( names={} ):
+
+    Nodes = [ n for row in names['fk'] for n in row ] + list( names['fkEnd'] or [] )
+    Nodes += [ names['ik'], names['ikFollow'], names['ikTarget'], names['pole'] ] + names['poleChain']
+
+    return list( dict.fromkeys( Nodes ) )
+
+
+# Joint orient (3x3) and rotate order of every FK joint, and the rotate order of every control, read once and cached
+def jly_limbStatics( names={} ):
+
+    Key = tuple( [ j for c,j,b in names['fk'] ] )
+    if Key in jlyMatchCache:
+        return jlyMatchCache[ Key ]
+
+    Orients = []
+    Orders = []
+    for ctrl,joint,bind in names['fk']:
+        JO = cmds.getAttr( joint+'.jointOrient' )[0]
+        Orients += [ np.array( list( om.MEulerRotation( np.radians( JO ).tolist() ).asMatrix() ) ).reshape( 4, 4 )[:3,:3] ]
+        # The control rotate goes straight into the joint rotate, so it is read with the joint's rotate order
+        Orders += [ cmds.getAttr( joint+'.rotateOrder' ) ]
+
+    Statics = { 'orients': np.array( Orients ), 'orders': Orders,
+                'fkEndOrder': cmds.getAttr( names['fkEnd'][0]+'.rotateOrder' ) if names['fkEnd'] else 0,
+                'ikOrder': cmds.getAttr( names['ik']+'.rotateOrder' ) }
+    jlyMatchCache[ Key ] = Statics
+
+    return Statics
+
+
+# Forget the cached joint orients, after a rig is rebuilt with the same names
+def jly_clearMatchCache():
+
+    jlyMatchCache.clear()
+
+
+# ---------------------------------------------------------------------------------------
+# Chain Matrices
+
+# Read many matrix plugs, one flat list of 16 numbers per plug
+def jly_readPlugMatrices( plugs=[] ):
+
+    return [ list( om.MFnMatrixData( p.asMObject() ).matrix() ) for p in plugs ]
+
+
+# Read the world matrix and the parent world matrix of every node in one API pass
+# frames: None reads the scene as it is now, a list of frames evaluates each frame in its own DG context (the current time does not change)
+# Returns two (F,N,4,4) arrays, F frames, N nodes, rows are Maya matrices (translate in row 3)
+def jly_chainMatrices( nodes=[], frames=None ):
+
+    # Find the worldMatrix[0] and parentMatrix[0] plugs of all the nodes once
+    SelList = om.MSelectionList()
+    for node in nodes:
+        SelList.add( node )
+    WorldPlugs = []
+    ParentPlugs = []
+    for i in range( len(nodes) ):
+        Fn = om.MFnDependencyNode( SelList.getDependNode( i ) )
+        WorldPlugs += [ Fn.findPlug( 'worldMatrix', False ).elementByLogicalIndex( 0 ) ]
+        ParentPlugs += [ Fn.findPlug( 'parentMatrix', False ).elementByLogicalIndex( 0 ) ]
+
+    Frames = [ None ] if frames is None else list( frames )
+    World = np.empty( ( len(Frames), len(nodes), 4, 4 ) )
+    Parent = np.empty( ( len(Frames), len(nodes), 4, 4 ) )
+    Unit = om.MTime.uiUnit()
+    for f,frame in enumerate( Frames ):
+        if frame is None:
+            World[f] = np.array( jly_readPlugMatrices( WorldPlugs ) ).reshape( -1, 4, 4 )
+            Parent[f] = np.array( jly_readPlugMatrices( ParentPlugs ) ).reshape( -1, 4, 4 )
+            continue
+        # One DG context per frame, every plug of the frame is pulled through it
+        Previous = om.MDGContext( om.MTime( frame, Unit ) ).makeCurrent()
+        try:
+            World[f] = np.array( jly_readPlugMatrices( WorldPlugs ) ).reshape( -1, 4, 4 )
+            Parent[f] = np.array( jly_readPlugMatrices( ParentPlugs ) ).reshape( -1, 4, 4 )
+        finally:
+            Previous.makeCurrent()
+
+    return World, Parent
+
+
+# Rotation part of many matrices without scale, (...,4,4) -> (...,3,3), the rows are normalized
+def jly_rotationPart( matrices=None ):
+
+    Rot = np.array( matrices )[...,:3,:3]
+
+    return Rot / np.linalg.norm( Rot, axis=-1 )[...,None]
+
+
+# Euler rotations (degrees) of many (K,3,3) rotations in one rotate order, (K,3)
+def jly_matrixEulers( rotations=None, order=0 ):
+
+    Eulers = np.empty( ( len(rotations), 3 ) )
+    Full = np.tile( np.identity(4), ( len(rotations), 1, 1 ) )
+    Full[:,:3,:3] = rotations
+    for i,m in enumerate( Full ):
+        Rot = om.MTransformationMatrix( om.MMatrix( m.flatten().tolist() ) ).rotation()
+        Rot.reorderIt( int(order) )
+        Eulers[i] = [ Rot.x, Rot.y, Rot.z ]
+
+    return np.degrees( Eulers )
+
+
+# Add the X/Y/Z channels of one compound attribute to a values dictionary: 'node.attrX' -> (F,) array
+def jly_addChannels( values={}, node='', attr='rotate', xyz=None ):
+
+    for i,axis in enumerate( 'XYZ' ):
+        values[ node+'.'+attr+axis ] = xyz[:,i]
+
+
+# ---------------------------------------------------------------------------------------
+# Match Solvers
+
+# Solve the FK controls so the FK chain lands on the bind chain (IK -> FK), for all frames at once
+# Each FK joint: local = target world * new parent world^-1, rotate = local rotation * joint orient^-1
+# The new parent of a joint is the target of the joint above it, the root keeps the parent it has
+def jly_solveToFK( names={}, nodes=[], world=None, parent=None ):
+
+    Statics = jly_limbStatics( names )
+    Index = { n:i for i,n in enumerate(nodes) }
+    Values = {}
+
+    ParentWorld = parent[ :, Index[ names['fk'][0][1] ] ]
+    for i,( ctrl, joint, bind ) in enumerate( names['fk'] ):
+        Target = world[ :, Index[bind] ]
+        Local = np.matmul( Target, np.linalg.inv( ParentWorld ) )
+        Rot = np.matmul( jly_rotationPart( Local ), Statics['orients'][i].T )
+        jly_addChannels( Values, ctrl, 'rotate', jly_matrixEulers( Rot, Statics['orders'][i] ) )
+        ParentWorld = Target
+
+    # End control outside the chain: it keeps its world rotation, its 0 null will follow the FK node
+    if names['fkEnd']:
+        ctrl, follow = names['fkEnd']
+        Rot = np.matmul( jly_rotationPart( world[ :, Index[ctrl] ] ), np.transpose( jly_rotationPart( world[ :, Index[follow] ] ), (0,2,1) ) )
+        jly_addChannels( Values, ctrl, 'rotate', jly_matrixEulers( Rot, Statics['fkEndOrder'] ) )
+
+    return Values
+
+
+# Solve the IK control and the pole so the IK chain lands on the bind chain (FK -> IK), for all frames at once
+# IK control: ikFollow moves with it, so new world = world * ikFollow^-1 * ikTarget
+# Pole: on the bind chain plane, as far from the root-end middle as it is now (jly_solvePoles of the tool script)
+def jly_solveToIK( names={}, nodes=[], world=None, parent=None ):
+
+    Statics = jly_limbStatics( names )
+    Index = { n:i for i,n in enumerate(nodes) }
+    Values = {}
+
+    # IK control
+    Target = ( parent if names['ikTargetParent'] else world )[ :, Index[ names['ikTarget'] ] ]
+    NewWorld = np.matmul( np.matmul( world[ :, Index[ names['ik'] ] ], np.linalg.inv( world[ :, Index[ names['ikFollow'] ] ] ) ), Target )
+    Local = np.matmul( NewWorld, np.linalg.inv( parent[ :, Index[ names['ik'] ] ] ) )
+    jly_addChannels( Values, names['ik'], 'translate', Local[:,3,:3] )
+    jly_addChannels( Values, names['ik'], 'rotate', jly_matrixEulers( jly_rotationPart( Local ), Statics['ikOrder'] ) )
+
+    # Pole, keep the distance the animator gave it
+    Roots, Mids, Ends = [ world[ :, Index[j], 3, :3 ] for j in names['poleChain'] ]
+    PolePos = world[ :, Index[ names['pole'] ], 3, :3 ]
+    Dist = np.linalg.norm( PolePos - ( Roots + Ends )*0.5, axis=1 )
+    Poles = jlyBR.jly_solvePoles( Roots, Mids, Ends, dist=Dist, fallback=names['fallback'] )
+    # World position to the pole control's parent space
+    PoleH = np.concatenate( [ Poles, np.ones( ( len(Poles), 1 ) ) ], axis=1 )
+    PoleLocal = np.einsum( 'fi,fij->fj', PoleH, np.linalg.inv( parent[ :, Index[ names['pole'] ] ] ) )
+    jly_addChannels( Values, names['pole'], 'translate', PoleLocal[:,:3] )
+
+    return Values
+
+
+# ---------------------------------------------------------------------------------------
+# Bulk Keys
+
+# A channel can take the solved value: not locked, and not driven by anything but its own anim curve
+def jly_freeChannel( plug='' ):
+
+    if cmds.getAttr( plug, lock=True ):
+        return False
+    Inputs = cmds.listConnections( plug, source=True, destination=False, skipConversionNodes=True ) or []
+
+    return all( [ cmds.nodeType( n ).startswith( 'animCurve' ) for n in Inputs ] )
+
+
+# Read many plugs on many frames, one DG context per frame, returns { plug: (F,) array } in UI units
+def jly_plugValues( plugs=[], frames=[] ):
+
+    SelList = om.MSelectionList()
+    for plug in plugs:
+        SelList.add( plug )
+    Plugs = [ SelList.getPlug( i ) for i in range( len(plugs) ) ]
+    Values = np.empty( ( len(frames), len(plugs) ) )
+    Unit = om.MTime.uiUnit()
+    for f,frame in enumerate( frames ):
+        Previous = om.MDGContext( om.MTime( frame, Unit ) ).makeCurrent()
+        try:
+            Values[f] = [ p.asDouble() for p in Plugs ]
+        finally:
+            Previous.makeCurrent()
+
+    # Internal units (cm, radians) to UI units
+    Scales = np.array( [ jly_plugUnitScale( p ) for p in Plugs ] )
+
+    return { plug: Values[:,i] / Scales[i] for i,plug in enumerate( plugs ) }
+
+
+# UI unit -> internal unit factor of a plug: degrees -> radians, scene distance unit -> cm, 1.0 for plain numbers
+def jly_plugUnitScale( plug=None ):
+
+    Attr = plug.attribute()
+    if not Attr.hasFn( om.MFn.kUnitAttribute ):
+        return 1.0
+    UnitType = om.MFnUnitAttribute( Attr ).unitType()
+    if UnitType == om.MFnUnitAttribute.kAngle:
+        return om.MAngle( 1.0, om.MAngle.uiUnit() ).asRadians()
+    if UnitType == om.MFnUnitAttribute.kDistance:
+        return om.MDistance( 1.0, om.MDistance.uiUnit() ).asCentimeters()
+
+    return 1.0
+
+
+# Key many channels on many frames, with cmds only so the keys are on Maya's undo queue (one undo chunk)
+# Per channel: one setKeyframe makes the keys on all the frames (and the curve if there is none), one keyframe query
+# per list reads the curve back, and one setAttr on the curve's keyTimeValue list writes every value
+# values: { 'node.attr': (F,) array in UI units }, keys already on the other frames are kept, keys on the same frames are replaced
+# Locked or driven channels are skipped
+# Returns the list of channels that were keyed
+def jly_keyChannels( values={}, frames=[] ):
+
+    Frames = np.asarray( frames, dtype=float )
+    Keyed = []
+    cmds.undoInfo( openChunk=True, chunkName='jly_keyChannels' )
+    try:
+        for plugName,value in values.items():
+            if not jly_freeChannel( plugName ):
+                continue
+            cmds.setKeyframe( plugName, time=Frames.tolist() )
+            Curve = cmds.listConnections( plugName, source=True, destination=False, type='animCurve', skipConversionNodes=True )[0]
+            Times = np.array( cmds.keyframe( Curve, query=True, timeChange=True ) )
+            Values = np.array( cmds.keyframe( Curve, query=True, valueChange=True ) )
+            # New values on the frames, the keys in between keep theirs
+            Values[ np.searchsorted( Times, Frames-1e-6 ) ] = value
+            TimeValues = np.stack( [ Times, Values ], axis=1 ).flatten().tolist()
+            cmds.setAttr( Curve+'.keyTimeValue[0:'+str( len(Times)-1 )+']', *TimeValues )
+            Keyed += [ plugName ]
+    finally:
+        cmds.undoInfo( closeChunk=True )
+
+    return Keyed
+
+
+# Euler rotations baked frame by frame can jump by 360 degrees, unwrap them so each frame is the closest to the one before
+# eulers: (F,) or (F,3) in degrees, frames on the first axis
+def jly_eulerFilter( eulers=None ):
+
+    return np.degrees( np.unwrap( np.radians( eulers ), axis=0 ) )
+
+
+# ---------------------------------------------------------------------------------------
+# Match And Switch
+
+# Set the solved values of one frame, locked or driven channels are skipped
+def jly_setMatchValues( values={}, frame=0 ):
+
+    for plug,value in values.items():
+        if not jly_freeChannel( plug ):
+            continue
+        cmds.setAttr( plug, float( value[frame] ) )
+
+
+# Match one limb on the current frame, then switch it
+# to: 'FK' snaps the FK controls to the limb, 'IK' snaps the IK control and pole
+# switch: also set the _FK_IK blend, key: key the matched controls and the blend on the current frame
+def jly_matchLimb( limb='Arm', side='L_', prefix='', to='FK', name='', namespace='', switch=True, key=False ):
+
+    Names = jly_limbNames( limb, side, prefix, name, namespace )
+    if not Names:
+        return {}
+
+    # One bulk read of all the chain matrices, then solve
+    Nodes = jly_limbNodes( Names )
+    World, Parent = jly_chainMatrices( Nodes )
+    Solver = jly_solveToFK if to == 'FK' else jly_solveToIK
+    Values = Solver( Names, Nodes, World, Parent )
+
+    cmds.undoInfo( openChunk=True, chunkName='jly_matchLimb' )
+    try:
+        jly_setMatchValues( Values, 0 )
+        if switch:
+            cmds.setAttr( Names['blend'], jlyMatchModes[ to ] )
+        if key:
+            cmds.setKeyframe( [ p for p in Values if jly_freeChannel( p ) ] + ( [ Names['blend'] ] if switch else [] ) )
+    finally:
+        cmds.undoInfo( closeChunk=True )
+
+    print( side+prefix+( name or limb )+' matched to '+to )
+
+    return Values
+
+
+# Match one limb on every frame from start to end, and key it, the timeline is not moved
+# All frames are read first (one DG context per frame), then solved together, then keyed
+# step: frame step, e.g. 2 keys every other frame
+def jly_matchLimbRange( limb='Arm', side='L_', prefix='', to='FK', start=1, end=24, step=1, name='', namespace='', switch=True ):
+
+    Names = jly_limbNames( limb, side, prefix, name, namespace )
+    if not Names:
+        return {}
+
+    Frames = list( np.arange( start, end+step*0.5, step ) )
+    Nodes = jly_limbNodes( Names )
+    World, Parent = jly_chainMatrices( Nodes, Frames )
+    Solver = jly_solveToFK if to == 'FK' else jly_solveToIK
+    Values = Solver( Names, Nodes, World, Parent )
+
+    # Rotations are solved frame by frame, keep them continuous
+    for plug in Values:
+        if '.rotate' in plug:
+            Values[ plug ] = jly_eulerFilter( Values[plug] )
+
+    # Key all the controls and the blend, a few calls per channel, one undo chunk
+    if switch:
+        Values[ Names['blend'] ] = np.full( len(Frames), jlyMatchModes[ to ] )
+    jly_keyChannels( Values, Frames )
+
+    print( side+prefix+( name or limb )+' matched to '+to+' on '+str( len(Frames) )+' frames ('+str( start )+'-'+str( end )+')' )
+
+    return Values
+
+
+# ---------------------------------------------------------------------------------------
+# Space Switch Bake
+
+# Change some attributes over a frame range and bake controls so they keep the world transform they had
+# ctrls: controls to bake (translate and rotate), they must not be parents of each other
+# changes: { 'node.attr': new value } e.g. the space weights, keyed on every frame of the range
+# hold: also key the frame before the range with the old values, so the animation before the range does not change
+# 1. world matrices of the controls before the change, 2. key the change, 3. parent matrices after the change,
+# 4. local = world before * parent after^-1 for all frames at once, 5. one bulk key call per channel
+def jly_bakeSwitch( ctrls=[], changes={}, start=1, end=24, step=1, hold=True ):
+
+    Frames = list( np.arange( start, end+step*0.5, step ) )
+    ReadFrames = ( [ start-step ] if hold else [] ) + Frames
+
+    # World matrices before the change
+    World, Parent = jly_chainMatrices( ctrls, ReadFrames )
+
+    # The change and the bake are one undo chunk
+    cmds.undoInfo( openChunk=True, chunkName='jly_bakeSwitch' )
+    try:
+        # Key the change: the old value on the hold frame, the new value on the range
+        Old = jly_plugValues( list( changes ), ReadFrames )
+        ChangeValues = {}
+        for plug,value in changes.items():
+            ChangeValues[ plug ] = np.concatenate( [ Old[plug][:1] if hold else [], np.full( len(Frames), float(value) ) ] )
+        jly_keyChannels( ChangeValues, ReadFrames )
+
+        # Parent matrices after the change, and the local values that put the controls back where they were
+        Parent = jly_chainMatrices( ctrls, ReadFrames )[1]
+        Local = np.matmul( World, np.linalg.inv( Parent ) )
+        Values = {}
+        for i,ctrl in enumerate( ctrls ):
+            Order = cmds.getAttr( ctrl+'.rotateOrder' )
+            jly_addChannels( Values, ctrl, 'translate', Local[:,i,3,:3] )
+            jly_addChannels( Values, ctrl, 'rotate', jly_eulerFilter( jly_matrixEulers( jly_rotationPart( Local[:,i] ), Order ) ) )
+        Keyed = jly_keyChannels( Values, ReadFrames )
+    finally:
+        cmds.undoInfo( closeChunk=True )
+
+    print( 'Baked '+str( len(ctrls) )+' control(s), '+str( len(Keyed) )+' channels on '+str( len(Frames) )+' frames ('+str( start )+'-'+str( end )+')' )
+
+    return Values
+
+
+# Switch the IK wrist (Arm) or ankle (Leg) control to one space over a frame range, the control is baked so it does not pop
+# space: one of jlySpaceSwitches[limb]['spaces'], its weight goes to 1 and all the others to 0
+def jly_switchSpaceRange( limb='Arm', side='L_', prefix='', space='Chest', start=1, end=24, step=1, name='', namespace='', hold=True ):
+
+    Spec = jlySpaceSwitches[ limb ]
+    if space not in Spec['spaces']:
+        print( 'ERROR - space must be one of '+str( Spec['spaces'] )+' for the '+limb )
+        return {}
+
+    Scope = namespace+side+prefix
+    Ctrl = jly_findLimbNode( Scope, Spec['ctrl'] )
+    Util = Scope+( name or limb )+'Util_Ctrl'
+    if not Ctrl or not cmds.objExists( Util ):
+        print( 'ERROR - can not switch the '+side+prefix+( name or limb )+' space, nodes are missing' )
+        return {}
+
+    Changes = { Util+'.'+side+prefix+s+'Space': 1.0 if s == space else 0.0 for s in Spec['spaces'] }
+
+    return jly_bakeSwitch( [ Ctrl ], Changes, start, end, step, hold )
+
+
+# ---------------------------------------------------------------------------------------
+# Rig Controls
+
+# All the controls of a rig from its metadata (CtrlsALL of every module), or of some modules only
+# namespace: the rig's namespace when it is referenced, e.g. 'SuitMan:'
+def jly_rigCtrls( modules=[], namespace='', rigMeta='Rig_Meta' ):
+
+    if not cmds.objExists( namespace+rigMeta ):
+        print( 'ERROR - '+namespace+rigMeta+' does not exist, build the rig with Biped_AutoRig_Creation.py first' )
+        return []
+
+    # Module names are saved without the namespace, only the metadata node has it
+    return list( dict.fromkeys( jlyBR.jly_getRigNodes( 'CtrlsALL', modules, namespace+rigMeta ) ) )
+
+
+# Every anim curve that drives a control channel directly, as (channel, curve) pairs
+def jly_ctrlCurves( ctrls=[] ):
+
+    Pairs = []
+    for ctrl in ctrls:
+        Connections = cmds.listConnections( ctrl, type='animCurve', source=True, destination=False, connections=True, plugs=True ) or []
+        # Connections come as ( ctrl plug, curve plug ) pairs
+        for i in range( 0, len(Connections), 2 ):
+            Pairs += [ ( Connections[i], Connections[i+1].split('.')[0] ) ]
+
+    return Pairs
+
+
+# ---------------------------------------------------------------------------------------
+# Keyframe Reduction
+
+# Reduction tolerance of each channel kind, in UI units (scene units, degrees), the start of the attribute name picks it
+jlyReduceTolerances = { 'translate': 0.01, 'rotate': 0.05, 'scale': 0.001, 'default': 0.001 }
+
+# Longest gap between two kept keys, in keys, keeps the fit fast on long shots
+jlyReduceMaxSpan = 200
+
+# Tolerance of one channel, e.g. 'L_Wrist_Ctrl.rotateX' -> the 'rotate' tolerance
+def jly_channelTolerance( channel='', tolerances=jlyReduceTolerances ):
+
+    Attr = channel.split('.')[-1]
+    for kind,tol in tolerances.items():
+        if Attr.startswith( kind ):
+            return tol
+
+    return tolerances.get( 'default', jlyReduceTolerances['default'] )
+
+
+# Keep the fewest keys of one baked curve so the curve through them stays within tol of every old key
+# Kept keys get fixed tangents with the slope the baked curve has there, so every segment is a cubic Hermite
+# that Maya evaluates the same way as it is checked here
+# Greedy: from each kept key, the furthest next key that fits is found with one array operation over all candidates
+# Returns the kept key indices and the slopes (value per frame) of all keys
+def jly_fitHermite( times=None, values=None, tol=0.01, maxSpan=jlyReduceMaxSpan ):
+
+    Count = len( values )
+    Slopes = np.gradient( values, times ) if Count > 1 else np.zeros( Count )
+    if Count < 3:
+        return np.arange( Count ), Slopes
+
+    Keys = [ 0 ]
+    a = 0
+    while a < Count-1:
+        # Every candidate end b (rows) against every old key j (columns) up to the span
+        B = np.arange( a+1, min( Count, a+1+maxSpan ) )
+        J = np.arange( a, B[-1]+1 )
+        H = ( times[B]-times[a] )[:,None]
+        S = ( times[J][None,:]-times[a] ) / H
+        S2 = S*S
+        S3 = S2*S
+        Curve = ( 2*S3-3*S2+1 )*values[a] + ( S3-2*S2+S )*H*Slopes[a] + ( -2*S3+3*S2 )*values[B][:,None] + ( S3-S2 )*H*Slopes[B][:,None]
+        Error = np.where( J[None,:] <= B[:,None], np.abs( Curve - values[J][None,:] ), 0.0 ).max( axis=1 )
+        a = int( B[ np.nonzero( Error <= tol )[0].max() ] )
+        Keys += [ a ]
+
+    return np.array( Keys, dtype=int ), Slopes
+
+
+# Reduce the baked curves of rig controls in one batch
+# All curves are read first, fitted with NumPy, then each curve is edited with cmds in one undo chunk:
+# one cutKey removes the dropped keys and the kept keys get fixed tangents (undo with ctrl+z)
+# ctrls: the controls to reduce, default every control of the rig (CtrlsALL from the rig metadata)
+# Stepped curves (switches, blends keyed with step tangents) are left alone
+def jly_reduceRig( ctrls=None, modules=[], namespace='', rigMeta='Rig_Meta', tolerances=jlyReduceTolerances ):
+
+    if ctrls is None:
+        ctrls = jly_rigCtrls( modules, namespace, rigMeta )
+
+    # Read and fit every curve
+    Fits = []
+    for channel,curve in jly_ctrlCurves( ctrls ):
+        Times = np.array( cmds.keyframe( curve, query=True, timeChange=True ) or [] )
+        if len( Times ) < 3 or 'step' in ( cmds.keyTangent( curve, query=True, outTangentType=True ) or [] ):
+            continue
+        Values = np.array( cmds.keyframe( curve, query=True, valueChange=True ) )
+        Keys, Slopes = jly_fitHermite( Times, Values, jly_channelTolerance( channel, tolerances ) )
+        Fits += [ ( curve, Times, Keys, Slopes ) ]
+
+    Before = sum( [ len(f[1]) for f in Fits ] )
+    After = sum( [ len(f[2]) for f in Fits ] )
+
+    # Tangent x is in seconds, one frame of it carries the slope (value per frame)
+    FrameSeconds = om.MTime( 1.0, om.MTime.uiUnit() ).asUnits( om.MTime.kSeconds )
+
+    cmds.undoInfo( openChunk=True, chunkName='jly_reduceRig' )
+    try:
+        for curve,Times,Keys,Slopes in Fits:
+            Dropped = np.setdiff1d( np.arange( len(Times) ), Keys ).tolist()
+            if Dropped:
+                cmds.cutKey( curve, index=[ ( i, i ) for i in Dropped ], clear=True )
+            # The kept keys are 0 to K-1 now: fixed tangents along the fitted slope
+            cmds.keyTangent( curve, index=[ ( 0, len(Keys)-1 ) ], inTangentType='fixed', outTangentType='fixed' )
+            # Every key has its own slope and keyTangent takes one value per call
+            for k,slope in enumerate( Slopes[Keys].tolist() ):
+                cmds.keyTangent( curve, index=[ ( k, k ) ], inTangentX=FrameSeconds, inTangentY=slope, outTangentX=FrameSeconds, outTangentY=slope )
+    finally:
+        cmds.undoInfo( closeChunk=True )
+
+    print( 'Reduced '+str( len(Fits) )+' curves: '+str( Before )+' -> '+str( After )+' keys ('+str( round( 100.0*After/max( Before, 1 ), 1 ) )+'%)' )
+
+    return { 'curves': len( Fits ), 'keysBefore': Before, 'keysAfter': After }
+
+
+# ---------------------------------------------------------------------------------------
+# Retarget Settings
+
+# Limb roles: ( role, bind joint, parent role ), parents first, {s} is the side (L_ or R_)
+# The torso roles depend on the spine and neck joint counts of the rig, see jly_retargetRoles
+# Roles without a rig joint are skipped (e.g. a hand without a thumb), their children use the next role up
+jlyFingerNames = [ 'Thumb', 'Index', 'Middle', 'Ring', 'Pinky' ]
+jlyRetargetLimbRoles = [
+    ( '{s}Clav', 'Clav_Jnt', 'Chest' ), ( '{s}Shld', 'Shld_Jnt', '{s}Clav' ), ( '{s}Elbow', 'Elbow_Jnt', '{s}Shld' ), ( '{s}Wrist', 'Wrist_Jnt', '{s}Elbow' ),
+] + [ ( '{s}'+f+n, f+n+'_Jnt', '{s}Wrist' if n == '01' else '{s}'+f+str( int(n)-1 ).zfill(2) ) for f in jlyFingerNames for n in [ '01', '02', '03' ] ] + [
+    ( '{s}Hip', 'Hip_Jnt', 'Pelvis' ), ( '{s}Knee', 'Knee_Jnt', '{s}Hip' ), ( '{s}Ankle', 'Ankle_Jnt', '{s}Knee' ), ( '{s}Ball', 'Ball_Jnt', '{s}Ankle' ),
+]
+
+# Controls driven by the retarget: ( control, role it follows, space, channels ), parents first
+# The control keeps the offset it has to its role joint in the rest pose
+# space: what the control's 0 null moves with, a role, a control above in this list, '' (nothing retargeted), or
+#        '@Arm'/'@Leg' for the IK control spaces picked on the limb's utility control
+# channels: 't' translate, 'r' rotate
+jlyRetargetCtrls = [
+    ( 'Pelvis_Ctrl', 'Pelvis', '', 'tr' ),
+    ( 'Chest_Ctrl', 'Chest', '', 'tr' ),
+    ( 'Head_Ctrl', 'Head', 'Chest', 'r' ),
+    ( '{s}Shld_Ctrl', '{s}Shld', 'Chest', 't' ),
+    ( '{s}ShldFK_Ctrl', '{s}Shld', '{s}Clav', 'r' ),
+    ( '{s}ElbowFK_Ctrl', '{s}Elbow', '{s}ShldFK_Ctrl', 'r' ),
+    ( '{s}WristFK_Ctrl', '{s}Wrist', '{s}Elbow', 'r' ),
+    ( '{s}Wrist_Ctrl', '{s}Wrist', '@Arm', 'tr' ),
+] + [ ( '{s}'+f+n+'_Ctrl', '{s}'+f+n, '{s}Wrist' if n == '01' else '{s}'+f+str( int(n)-1 ).zfill(2)+'_Ctrl', 'r' ) for f in jlyFingerNames for n in [ '01', '02', '03' ] ] + [
+    ( '{s}HipFK_Ctrl', '{s}Hip', 'Pelvis', 'r' ),
+    ( '{s}KneeFK_Ctrl', '{s}Knee', '{s}HipFK_Ctrl', 'r' ),
+    ( '{s}AnkleFK_Ctrl', '{s}Ankle', '{s}KneeFK_Ctrl', 'r' ),
+    ( '{s}BallFK_Ctrl', '{s}Ball', '{s}AnkleFK_Ctrl', 'r' ),
+    ( '{s}Ankle_Ctrl', '{s}Ankle', '@Leg', 'tr' ),
+]
+
+# Pole controls: ( control, root/mid/end roles, space, straight limb direction ), placed on the retargeted limb plane
+jlyRetargetPoles = [
+    ( '{s}Elbow_Ctrl', ( '{s}Shld', '{s}Elbow', '{s}Wrist' ), 'Chest', (0,0,-1) ),
+    ( '{s}Knee_Ctrl', ( '{s}Hip', '{s}Knee', '{s}Ankle' ), 'Pelvis', (0,0,1) ),
+]
+
+# IK control space name on the utility control -> role the space follows ('' for Cog and All, they are not retargeted)
+jlyRetargetSpaceRoles = { 'Head': 'Head', 'Chest': 'Chest', 'Pelvis': 'Pelvis', 'Cog': '', 'All': '' }
+
+# Example mapping for HumanIK named mocap skeletons (Hips, Spine, LeftArm...): role -> source joint
+jlyRetargetHIK = { 'Pelvis': 'Hips', 'Spine01': 'Spine', 'Spine02': 'Spine1', 'Chest': 'Spine2', 'Neck01': 'Neck', 'Head': 'Head' }
+for side,word in [ ( 'L_', 'Left' ), ( 'R_', 'Right' ) ]:
+    jlyRetargetHIK.update( { side+'Clav': word+'Shoulder', side+'Shld': word+'Arm', side+'Elbow': word+'ForeArm', side+'Wrist': word+'Hand',
+                             side+'Hip': word+'UpLeg', side+'Knee': word+'Leg', side+'Ankle': word+'Foot', side+'Ball': word+'ToeBase' } )
+    jlyRetargetHIK.update( { side+f+'0'+str(n): word+'Hand'+f+str(n) for f in jlyFingerNames for n in [ 1, 2, 3 ] } )
+
+
+# ---------------------------------------------------------------------------------------
+# Retarget Mocap
+
+# Put a side into the {s} of a retarget table value, tuples are done item by item
+def jly_sideValue( value='', side='L_' ):
+
+    if isinstance( value, str ):
+        return value.replace( '{s}', side )
+    if isinstance( value, tuple ):
+        return tuple( [ jly_sideValue( v, side ) for v in value ] )
+
+    return value
+
+
+# Number of joints in a numbered chain of the rig (Spine01_Jnt, Spine02_Jnt...), counted until one is missing
+def jly_chainCount( scope='', name='Spine' ):
+
+    Count = 0
+    while jly_findLimbNode( scope, name+str( Count+1 ).zfill(2)+'_Jnt', warn=False ):
+        Count += 1
+
+    return Count
+
+
+# All the retarget roles of a rig with spineCount spine joints and neckCount neck joints, torso first
+def jly_retargetRoles( spineCount=2, neckCount=1 ):
+
+    Spines = [ 'Spine'+str(i+1).zfill(2) for i in range( spineCount ) ]
+    Necks = [ 'Neck'+str(i+1).zfill(2) for i in range( neckCount ) ]
+    Roles = [ ( 'Pelvis', 'Pelvis_Jnt', '' ) ]
+    Roles += [ ( role, role+'_Jnt', ( [ 'Pelvis' ]+Spines )[i] ) for i,role in enumerate( Spines ) ]
+    Roles += [ ( 'Chest', 'Chest_Jnt', ( [ 'Pelvis' ]+Spines )[-1] ) ]
+    Roles += [ ( role, role+'_Jnt', ( [ 'Chest' ]+Necks )[i] ) for i,role in enumerate( Necks ) ]
+    Roles += [ ( 'Head', 'Head_Jnt', ( [ 'Chest' ]+Necks )[-1] ) ]
+
+    return Roles + jlyRetargetLimbRoles
+
+
+# Expand the {s} rows of a retarget table for both sides
+def jly_expandSides( rows=[] ):
+
+    Rows = []
+    for row in rows:
+        for side in ( [ 'L_', 'R_' ] if '{s}' in str( row ) else [ '' ] ):
+            Rows += [ jly_sideValue( row, side ) ]
+
+    return Rows
+
+
+# Matrices from (F,3,3) rotation rows and (F,3) positions, (F,4,4)
+def jly_composeRows( rotations=None, positions=None ):
+
+    M = np.tile( np.identity(4), ( len(rotations), 1, 1 ) )
+    M[:,:3,:3] = rotations
+    M[:,3,:3] = positions
+
+    return M
+
+
+# World matrices (F,4,4) of a 0 null that moves with a retargeted space
+# known: { space: ( rest world, (F,4,4) retargeted world ) }, a space not in it stays where it is in the rest pose
+def jly_spaceMatrices( restParent=None, space='', known={}, count=1 ):
+
+    if space not in known:
+        return np.tile( restParent, ( count, 1, 1 ) )
+
+    SpaceRest, SpaceTarget = known[ space ]
+
+    return np.matmul( np.dot( restParent, np.linalg.inv( SpaceRest ) ), SpaceTarget )
+
+
+# Retarget a mocap skeleton onto the rig's FK and IK controls, and key them
+# mapping: { role: source joint }, roles from jly_retargetRoles (e.g. jlyRetargetHIK), sourceNamespace is added to every source joint
+# restFrame: a frame where the mocap skeleton stands in the same pose as the rig's rest pose (T pose)
+# The rig has to be in its rest pose on the current frame (controls at 0), that pose is read as the retarget rest
+# Each role: world rotation = rig rest * ( mocap rest^-1 * mocap ), roles without a source joint turn with their parent
+# The pelvis moves by the mocap hips motion, scaled by the hip heights, every other joint hangs off its parent with the rig's bone lengths
+# All frames are read in one pass (one DG context per frame), solved with NumPy, then keyed with one call per channel
+def jly_retargetMocap( mapping=jlyRetargetHIK, start=1, end=24, step=1, restFrame=0, sourceNamespace='', namespace='', prefix='' ):
+
+    Frames = list( np.arange( start, end+step*0.5, step ) )
+
+    # Rig roles that exist, parent roles that are skipped go up to the next existing role
+    # Rig roles for the spine and neck joint counts this rig was built with
+    RoleTable = jly_retargetRoles( jly_chainCount( namespace+prefix, 'Spine' ), jly_chainCount( namespace+prefix, 'Neck' ) )
+    Roles = {}
+    Parents = {}
+    for role,joint,parent in jly_expandSides( RoleTable ):
+        Side = role[:2] if role[:2] in ( 'L_', 'R_' ) else ''
+        Joint = jly_findLimbNode( namespace+Side+prefix, joint, warn=False )
+        Parents[ role ] = parent
+        if Joint:
+            Roles[ role ] = Joint
+    for role in Roles:
+        while Parents[ role ] and Parents[ role ] not in Roles:
+            Parents[ role ] = Parents.get( Parents[ role ], '' )
+
+    # Source joints that exist
+    Sources = { role: sourceNamespace+mapping[role] for role in Roles if role in mapping and cmds.objExists( sourceNamespace+mapping[role] ) }
+    if 'Pelvis' not in Sources:
+        print( 'ERROR - the mocap has no Pelvis joint in the mapping, can not retarget' )
+        return {}
+
+    # Controls and poles that exist, with their spaces
+    Ctrls = []
+    for ctrl,role,space,channels in jly_expandSides( jlyRetargetCtrls ):
+        Ctrl = namespace+prefix+ctrl if ctrl[:2] not in ( 'L_', 'R_' ) else namespace+ctrl[:2]+prefix+ctrl[2:]
+        if role in Roles and cmds.objExists( Ctrl ):
+            Ctrls += [ ( ctrl, Ctrl, role, space, channels ) ]
+    Poles = [ ( namespace+ctrl[:2]+prefix+ctrl[2:], chain, space, fallback ) for ctrl,chain,space,fallback in jly_expandSides( jlyRetargetPoles )
+              if cmds.objExists( namespace+ctrl[:2]+prefix+ctrl[2:] ) and all( [ r in Roles for r in chain ] ) ]
+
+    # IK control spaces: the space with the biggest weight on the utility control
+    Spaces = {}
+    for limb in [ 'Arm', 'Leg' ]:
+        for side in [ 'L_', 'R_' ]:
+            Util = namespace+side+prefix+limb+'Util_Ctrl'
+            if not cmds.objExists( Util ):
+                continue
+            Weights = { s: cmds.getAttr( Util+'.'+side+prefix+s+'Space' ) for s in jlySpaceSwitches[limb]['spaces'] }
+            Spaces[ side+'@'+limb ] = jlyRetargetSpaceRoles[ max( Weights, key=Weights.get ) ]
+
+    # Read the mocap on the rest frame and every frame, and the rig rest pose, two bulk reads
+    SrcRoles = list( Sources )
+    SrcWorld = jly_chainMatrices( [ Sources[r] for r in SrcRoles ], [ restFrame ]+Frames )[0]
+    SrcRot = jly_rotationPart( SrcWorld )
+    RigNodes = list( dict.fromkeys( list( Roles.values() ) + [ c[1] for c in Ctrls ] + [ p[0] for p in Poles ] ) )
+    RigWorld, RigParent = jly_chainMatrices( RigNodes )
+    Rest = { n: RigWorld[0,i] for i,n in enumerate( RigNodes ) }
+    RestParent = { n: RigParent[0,i] for i,n in enumerate( RigNodes ) }
+
+    # World delta of every role since the rest frame, (F,3,3)
+    Delta = {}
+    for role in Roles:
+        if role in Sources:
+            i = SrcRoles.index( role )
+            Delta[ role ] = np.matmul( SrcRot[0,i].T, SrcRot[1:,i] )
+        else:
+            Delta[ role ] = Delta[ Parents[role] ] if Parents[ role ] else np.tile( np.identity(3), ( len(Frames), 1, 1 ) )
+
+    # Target world matrix of every role joint, (F,4,4)
+    Target = {}
+    Height = Rest[ Roles['Pelvis'] ][3,1] / max( SrcWorld[0,SrcRoles.index('Pelvis'),3,1], 1e-6 )
+    for role,joint in Roles.items():
+        RestM = Rest[ joint ]
+        Rot = np.matmul( RestM[:3,:3], Delta[role] )
+        if not Parents[ role ]:
+            i = SrcRoles.index( role )
+            Pos = RestM[3,:3] + ( SrcWorld[1:,i,3,:3] - SrcWorld[0,i,3,:3] ) * Height
+        else:
+            ParentRest = Rest[ Roles[ Parents[role] ] ]
+            Offset = np.dot( RestM[3,:3] - ParentRest[3,:3], np.linalg.inv( ParentRest[:3,:3] ) )
+            ParentTarget = Target[ Parents[role] ]
+            Pos = ParentTarget[:,3,:3] + np.einsum( 'j,fjk->fk', Offset, ParentTarget[:,:3,:3] )
+        Target[ role ] = jly_composeRows( Rot, Pos )
+
+    # Spaces the controls and poles can move with, controls are added once they are solved
+    Known = { role: ( Rest[ Roles[role] ], Target[role] ) for role in Roles }
+
+    # Controls: keep the rest offset to the role joint, then back to local space
+    Values = {}
+    for key,ctrl,role,space,channels in Ctrls:
+        if space.startswith( '@' ):
+            space = Spaces.get( key[:2]+space, '' )
+        World = np.matmul( np.dot( Rest[ctrl], np.linalg.inv( Rest[ Roles[role] ] ) ), Target[role] )
+        Local = np.matmul( World, np.linalg.inv( jly_spaceMatrices( RestParent[ctrl], space, Known, len(Frames) ) ) )
+        Known[ key ] = ( Rest[ctrl], World )
+        if 't' in channels:
+            jly_addChannels( Values, ctrl, 'translate', Local[:,3,:3] )
+        if 'r' in channels:
+            jly_addChannels( Values, ctrl, 'rotate', jly_eulerFilter( jly_matrixEulers( jly_rotationPart( Local ), cmds.getAttr( ctrl+'.rotateOrder' ) ) ) )
+
+    # Poles on the retargeted limb planes, as far out as in the rest pose
+    for pole,chain,space,fallback in Poles:
+        Roots, Mids, Ends = [ Target[r][:,3,:3] for r in chain ]
+        RestCenter = ( Rest[ Roles[chain[0]] ][3,:3] + Rest[ Roles[chain[2]] ][3,:3] )*0.5
+        PolePos = jlyBR.jly_solvePoles( Roots, Mids, Ends, dist=np.linalg.norm( Rest[pole][3,:3] - RestCenter ), fallback=fallback )
+        PoleH = np.concatenate( [ PolePos, np.ones( ( len(PolePos), 1 ) ) ], axis=1 )
+        jly_addChannels( Values, pole, 'translate', np.einsum( 'fi,fij->fj', PoleH, np.linalg.inv( jly_spaceMatrices( RestParent[pole], space, Known, len(Frames) ) ) )[:,:3] )
+
+    Keyed = jly_keyChannels( Values, Frames )
+
+    print( 'Retargeted '+str( len(Sources) )+' mocap joints onto '+str( len(Ctrls)+len(Poles) )+' controls, '+str( len(Keyed) )+' channels on '+str( len(Frames) )+' frames' )
+
+    return Values
@@ -0,0 +1,228 @@
+# ---------------------------------------------------------------------------------------
+# Biped Auto-Rig Tool – Batch Build Script
+# Developed by Arrow Lyu
+#
+# ---------------------------------------------------------------------------------------
+# This script builds many character variants without opening Maya.
+# Every character spec is built in its own headless Python process (mayapy + maya.standalone),
+# by running Biped_AutoRig_Creation.py with the spec, and the finished rig is saved to its own scene file.
+#
+# Use this together with: Biped_AutoRig_Creation.py and Biped_AutoRig_Python_Tool.py
+#
+# How to Use:
+# 1. Write a JSON file with a list of character specs, for example:
+#    [ { "name": "SuitMan_Tall",
+#        "rigName": "Suit Man Tall",
+#        "scene": "D:/chars/SuitMan_Tall_Model.ma",
+#        "output": "D:/rigs/SuitMan_Tall_Rig.ma",
+#        "symmetric": false,
+#        "pivots": { "Cog_Piv": { "t": [0.0, 104.0, 0.0] },
+#                    "L_Shld_Piv": { "t": [17.5, 159.1, 1.7], "ro": [86.7, -0.7, -48.3] } } } ]
+#    Pivots not in the spec keep the numbers in Biped_AutoRig_Creation.py
+# 2. Run it with mayapy:
+#    mayapy Biped_AutoRig_Batch_Build.py characters.json --workers 4 --report batch_report.json
+# 3. Test the scheduler without Maya with the stand-in backend (any Python 3):
+#    python Biped_AutoRig_Batch_Build.py characters.json --backend standin
+#
+# =======================
+#
+# Happy rigging!
+# ---------------------------------------------------------------------------------------
+# (c) 2025 by Arrow Lyu. All rights reserved. For portfolio and educational use only.
+# ---------------------------------------------------------------------------------------
+
+
+
+import sys; sys.dont_write_bytecode=True
+import os
+import json
+import time
+import argparse
+import traceback
+import multiprocessing
+
+
+# Folder of this script, the creation script and the tool script are next to it
+jlyScriptDir = os.path.dirname( os.path.abspath( __file__ ) )
+
+
+# ---------------------------------------------------------------------------------------
+# Workers
+
+# Maya backend: start maya.standalone in this process, open the character's model scene, run the creation script with the spec, save
+# Maya is imported here, not at the top, so the stand-in backend and the scheduler run without Maya
+def jly_mayaBuild( spec={}, creationScript='' ):
+
+    import runpy
+    import maya.standalone
+    maya.standalone.initialize( name='python' )
+    import maya.cmds as cmds
+
+    # The creation script imports the tool script and den_Utilities from sys.path
+    if jlyScriptDir not in sys.path:
+        sys.path.insert( 0, jlyScriptDir )
+
+    # Open the model scene, or start from an empty scene
+    if spec.get( 'scene' ):
+        cmds.file( spec['scene'], open=True, force=True )
+    else:
+        cmds.file( new=True, force=True )
+
+    # Run the creation script, BatchSpec tells it which character to build
+    runpy.run_path( creationScript, init_globals={ 'BatchSpec': spec }, run_name='__main__' )
+
+    # Save the finished rig to its own scene file, .mb is binary, anything else is ascii
+    Output = spec['output']
+    if os.path.dirname( Output ) and not os.path.isdir( os.path.dirname( Output ) ):
+        os.makedirs( os.path.dirname( Output ) )
+    cmds.file( rename=Output )
+    cmds.file( save=True, force=True, type='mayaBinary' if Output.lower().endswith('.mb') else 'mayaAscii' )
+
+    return Output
+
+
+# Stand-in backend: no Maya, it only checks the spec, waits, and writes the spec to the output path
+# Test keys in the spec: 'standInSeconds' (how long the fake build takes), 'standInFail' (raise an error with this message)
+def jly_standInBuild( spec={}, creationScript='' ):
+
+    time.sleep( float( spec.get( 'standInSeconds', 0.0 ) ) )
+    if spec.get( 'standInFail' ):
+        raise RuntimeError( spec['standInFail'] )
+
+    # Write the spec where the scene would be, so the output paths can be checked too
+    Output = spec['output']
+    if os.path.dirname( Output ) and not os.path.isdir( os.path.dirname( Output ) ):
+        os.makedirs( os.path.dirname( Output ) )
+    with open( Output, 'w' ) as f:
+        json.dump( spec, f, indent=2 )
+
+    return Output
+
+
+# Backend name -> worker function
+jlyBatchBackends = { 'maya': jly_mayaBuild, 'standin': jly_standInBuild }
+
+
+# Build one character in this worker process, never raise: the result says what happened
+def jly_buildCharacter( job=() ):
+
+    spec, backend, creationScript = job
+    Result = { 'name': spec.get( 'name', '' ), 'output': spec.get( 'output', '' ), 'status': 'failed', 'seconds': 0.0, 'error': '', 'pid': os.getpid() }
+
+    StartTime = time.time()
+    try:
+        Result['output'] = jlyBatchBackends[ backend ]( spec, creationScript )
+        Result['status'] = 'ok'
+    except Exception:
+        Result['error'] = traceback.format_exc()
+    Result['seconds'] = round( time.time() - StartTime, 3 )
+
+    return Result
+
+
+# ---------------------------------------------------------------------------------------
+# Scheduler
+
+# Check the specs before starting any worker, returns a list of error strings
+def jly_checkSpecs( specs=[] ):
+
+    Errors = []
+    Names = set()
+    Outputs = set()
+    for i,spec in enumerate( specs ):
+        if not isinstance( spec, dict ):
+            Errors += [ 'spec '+str(i)+' is not an object' ]
+            continue
+        for key in [ 'name', 'output' ]:
+            if not spec.get( key ):
+                Errors += [ 'spec '+str(i)+' has no \''+key+'\'' ]
+        # Two characters must not share a name or write over each other's scene
+        if spec.get( 'name' ) in Names:
+            Errors += [ 'spec '+str(i)+' name \''+spec['name']+'\' is used twice' ]
+        if spec.get( 'output' ) in Outputs:
+            Errors += [ 'spec '+str(i)+' output \''+spec['output']+'\' is used twice' ]
+        Names.add( spec.get( 'name' ) )
+        Outputs.add( spec.get( 'output' ) )
+
+    return Errors
+
+
+# Build every spec in a process pool, one fresh process per character (maya.standalone can not be reset)
+# Returns the report dict: totals, wall time, and one result per character in spec order
+def jly_runBatch( specs=[], workers=2, backend='maya', creationScript='', reportPath='' ):
+
+    if not creationScript:
+        creationScript = os.path.join( jlyScriptDir, 'Biped_AutoRig_Creation.py' )
+
+    Errors = jly_checkSpecs( specs )
+    if Errors:
+        for error in Errors:
+            print( 'ERROR - '+error )
+        return None
+
+    Jobs = [ ( spec, backend, creationScript ) for spec in specs ]
+    Results = {}
+    StartTime = time.time()
+
+    # maxtasksperchild=1: each character gets a new process, spawn: no Maya state is forked into the workers
+    Context = multiprocessing.get_context( 'spawn' )
+    with Context.Pool( processes=max( 1, min( workers, len(Jobs) ) ), maxtasksperchild=1 ) as Pool:
+        # Results come back as soon as each character is done
+        for i,Result in enumerate( Pool.imap_unordered( jly_buildCharacter, Jobs ) ):
+            Results[ Result['name'] ] = Result
+            print( '['+str(i+1)+'/'+str(len(Jobs))+'] '+Result['name']+' '+Result['status']+' '+str(Result['seconds'])+'s' )
+            if Result['status'] != 'ok':
+                print( 'ERROR - '+Result['name']+' failed:\n'+Result['error'] )
+
+    # Put the results back in spec order, and add the totals
+    Ordered = [ Results[ spec['name'] ] for spec in specs ]
+    Seconds = [ r['seconds'] for r in Ordered ]
+    Report = {
+        'backend': backend,
+        'workers': workers,
+        'characters': len( Ordered ),
+        'ok': len( [ r for r in Ordered if r['status'] == 'ok' ] ),
+        'failed': [ r['name'] for r in Ordered if r['status'] != 'ok' ],
+        'wallSeconds': round( time.time() - StartTime, 3 ),
+        'buildSeconds': round( sum( Seconds ), 3 ),
+        'slowest': max( Ordered, key=lambda r: r['seconds'] )['name'] if Ordered else '',
+        'results': Ordered,
+    }
+
+    print( 'Batch done: '+str(Report['ok'])+'/'+str(Report['characters'])+' built, wall '+str(Report['wallSeconds'])+'s, build total '+str(Report['buildSeconds'])+'s' )
+
+    # Save the report
+    if reportPath:
+        with open( reportPath, 'w' ) as f:
+            json.dump( Report, f, indent=2 )
+        print( 'Report saved to '+reportPath )
+
+    return Report
+
+
+# ---------------------------------------------------------------------------------------
+# Command Line
+
+def jly_batchMain( argv=None ):
+
+    Parser = argparse.ArgumentParser( description='Build biped rigs for many character specs in parallel headless workers.' )
+    Parser.add_argument( 'specs', help='JSON file with a list of character specs' )
+    Parser.add_argument( '--workers', type=int, default=max( 1, multiprocessing.cpu_count()//2 ), help='number of worker processes' )
+    Parser.add_argument( '--backend', choices=sorted( jlyBatchBackends ), default='maya', help='maya: mayapy + maya.standalone, standin: no Maya, for testing' )
+    Parser.add_argument( '--creation', default='', help='creation script to run, default Biped_AutoRig_Creation.py next to this script' )
+    Parser.add_argument( '--report', default='', help='save the batch report to this JSON file' )
+    Args = Parser.parse_args( argv )
+
+    with open( Args.specs ) as f:
+        Specs = json.load( f )
+
+    Report = jly_runBatch( specs=Specs, workers=Args.workers, backend=Args.backend, creationScript=Args.creation, reportPath=Args.report )
+
+    # Exit code 1 if any character failed, so a farm job shows as failed
+    if Report is None or Report['failed']:
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit( jly_batchMain() )
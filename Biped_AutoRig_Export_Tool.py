@@ -0,0 +1,697 @@
+# ---------------------------------------------------------------------------------------
+# Biped Auto-Rig Tool – Export Script
+# Developed by Arrow Lyu
+#
+# ---------------------------------------------------------------------------------------
+# This script contains export and import functions for a biped rig that is already built.
+# Animation: every anim curve on the rig controls is saved as packed NumPy arrays (times, values, tangents)
+# in one binary file, a much smaller and faster replacement for ATOM files.
+# Game export: the bind joints are saved as a skeleton definition, and animation clips are sampled, reduced and
+# quantized into compact binary clips, many clips in one batch.
+# LOD: reduced skeletons without twist, metacarpal and muscle joints, with the skin weights moved onto the kept joints.
+#
+# Use this after running the run script: Biped_AutoRig_Creation.py
+#
+# How to Use:
+# 1. Build the rig with Biped_AutoRig_Creation.py (or reference a built rig, pass its namespace).
+# 2. Run this script in Maya's script editor.
+# 3. Save the animation:   jly_exportAnim( projDir+'data/SuitMan_Walk.npz' )
+#    Load it again:        jly_importAnim( projDir+'data/SuitMan_Walk.npz', namespace='SuitMan:' )
+#    Game skeleton+clips:  jly_exportGameClips( projDir+'game/', clips=[ { 'name': 'Walk', 'start': 1, 'end': 32, 'anim': projDir+'data/SuitMan_Walk.npz' } ] )
+#    LOD skeleton+meshes:  jly_generateLod( lodName='LOD1', remove=jlyLodRemove )
+#
+# =======================
+#
+# Happy rigging!
+# ---------------------------------------------------------------------------------------
+# (c) 2025 by Arrow Lyu. All rights reserved. For portfolio and educational use only.
+# ---------------------------------------------------------------------------------------
+
+
+
+import sys; sys.dont_write_bytecode=True
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
+import numpy as np
+import os
+import json
+import struct
+
+import Biped_AutoRig_Python_Tool as jlyBR
+import Biped_AutoRig_Anim_Tool as jlyAnim
+
+
+# ---------------------------------------------------------------------------------------
+# Animation File Settings
+
+# File format version, saved in every file, so old files can still be read when the layout changes
+jlyAnimVersion = 1
+
+# Imports go through the API, not through cmds, so they are not in Maya's undo queue
+# Every import keeps its changes here, jly_undoLastImport puts the curves back
+jlyImportUndo = globals().get( 'jlyImportUndo', [] )
+
+
+# ---------------------------------------------------------------------------------------
+# Export Animation
+
+# Read one anim curve into flat lists with one MFnAnimCurve pass, times in seconds, values and tangents in internal units
+# Info: first key, key count, anim curve type, pre infinity, post infinity, weighted tangents (one row of curveInfo)
+def jly_readCurve( curve='' ):
+
+    SelList = om.MSelectionList()
+    SelList.add( curve )
+    CurveFn = oma.MFnAnimCurve( SelList.getDependNode( 0 ) )
+    Count = CurveFn.numKeys
+
+    Times = np.empty( Count )
+    Values = np.empty( Count )
+    Tangents = np.empty( ( Count, 4 ) )
+    Types = np.empty( ( Count, 2 ), dtype=np.int8 )
+    Locks = np.empty( ( Count, 2 ), dtype=np.int8 )
+    for i in range( Count ):
+        Times[i] = CurveFn.input( i ).asUnits( om.MTime.kSeconds )
+        Values[i] = CurveFn.value( i )
+        Tangents[i,:2] = CurveFn.getTangentXY( i, True )
+        Tangents[i,2:] = CurveFn.getTangentXY( i, False )
+        Types[i] = [ CurveFn.inTangentType( i ), CurveFn.outTangentType( i ) ]
+        Locks[i] = [ CurveFn.tangentsLocked( i ), CurveFn.weightsLocked( i ) ]
+
+    Info = [ 0, Count, CurveFn.animCurveType, CurveFn.preInfinityType, CurveFn.postInfinityType, int( CurveFn.isWeighted ) ]
+
+    return Info, Times, Values, Tangents, Types, Locks
+
+
+# Save the animation of rig controls to one binary .npz file
+# All curves are packed end to end: curve i has keys start..start+count of the times/values/tangents arrays
+# Channel names are saved without the namespace, so the file loads on any copy of the rig
+# ctrls: the controls to save, default every control of the rig (jly_rigCtrls of the animation script)
+# compress: zip the arrays, smaller files, a bit slower
+def jly_exportAnim( path='', ctrls=None, modules=[], namespace='', rigMeta='Rig_Meta', compress=True ):
+
+    if ctrls is None:
+        ctrls = jlyAnim.jly_rigCtrls( modules, namespace, rigMeta )
+
+    Channels = []
+    Infos = []
+    Arrays = { 'times': [], 'values': [], 'tangents': [], 'tangentTypes': [], 'locks': [] }
+    Start = 0
+    for channel,curve in jlyAnim.jly_ctrlCurves( ctrls ):
+        Info, Times, Values, Tangents, Types, Locks = jly_readCurve( curve )
+        Info[0] = Start
+        Start += Info[1]
+        Channels += [ channel[ len(namespace): ] if namespace and channel.startswith( namespace ) else channel ]
+        Infos += [ Info ]
+        for key,array in zip( [ 'times', 'values', 'tangents', 'tangentTypes', 'locks' ], [ Times, Values, Tangents, Types, Locks ] ):
+            Arrays[ key ] += [ array ]
+
+    if not Channels:
+        print( 'WARNING - no animated channels found, nothing is saved' )
+        return None
+
+    Data = { key: np.concatenate( arrays ) for key,arrays in Arrays.items() }
+    # Tangents only need single precision
+    Data['tangents'] = Data['tangents'].astype( np.float32 )
+    Data['channels'] = np.array( Channels )
+    Data['curveInfo'] = np.array( Infos, dtype=np.int32 )
+    Data['version'] = np.array( jlyAnimVersion )
+
+    if os.path.dirname( path ) and not os.path.isdir( os.path.dirname( path ) ):
+        os.makedirs( os.path.dirname( path ) )
+    Save = np.savez_compressed if compress else np.savez
+    with open( path, 'wb' ) as f:
+        Save( f, **Data )
+
+    print( 'Animation saved: '+path+' ('+str( len(Channels) )+' curves, '+str( Start )+' keys, '+str( os.path.getsize( path )//1024 )+' KB)' )
+
+    return path
+
+
+# ---------------------------------------------------------------------------------------
+# Import Animation
+
+# Load an animation file saved by jly_exportAnim onto the rig controls
+# namespace: the rig's namespace, offset: frames added to every key time
+# replace: delete the curves the channels have now, False keeps them and replaces only keys on the same times
+def jly_importAnim( path='', namespace='', offset=0.0, replace=True ):
+
+    Data = np.load( path )
+    if int( Data['version'] ) > jlyAnimVersion:
+        print( 'ERROR - '+path+' is version '+str( int(Data['version']) )+', this script reads up to version '+str( jlyAnimVersion ) )
+        return []
+
+    Channels = Data['channels']
+    Infos = Data['curveInfo']
+    # Seconds to the scene's frames, plus the offset
+    Unit = om.MTime.uiUnit()
+    Frames = Data['times'] * om.MTime( 1.0, om.MTime.kSeconds ).asUnits( Unit ) + offset
+    Values = Data['values']
+    Tangents = Data['tangents'].astype( float )
+    Types = Data['tangentTypes'].astype( int )
+    Locks = Data['locks'].astype( int )
+
+    Change = oma.MAnimCurveChange()
+    Modifier = om.MDGModifier()
+    Loaded = []
+    for c,channel in enumerate( Channels ):
+        Plug = namespace+str( channel )
+        if not cmds.objExists( Plug ):
+            print( 'WARNING - '+Plug+' does not exist, skipped' )
+            continue
+        if cmds.getAttr( Plug, lock=True ):
+            print( 'WARNING - '+Plug+' is locked, skipped' )
+            continue
+        SelList = om.MSelectionList()
+        SelList.add( Plug )
+        PlugObj = SelList.getPlug( 0 )
+
+        # Remove the curve the channel has now, or add to it
+        Old = oma.MAnimUtil.findAnimation( PlugObj )
+        CurveFn = oma.MFnAnimCurve()
+        if len( Old ) and replace:
+            for curve in Old:
+                Modifier.deleteNode( curve )
+            Modifier.doIt()
+            Old = []
+        if len( Old ):
+            CurveFn.setObject( Old[0] )
+        else:
+            CurveFn.create( PlugObj, int( Infos[c,2] ), Modifier )
+            Modifier.doIt()
+
+        # All the keys of the curve in one call
+        Start, Count = Infos[c,0], Infos[c,1]
+        Keys = slice( Start, Start+Count )
+        CurveFn.setIsWeighted( bool( Infos[c,5] ), Change )
+        CurveFn.addKeysWithTangents( om.MTimeArray( [ om.MTime( float(f), Unit ) for f in Frames[Keys] ] ),
+                                     om.MDoubleArray( Values[Keys].tolist() ),
+                                     tangentInTypeArray=om.MIntArray( Types[Keys,0].tolist() ),
+                                     tangentOutTypeArray=om.MIntArray( Types[Keys,1].tolist() ),
+                                     tangentInXArray=om.MDoubleArray( Tangents[Keys,0].tolist() ),
+                                     tangentInYArray=om.MDoubleArray( Tangents[Keys,1].tolist() ),
+                                     tangentOutXArray=om.MDoubleArray( Tangents[Keys,2].tolist() ),
+                                     tangentOutYArray=om.MDoubleArray( Tangents[Keys,3].tolist() ),
+                                     tangentsLockedArray=om.MIntArray( Locks[Keys,0].tolist() ),
+                                     weightsLockedArray=om.MIntArray( Locks[Keys,1].tolist() ),
+                                     convertUnits=False, keepExistingKeys=not replace, change=Change )
+        CurveFn.setPreInfinityType( int( Infos[c,3] ), Change )
+        CurveFn.setPostInfinityType( int( Infos[c,4] ), Change )
+        Loaded += [ Plug ]
+
+    jlyImportUndo.append( ( Change, Modifier ) )
+
+    print( 'Animation loaded: '+path+' ('+str( len(Loaded) )+'/'+str( len(Channels) )+' curves)' )
+
+    return Loaded
+
+
+# Put back the curves of the last import (new curves are deleted, deleted curves come back, changed curves get their old keys)
+def jly_undoLastImport():
+
+    if not jlyImportUndo:
+        print( 'WARNING - nothing to undo' )
+        return
+    Change, Modifier = jlyImportUndo.pop()
+    Change.undoIt()
+    Modifier.undoIt()
+    print( 'Last import undone' )
+
+
+# Delete the anim curves of every channel of the controls, the channels keep the value they have on holdFrame
+# It goes on jlyImportUndo like an import, jly_undoLastImport puts the curves back
+def jly_clearCtrlCurves( ctrls=[], holdFrame=0 ):
+
+    Pairs = jlyAnim.jly_ctrlCurves( ctrls )
+    Hold = jlyAnim.jly_plugValues( [ plug for plug,curve in Pairs ], [ holdFrame ] ) if Pairs else {}
+    Modifier = om.MDGModifier()
+    Deleted = set()
+    for plug,curve in Pairs:
+        SelList = om.MSelectionList()
+        SelList.add( plug )
+        SelList.add( curve )
+        Plug = SelList.getPlug( 0 )
+        # A curve can drive more than one channel, delete it once
+        if curve not in Deleted:
+            Modifier.deleteNode( SelList.getDependNode( 1 ) )
+            Deleted.add( curve )
+        Modifier.newPlugValueDouble( Plug, float( Hold[plug][0] ) * jlyAnim.jly_plugUnitScale( Plug ) )
+    Modifier.doIt()
+    jlyImportUndo.append( ( oma.MAnimCurveChange(), Modifier ) )
+
+    return sorted( Deleted )
+
+
+# ---------------------------------------------------------------------------------------
+# Game Export Settings
+
+# Channels of every joint in a game clip: local translate, local rotation quaternion (Maya MQuaternion x,y,z,w), local scale
+jlyClipChannels = [ 'tx', 'ty', 'tz', 'qx', 'qy', 'qz', 'qw', 'sx', 'sy', 'sz' ]
+
+# Keyframe reduction tolerance of each channel kind: translate in scene units, quaternion components, scale
+# A key is dropped when the straight line between the keys around it stays this close to every sampled frame
+jlyClipTolerances = { 't': 0.01, 'q': 0.0005, 's': 0.001 }
+
+# Longest gap between two kept keys, in frames, keeps the reduction fast on long clips
+jlyClipMaxSpan = 240
+
+# Binary clip file: magic, version, joints, channels per joint, frames, fps
+jlyClipMagic = b'JLYC'
+jlyClipVersion = 1
+jlyClipHeader = '<4sIIIIf'
+
+
+# ---------------------------------------------------------------------------------------
+# Game Skeleton
+
+# Closest exported joint above a DAG path, '' if there is none
+# exported: { long name: anything }, inclusive: the path itself counts too
+def jly_exportedAncestor( path='', exported={}, inclusive=False ):
+
+    Up = path if inclusive else path.rsplit( '|', 1 )[0]
+    while Up:
+        if Up in exported:
+            return Up
+        Up = Up.rsplit( '|', 1 )[0]
+
+    return ''
+
+
+# The registered SpaceOUT a SpaceIN follows: its inputs are walked up (parent/scale constraints or matrix wiring)
+# until a SpaceOUT is found, '' if there is none. spaceOUTs: long names of every registered SpaceOUT
+def jly_spaceINSource( spaceIN='', spaceOUTs=set(), depth=4 ):
+
+    Front = cmds.ls( spaceIN, long=True )
+    Seen = set( Front )
+    for i in range( depth ):
+        Inputs = cmds.ls( cmds.listConnections( Front, source=True, destination=False, skipConversionNodes=True ) or [], long=True ) if Front else []
+        Front = []
+        for node in Inputs:
+            if node in spaceOUTs:
+                return node
+            if node not in Seen:
+                Seen.add( node )
+                Front += [ node ]
+
+    return ''
+
+
+# Bind joints of the rig from its metadata (twist joints included, they are registered in place of the joints they replace)
+# Each joint's parent is its closest exported ancestor in the DAG. Module roots (Clav, Hip, finger roots, Thigh, Eye...)
+# hang under their own SpaceIN groups, their parent is the bind joint that owns the SpaceOUT their SpaceIN follows
+# (Chest_Jnt for Clav, Wrist_Jnt for the finger roots, Pelvis_Jnt for Hip), so the skeleton is one tree
+# Returns ( joints, parents ), joints are sorted so every parent comes before its children, the root has -1
+def jly_gameJoints( modules=[], namespace='', rigMeta='Rig_Meta' ):
+
+    Meta = namespace+rigMeta
+    if not cmds.objExists( Meta ):
+        print( 'ERROR - '+Meta+' does not exist, build the rig with Biped_AutoRig_Creation.py first' )
+        return [], []
+    if not modules:
+        ModuleIndex = json.loads( cmds.getAttr( Meta+'.Module_Index' ) or '{}' )
+        modules = sorted( ModuleIndex, key=ModuleIndex.get )
+
+    # Long name -> joint name and module, in registration order
+    Long = {}
+    ModuleOf = {}
+    for moduleName in modules:
+        for joint in jlyBR.jly_getModuleNodes( moduleName, 'BindJoints', Meta ):
+            Path = cmds.ls( joint, long=True )[0]
+            if Path not in Long:
+                Long[ Path ] = joint
+                ModuleOf[ Path ] = moduleName
+    SpaceOUTs = set( cmds.ls( jlyBR.jly_getRigNodes( 'SpaceOUTs', [], Meta ), long=True ) )
+
+    # DAG parents inside each module
+    Parent = { path: jly_exportedAncestor( path, Long ) for path in Long }
+
+    # Module roots: follow their SpaceIN to the SpaceOUT, and take the bind joint that owns it
+    for path in Long:
+        if Parent[ path ]:
+            continue
+        # The SpaceIN the joint hangs under first, then the module's other SpaceINs in order
+        SpaceINs = cmds.ls( jlyBR.jly_getModuleNodes( ModuleOf[path], 'SpaceINs', Meta ), long=True )
+        SpaceINs = sorted( SpaceINs, key=lambda spaceIN: not path.startswith( spaceIN+'|' ) )
+        for spaceIN in SpaceINs:
+            Owner = jly_exportedAncestor( jly_spaceINSource( spaceIN, SpaceOUTs ), Long, inclusive=True )
+            # Never under one of its own children
+            Up = Owner
+            while Up and Up != path:
+                Up = Parent[ Up ]
+            if Owner and not Up:
+                Parent[ path ] = Owner
+                break
+
+    # One root: the root with the most joints under it keeps -1, the other roots go under it
+    def jly_rootOf( path ):
+        while Parent[ path ]:
+            path = Parent[ path ]
+        return path
+    Roots = [ path for path in Long if not Parent[path] ]
+    Main = max( Roots, key=lambda root: sum( [ jly_rootOf( p ) == root for p in Long ] ) ) if Roots else ''
+    for root in Roots:
+        if root != Main:
+            print( 'WARNING - '+Long[root]+' follows no bind joint, it is parented to '+Long[Main] )
+            Parent[ root ] = Main
+
+    # Parents first: sort by depth in the joint tree, registration order after that
+    Depth = {}
+    for path in Long:
+        Up = path
+        Depth[ path ] = 0
+        while Parent[ Up ]:
+            Up = Parent[ Up ]
+            Depth[ path ] += 1
+    Order = sorted( Long, key=Depth.get )
+    Index = { path:i for i,path in enumerate( Order ) }
+    Joints = [ Long[path] for path in Order ]
+    Parents = [ Index[ Parent[path] ] if Parent[path] else -1 for path in Order ]
+
+    return Joints, Parents
+
+
+# Local matrices of exported joints, relative to their exported parent, (F,N,4,4) world -> (F,N,4,4) local
+def jly_gameLocals( world=None, parents=[] ):
+
+    Local = world.copy()
+    Child = [ i for i,p in enumerate( parents ) if p >= 0 ]
+    if Child:
+        Local[:,Child] = np.matmul( world[:,Child], np.linalg.inv( world[ :, [ parents[i] for i in Child ] ] ) )
+
+    return Local
+
+
+# Unit quaternions (x,y,z,w) of many (K,3,3) Maya rotation matrices, same values as MQuaternion, all at once
+def jly_matrixQuats( rotations=None ):
+
+    M = np.asarray( rotations, dtype=float )
+    Quats = np.empty( ( len(M), 4 ) )
+    Trace = M[:,0,0] + M[:,1,1] + M[:,2,2]
+
+    # Pick the biggest of w, x, y, z to divide by, so the result is stable for every rotation
+    Case = np.argmax( np.stack( [ Trace, M[:,0,0], M[:,1,1], M[:,2,2] ], axis=1 ), axis=1 )
+    for c in range( 4 ):
+        Rows = Case == c
+        if not Rows.any():
+            continue
+        R = M[Rows]
+        if c == 0:
+            S = np.sqrt( 1.0 + Trace[Rows] ) * 2.0
+            Quats[Rows] = np.stack( [ ( R[:,1,2]-R[:,2,1] )/S, ( R[:,2,0]-R[:,0,2] )/S, ( R[:,0,1]-R[:,1,0] )/S, 0.25*S ], axis=1 )
+        elif c == 1:
+            S = np.sqrt( 1.0 + R[:,0,0] - R[:,1,1] - R[:,2,2] ) * 2.0
+            Quats[Rows] = np.stack( [ 0.25*S, ( R[:,0,1]+R[:,1,0] )/S, ( R[:,2,0]+R[:,0,2] )/S, ( R[:,1,2]-R[:,2,1] )/S ], axis=1 )
+        elif c == 2:
+            S = np.sqrt( 1.0 + R[:,1,1] - R[:,0,0] - R[:,2,2] ) * 2.0
+            Quats[Rows] = np.stack( [ ( R[:,0,1]+R[:,1,0] )/S, 0.25*S, ( R[:,1,2]+R[:,2,1] )/S, ( R[:,2,0]-R[:,0,2] )/S ], axis=1 )
+        else:
+            S = np.sqrt( 1.0 + R[:,2,2] - R[:,0,0] - R[:,1,1] ) * 2.0
+            Quats[Rows] = np.stack( [ ( R[:,2,0]+R[:,0,2] )/S, ( R[:,1,2]+R[:,2,1] )/S, 0.25*S, ( R[:,0,1]-R[:,1,0] )/S ], axis=1 )
+
+    return Quats / np.linalg.norm( Quats, axis=1 )[:,None]
+
+
+# Split (F,N,4,4) local matrices into the clip channels, (F,N,10): translate, quaternion, scale
+# Quaternions are kept on the same side as the frame before (q and -q are the same rotation), so the curves are smooth
+def jly_clipChannels( local=None ):
+
+    Frames, Count = local.shape[:2]
+    Scale = np.linalg.norm( local[...,:3,:3], axis=-1 )
+    Quats = jly_matrixQuats( ( local[...,:3,:3] / Scale[...,None] ).reshape( -1, 3, 3 ) ).reshape( Frames, Count, 4 )
+    Flip = np.sum( Quats[1:]*Quats[:-1], axis=-1 ) < 0.0
+    Sign = np.concatenate( [ np.ones( ( 1, Count ) ), np.cumprod( np.where( Flip, -1.0, 1.0 ), axis=0 ) ] )
+
+    return np.concatenate( [ local[...,3,:3], Quats*Sign[...,None], Scale ], axis=-1 )
+
+
+# Skeleton definition for the engine: joint names (no namespace), parents, and the rest local transform
+def jly_gameSkeleton( joints=[], parents=[], rest=None, namespace='' ):
+
+    Skeleton = { 'version': jlyClipVersion, 'channels': jlyClipChannels, 'joints': [] }
+    for i,joint in enumerate( joints ):
+        Name = joint[ len(namespace): ] if namespace and joint.startswith( namespace ) else joint
+        Skeleton['joints'] += [ { 'name': Name, 'parent': parents[i],
+                                  'translate': rest[i,:3].tolist(), 'rotate': rest[i,3:7].tolist(), 'scale': rest[i,7:].tolist() } ]
+
+    return Skeleton
+
+
+# ---------------------------------------------------------------------------------------
+# Keyframe Reduction And Quantization
+
+# Keep the fewest keys of one sampled channel so straight lines between them stay within tol of every frame
+# Greedy: from each kept key, the furthest next key that fits is found with one array operation over all candidates
+# Returns the kept frame indices, a constant channel keeps one key
+def jly_reduceLinear( values=None, tol=0.001, maxSpan=jlyClipMaxSpan ):
+
+    Count = len( values )
+    if Count and np.ptp( values ) <= tol:
+        return np.array( [0], dtype=int )
+    if Count < 3:
+        return np.arange( Count )
+
+    Keys = [ 0 ]
+    a = 0
+    while a < Count-1:
+        # Every candidate end b (rows) against every sample j (columns) up to the span
+        B = np.arange( a+1, min( Count, a+1+maxSpan ) )
+        J = np.arange( a, B[-1]+1 )
+        T = ( J[None,:]-a ) / ( B[:,None]-a ).astype( float )
+        Line = values[a] + ( values[B]-values[a] )[:,None]*T
+        Error = np.where( J[None,:] <= B[:,None], np.abs( Line - values[J][None,:] ), 0.0 ).max( axis=1 )
+        a = int( B[ np.nonzero( Error <= tol )[0].max() ] )
+        Keys += [ a ]
+
+    return np.array( Keys, dtype=int )
+
+
+# Reduce and quantize every channel of a clip, (F,C) samples -> per channel keys as 16 bit frame indices and 16 bit values
+# Each channel is stored as min + value/65535 * range, so the quantization error is range/131070 at most
+def jly_compressClip( samples=None, tolerances=None ):
+
+    Counts = []
+    Mins = []
+    Ranges = []
+    KeyFrames = []
+    KeyValues = []
+    for c in range( samples.shape[1] ):
+        Values = samples[:,c]
+        Keys = jly_reduceLinear( Values, tolerances[c] )
+        Min = float( Values.min() )
+        Range = float( np.ptp( Values ) )
+        Quant = np.zeros( len(Keys) ) if Range == 0.0 else np.round( ( Values[Keys]-Min ) / Range * 65535.0 )
+        Counts += [ len(Keys) ]
+        Mins += [ Min ]
+        Ranges += [ Range ]
+        KeyFrames += [ Keys ]
+        KeyValues += [ Quant ]
+
+    return { 'counts': np.array( Counts, dtype='<u4' ), 'mins': np.array( Mins, dtype='<f4' ), 'ranges': np.array( Ranges, dtype='<f4' ),
+             'frames': np.concatenate( KeyFrames ).astype( '<u2' ), 'values': np.concatenate( KeyValues ).astype( '<u2' ) }
+
+
+# ---------------------------------------------------------------------------------------
+# Game Clip Export
+
+# Write one compressed clip: header, per channel key count/min/range, then all key frames, then all key values
+def jly_writeClip( path='', clip={}, jointCount=0, frameCount=0, fps=24.0 ):
+
+    with open( path, 'wb' ) as f:
+        f.write( struct.pack( jlyClipHeader, jlyClipMagic, jlyClipVersion, jointCount, len(jlyClipChannels), frameCount, fps ) )
+        for key in [ 'counts', 'mins', 'ranges', 'frames', 'values' ]:
+            f.write( clip[key].tobytes() )
+
+    return path
+
+
+# Export the game skeleton once and many animation clips in one batch
+# clips: [ { 'name': 'Walk', 'start': 1, 'end': 32, 'anim': 'D:/anim/Walk.npz' }, ... ]
+#        'anim' is optional, an animation file from jly_exportAnim loaded onto the rig before the clip is sampled
+# Every clip is sampled in one pass (one DG context per frame), reduced and quantized with NumPy, and saved as <name>.clip
+# restFrame: frame the skeleton's rest transforms are read from
+def jly_exportGameClips( outDir='', clips=[], modules=[], namespace='', rigMeta='Rig_Meta', restFrame=0, tolerances=jlyClipTolerances ):
+
+    Joints, Parents = jly_gameJoints( modules, namespace, rigMeta )
+    if not Joints:
+        return []
+    if not os.path.isdir( outDir ):
+        os.makedirs( outDir )
+    Fps = om.MTime( 1.0, om.MTime.kSeconds ).asUnits( om.MTime.uiUnit() )
+    ChannelTols = np.tile( [ tolerances[ c[0] ] for c in jlyClipChannels ], len(Joints) )
+
+    # Skeleton definition
+    Rest = jly_clipChannels( jly_gameLocals( jlyAnim.jly_chainMatrices( Joints, [ restFrame ] )[0], Parents ) )[0]
+    SkeletonPath = os.path.join( outDir, 'skeleton.json' )
+    with open( SkeletonPath, 'w' ) as f:
+        json.dump( jly_gameSkeleton( Joints, Parents, Rest, namespace ), f, indent=2 )
+    print( 'Skeleton saved: '+SkeletonPath+' ('+str( len(Joints) )+' joints)' )
+
+    # A clip with its own animation starts from no curves on the controls, so nothing is left from the scene or the clip before
+    Ctrls = jlyAnim.jly_rigCtrls( [], namespace, rigMeta )
+
+    Written = []
+    for clip in clips:
+        UndoCount = len( jlyImportUndo )
+        try:
+            if clip.get( 'anim' ):
+                jly_clearCtrlCurves( Ctrls, restFrame )
+                jly_importAnim( clip['anim'], namespace=namespace )
+            Frames = list( range( int( clip['start'] ), int( clip['end'] )+1 ) )
+
+            # Sample all joints on all frames, local channels, then reduce and quantize
+            World = jlyAnim.jly_chainMatrices( Joints, Frames )[0]
+            Samples = jly_clipChannels( jly_gameLocals( World, Parents ) ).reshape( len(Frames), -1 )
+            Compressed = jly_compressClip( Samples, ChannelTols )
+            Path = jly_writeClip( os.path.join( outDir, clip['name']+'.clip' ), Compressed, len(Joints), len(Frames), Fps )
+        finally:
+            # Put the original curves back: the clip's import first, then the cleared curves
+            while len( jlyImportUndo ) > UndoCount:
+                jly_undoLastImport()
+
+        Keys = len( Compressed['frames'] )
+        print( 'Clip saved: '+Path+' ('+str( len(Frames) )+' frames, '+str( Keys )+'/'+str( Samples.size )+' keys, '+str( os.path.getsize( Path )//1024 )+' KB)' )
+        Written += [ Path ]
+
+    return Written
+
+
+# ---------------------------------------------------------------------------------------
+# LOD Settings
+
+# Bind joints dropped from the LOD skeletons by default, a joint is dropped when its name ends with one of these
+# Twist joints, finger 00 metacarpals, the second scapula joint and the half muscle thigh joints
+jlyLodRemove = [ 'Twist01_Jnt', 'Twist02_Jnt', 'Twist03_Jnt', '00_Jnt', 'Scap02_Jnt', 'Thigh01_Jnt', 'Thigh02_Jnt' ]
+
+
+# ---------------------------------------------------------------------------------------
+# LOD Skeleton
+
+# Index of the kept joint each influence goes to: itself if it is kept, else its closest kept ancestor in the game skeleton
+# An influence is matched to its exported joint (or the closest exported joint above it in the DAG), then walks up the
+# logical parents from jly_gameJoints, so the finger roots go to the wrist and the half muscle joints to the pelvis side
+# Influences that are not under any exported joint go to the closest kept joint
+# paths: long names of the influences, joints: long names of the game joints, parents: their parent indices
+# kept: { game joint index: kept index }, positions: (N,3) / (K,3) world positions
+def jly_lodTargets( paths=[], joints=[], parents=[], kept={}, positions=None, keptPositions=None ):
+
+    JointIndex = { path:i for i,path in enumerate( joints ) }
+    Targets = []
+    for i,path in enumerate( paths ):
+        Up = JointIndex.get( jly_exportedAncestor( path, JointIndex, inclusive=True ), -1 )
+        while Up >= 0 and Up not in kept:
+            Up = parents[ Up ]
+        Targets += [ kept[Up] if Up >= 0 else int( np.argmin( np.linalg.norm( keptPositions - positions[i], axis=1 ) ) ) ]
+
+    return Targets
+
+
+# Skin weights of a mesh as a (V,I) matrix, one API call, with the long names of its influences in column order
+def jly_readSkinWeights( skin='', mesh='' ):
+
+    SelList = om.MSelectionList()
+    SelList.add( skin )
+    SelList.add( mesh )
+    SkinFn = oma.MFnSkinCluster( SelList.getDependNode( 0 ) )
+    MeshPath = SelList.getDagPath( 1 )
+    Components = om.MFnSingleIndexedComponent().create( om.MFn.kMeshVertComponent )
+    om.MFnSingleIndexedComponent( Components ).setCompleteData( om.MFnMesh( MeshPath ).numVertices )
+
+    Weights, Count = SkinFn.getWeights( MeshPath, Components )
+    Influences = [ p.fullPathName() for p in SkinFn.influenceObjects() ]
+
+    return np.array( Weights ).reshape( -1, Count ), Influences
+
+
+# Write a (V,I) weight matrix onto a new skinCluster in one API call, columns in the order of joints
+def jly_writeSkinWeights( skin='', mesh='', weights=None, joints=[] ):
+
+    SelList = om.MSelectionList()
+    SelList.add( skin )
+    SelList.add( mesh )
+    SkinFn = oma.MFnSkinCluster( SelList.getDependNode( 0 ) )
+    MeshPath = SelList.getDagPath( 1 )
+    Components = om.MFnSingleIndexedComponent().create( om.MFn.kMeshVertComponent )
+    om.MFnSingleIndexedComponent( Components ).setCompleteData( om.MFnMesh( MeshPath ).numVertices )
+
+    # The skinCluster keeps its own influence order, match the columns to it
+    Column = { cmds.ls( j, long=True )[0]: i for i,j in enumerate( joints ) }
+    Order = [ Column[ p.fullPathName() ] for p in SkinFn.influenceObjects() ]
+    SkinFn.setWeights( MeshPath, Components, om.MIntArray( list( range( len(Order) ) ) ), om.MDoubleArray( weights[:,Order].ravel().tolist() ), normalize=False )
+
+
+# Make an LOD skeleton and skinned LOD meshes from the built rig, without rebuilding the rig
+# remove: endings of the bind joint names to drop (jlyLodRemove), or full joint names
+# meshes: skinned meshes to copy, empty for every mesh skinned to the rig's bind joints
+# Every removed influence's weights go to its closest kept ancestor in the game skeleton, one matrix multiply per mesh: W(V,I) * Map(I,K)
+# The rig has to be in its bind pose on the current frame, the LOD joints and meshes are copied from that pose
+# Returns ( LOD joints, LOD meshes ), all of them under one lodName+'_Grp' group, delete the group to start again
+def jly_generateLod( lodName='LOD1', remove=jlyLodRemove, meshes=[], modules=[], namespace='', rigMeta='Rig_Meta' ):
+
+    Joints, Parents = jly_gameJoints( modules, namespace, rigMeta )
+    if not Joints:
+        return [], []
+    if cmds.objExists( lodName+'_Grp' ):
+        print( 'ERROR - '+lodName+'_Grp already exists, delete it or use another lodName' )
+        return [], []
+
+    # Kept joints, each one parented to its closest kept ancestor in the game skeleton
+    Names = [ j[ len(namespace): ] if namespace and j.startswith( namespace ) else j for j in Joints ]
+    Keep = [ i for i,n in enumerate( Names ) if not any( [ n.endswith( r ) for r in remove ] ) ]
+    KeptIndex = { j:k for k,j in enumerate( Keep ) }
+    LodParents = []
+    for i in Keep:
+        Parent = Parents[i]
+        while Parent >= 0 and Parent not in KeptIndex:
+            Parent = Parents[ Parent ]
+        LodParents += [ KeptIndex.get( Parent, -1 ) ]
+
+    # LOD joints on the current pose, rotation goes into the joint orient
+    World = jlyAnim.jly_chainMatrices( Joints )[0][0]
+    LodGrp = cmds.group( empty=True, name=lodName+'_Grp' )
+    LodJoints = []
+    for k,i in enumerate( Keep ):
+        Joint = cmds.createNode( 'joint', name=lodName+'_'+Names[i], parent=LodJoints[ LodParents[k] ] if LodParents[k] >= 0 else LodGrp )
+        Matrix = World[i].copy()
+        Matrix[:3,:3] = jlyAnim.jly_rotationPart( Matrix )
+        cmds.xform( Joint, matrix=Matrix.ravel().tolist(), worldSpace=True )
+        cmds.makeIdentity( Joint, apply=True, rotate=True )
+        LodJoints += [ Joint ]
+    print( 'LOD skeleton: '+str( len(Keep) )+' of '+str( len(Joints) )+' joints kept' )
+
+    # Skinned meshes of the rig
+    Skins = list( dict.fromkeys( cmds.listConnections( Joints, type='skinCluster', source=False, destination=True ) or [] ) )
+    Pairs = []
+    for skin in Skins:
+        for shape in cmds.skinCluster( skin, query=True, geometry=True ) or []:
+            Mesh = cmds.listRelatives( shape, parent=True, fullPath=True )[0] if cmds.nodeType( shape ) == 'mesh' else None
+            if Mesh and ( not meshes or any( [ cmds.ls( m, long=True ) == [ Mesh ] for m in meshes ] ) ):
+                Pairs += [ ( skin, Mesh ) ]
+
+    JointPaths = [ cmds.ls( j, long=True )[0] for j in Joints ]
+    KeptPositions = World[ Keep, 3, :3 ]
+    LodMeshes = []
+    for skin,mesh in Pairs:
+        Weights, Influences = jly_readSkinWeights( skin, mesh )
+        Positions = jlyAnim.jly_chainMatrices( Influences )[0][0][:,3,:3]
+
+        # Map(I,K): one 1 per row, at the kept joint the influence goes to
+        Map = np.zeros( ( len(Influences), len(Keep) ) )
+        Map[ np.arange( len(Influences) ), jly_lodTargets( Influences, JointPaths, Parents, KeptIndex, Positions, KeptPositions ) ] = 1.0
+        LodWeights = np.dot( Weights, Map )
+        Used = np.flatnonzero( LodWeights.max( axis=0 ) > 0.0 )
+
+        # Copy the mesh without its history, only the deformed shape is left
+        LodMesh = cmds.duplicate( mesh, name=lodName+'_'+mesh.rsplit( '|', 1 )[-1].rsplit( ':', 1 )[-1] )[0]
+        Intermediate = [ s for s in cmds.listRelatives( LodMesh, shapes=True, fullPath=True ) or [] if cmds.getAttr( s+'.intermediateObject' ) ]
+        if Intermediate:
+            cmds.delete( Intermediate )
+        LodMesh = cmds.parent( LodMesh, LodGrp )[0]
+
+        UsedJoints = [ LodJoints[k] for k in Used ]
+        LodSkin = cmds.skinCluster( UsedJoints, LodMesh, toSelectedBones=True, name=LodMesh+'_skinCluster' )[0]
+        jly_writeSkinWeights( LodSkin, LodMesh, LodWeights[:,Used], UsedJoints )
+
+        print( 'LOD mesh: '+LodMesh+' ('+str( len(Influences) )+' -> '+str( len(Used) )+' influences)' )
+        LodMeshes += [ LodMesh ]
+
+    return LodJoints, LodMeshes
@@ -0,0 +1,1013 @@
+# ---------------------------------------------------------------------------------------
+# Biped Auto-Rig Tool – Maya ASCII Compiler Script
+# Developed by Arrow Lyu
+#
+# ---------------------------------------------------------------------------------------
+# This script writes a biped rig straight into a Maya ASCII (.ma) file, without a running Maya.
+# The torso, arm, leg, hand, twist, muscle and eye modules are plain data here:
+# the joint positions come from the pivot numbers, and every node is streamed into the file
+# as createNode / setAttr / connectAttr lines. Only Python 3 is needed (no Maya, no licence),
+# so rigs can be made on any build machine and opened in Maya afterwards.
+#
+# Use this together with: Biped_AutoRig_Tables.py (the pivot numbers, schemas and module list the Maya builders read too)
+# and Biped_AutoRig_Batch_Build.py (same spec file)
+#
+# How to Use:
+# 1. Write a JSON spec, the same format as the batch build spec (only 't' of the L_ and center pivots is read):
+#    { "name": "SuitMan_Tall",
+#      "rigName": "SuitMan",
+#      "maOutput": "D:/rigs/SuitMan_Tall_Rig.ma",
+#      "pivots": { "L_Shld_Piv": { "t": [17.5, 159.1, 1.7] } } }
+#    Pivots not in the spec keep the numbers in jlyTables.jlyDefaultPivots (the same numbers as Biped_AutoRig_Creation.py)
+#    "modules": [ "Base", "Torso", "L_Arm", ... ] picks the modules (default: every module in jlyMaModuleKinds),
+#    a module the compiler cannot write (the Seat angle splitters) or one without the modules it sits on stops the compile
+# 2. Run it with any Python 3:
+#    python Biped_AutoRig_MA_Compiler.py characters.json
+#    (a list of specs in the file makes one .ma per spec)
+#
+# Same as the rig made in Maya: node names, control attributes (<side>ArmUtil_Ctrl, <side>LegUtil_Ctrl), SpaceINs/SpaceOUTs,
+# and the Rig_Meta / <Module>_Meta metadata nodes, so Biped_AutoRig_Anim_Tool.py and Biped_AutoRig_Export_Tool.py
+# work on a compiled rig too
+#
+# Differences from the rig made in Maya:
+# - R_ modules are always mirrored from the L_ pivots (like symmetric mode, no negative scale)
+# - Controls are plain nurbs circles. Module links, space switches and follows are matrix nodes
+#   (multMatrix, wtAddMatrix, decomposeMatrix) instead of constraints, the pole vector is driven by vector nodes
+# - The torso is an FK chain (no spline IK), no scapula, reverse foot, limb stretch, display layers or proxy geometry.
+#   Only attributes that drive something are added: no FootUtil_Ctrl, All_Ctrl has Global_Scale, Show_Controls,
+#   Show_Guts and Bone_Draw_Style (no geo switches or side colors), the module groups have no display attributes
+# - No Seat (angle splitter) modules
+#
+# =======================
+#
+# Happy rigging!
+# ---------------------------------------------------------------------------------------
+# (c) 2025 by Arrow Lyu. All rights reserved. For portfolio and educational use only.
+# ---------------------------------------------------------------------------------------
+
+
+
+import sys; sys.dont_write_bytecode=True
+import os
+import json
+import math
+import time
+import argparse
+
+# Pivot layout, schemas and module list, the same tables the Maya builders read
+import Biped_AutoRig_Tables as jlyTables
+
+
+# Identity rotation, rows are the X, Y, Z axes
+jlyMaIdentity = ( (1.0,0.0,0.0), (0.0,1.0,0.0), (0.0,0.0,1.0) )
+
+
+# ---------------------------------------------------------------------------------------
+# Vector Math (pure Python, rows are axes, same row-vector convention as Maya)
+
+def jly_vAdd( a, b ):
+    return ( a[0]+b[0], a[1]+b[1], a[2]+b[2] )
+
+def jly_vSub( a, b ):
+    return ( a[0]-b[0], a[1]-b[1], a[2]-b[2] )
+
+def jly_vMul( a, s ):
+    return ( a[0]*s, a[1]*s, a[2]*s )
+
+def jly_vDot( a, b ):
+    return a[0]*b[0] + a[1]*b[1] + a[2]*b[2]
+
+def jly_vCross( a, b ):
+    return ( a[1]*b[2]-a[2]*b[1], a[2]*b[0]-a[0]*b[2], a[0]*b[1]-a[1]*b[0] )
+
+def jly_vLen( a ):
+    return math.sqrt( jly_vDot( a, a ) )
+
+def jly_vNorm( a ):
+    Length = jly_vLen( a )
+    if Length < 1e-9:
+        return ( 0.0, 0.0, 0.0 )
+    return jly_vMul( a, 1.0/Length )
+
+# Mirror a world position across the YZ plane (L_ -> R_)
+def jly_vMirror( a ):
+    return ( -a[0], a[1], a[2] )
+
+# 3x3 multiply, row vectors: jly_mMul( A, B ) applies A first, then B
+def jly_mMul( A, B ):
+    return tuple( tuple( sum( A[r][k]*B[k][c] for k in range(3) ) for c in range(3) ) for r in range(3) )
+
+# Transpose, the inverse of a rotation
+def jly_mT( A ):
+    return tuple( tuple( A[c][r] for c in range(3) ) for r in range(3) )
+
+# Point (row vector) times rotation
+def jly_vRot( a, R ):
+    return tuple( sum( a[k]*R[k][c] for k in range(3) ) for c in range(3) )
+
+# Rotation with X aimed along aim, Y towards up (the joint orient of a chain: X down the bone)
+def jly_mAim( aim=(1,0,0), up=(0,1,0) ):
+    X = jly_vNorm( aim )
+    Z = jly_vNorm( jly_vCross( X, up ) )
+    # Up is parallel to the aim, pick any other up
+    if jly_vLen( Z ) < 1e-6:
+        Z = jly_vNorm( jly_vCross( X, (0,0,1) if abs( X[2] ) < 0.9 else (1,0,0) ) )
+    Y = jly_vCross( Z, X )
+    return ( X, Y, Z )
+
+# Rotation -> Euler angles in degrees, rotate order xyz (R = Rx * Ry * Rz)
+def jly_mEuler( R ):
+    Y = math.asin( max( -1.0, min( 1.0, -R[0][2] ) ) )
+    if abs( R[0][2] ) < 0.999999:
+        X = math.atan2( R[1][2], R[2][2] )
+        Z = math.atan2( R[0][1], R[0][0] )
+    # Gimbal lock: put everything into X
+    else:
+        X = math.atan2( -R[2][1], R[1][1] )
+        Z = 0.0
+    return ( math.degrees(X), math.degrees(Y), math.degrees(Z) )
+
+# Pole position: push the middle joint away from the root-end line, same idea as the ElbowPole/KneePole locators
+def jly_polePos( rootPos, midPos, endPos, dist=20.0 ):
+    Line = jly_vSub( endPos, rootPos )
+    LineLen2 = max( jly_vDot( Line, Line ), 1e-9 )
+    # Closest point to the middle joint on the root-end line
+    Proj = jly_vAdd( rootPos, jly_vMul( Line, jly_vDot( jly_vSub( midPos, rootPos ), Line )/LineLen2 ) )
+    Out = jly_vNorm( jly_vSub( midPos, Proj ) )
+    return jly_vAdd( midPos, jly_vMul( Out, dist ) )
+
+
+# ---------------------------------------------------------------------------------------
+# Compiled Modules
+
+# Module kinds the compiler can write (the kinds of jlyTables.jlyBipedModules), the Seat angle splitters are left out
+jlyMaModuleKinds = [ 'Base', 'Torso', 'Arm', 'Twist', 'Leg', 'Hand', 'HalfMuscle', 'Eye' ]
+
+# All_Ctrl attributes of jlyTables.jlyAllCtrlSchema that the compiled rig wires up (jly_maBase, jly_maDisplay)
+jlyMaAllCtrlAttrs = [ 'Global_Scale', 'Show_Controls', 'Show_Guts', 'Bone_Draw_Style' ]
+
+
+# Spaces of a module kind in SpaceIN order, from the wiring table ('HeadSpaceOUT' -> 'Head')
+def jly_maSpaces( kind='Arm' ):
+    return [ s[:-len( 'SpaceOUT' )] for s in jlyTables.jlyWiringTable[ kind ]['spaces'] ]
+
+
+# Modules a module is built on: the base and torso SpaceOUTs, the limb under a twist, hand or muscle
+def jly_maNeeds( moduleName='', kind='' ):
+    Side = moduleName[:2] if moduleName[:2] in [ 'L_', 'R_' ] else ''
+    Needs = { 'Base': [], 'Torso': [ 'Base' ], 'Arm': [ 'Torso' ], 'Leg': [ 'Torso' ], 'Twist': [ moduleName[:-len( 'Twist' )] ],
+              'Hand': [ Side+'Arm' ], 'HalfMuscle': [ 'Torso', Side+'LegTwist' ], 'Eye': [ 'Torso' ] }
+    return Needs[ kind ]
+
+
+# ---------------------------------------------------------------------------------------
+# Maya ASCII Writer
+
+# Start a .ma file, returns the writer state dict
+# 'world' keeps the world rotation/position of every transform so child values can be made local
+# 'orient' keeps the joint orients, 'meta' the module name -> Rig_Meta.Modules index
+def jly_maOpen( path='', mayaVersion='2022' ):
+
+    if os.path.dirname( path ) and not os.path.isdir( os.path.dirname( path ) ):
+        os.makedirs( os.path.dirname( path ) )
+
+    Ma = { 'path': path, 'file': open( path, 'w' ), 'world': {}, 'orient': {}, 'meta': {}, 'nodes': 0, 'lines': 0, 'start': time.time() }
+
+    jly_maLine( Ma, '//Maya ASCII '+mayaVersion+' scene' )
+    jly_maLine( Ma, '//Name: '+os.path.basename( path ) )
+    jly_maLine( Ma, '//Codeset: UTF-8' )
+    jly_maLine( Ma, 'requires maya "'+mayaVersion+'";' )
+    jly_maLine( Ma, 'requires "matrixNodes" "1.0";' )
+    jly_maLine( Ma, 'currentUnit -l centimeter -a degree -t film;' )
+    jly_maLine( Ma, 'fileInfo "application" "maya";' )
+
+    # One RP solver for the limb IK handles, one SC solver for the clav handles
+    jly_maNode( Ma, 'ikRPsolver', 'ikRPsolver' )
+    jly_maNode( Ma, 'ikSCsolver', 'ikSCsolver' )
+
+    return Ma
+
+
+# Finish the file, returns nodes, lines and seconds
+def jly_maClose( Ma={} ):
+
+    # Register the solvers with the scene's IK system
+    jly_maConnect( Ma, 'ikRPsolver.message', ':ikSystem.sol', nextAvailable=True )
+    jly_maConnect( Ma, 'ikSCsolver.message', ':ikSystem.sol', nextAvailable=True )
+    # The module index is only known once every module is registered
+    if Ma['meta']:
+        jly_maString( Ma, 'Rig_Meta.Module_Index', json.dumps( Ma['meta'] ) )
+    jly_maLine( Ma, '// End of '+os.path.basename( Ma['path'] ) )
+    Ma['file'].close()
+
+    Seconds = max( time.time() - Ma['start'], 1e-6 )
+    return { 'path': Ma['path'], 'nodes': Ma['nodes'], 'lines': Ma['lines'], 'seconds': round( Seconds, 4 ), 'nodesPerSecond': int( Ma['nodes']/Seconds ) }
+
+
+# Write one line
+def jly_maLine( Ma={}, text='' ):
+    Ma['file'].write( text+'\n' )
+    Ma['lines'] += 1
+
+
+# Number to .ma text
+def jly_maNum( v ):
+    if isinstance( v, bool ):
+        return 'yes' if v else 'no'
+    if isinstance( v, int ):
+        return str( v )
+    v = round( v, 6 )
+    return repr( 0.0 if v == 0 else v )
+
+
+# Rotation/position -> the 16 values of a .ma matrix (rows, translate in the last row)
+def jly_maMatrix( rot=jlyMaIdentity, pos=(0,0,0) ):
+    return [ float(v) for row in rot for v in tuple(row)+(0.0,) ] + [ float(v) for v in pos ] + [ 1.0 ]
+
+
+# createNode, with an optional parent
+def jly_maNode( Ma={}, nodeType='transform', name='', parent='' ):
+    jly_maLine( Ma, 'createNode '+nodeType+' -n "'+name+'"'+( ' -p "'+parent+'"' if parent else '' )+';' )
+    Ma['nodes'] += 1
+    return name
+
+
+# setAttr, values can be one value or a list (a list of 3 is written as double3)
+def jly_maSet( Ma={}, plug='', values=0, dataType='' ):
+    if isinstance( values, (list,tuple) ):
+        if not dataType and len( values ) == 3:
+            dataType = 'double3'
+        Text = ' '.join( jly_maNum( v ) for v in values )
+    else:
+        Text = jly_maNum( values )
+    jly_maLine( Ma, '\tsetAttr "'+plug+'"'+( ' -type "'+dataType+'"' if dataType else '' )+' '+Text+';' )
+
+
+# setAttr of a string attribute
+def jly_maString( Ma={}, plug='', text='' ):
+    jly_maLine( Ma, '\tsetAttr "'+plug+'" -type "string" "'+text.replace( '\\', '\\\\' ).replace( '"', '\\"' )+'";' )
+
+
+# connectAttr
+def jly_maConnect( Ma={}, src='', dst='', nextAvailable=False ):
+    jly_maLine( Ma, 'connectAttr "'+src+'" "'+dst+'"'+( ' -na' if nextAvailable else '' )+';' )
+
+
+# addAttr on a node, attrType: double, float, enum, float3, string, message
+# multi with indexMatters False is the message list of the metadata nodes, parentAttr makes a float3 child
+def jly_maAddAttr( Ma={}, node='', longName='', attrType='double', defaultValue=None, minValue=None, maxValue=None, keyable=False, enumNames='', multi=False, parentAttr='', usedAsColor=False ):
+    jly_maLine( Ma, 'select -ne "'+node+'";' )
+    Text = 'addAttr -ci true'+( ' -k true' if keyable else '' )+( ' -uac' if usedAsColor else '' )+( ' -m -im false' if multi else '' )
+    Text += ' -sn "'+longName+'" -ln "'+longName+'"'
+    if defaultValue is not None:
+        Text += ' -dv '+jly_maNum( float(defaultValue) )
+    if minValue is not None:
+        Text += ' -min '+jly_maNum( float(minValue) )
+    if maxValue is not None:
+        Text += ' -max '+jly_maNum( float(maxValue) )
+    if enumNames:
+        Text += ' -en "'+enumNames+'"'
+    if attrType == 'float3':
+        Text += ' -nc 3'
+    if parentAttr:
+        Text += ' -p "'+parentAttr+'"'
+    jly_maLine( Ma, Text+( ' -dt "string";' if attrType == 'string' else ' -at "'+attrType+'";' ) )
+
+
+# Add every attribute of a schema (same entries as jly_addAttrSchema) to a node, returns the node.attr names
+def jly_maSchema( Ma={}, node='', schema=[], side='', prefix='', name='' ):
+
+    Attrs = []
+    for entry in schema:
+        AttrName = entry['name'].format( side=side, prefix=prefix, name=name )
+        Type = entry.get( 'type', 'double' )
+        Keyable = entry.get( 'keyable', False )
+        if Type == 'float3':
+            jly_maAddAttr( Ma, node, AttrName, 'float3', usedAsColor=entry.get( 'usedAsColor', False ) )
+            for axis,value in zip( 'RGB', entry.get( 'default', (0.0,0.0,0.0) ) ):
+                jly_maAddAttr( Ma, node, AttrName+axis, 'float', value, parentAttr=AttrName )
+        else:
+            jly_maAddAttr( Ma, node, AttrName, Type, entry.get( 'default', 0.0 ), entry.get( 'min' ), entry.get( 'max' ), Keyable, entry.get( 'enum', '' ) )
+        if entry.get( 'channelBox', False ) and not Keyable:
+            jly_maLine( Ma, '\tsetAttr -cb on "'+node+'.'+AttrName+'";' )
+        Attrs += [ node+'.'+AttrName ]
+
+    return Attrs
+
+
+# Transform or joint at a world rotation/position, the local values are worked out from the parent
+# Joints get the rotation as jointOrient (rotate stays 0), like Maya's joint tool
+def jly_maXform( Ma={}, nodeType='transform', name='', parent='', rot=jlyMaIdentity, pos=(0,0,0), radius=None ):
+
+    ParentRot, ParentPos = Ma['world'].get( parent, ( jlyMaIdentity, (0.0,0.0,0.0) ) )
+    # Local = world * parent inverse (rigid, so the inverse is the transpose)
+    LocalRot = jly_mMul( rot, jly_mT( ParentRot ) )
+    LocalPos = jly_vRot( jly_vSub( pos, ParentPos ), jly_mT( ParentRot ) )
+
+    jly_maNode( Ma, nodeType, name, parent )
+    if jly_vLen( LocalPos ) > 1e-9:
+        jly_maSet( Ma, name+'.translate', LocalPos )
+    Euler = jly_mEuler( LocalRot )
+    if jly_vLen( Euler ) > 1e-9:
+        jly_maSet( Ma, name+( '.jointOrient' if nodeType == 'joint' else '.rotate' ), Euler )
+    if nodeType == 'joint':
+        jly_maSet( Ma, name+'.radius', float( radius or 1.0 ) )
+        Ma['orient'][ name ] = LocalRot
+        # Child joints follow the parent joint's scale without shearing
+        if parent in Ma['orient']:
+            jly_maConnect( Ma, parent+'.scale', name+'.inverseScale' )
+
+    Ma['world'][ name ] = ( rot, pos )
+    return name
+
+
+# Empty group lined up with its parent (local values all 0)
+def jly_maGrp( Ma={}, name='Grp', parent='' ):
+    Rot, Pos = Ma['world'].get( parent, ( jlyMaIdentity, (0.0,0.0,0.0) ) )
+    return jly_maXform( Ma, 'transform', name, parent, Rot, Pos )
+
+
+# Circle control with a zero group above it (<name>Zero, like den_AddZeroNull), returns the control name
+# The zero group holds the placement, so the control's own channels start at 0
+def jly_maCtrl( Ma={}, name='Ctrl', parent='', rot=jlyMaIdentity, pos=(0,0,0), radius=5.0, normal='x', color=jlyTables.jlySideColors[''] ):
+
+    Zero = jly_maXform( Ma, 'transform', name+'Zero', parent, rot, pos )
+    Ctrl = jly_maXform( Ma, 'transform', name, Zero, rot, pos )
+
+    # Periodic degree 3 circle, 8 spans, 11 cvs (the last 3 repeat the first 3)
+    Cvs = []
+    for i in range( 11 ):
+        Angle = math.radians( 45.0*( i % 8 ) )
+        A, B = math.cos( Angle )*radius*1.108, math.sin( Angle )*radius*1.108
+        Cvs += [ { 'x': (0,A,B), 'y': (A,0,B), 'z': (A,B,0) }[ normal ] ]
+    Shape = jly_maNode( Ma, 'nurbsCurve', name+'Shape', Ctrl )
+    jly_maSet( Ma, Shape+'.overrideEnabled', True )
+    jly_maSet( Ma, Shape+'.overrideColor', color )
+    jly_maLine( Ma, '\tsetAttr "'+Shape+'.cached" -type "nurbsCurve" 3 8 2 no 3 13 '+' '.join( str(k) for k in range(-2,11) )+' 11 '+' '.join( ' '.join( jly_maNum(v) for v in cv ) for cv in Cvs )+';' )
+
+    return Ctrl
+
+
+# Locator (transform + locator shape)
+def jly_maLoc( Ma={}, name='Loc', parent='', pos=(0,0,0), radius=1.0 ):
+    Loc = jly_maXform( Ma, 'transform', name, parent, jlyMaIdentity, pos )
+    Shape = jly_maNode( Ma, 'locator', name+'Shape', Loc )
+    jly_maSet( Ma, Shape+'.localScale', (radius,radius,radius) )
+    return Loc
+
+
+# Joint chain through world positions, X aims at the next joint, Y towards up
+# The last joint keeps the orientation of the one before it, returns the joint names
+def jly_maChain( Ma={}, names=[], positions=[], up=(0,1,0), parent='', radius=1.0 ):
+
+    Rot = jlyMaIdentity
+    for i,name in enumerate( names ):
+        if i < len( names )-1:
+            Rot = jly_mAim( jly_vSub( positions[i+1], positions[i] ), up )
+        jly_maXform( Ma, 'joint', name, parent if i == 0 else names[i-1], Rot, positions[i], radius )
+
+    return names
+
+
+# Module link: the space group follows a node of another module (SpaceOUT -> SpaceIN) with matrix nodes
+# world matrix of the source * parent inverse of the space group -> translate/rotate/scale
+def jly_maSpaceLink( Ma={}, source='', spaceIN='' ):
+
+    Mult = jly_maNode( Ma, 'multMatrix', spaceIN+'_MM' )
+    Decomp = jly_maNode( Ma, 'decomposeMatrix', spaceIN+'_DM' )
+    jly_maConnect( Ma, source+'.worldMatrix[0]', Mult+'.matrixIn[0]' )
+    jly_maConnect( Ma, spaceIN+'.parentInverseMatrix[0]', Mult+'.matrixIn[1]' )
+    jly_maConnect( Ma, Mult+'.matrixSum', Decomp+'.inputMatrix' )
+    for a in [ 'Translate', 'Rotate', 'Scale' ]:
+        jly_maConnect( Ma, Decomp+'.output'+a, spaceIN+'.'+a.lower() )
+
+    # The space group now sits where the source is
+    Ma['world'][ spaceIN ] = Ma['world'][ source ]
+    return [ Mult, Decomp ]
+
+
+# Space group (SpaceIN) in a module group, following a source node
+def jly_maSpaceIN( Ma={}, name='', parent='', source='' ):
+    SpaceIN = jly_maNode( Ma, 'transform', name, parent )
+    Ma['world'][ SpaceIN ] = Ma['world'].get( parent, ( jlyMaIdentity, (0.0,0.0,0.0) ) )
+    if source:
+        jly_maSpaceLink( Ma, source, SpaceIN )
+    return SpaceIN
+
+
+# SpaceOUT group under a node, other modules' SpaceINs follow it (<node>_SpaceOUT, like den_AddSpaceOUTs)
+def jly_maSpaceOUT( Ma={}, node='', name='' ):
+    return jly_maGrp( Ma, name or node+'_SpaceOUT', node )
+
+
+# Weighted follow of one or more sources, kept where it is now (what a parent/point/orient constraint with
+# maintain offset does): offset * source world matrix -> wtAddMatrix -> parent inverse -> translate and/or rotate
+# weights: a number or a plug per source. Joints get their jointOrient taken out of the rotation
+def jly_maBlend( Ma={}, node='', sources=[], weights=[], translate=True, rotate=True, name='' ):
+
+    name = name or node
+    NodeRot, NodePos = Ma['world'][ node ]
+    Sum = jly_maNode( Ma, 'wtAddMatrix', name+'_WAM' )
+    for i,(source,weight) in enumerate( zip( sources, weights ) ):
+        # Offset = node world * source world inverse, at the build pose
+        SourceRot, SourcePos = Ma['world'][ source ]
+        Offset = jly_maNode( Ma, 'multMatrix', name+'_MM'+str(i) )
+        jly_maSet( Ma, Offset+'.matrixIn[0]', jly_maMatrix( jly_mMul( NodeRot, jly_mT( SourceRot ) ), jly_vRot( jly_vSub( NodePos, SourcePos ), jly_mT( SourceRot ) ) ), 'matrix' )
+        jly_maConnect( Ma, source+'.worldMatrix[0]', Offset+'.matrixIn[1]' )
+        jly_maConnect( Ma, Offset+'.matrixSum', Sum+'.wtMatrix['+str(i)+'].matrixIn' )
+        if isinstance( weight, str ):
+            jly_maConnect( Ma, weight, Sum+'.wtMatrix['+str(i)+'].weightIn' )
+        else:
+            jly_maSet( Ma, Sum+'.wtMatrix['+str(i)+'].weightIn', float( weight ) )
+
+    # World -> the node's parent space
+    Local = jly_maNode( Ma, 'multMatrix', name+'_Local_MM' )
+    Decomp = jly_maNode( Ma, 'decomposeMatrix', name+'_Local_DM' )
+    jly_maConnect( Ma, Sum+'.matrixSum', Local+'.matrixIn[0]' )
+    jly_maConnect( Ma, node+'.parentInverseMatrix[0]', Local+'.matrixIn[1]' )
+    jly_maConnect( Ma, Local+'.matrixSum', Decomp+'.inputMatrix' )
+    jly_maConnect( Ma, node+'.rotateOrder', Decomp+'.inputRotateOrder' )
+    if translate:
+        jly_maConnect( Ma, Decomp+'.outputTranslate', node+'.translate' )
+    if rotate and node in Ma['orient']:
+        # Joint: rotate = local rotation * jointOrient inverse
+        Orient = jly_maNode( Ma, 'multMatrix', name+'_Orient_MM' )
+        OrientDecomp = jly_maNode( Ma, 'decomposeMatrix', name+'_Orient_DM' )
+        jly_maConnect( Ma, Local+'.matrixSum', Orient+'.matrixIn[0]' )
+        jly_maSet( Ma, Orient+'.matrixIn[1]', jly_maMatrix( jly_mT( Ma['orient'][ node ] ) ), 'matrix' )
+        jly_maConnect( Ma, Orient+'.matrixSum', OrientDecomp+'.inputMatrix' )
+        jly_maConnect( Ma, node+'.rotateOrder', OrientDecomp+'.inputRotateOrder' )
+        jly_maConnect( Ma, OrientDecomp+'.outputRotate', node+'.rotate' )
+    elif rotate:
+        jly_maConnect( Ma, Decomp+'.outputRotate', node+'.rotate' )
+
+    return Sum
+
+
+# IK handle from startJoint to endJoint, under handleParent
+# With a poleCtrl it is an RP handle with the pole vector from poleCtrl, without one an SC handle
+def jly_maIK( Ma={}, name='Ikh', startJoint='', midJoint='', endJoint='', handleParent='', poleCtrl='' ):
+
+    Handle = jly_maXform( Ma, 'ikHandle', name, handleParent, Ma['world'][ handleParent ][0], Ma['world'][ endJoint ][1] )
+    jly_maSet( Ma, Handle+'.roc', True )
+    Effector = jly_maNode( Ma, 'ikEffector', name.replace( '_Ikh', '_Eff' ), midJoint )
+    jly_maSet( Ma, Effector+'.visibility', False )
+    jly_maConnect( Ma, startJoint+'.message', Handle+'.handleStartJoint' )
+    jly_maConnect( Ma, Effector+'.handlePath[0]', Handle+'.handleEndEffector' )
+    jly_maConnect( Ma, ( 'ikRPsolver' if poleCtrl else 'ikSCsolver' )+'.message', Handle+'.ikSolver' )
+    for a in [ 'tx', 'ty', 'tz' ]:
+        jly_maConnect( Ma, endJoint+'.'+a, Effector+'.'+a )
+    if not poleCtrl:
+        return Handle
+
+    # Pole vector = pole position - start joint position, in the handle's parent space (what poleVectorConstraint does)
+    PoleDM = jly_maNode( Ma, 'decomposeMatrix', name+'Pole_DM' )
+    StartDM = jly_maNode( Ma, 'decomposeMatrix', name+'Start_DM' )
+    PoleSub = jly_maNode( Ma, 'plusMinusAverage', name+'Pole_PMA' )
+    PoleVec = jly_maNode( Ma, 'vectorProduct', name+'Pole_VP' )
+    jly_maSet( Ma, PoleSub+'.operation', 2 )
+    jly_maSet( Ma, PoleVec+'.operation', 3 )
+    jly_maConnect( Ma, poleCtrl+'.worldMatrix[0]', PoleDM+'.inputMatrix' )
+    jly_maConnect( Ma, startJoint+'.worldMatrix[0]', StartDM+'.inputMatrix' )
+    jly_maConnect( Ma, PoleDM+'.outputTranslate', PoleSub+'.input3D[0]' )
+    jly_maConnect( Ma, StartDM+'.outputTranslate', PoleSub+'.input3D[1]' )
+    jly_maConnect( Ma, PoleSub+'.output3D', PoleVec+'.input1' )
+    jly_maConnect( Ma, Handle+'.parentInverseMatrix[0]', PoleVec+'.matrix' )
+    jly_maConnect( Ma, PoleVec+'.output', Handle+'.poleVector' )
+
+    return Handle
+
+
+# Aim a node at a target (aimConstraint node), X aims
+# upObject: Y towards the up object, no upObject: no up vector (worldUpType none, like the muscle rig)
+def jly_maAim( Ma={}, node='', target='', upObject='' ):
+
+    Con = jly_maNode( Ma, 'aimConstraint', node+'_aimConstraint1', node )
+    jly_maSet( Ma, Con+'.worldUpType', 1 if upObject else 4 )
+    jly_maSet( Ma, Con+'.target[0].targetWeight', 1.0 )
+    jly_maConnect( Ma, node+'.parentInverseMatrix[0]', Con+'.constraintParentInverseMatrix' )
+    jly_maConnect( Ma, node+'.translate', Con+'.constraintTranslate' )
+    jly_maConnect( Ma, node+'.rotatePivot', Con+'.constraintRotatePivot' )
+    jly_maConnect( Ma, node+'.rotatePivotTranslate', Con+'.constraintRotateTranslate' )
+    jly_maConnect( Ma, node+'.rotateOrder', Con+'.constraintRotateOrder' )
+    if node in Ma['orient']:
+        jly_maConnect( Ma, node+'.jointOrient', Con+'.constraintJointOrient' )
+    jly_maConnect( Ma, target+'.translate', Con+'.target[0].targetTranslate' )
+    jly_maConnect( Ma, target+'.rotatePivot', Con+'.target[0].targetRotatePivot' )
+    jly_maConnect( Ma, target+'.rotatePivotTranslate', Con+'.target[0].targetRotateTranslate' )
+    jly_maConnect( Ma, target+'.parentMatrix[0]', Con+'.target[0].targetParentMatrix' )
+    if upObject:
+        jly_maConnect( Ma, upObject+'.worldMatrix[0]', Con+'.worldUpMatrix' )
+    for a in [ 'X', 'Y', 'Z' ]:
+        jly_maConnect( Ma, Con+'.constraintRotate'+a, node+'.rotate'+a )
+
+    return Con
+
+
+# FK controls for a joint chain: nested controls at the joints, control rotate -> joint rotate
+# The control is the joint name with suffix in place of _Jnt (Index01_Jnt -> Index01_Ctrl, Hip_FK -> HipFK_Ctrl)
+def jly_maFKCtrls( Ma={}, joints=[], parent='', radius=5.0, color=jlyTables.jlySideColors[''], suffix='_Ctrl' ):
+
+    Ctrls = []
+    for i,jnt in enumerate( joints ):
+        Rot, Pos = Ma['world'][ jnt ]
+        Ctrl = jly_maCtrl( Ma, jnt.rsplit( '_', 1 )[0]+suffix, Ctrls[-1] if Ctrls else parent, Rot, Pos, radius, 'x', color )
+        jly_maConnect( Ma, Ctrl+'.rotate', jnt+'.rotate' )
+        Ctrls += [ Ctrl ]
+
+    return Ctrls
+
+
+# FK/IK blend of the bind joints' rotations, one pairBlend per joint (<joint>_ikFk_pairBlend), weight 0 = FK, 1 = IK
+def jly_maIkFkBlend( Ma={}, weight='', fk=[], ik=[], bind=[] ):
+
+    Blends = []
+    for f,i,b in zip( fk, ik, bind ):
+        Blend = jly_maNode( Ma, 'pairBlend', b.rsplit( '_', 1 )[0]+'_ikFk_pairBlend' )
+        jly_maSet( Ma, Blend+'.rotInterpolation', 1 )
+        jly_maConnect( Ma, f+'.rotate', Blend+'.inRotate1' )
+        jly_maConnect( Ma, i+'.rotate', Blend+'.inRotate2' )
+        jly_maConnect( Ma, weight, Blend+'.weight' )
+        jly_maConnect( Ma, Blend+'.outRotate', b+'.rotate' )
+        Blends += [ Blend ]
+
+    return Blends
+
+
+# ---------------------------------------------------------------------------------------
+# Metadata (same nodes as jly_makeRigMeta and jly_registerModule, so the Anim and Export tools find the modules)
+
+# Rig_Meta network node, connected to the root rig group
+def jly_maRigMeta( Ma={}, rigGrp='RigName_Rig_Grp', label='RigName', rigMeta='Rig_Meta' ):
+
+    RigMeta = jly_maNode( Ma, 'network', rigMeta )
+    jly_maAddAttr( Ma, RigMeta, 'Rig_Label', 'string' )
+    jly_maString( Ma, RigMeta+'.Rig_Label', label )
+    # Module_Index is written by jly_maClose
+    jly_maAddAttr( Ma, RigMeta, 'Module_Index', 'string' )
+    jly_maAddAttr( Ma, RigMeta, 'RigGrp', 'message' )
+    jly_maAddAttr( Ma, RigMeta, 'Modules', 'message', multi=True )
+    jly_maConnect( Ma, rigGrp+'.message', RigMeta+'.RigGrp' )
+
+    return RigMeta
+
+
+# <Module>_Meta network node with the module's six outputs, connected to the next Rig_Meta.Modules index
+def jly_maRegister( Ma={}, moduleName='L_Arm', rigRet=(), builder='', rigMeta='Rig_Meta' ):
+
+    Index = len( Ma['meta'] )
+    ModuleMeta = jly_maNode( Ma, 'network', moduleName+'_Meta' )
+    jly_maAddAttr( Ma, ModuleMeta, 'Module_Name', 'string' )
+    jly_maString( Ma, ModuleMeta+'.Module_Name', moduleName )
+    jly_maAddAttr( Ma, ModuleMeta, 'Builder', 'string' )
+    jly_maString( Ma, ModuleMeta+'.Builder', builder )
+
+    for i,key in enumerate( jlyTables.jlyModuleMetaKeys ):
+        jly_maAddAttr( Ma, ModuleMeta, key, 'message', multi=True )
+        # RigGrp is a single name, the other five are lists
+        Items = rigRet[i] if i < len( rigRet ) else []
+        if not isinstance( Items, (list,tuple) ):
+            Items = [ Items ]
+        for j,s in enumerate( [ s for s in Items if s ] ):
+            jly_maConnect( Ma, s+'.message', ModuleMeta+'.'+key+'['+str(j)+']' )
+
+    jly_maConnect( Ma, ModuleMeta+'.message', rigMeta+'.Modules['+str(Index)+']' )
+    Ma['meta'][ moduleName ] = Index
+
+    return ModuleMeta
+
+
+# ---------------------------------------------------------------------------------------
+# Modules
+# Every module returns the same 6 items, with the same names, as the builders in Biped_AutoRig_Python_Tool.py:
+# RigGrp, SpaceINs, SpaceOUTs, BindJoints, CtrlsALL, GutsALL
+
+def jly_maBase( Ma={}, piv={}, label='RigName', ctrlRadius=50.0 ):
+
+    RootRigGrp = jly_maNode( Ma, 'transform', label+'_Rig_Grp' )
+    BaseRigGrp = jly_maNode( Ma, 'transform', 'Base_Grp', RootRigGrp )
+    Ma['world'][ RootRigGrp ] = Ma['world'][ BaseRigGrp ] = ( jlyMaIdentity, (0.0,0.0,0.0) )
+
+    WorldCtrl = jly_maCtrl( Ma, 'World_Ctrl', BaseRigGrp, radius=ctrlRadius, normal='y', color=11 )
+    WorldOffsetCtrl = jly_maCtrl( Ma, 'WorldOffset_Ctrl', WorldCtrl, radius=ctrlRadius*0.9, normal='y', color=10 )
+    AllCtrl = jly_maCtrl( Ma, 'All_Ctrl', WorldOffsetCtrl, radius=ctrlRadius*0.8, normal='y', color=21 )
+    CogCtrl = jly_maCtrl( Ma, 'Cog_Ctrl', AllCtrl, pos=piv['Cog_Piv'], radius=ctrlRadius*0.5, normal='y', color=21 )
+
+    # Global scale and the display switches on the All control, the switches are connected by jly_maDisplay
+    jly_maSchema( Ma, AllCtrl, [ e for e in jlyTables.jlyAllCtrlSchema if e['name'] in jlyMaAllCtrlAttrs ] )
+    for a in [ 'scaleX', 'scaleY', 'scaleZ' ]:
+        jly_maConnect( Ma, AllCtrl+'.Global_Scale', AllCtrl+'.'+a )
+
+    jly_maRigMeta( Ma, RootRigGrp, label )
+
+    CogSpaceOUT = jly_maSpaceOUT( Ma, CogCtrl, 'CogSpace_OUT' )
+    AllSpaceOUT = jly_maSpaceOUT( Ma, AllCtrl, 'AllSpace_OUT' )
+
+    return RootRigGrp, [], [ CogSpaceOUT, AllSpaceOUT ], [], [ WorldCtrl, WorldOffsetCtrl, AllCtrl, CogCtrl ], []
+
+
+# FK torso with the controls of the spline rig: Pelvis_Ctrl moves the pelvis, SpineMid_Ctrl bends the spine joints,
+# Chest_Ctrl and Head_Ctrl turn the chest and head, Jaw_Ctrl moves the jaw
+def jly_maTorso( Ma={}, piv={}, rigGrp='', cog='', prefix='', radius=3.0, ctrlRadius=(19.0,21.0,12.0,2.0) ):
+
+    TorsoRigGrp = jly_maNode( Ma, 'transform', prefix+'Torso_Grp', rigGrp )
+    TorsoSpaceIN = jly_maSpaceIN( Ma, prefix+'Torso_SpaceIN', TorsoRigGrp, cog )
+
+    # Spine and neck counts come from the pivots in the layout
+    Spines = sorted( n[:-4] for n in piv if n.startswith( prefix+'Spine' ) and n.endswith( '_Piv' ) )
+    Necks = sorted( n[:-4] for n in piv if n.startswith( prefix+'Neck' ) and n.endswith( '_Piv' ) )
+    Names = [ prefix+'Pelvis' ] + Spines + [ prefix+'Chest' ] + Necks + [ prefix+'Head' ]
+
+    # Spine to head chain, X up the spine, Y to the front
+    Joints = jly_maChain( Ma, [ n+'_Jnt' for n in Names ]+[ prefix+'Head_end' ], [ piv[n+'_Piv'] for n in Names+[ prefix+'HeadEnd' ] ], (0,0,1), TorsoSpaceIN, radius )
+    # Jaw under the head, X towards the chin, Y up
+    JawJoints = jly_maChain( Ma, [ prefix+'Jaw_Jnt', prefix+'Jaw_end' ], [ piv[prefix+'Jaw_Piv'], piv[prefix+'JawEnd_Piv'] ], (0,1,0), Joints[-2], radius )
+    PelvisJoint, SpineJoints, ChestJoint, HeadJoint = Joints[0], Joints[1:len(Spines)+1], Joints[len(Spines)+1], Joints[-2]
+
+    Color = jlyTables.jlySideColors['']
+    World = lambda jnt: Ma['world'][ jnt ][1]
+    PelvisCtrl = jly_maCtrl( Ma, prefix+'Pelvis_Ctrl', TorsoSpaceIN, jlyMaIdentity, World( PelvisJoint ), ctrlRadius[0], 'y', Color )
+    ChestCtrl = jly_maCtrl( Ma, prefix+'Chest_Ctrl', TorsoSpaceIN, jlyMaIdentity, World( ChestJoint ), ctrlRadius[1], 'y', Color )
+    HeadCtrl = jly_maCtrl( Ma, prefix+'Head_Ctrl', ChestCtrl, jlyMaIdentity, World( HeadJoint ), ctrlRadius[2], 'y', Color )
+    JawCtrl = jly_maCtrl( Ma, prefix+'Jaw_Ctrl', HeadCtrl, jlyMaIdentity, World( JawJoints[1] ), ctrlRadius[3], 'x', Color )
+    SpineMidCtrl = jly_maCtrl( Ma, prefix+'SpineMid_Ctrl', TorsoSpaceIN, jlyMaIdentity, World( SpineJoints[ len(SpineJoints)//2 ] ), ctrlRadius[0]*0.7, 'y', Color )
+
+    # Same follows as the constraints of the spline rig, with maintain offset
+    jly_maBlend( Ma, PelvisJoint, [ PelvisCtrl ], [ 1.0 ] )
+    jly_maBlend( Ma, SpineMidCtrl+'Zero', [ PelvisCtrl, ChestCtrl ], [ 0.5, 0.5 ] )
+    for jnt in SpineJoints:
+        jly_maConnect( Ma, SpineMidCtrl+'.rotate', jnt+'.rotate' )
+    jly_maBlend( Ma, ChestJoint, [ ChestCtrl ], [ 1.0 ], translate=False )
+    jly_maBlend( Ma, HeadCtrl+'Zero', [ ChestJoint ], [ 1.0 ] )
+    jly_maBlend( Ma, HeadJoint, [ HeadCtrl ], [ 1.0 ], translate=False )
+    jly_maBlend( Ma, JawCtrl+'Zero', [ HeadJoint ], [ 1.0 ] )
+    jly_maBlend( Ma, JawJoints[0], [ JawCtrl ], [ 1.0 ] )
+
+    # One SpaceOUT per bind joint, in bind joint order
+    BindJoints = Joints[:-1]+JawJoints[:1]
+    SpaceOUTs = [ jly_maSpaceOUT( Ma, jnt ) for jnt in BindJoints ]
+
+    return TorsoRigGrp, [ TorsoSpaceIN ], SpaceOUTs, BindJoints, [ PelvisCtrl, ChestCtrl, HeadCtrl, JawCtrl, SpineMidCtrl ], []
+
+
+# Arm: clav driven by Shld_Ctrl, FK/IK shoulder and elbow, wrist following WristFK_Ctrl
+# spaces: the SpaceOUTs of jly_maSpaces( 'Arm' ) (head, chest, pelvis, cog, all), the arm is built in the chest space
+def jly_maArm( Ma={}, piv={}, rigGrp='', side='L_', prefix='', name='Arm', spaces=[], radius=2.0, ctrlRadius=10.0, poleDist=20.0 ):
+
+    Color = jlyTables.jlySideColors[ side ]
+    Scope = side+prefix
+    Pos = lambda n: piv[ Scope+n+'_Piv' ] if side != 'R_' else jly_vMirror( piv[ 'L_'+prefix+n+'_Piv' ] )
+    Mirror = -1.0 if side == 'R_' else 1.0
+
+    ArmRigGrp = jly_maNode( Ma, 'transform', Scope+name+'_Grp', rigGrp )
+    Spaces = jly_maSpaces( 'Arm' )
+    SpaceINs = [ jly_maSpaceIN( Ma, Scope+s+'_SpaceIN', ArmRigGrp, source ) for s,source in zip( Spaces, spaces ) ]
+    ArmSkelGrp = jly_maGrp( Ma, Scope+name+'Skel_Grp', SpaceINs[1] )
+    ArmCtrlGrp = jly_maGrp( Ma, Scope+name+'Ctrl_Grp', SpaceINs[1] )
+
+    # Bend plane normal of shoulder, elbow, wrist, used as the Y axis of the chain
+    Shld, Elbow, Wrist = Pos( 'Shld' ), Pos( 'Elbow' ), Pos( 'Wrist' )
+    Up = jly_vCross( jly_vSub( Elbow, Shld ), jly_vSub( Wrist, Elbow ) )
+
+    # Bind, FK and IK chains through the same positions (so they have the same joint orients), all under the clav
+    Clav = jly_maXform( Ma, 'joint', Scope+'Clav_Jnt', ArmSkelGrp, jly_mAim( jly_vSub( Shld, Pos( 'Clav' ) ), Up ), Pos( 'Clav' ), radius )
+    Bind = jly_maChain( Ma, [ Scope+n+'_Jnt' for n in [ 'Shld', 'Elbow', 'Wrist' ] ], [ Shld, Elbow, Wrist ], Up, Clav, radius )
+    FK = jly_maChain( Ma, [ Scope+n+'_FK' for n in [ 'Shld', 'Elbow', 'Wrist' ] ], [ Shld, Elbow, Wrist ], Up, Clav, radius )
+    IK = jly_maChain( Ma, [ Scope+n+'_IK' for n in [ 'Shld', 'Elbow', 'Wrist' ] ], [ Shld, Elbow, Wrist ], Up, Clav, radius )
+
+    # Shoulder control moves the clav through an SC handle, the shoulder FK control follows the clav
+    ShldCtrl = jly_maCtrl( Ma, Scope+'Shld_Ctrl', ArmCtrlGrp, jlyMaIdentity, Shld, ctrlRadius*0.8, 'x', Color )
+    jly_maIK( Ma, Scope+'Clav_Ikh', Clav, Clav, Bind[0], ShldCtrl )
+    ShldFKCtrl = jly_maCtrl( Ma, Scope+'ShldFK_Ctrl', ArmCtrlGrp, Ma['world'][ FK[0] ][0], Shld, ctrlRadius, 'x', Color )
+    jly_maConnect( Ma, ShldFKCtrl+'.rotate', FK[0]+'.rotate' )
+    jly_maBlend( Ma, ShldFKCtrl+'Zero', [ Clav ], [ 1.0 ] )
+
+    # Utility control on the shoulder control: FK/IK blends and the wrist control spaces
+    ArmUtilCtrl = jly_maCtrl( Ma, Scope+name+'Util_Ctrl', ShldCtrl, jlyMaIdentity, jly_vAdd( Shld, ( 4.0*Mirror, 12.0, 0.0 ) ), ctrlRadius*0.2, 'z', Color )
+    jly_maSchema( Ma, ArmUtilCtrl, jlyTables.jlyArmUtilSchema, side, prefix, name )
+    Util = lambda attr: ArmUtilCtrl+'.'+Scope+attr
+
+    ElbowCtrl = jly_maCtrl( Ma, Scope+'Elbow_Ctrl', ArmCtrlGrp, jlyMaIdentity, jly_polePos( Shld, Elbow, Wrist, poleDist ), ctrlRadius*0.4, 'z', Color )
+    ElbowFKCtrl = jly_maCtrl( Ma, Scope+'ElbowFK_Ctrl', ShldFKCtrl, Ma['world'][ FK[1] ][0], Elbow, ctrlRadius*0.4, 'x', Color )
+    jly_maConnect( Ma, ElbowFKCtrl+'.rotate', FK[1]+'.rotate' )
+
+    # IK wrist control in a space group blended between the SpaceINs by the utility control
+    WristCtrlSpace = jly_maGrp( Ma, Scope+'WristCtrl_Space', ArmCtrlGrp )
+    jly_maBlend( Ma, WristCtrlSpace, SpaceINs, [ Util( s+'Space' ) for s in Spaces ] )
+    WristCtrl = jly_maCtrl( Ma, Scope+'Wrist_Ctrl', WristCtrlSpace, jlyMaIdentity, Wrist, ctrlRadius*0.7, 'y', Color )
+
+    # Wrist FK control: the zero follows the elbow (A), its rotation blends to the IK control (B) by Arm_FK_IK * Wrist_FK_IK
+    WristFKCtrl = jly_maCtrl( Ma, Scope+'WristFK_Ctrl', ElbowFKCtrl, Ma['world'][ FK[2] ][0], Wrist, ctrlRadius, 'x', Color )
+    jly_maSet( Ma, WristFKCtrl+'.rotateOrder', 1 )
+    ZeroRot, ZeroPos = Ma['world'][ WristFKCtrl+'Zero' ]
+    ZeroA = jly_maXform( Ma, 'transform', Scope+'WristFK_CtrlZeroA', Bind[1], ZeroRot, ZeroPos )
+    ZeroB = jly_maXform( Ma, 'transform', Scope+'WristFK_CtrlZeroB', WristCtrl, ZeroRot, ZeroPos )
+    WristMult = jly_maNode( Ma, 'multiplyDivide', Scope+'Wrist_ikFk_multiplyDivide' )
+    WristRev = jly_maNode( Ma, 'reverse', Scope+'Wrist_ikFk_reverse' )
+    jly_maConnect( Ma, Util( name+'_FK_IK' ), WristMult+'.input1X' )
+    jly_maConnect( Ma, Util( 'Wrist_FK_IK' ), WristMult+'.input2X' )
+    jly_maConnect( Ma, WristMult+'.outputX', WristRev+'.inputX' )
+    jly_maBlend( Ma, WristFKCtrl+'Zero', [ ZeroA ], [ 1.0 ], rotate=False, name=WristFKCtrl+'ZeroPoint' )
+    jly_maBlend( Ma, WristFKCtrl+'Zero', [ ZeroA, ZeroB ], [ WristRev+'.outputX', WristMult+'.outputX' ], translate=False, name=WristFKCtrl+'ZeroOrient' )
+    # The wrist bind joint turns with the wrist FK control
+    jly_maSet( Ma, Bind[2]+'.rotateOrder', 1 )
+    jly_maBlend( Ma, Bind[2], [ WristFKCtrl ], [ 1.0 ], translate=False )
+
+    # Shoulder and elbow blend FK and IK
+    jly_maIkFkBlend( Ma, Util( name+'_FK_IK' ), FK[:2], IK[:2], Bind[:2] )
+    jly_maIK( Ma, Scope+'Shld_Ikh', IK[0], IK[1], IK[2], WristCtrl, ElbowCtrl )
+
+    WristSpaceOUT = jly_maSpaceOUT( Ma, Bind[2], Scope+'Wrist_SpaceOUT' )
+
+    # The FK and IK chains are the guts, All_Ctrl.Show_Guts shows them (jly_maDisplay)
+    Ctrls = [ ShldCtrl, ShldFKCtrl, ArmUtilCtrl, ElbowCtrl, ElbowFKCtrl, WristCtrl, WristFKCtrl ]
+    return ArmRigGrp, SpaceINs, [ WristSpaceOUT ], [ Clav ]+Bind, Ctrls, [ FK[0], IK[0] ]
+
+
+# Leg: FK/IK hip, knee, ankle and ball, IK ankle control in a blended space (no reverse foot)
+# spaces: the SpaceOUTs of jly_maSpaces( 'Leg' ) (pelvis, cog, all), the leg is built in the pelvis space
+def jly_maLeg( Ma={}, piv={}, rigGrp='', side='L_', prefix='', name='Leg', spaces=[], radius=2.0, ctrlRadius=15.0, poleDist=20.0 ):
+
+    Color = jlyTables.jlySideColors[ side ]
+    Scope = side+prefix
+    Pos = lambda n: piv[ Scope+n+'_Piv' ] if side != 'R_' else jly_vMirror( piv[ 'L_'+prefix+n+'_Piv' ] )
+
+    LegRigGrp = jly_maNode( Ma, 'transform', Scope+name+'_Grp', rigGrp )
+    Spaces = jly_maSpaces( 'Leg' )
+    SpaceINs = [ jly_maSpaceIN( Ma, Scope+s+'Space_IN', LegRigGrp, source ) for s,source in zip( Spaces, spaces ) ]
+    LegSkelGrp = jly_maGrp( Ma, Scope+name+'Skel_Grp', SpaceINs[0] )
+    LegCtrlGrp = jly_maGrp( Ma, Scope+name+'Ctrl_Grp', SpaceINs[0] )
+
+    # Bend plane normal of hip, knee, ankle, used as the Y axis of the chain
+    Joints = [ 'Hip', 'Knee', 'Ankle', 'Ball', 'Toe' ]
+    Positions = [ Pos( n ) for n in Joints ]
+    Hip, Knee, Ankle = Positions[:3]
+    Up = jly_vCross( jly_vSub( Knee, Hip ), jly_vSub( Ankle, Knee ) )
+
+    # Bind, FK and IK chains through the same positions
+    Bind = jly_maChain( Ma, [ Scope+n+'_Jnt' for n in Joints[:-1] ]+[ Scope+'Toe_Jx' ], Positions, Up, LegSkelGrp, radius )
+    FK = jly_maChain( Ma, [ Scope+n+'_FK' for n in Joints ], Positions, Up, LegSkelGrp, radius )
+    IK = jly_maChain( Ma, [ Scope+n+'_IK' for n in Joints ], Positions, Up, LegSkelGrp, radius )
+
+    HipFKCtrl = jly_maCtrl( Ma, Scope+'HipFK_Ctrl', LegCtrlGrp, Ma['world'][ FK[0] ][0], Hip, ctrlRadius, 'x', Color )
+    jly_maConnect( Ma, HipFKCtrl+'.rotate', FK[0]+'.rotate' )
+
+    # Utility control next to the hip: FK/IK blends and the ankle control spaces
+    HipRot = Ma['world'][ FK[0] ][0]
+    LegUtilCtrl = jly_maCtrl( Ma, Scope+name+'Util_Ctrl', LegCtrlGrp, jlyMaIdentity, jly_vAdd( Hip, jly_vRot( ( ctrlRadius*0.5, 0.0, ctrlRadius ), HipRot ) ), ctrlRadius*0.2, 'y', Color )
+    jly_maSchema( Ma, LegUtilCtrl, jlyTables.jlyLegUtilSchema, side, prefix, name )
+    Util = lambda attr: LegUtilCtrl+'.'+Scope+attr
+
+    KneeCtrl = jly_maCtrl( Ma, Scope+'Knee_Ctrl', LegCtrlGrp, jlyMaIdentity, jly_polePos( Hip, Knee, Ankle, poleDist ), ctrlRadius*0.3, 'z', Color )
+    FKCtrls = [ HipFKCtrl ]
+    for n,fk,radiusScale in [ ( 'Knee', FK[1], 0.3 ), ( 'Ankle', FK[2], 0.7 ), ( 'Ball', FK[3], 0.7 ) ]:
+        FKCtrls += [ jly_maCtrl( Ma, Scope+n+'FK_Ctrl', FKCtrls[-1], Ma['world'][ fk ][0], Ma['world'][ fk ][1], ctrlRadius*radiusScale, 'x', Color ) ]
+        jly_maConnect( Ma, FKCtrls[-1]+'.rotate', fk+'.rotate' )
+
+    # IK ankle control in a space group blended between the SpaceINs by the utility control
+    AnkleCtrlSpace = jly_maGrp( Ma, Scope+'AnkleCtrl_Space', LegCtrlGrp )
+    jly_maBlend( Ma, AnkleCtrlSpace, SpaceINs, [ Util( s+'Space' ) for s in Spaces ] )
+    AnkleCtrl = jly_maCtrl( Ma, Scope+'Ankle_Ctrl', AnkleCtrlSpace, jlyMaIdentity, Ankle, ctrlRadius*0.7, 'y', Color )
+    jly_maSet( Ma, AnkleCtrl+'.rotateOrder', 1 )
+
+    # Hip, knee, ankle and ball blend FK and IK, the IK ankle turns with the ankle control
+    jly_maIkFkBlend( Ma, Util( name+'_FK_IK' ), FK[:4], IK[:4], Bind[:4] )
+    jly_maIK( Ma, Scope+'Hip_Ikh', IK[0], IK[1], IK[2], AnkleCtrl, KneeCtrl )
+    jly_maBlend( Ma, IK[2], [ AnkleCtrl ], [ 1.0 ], translate=False )
+
+    AnkleSpaceOUT = jly_maSpaceOUT( Ma, Bind[2], Scope+'AnkleSpace_OUT' )
+
+    # The FK and IK chains are the guts, All_Ctrl.Show_Guts shows them (jly_maDisplay)
+    Ctrls = FKCtrls + [ KneeCtrl, AnkleCtrl, LegUtilCtrl ]
+    return LegRigGrp, SpaceINs, [ AnkleSpaceOUT ], Bind[:4], Ctrls, [ FK[0], IK[0] ]
+
+
+# Twist joints along the upper and lower bone of a limb, driven by rotateX
+# Upper bone: counter the root's twist, lower bone: spread the end joint's twist
+def jly_maTwist( Ma={}, side='L_', prefix='', joints=['Shld','Elbow','Wrist'], count=3, radius=1.0 ):
+
+    Twists = []
+    Names = [ side+prefix+n+'_Jnt' for n in joints ]
+    # ( bone start, bone end, twist driver )
+    for seg,(first,second,driver) in enumerate( [ ( Names[0], Names[1], Names[0] ), ( Names[1], Names[2], Names[2] ) ] ):
+        FirstRot, FirstPos = Ma['world'][ first ]
+        SecondPos = Ma['world'][ second ][1]
+        for i in range( count ):
+            Fraction = float( i+1 )/( count+1 )
+            Twist = jly_maXform( Ma, 'joint', side+prefix+joints[seg]+'Twist'+str(i+1).zfill(2)+'_Jnt', first, FirstRot, jly_vAdd( FirstPos, jly_vMul( jly_vSub( SecondPos, FirstPos ), Fraction ) ), radius )
+            Mult = jly_maNode( Ma, 'multDoubleLinear', Twist+'_MDL' )
+            # Upper bone: full counter twist near the shoulder, none near the elbow. Lower bone: none near the elbow, full near the wrist
+            jly_maSet( Ma, Mult+'.input2', -( 1.0-Fraction ) if seg == 0 else Fraction )
+            jly_maConnect( Ma, driver+'.rotateX', Mult+'.input1' )
+            jly_maConnect( Ma, Mult+'.output', Twist+'.rotateX' )
+            Twists += [ Twist ]
+
+    return '', [], [], Twists, [], []
+
+
+def jly_maHand( Ma={}, piv={}, rigGrp='', wrist='', side='L_', prefix='', name='Hand', radius=1.0, ctrlRadius=1.5 ):
+
+    Color = jlyTables.jlySideColors[ side ]
+    Scope = side+prefix
+    Pos = lambda n: piv[ Scope+n+'_Piv' ] if side != 'R_' else jly_vMirror( piv[ 'L_'+prefix+n+'_Piv' ] )
+
+    HandRigGrp = jly_maNode( Ma, 'transform', Scope+name+'_Grp', rigGrp )
+    WristSpaceIN = jly_maSpaceIN( Ma, Scope+'Wrist_SpaceIN', HandRigGrp, wrist )
+    HandSkelGrp = jly_maGrp( Ma, Scope+name+'Skel_Grp', WristSpaceIN )
+    HandCtrlGrp = jly_maGrp( Ma, Scope+name+'Ctrl_Grp', WristSpaceIN )
+    BindJoints = []
+    Ctrls = []
+
+    # One chain per finger, Y points towards the finger's Up pivot
+    for finger in [ 'Thumb', 'Index', 'Middle', 'Ring', 'Pinky' ]:
+        Segs = ( [] if finger == 'Thumb' else [ '00' ] ) + [ '01', '02', '03' ]
+        Names = [ Scope+finger+s+'_Jnt' for s in Segs ] + [ Scope+finger+'_end' ]
+        Positions = [ Pos( finger+s ) for s in Segs+['End'] ]
+        Up = jly_vSub( Pos( finger+'Up' ), Positions[0] )
+        Joints = jly_maChain( Ma, Names, Positions, Up, HandSkelGrp, radius )
+        Ctrls += jly_maFKCtrls( Ma, Joints[:-1], HandCtrlGrp, ctrlRadius, Color )
+        BindJoints += Joints[:-1]
+
+    return HandRigGrp, [ WristSpaceIN ], [], BindJoints, Ctrls, []
+
+
+# Half muscle: a joint from root to tip, aimed at the tip locator and stretched by the distance
+# Stretch = root-tip distance / ( RestDistance * root locator world scale ), so Global_Scale does not stretch it
+def jly_maMuscle( Ma={}, piv={}, rigGrp='', rootSpace='', tipSpace='', side='L_', prefix='', name='Thigh01', radius=1.0 ):
+
+    Scope = side+prefix
+    Pos = lambda n: piv[ Scope+name+n+'_Piv' ] if side != 'R_' else jly_vMirror( piv[ 'L_'+prefix+name+n+'_Piv' ] )
+
+    MuscleRigGrp = jly_maNode( Ma, 'transform', Scope+name+'_Grp', rigGrp )
+    RootSpaceIN = jly_maSpaceIN( Ma, Scope+name+'Root_SpaceIN', MuscleRigGrp, rootSpace )
+    TipSpaceIN = jly_maSpaceIN( Ma, Scope+name+'Tip_SpaceIN', MuscleRigGrp, tipSpace )
+
+    RootLoc = jly_maLoc( Ma, Scope+name+'_RLoc', RootSpaceIN, Pos( 'Root' ), radius )
+    TipLoc = jly_maLoc( Ma, Scope+name+'_TLoc', TipSpaceIN, Pos( 'Tip' ), radius )
+    RestDistance = jly_vLen( jly_vSub( Pos( 'Tip' ), Pos( 'Root' ) ) )
+    jly_maAddAttr( Ma, RootLoc, 'RestDistance', 'float', RestDistance, keyable=True )
+
+    Joints = jly_maChain( Ma, [ Scope+name+'_Jnt', Scope+name+'_end' ], [ Pos( 'Root' ), Pos( 'Tip' ) ], jly_vSub( Pos( 'RootUp' ), Pos( 'Root' ) ), RootLoc, radius )
+    jly_maAim( Ma, Joints[0], TipLoc )
+
+    # Both ends are measured on the locators, the joint's own scale never feeds back into the distance
+    Dist = jly_maNode( Ma, 'distanceBetween', Scope+name+'_distanceBetween' )
+    Decomp = jly_maNode( Ma, 'decomposeMatrix', Scope+name+'_decomposeMatrix' )
+    Ratio = jly_maNode( Ma, 'multiplyDivide', Scope+name+'_multiplyDivide' )
+    RestScaled = jly_maNode( Ma, 'multiplyDivide', Scope+name+'4scale_multiplyDivide' )
+    jly_maConnect( Ma, RootLoc+'.worldMatrix[0]', Dist+'.inMatrix1' )
+    jly_maConnect( Ma, TipLoc+'.worldMatrix[0]', Dist+'.inMatrix2' )
+    jly_maConnect( Ma, RootLoc+'.worldMatrix[0]', Decomp+'.inputMatrix' )
+    jly_maConnect( Ma, Decomp+'.outputScaleX', RestScaled+'.input1X' )
+    jly_maConnect( Ma, RootLoc+'.RestDistance', RestScaled+'.input2X' )
+    jly_maSet( Ma, Ratio+'.operation', 2 )
+    jly_maConnect( Ma, Dist+'.distance', Ratio+'.input1X' )
+    jly_maConnect( Ma, RestScaled+'.outputX', Ratio+'.input2X' )
+    jly_maConnect( Ma, Ratio+'.outputX', Joints[0]+'.scaleX' )
+
+    return MuscleRigGrp, [ RootSpaceIN, TipSpaceIN ], [], Joints[:1], [], []
+
+
+def jly_maEye( Ma={}, piv={}, rigGrp='', head='', side='L_', prefix='', name='Eye', radius=1.0, ctrlRadius=6.0 ):
+
+    Scope = side+prefix
+    Pos = piv[ Scope+'Eye_Piv' ] if side != 'R_' else jly_vMirror( piv[ 'L_'+prefix+'Eye_Piv' ] )
+
+    EyeRigGrp = jly_maNode( Ma, 'transform', Scope+name+'Rig_Grp', rigGrp )
+    EyeSpaceIN = jly_maSpaceIN( Ma, Scope+name+'Space_IN', EyeRigGrp, head )
+    EyeLoc = jly_maLoc( Ma, Scope+name+'_Loc', EyeSpaceIN, Pos, radius )
+    # Eye joint at the locator, the control in front of it (+Z) turns it
+    EyeJnt = jly_maXform( Ma, 'joint', Scope+name+'_Jnt', EyeLoc, jlyMaIdentity, Pos, radius )
+    EyeCtrl = jly_maCtrl( Ma, Scope+name+'_Ctrl', EyeLoc, jlyMaIdentity, jly_vAdd( Pos, (0,0,ctrlRadius) ), ctrlRadius*0.3, 'z', jlyTables.jlySideColors[ side ] )
+    jly_maConnect( Ma, EyeCtrl+'.rotate', EyeJnt+'.rotate' )
+
+    return EyeRigGrp, [ EyeSpaceIN ], [], [ EyeJnt ], [ EyeCtrl ], []
+
+
+# ---------------------------------------------------------------------------------------
+# Compile
+
+# Layout: the default pivots of jlyTables + the spec's pivots ('t' only), as tuples
+# Two spine pivots and one neck pivot, at the guide points like SpineCount=2, NeckCount=1 in the creation script
+def jly_maLayout( spec={} ):
+    Pivots = { name: tuple( values['t'] ) for name,values in jlyTables.jlyDefaultPivots.items() }
+    for i,pos in enumerate( jlyTables.jlySpineGuides[1:-1] ):
+        Pivots[ 'Spine'+str(i+1).zfill(2)+'_Piv' ] = tuple( pos )
+    Pivots[ 'Neck01_Piv' ] = tuple( jlyTables.jlyNeckGuides[0] )
+    for name,values in spec.get( 'pivots', {} ).items():
+        if 't' in values:
+            Pivots[ name ] = tuple( float(v) for v in values['t'] )
+    return Pivots
+
+
+# Modules to write, in jlyTables.jlyBipedModules order: the spec's 'modules', or every module the compiler can write
+# Raises ValueError for an unknown module, a module the compiler cannot write, or one without the modules it sits on
+def jly_maModuleList( spec={} ):
+
+    Kinds = { name: kind for name,kind,builder in jlyTables.jlyBipedModules }
+    Wanted = spec.get( 'modules' ) or [ name for name,kind,builder in jlyTables.jlyBipedModules if kind in jlyMaModuleKinds ]
+
+    Unknown = [ name for name in Wanted if name not in Kinds ]
+    if Unknown:
+        raise ValueError( 'unknown modules '+str( Unknown )+', the modules are in jlyTables.jlyBipedModules' )
+    Unsupported = [ name for name in Wanted if Kinds[ name ] not in jlyMaModuleKinds ]
+    if Unsupported:
+        raise ValueError( 'the compiler cannot write '+str( Unsupported )+', build them in Maya (Biped_AutoRig_Creation.py)' )
+    Missing = [ name+' needs '+need for name in Wanted for need in jly_maNeeds( name, Kinds[ name ] ) if need not in Wanted ]
+    if Missing:
+        raise ValueError( 'missing modules: '+', '.join( Missing ) )
+
+    return [ ( name, kind, builder ) for name,kind,builder in jlyTables.jlyBipedModules if name in Wanted ]
+
+
+# Keep a module's outputs and register them on Rig_Meta
+def jly_maModule( Ma={}, modules={}, moduleName='', builder='', rigRet=() ):
+    modules[ moduleName ] = rigRet
+    jly_maRegister( Ma, moduleName, rigRet, builder )
+    return rigRet
+
+
+# All_Ctrl display switches, for every module: Show_Controls -> the control shapes, Show_Guts -> the guts,
+# Bone_Draw_Style -> the bind joints' drawStyle (same enum order). All_Ctrl itself always stays visible
+def jly_maDisplay( Ma={}, allCtrl='All_Ctrl', modules={} ):
+
+    for rigRet in modules.values():
+        for ctrl in rigRet[4]:
+            if ctrl != allCtrl:
+                jly_maConnect( Ma, allCtrl+'.Show_Controls', ctrl+'Shape.visibility' )
+        for guts in rigRet[5]:
+            jly_maConnect( Ma, allCtrl+'.Show_Guts', guts+'.visibility' )
+        for jnt in rigRet[3]:
+            jly_maConnect( Ma, allCtrl+'.Bone_Draw_Style', jnt+'.drawStyle' )
+
+
+# Write the biped into one .ma file, returns the module outputs and the write stats
+# Modules are built and registered in the same order as Biped_AutoRig_Creation.py (jlyTables.jlyBipedModules)
+def jly_compileRig( spec={}, path='' ):
+
+    ModuleList = jly_maModuleList( spec )
+    Piv = jly_maLayout( spec )
+    Label = spec.get( 'rigName', spec.get( 'name', 'RigName' ) ).replace( ' ', '' )
+    Ma = jly_maOpen( path or spec.get( 'maOutput', Label+'_Rig.ma' ), spec.get( 'mayaVersion', '2022' ) )
+    Modules = {}
+    Outs = {}
+
+    for moduleName,kind,builder in ModuleList:
+        side = moduleName[:2] if moduleName[:2] in [ 'L_', 'R_' ] else ''
+        if kind == 'Base':
+            RigRet = jly_maBase( Ma, Piv, Label )
+            RigGrp = RigRet[0]
+            Outs['Cog'], Outs['All'] = RigRet[2]
+        elif kind == 'Torso':
+            RigRet = jly_maTorso( Ma, Piv, RigGrp, Outs['Cog'] )
+            # Torso SpaceOUTs by bind joint
+            TorsoOUTs = dict( zip( RigRet[3], RigRet[2] ) )
+            Outs['Pelvis'], Outs['Chest'], Outs['Head'] = TorsoOUTs['Pelvis_Jnt'], TorsoOUTs['Chest_Jnt'], TorsoOUTs['Head_Jnt']
+        elif kind == 'Arm':
+            RigRet = jly_maArm( Ma, Piv, RigGrp, side, '', 'Arm', [ Outs[s] for s in jly_maSpaces( 'Arm' ) ], 2.0, 10.0, 30.0 )
+        elif kind == 'Leg':
+            RigRet = jly_maLeg( Ma, Piv, RigGrp, side, '', 'Leg', [ Outs[s] for s in jly_maSpaces( 'Leg' ) ], 2.0, 15.0, 40.0 )
+        elif kind == 'Twist':
+            RigRet = jly_maTwist( Ma, side, '', [ 'Shld', 'Elbow', 'Wrist' ] if moduleName == side+'ArmTwist' else [ 'Hip', 'Knee', 'Ankle' ] )
+        elif kind == 'Hand':
+            RigRet = jly_maHand( Ma, Piv, RigGrp, Modules[ side+'Arm' ][2][0], side )
+        elif kind == 'HalfMuscle':
+            # The muscle tips follow the last upper leg twist joint, like the rig made in Maya
+            if side+'HipTwist' not in Outs:
+                Outs[ side+'HipTwist' ] = jly_maSpaceOUT( Ma, side+'HipTwist03_Jnt' )
+            RigRet = jly_maMuscle( Ma, Piv, RigGrp, Outs['Pelvis'], Outs[ side+'HipTwist' ], side, '', moduleName[2:] )
+        elif kind == 'Eye':
+            RigRet = jly_maEye( Ma, Piv, RigGrp, Outs['Head'], side )
+        jly_maModule( Ma, Modules, moduleName, builder, RigRet )
+
+    jly_maDisplay( Ma, 'All_Ctrl', Modules )
+    Stats = jly_maClose( Ma )
+    return Modules, Stats
+
+
+# ---------------------------------------------------------------------------------------
+# Command Line
+
+def jly_compileMain( argv=None ):
+
+    Parser = argparse.ArgumentParser( description='Write biped rigs straight to Maya ASCII files, without Maya.' )
+    Parser.add_argument( 'specs', nargs='?', default='', help='JSON file with one spec or a list of specs, empty: default layout' )
+    Parser.add_argument( '--output', default='', help='output .ma file (single spec only)' )
+    Args = Parser.parse_args( argv )
+
+    Specs = [ {} ]
+    if Args.specs:
+        with open( Args.specs ) as f:
+            Specs = json.load( f )
+        if isinstance( Specs, dict ):
+            Specs = [ Specs ]
+
+    for spec in Specs:
+        Modules, Stats = jly_compileRig( spec, Args.output if len( Specs ) == 1 else '' )
+        print( Stats['path']+': '+str(len(Modules))+' modules, '+str(Stats['nodes'])+' nodes, '+str(Stats['lines'])+' lines in '+str(Stats['seconds'])+'s ('+str(Stats['nodesPerSecond'])+' nodes/s)' )
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit( jly_compileMain() )
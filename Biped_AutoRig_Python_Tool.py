@@ -31,11 +31,953 @@ import sys; sys.dont_write_bytecode=True
 import maya.cmds as cmds
 import importlib
 import maya.api.OpenMaya as om
+import numpy as np
+import json
+import os
+import time
 
 import den_Utilities_v12 as denUt
 importlib.reload(denUt)
 print(denUt.__file__)
 
+# Pivot layout, schemas and module tables, shared with the MA compiler
+import Biped_AutoRig_Tables as jlyTables
+importlib.reload(jlyTables)
+
+
+# ---------------------------------------------------------------------------------------
+# Control Shape Cache
+
+# Every control shape type and size is built once with its den_Make* function, after that the curve data is copied
+# Key: (den_Make* function name, its arguments except nodeName), value: the recorded curves and channel states
+jlyCtrlShapeCache = {}
+
+# Channel states of a new transform: ( value, locked, keyable, in channel box when not keyable ), copies skip channels still at these
+jlyCtrlChannelDefaults = { attr: ( 1.0 if attr[0] == 's' else 0.0, False, True, False ) for attr in [ 'tx','ty','tz', 'rx','ry','rz', 'sx','sy','sz' ] }
+jlyCtrlChannelDefaults[ 'v' ] = ( True, False, True, False )
+
+# Record a control made by a den_Make* function: every curve shape (CVs, knots, degree, periodic), and the transform channels
+# Plain tuples and lists, so the copies are made with cmds.curve and stay on the undo queue
+def jly_captureCtrlShape( ctrl='' ):
+    
+    # den_Make* functions can return a name or a list, remember which one so the copies return the same
+    IsList = isinstance( ctrl, list )
+    CtrlName = ctrl[0] if IsList else ctrl
+    
+    # Get the control as a DAG path, to read the shapes with the API
+    SelList = om.MSelectionList()
+    SelList.add( CtrlName )
+    CtrlPath = SelList.getDagPath( 0 )
+    # Read every curve shape under the control
+    Shapes = []
+    for i in range( CtrlPath.childCount() ):
+        Child = CtrlPath.child( i )
+        if Child.hasFn( om.MFn.kNurbsCurve ):
+            CurveFn = om.MFnNurbsCurve( Child )
+            Cvs = [ ( p.x, p.y, p.z ) for p in CurveFn.cvPositions( om.MSpace.kObject ) ]
+            Shapes += [ ( Cvs, list( CurveFn.knots() ), CurveFn.degree, CurveFn.form == om.MFnNurbsCurve.kPeriodic ) ]
+    
+    # Read the transform channels: value, lock, keyable, channel box (den_Make* functions may move or lock them)
+    Channels = []
+    for attr in [ 'tx','ty','tz', 'rx','ry','rz', 'sx','sy','sz', 'v' ]:
+        Plug = CtrlName+'.'+attr
+        Channels += [ ( attr, cmds.getAttr( Plug ), cmds.getAttr( Plug, lock=True ), cmds.getAttr( Plug, keyable=True ), cmds.getAttr( Plug, channelBox=True ) ) ]
+    
+    return { 'isList': IsList, 'shapes': Shapes, 'channels': Channels }
+
+
+# Make a new control from recorded curve data, instead of building the shape again
+# Only cmds calls, so ctrl+z takes the copy off like any other node the builder makes
+def jly_copyCtrlShape( data={}, nodeName='Ctrl' ):
+    
+    # The first curve makes the control (transform and <nodeName>Shape), the others are moved under it
+    CtrlName = ''
+    for i,(cvs,knots,degree,periodic) in enumerate( data['shapes'] ):
+        Curve = cmds.curve( name=nodeName, degree=degree, point=cvs, knot=knots, periodic=periodic )
+        if not CtrlName:
+            CtrlName = Curve
+            continue
+        Shape = cmds.listRelatives( Curve, shapes=True, fullPath=True )[0]
+        Shape = cmds.parent( Shape, CtrlName, shape=True, relative=True )[0]
+        cmds.rename( Shape, nodeName+'Shape'+str(i) )
+        cmds.delete( Curve )
+    # No curves recorded: an empty transform
+    if not CtrlName:
+        CtrlName = cmds.createNode( 'transform', name=nodeName )
+    
+    # Copy only the channels that are not at a new transform's defaults
+    for attr,value,locked,keyable,channelBox in data['channels']:
+        Default = jlyCtrlChannelDefaults[ attr ]
+        if ( value, locked, keyable, channelBox and not keyable ) == Default:
+            continue
+        Plug = CtrlName+'.'+attr
+        # Values first, then the lock/keyable/channel box states
+        if value != Default[0]:
+            cmds.setAttr( Plug, value )
+        cmds.setAttr( Plug, keyable=keyable )
+        if not keyable:
+            cmds.setAttr( Plug, channelBox=channelBox )
+        cmds.setAttr( Plug, lock=locked )
+    
+    # Leave the new control selected, same as den_Make* functions, so den_ColorShapeRGB/jly_lock work on it next
+    cmds.select( CtrlName )
+    
+    if data['isList']:
+        return [ CtrlName ]
+    return CtrlName
+
+
+# Use this instead of calling den_MakeBall, den_MakeSpike, den_MakeCube, den_MakePole, den_MakeGear, den_MakeArrowR directly
+# makeFunc: the den_Make* function, the other arguments are passed to it (the first time only)
+def jly_makeCachedCtrl( makeFunc=None, nodeName='Ctrl', **kwargs ):
+    
+    # Same function and same arguments give the same shape, only the name changes
+    Key = ( makeFunc.__name__, tuple( sorted( [ (k, repr(v)) for k,v in kwargs.items() ] ) ) )
+    
+    # First time: build it the normal way, and record it
+    if Key not in jlyCtrlShapeCache:
+        Ctrl = makeFunc( nodeName=nodeName, **kwargs )
+        jlyCtrlShapeCache[ Key ] = jly_captureCtrlShape( Ctrl )
+        return Ctrl
+    
+    # After that: copy the recorded curves
+    return jly_copyCtrlShape( jlyCtrlShapeCache[ Key ], nodeName )
+
+
+# ---------------------------------------------------------------------------------------
+# Node Handle Registry
+
+# Builders register the nodes they make here, and look them up here instead of resolving name strings again
+# Key: (scope, role), scope is side+prefix of the character part, role is the node name without the scope (e.g. 'Elbow_IK')
+# Value: MObjectHandle, it stays valid through renames and reparenting, and knows when the node is deleted
+jlyNodeHandles = globals().get( 'jlyNodeHandles', {} )
+
+# Register a node (name, or MObject) under a role, returns the node name so it can wrap the creating call
+def jly_registerHandle( scope='', role='', node='' ):
+    
+    if isinstance( node, om.MObject ):
+        Obj = node
+    else:
+        # Resolve the name one time
+        SelList = om.MSelectionList()
+        SelList.add( node )
+        Obj = SelList.getDependNode( 0 )
+    jlyNodeHandles[ (scope, role) ] = om.MObjectHandle( Obj )
+    
+    return node
+
+
+# Get a registered node as an MObject, None if it was never registered or it has been deleted
+def jly_getHandleObj( scope='', role='' ):
+    
+    Handle = jlyNodeHandles.get( (scope, role) )
+    if Handle is None:
+        return None
+    # Forget deleted nodes
+    if not Handle.isValid():
+        del jlyNodeHandles[ (scope, role) ]
+        return None
+    
+    return Handle.object()
+
+
+# Get a registered node's current name, shortest unique DAG path for DAG nodes, '' if it is not registered
+def jly_getHandleName( scope='', role='' ):
+    
+    Obj = jly_getHandleObj( scope, role )
+    if Obj is None:
+        return ''
+    if Obj.hasFn( om.MFn.kDagNode ):
+        return om.MDagPath.getAPathTo( Obj ).partialPathName()
+    
+    return om.MFnDependencyNode( Obj ).name()
+
+
+# Forget all handles of one scope (when a character part is deleted or rebuilt), or every handle if scope is None
+def jly_clearHandles( scope=None ):
+    
+    for Key in list( jlyNodeHandles ):
+        if scope is None or Key[0] == scope:
+            del jlyNodeHandles[ Key ]
+
+
+# Duplicate a registered joint chain, rename the copies by walking the new hierarchy with the API
+# Each copy gets its name suffix replaced (L_Elbow_Jnt -> L_Elbow_IK), and is registered under its new role
+# Returns the new joint names in chain order, root first
+def jly_duplicateChain( scope='L_', rootRole='Shld_Jnt', suffix='_IK' ):
+    
+    RootObj = jly_getHandleObj( scope, rootRole )
+    if RootObj is None:
+        print( 'ERROR - '+scope+rootRole+' is not registered, cannot duplicate its chain' )
+        return []
+    RootPath = om.MDagPath.getAPathTo( RootObj )
+    
+    # Duplicate from the full path, so another character with the same names does not matter
+    NewRole = rootRole.rsplit( '_', 1 )[0]+suffix
+    NewRoot = cmds.duplicate( RootPath.fullPathName(), name=scope+NewRole )[0]
+    jly_registerHandle( scope, NewRole, NewRoot )
+    ChainPath = om.MDagPath.getAPathTo( jly_getHandleObj( scope, NewRole ) )
+    Chain = [ ChainPath.partialPathName() ]
+    
+    # Follow the joint children down the chain
+    while True:
+        ChildPath = None
+        for i in range( ChainPath.childCount() ):
+            if ChainPath.child( i ).hasFn( om.MFn.kJoint ):
+                ChildPath = om.MDagPath.getAPathTo( ChainPath.child( i ) )
+                break
+        if ChildPath is None:
+            break
+        # Rename it by its full path, the role comes from its old short name
+        OldRole = om.MFnDagNode( ChildPath ).name()
+        if OldRole.startswith( scope ):
+            OldRole = OldRole[ len(scope): ]
+        NewRole = OldRole.rsplit( '_', 1 )[0]+suffix
+        cmds.rename( ChildPath.fullPathName(), scope+NewRole )
+        jly_registerHandle( scope, NewRole, ChildPath.node() )
+        Chain += [ ChildPath.partialPathName() ]
+        ChainPath = ChildPath
+    
+    return Chain
+
+
+# ---------------------------------------------------------------------------------------
+# Attribute Schema
+
+# An attribute schema is a list of attribute entries for one control, all of them are added in one MDGModifier
+# Entry keys: name, type ('double', 'float', 'enum', 'float3'), default, min, max, enum ('a:b:c'), keyable, channelBox,
+# children (float3 only, list of child entries), usedAsColor (float3 only)
+# Names can use {side}, {prefix} and {name}, they are filled in by jly_addAttrSchema
+
+# The schemas are kept in Biped_AutoRig_Tables.py, the MA compiler adds the same entries
+jlyAllCtrlSchema = jlyTables.jlyAllCtrlSchema
+jlyArmUtilSchema = jlyTables.jlyArmUtilSchema
+jlyLegUtilSchema = jlyTables.jlyLegUtilSchema
+jlyFootUtilSchema = jlyTables.jlyFootUtilSchema
+
+# Schema type -> numeric data type
+jlyAttrNumericTypes = { 'double': om.MFnNumericData.kDouble, 'float': om.MFnNumericData.kFloat }
+
+
+# Make one attribute object from a schema entry (not added to a node yet)
+def jly_makeAttrObj( entry={}, name='' ):
+    
+    Type = entry.get( 'type', 'double' )
+    if Type == 'enum':
+        FnAttr = om.MFnEnumAttribute()
+        AttrObj = FnAttr.create( name, name, int( entry.get( 'default', 0 ) ) )
+        for i,field in enumerate( entry['enum'].split( ':' ) ):
+            FnAttr.addField( field, i )
+    elif Type == 'float3':
+        # Children are made from the default, <name>R/G/B like cmds.addAttr -at float3 with float children
+        Default = entry.get( 'default', (0.0,0.0,0.0) )
+        Children = [ jly_makeAttrObj( { 'type': 'float', 'default': Default[i] }, name+axis ) for i,axis in enumerate( 'RGB' ) ]
+        FnAttr = om.MFnNumericAttribute()
+        AttrObj = FnAttr.create( name, name, Children[0], Children[1], Children[2] )
+        FnAttr.usedAsColor = entry.get( 'usedAsColor', False )
+    elif Type in jlyAttrNumericTypes:
+        FnAttr = om.MFnNumericAttribute()
+        AttrObj = FnAttr.create( name, name, jlyAttrNumericTypes[ Type ], entry.get( 'default', 0.0 ) )
+        if 'min' in entry:
+            FnAttr.setMin( entry['min'] )
+        if 'max' in entry:
+            FnAttr.setMax( entry['max'] )
+    else:
+        print( 'ERROR - attribute type '+str(Type)+' is not in the schema types' )
+        return None
+    
+    FnAttr.keyable = entry.get( 'keyable', False )
+    FnAttr.channelBox = entry.get( 'channelBox', False ) and not FnAttr.keyable
+    FnAttr.storable = True
+    
+    return AttrObj
+
+
+# Add every attribute of a schema to a node in one MDGModifier, attributes the node has already are skipped
+# Fill in the names with side/prefix/name, returns the node.attr names in schema order
+def jly_addAttrSchema( node='', schema=[], side='', prefix='', name='' ):
+    
+    # Take the control list the den_Make* functions return, or a name
+    Node = cmds.ls( node )[0]
+    SelList = om.MSelectionList()
+    SelList.add( Node )
+    NodeObj = SelList.getDependNode( 0 )
+    FnNode = om.MFnDependencyNode( NodeObj )
+    
+    DG = om.MDGModifier()
+    Attrs = []
+    for entry in schema:
+        AttrName = entry['name'].format( side=side, prefix=prefix, name=name )
+        Attrs += [ Node+'.'+AttrName ]
+        if FnNode.hasAttribute( AttrName ):
+            print( 'WARNING - '+Node+'.'+AttrName+' already exists, skipped' )
+            continue
+        AttrObj = jly_makeAttrObj( entry, AttrName )
+        if AttrObj is not None:
+            DG.addAttribute( NodeObj, AttrObj )
+    DG.doIt()
+    
+    return Attrs
+
+
+# ---------------------------------------------------------------------------------------
+# Lock Table
+
+# Builders do not lock channels while they build, jly_lock/jly_lockAttr write what each node should end up with
+# in the lock table, and jly_applyLocks sets the whole table in one pass at the end of the builder.
+# A control that is unlocked, reparented and locked again only has its last state in the table.
+# Nodes are kept as MObjectHandles, so renames and reparenting after jly_lock do not matter.
+# The table is keyed on the handle's hashCode, which is not unique, so each key holds a list of [ handle, channels ] entries
+jlyLockChannels = [ 'translateX','translateY','translateZ', 'rotateX','rotateY','rotateZ', 'scaleX','scaleY','scaleZ', 'visibility' ]
+jlyLockTable = globals().get( 'jlyLockTable', {} )
+# Module name -> what jly_applyLocks set (or would set in a dry run), { node: { channel: locked } }
+jlyLockAudit = globals().get( 'jlyLockAudit', {} )
+# Dry run: jly_applyLocks only works out the diff and does not lock anything, see jly_setLockDryRun
+jlyLockDryRun = globals().get( 'jlyLockDryRun', False )
+
+# Same arguments as den_Lock: 1 locks and hides the channel, 0 leaves it unlocked and keyable
+# nodes=[]: the selected nodes, like den_Lock
+def jly_lock( tx=0,ty=0,tz=0, rx=0,ry=0,rz=0, sx=0,sy=0,sz=0, v=0, nodes=[] ):
+    
+    if nodes:
+        SelList = om.MSelectionList()
+        for node in cmds.ls( nodes ):
+            SelList.add( node )
+    else:
+        SelList = om.MGlobal.getActiveSelectionList()
+    
+    for i in range( SelList.length() ):
+        Handle = om.MObjectHandle( SelList.getDependNode( i ) )
+        Bucket = jlyLockTable.setdefault( Handle.hashCode(), [] )
+        # Nodes with the same hashCode are told apart by their MObject
+        Entry = next( ( e for e in Bucket if e[0].object() == Handle.object() ), None )
+        if Entry is None:
+            Entry = [ Handle, {} ]
+            Bucket += [ Entry ]
+        Entry[1].update( dict( zip( jlyLockChannels, [ bool(x) for x in (tx,ty,tz, rx,ry,rz, sx,sy,sz, v) ] ) ) )
+
+
+# Same arguments as den_LockAttr: translate, rotate, scale, visibility, True locks all 3 axes
+def jly_lockAttr( t=False, r=False, s=False, v=False, nodes=[] ):
+    
+    jly_lock( t,t,t, r,r,r, s,s,s, v, nodes=nodes )
+
+
+# Dry run on/off for the next builds
+def jly_setLockDryRun( dryRun=False ):
+    
+    global jlyLockDryRun
+    jlyLockDryRun = dryRun
+
+
+# Compare the lock table with the scene, returns [ ( node.channel, (locked, keyable) now, (locked, keyable) wanted ), ... ]
+def jly_lockDiff( table={} ):
+    
+    Diff = []
+    for handle,channels in [ e for bucket in table.values() for e in bucket ]:
+        if not handle.isValid():
+            continue
+        FnNode = om.MFnDependencyNode( handle.object() )
+        Name = jly_txnNodeName( handle )
+        for channel,locked in channels.items():
+            if not FnNode.hasAttribute( channel ):
+                continue
+            Plug = FnNode.findPlug( channel, False )
+            Now = ( Plug.isLocked, Plug.isKeyable )
+            Wanted = ( locked, not locked )
+            if Now != Wanted:
+                Diff += [ ( Name+'.'+channel, Now, Wanted ) ]
+    
+    return Diff
+
+
+# Set the whole lock table in one pass (MPlug lock/keyable/channel box), then empty it
+# module: name for the audit, dryRun=None: use jlyLockDryRun. Returns the diff
+def jly_applyLocks( module='', dryRun=None ):
+    
+    if dryRun is None:
+        dryRun = jlyLockDryRun
+    Table = dict( jlyLockTable )
+    jlyLockTable.clear()
+    Diff = jly_lockDiff( Table )
+    
+    # What the module leaves locked, by current node name
+    jlyLockAudit[ module ] = { jly_txnNodeName( h ): dict( c ) for bucket in Table.values() for h,c in bucket if h.isValid() }
+    
+    if dryRun:
+        print( 'Lock dry run '+module+': '+str( len(Diff) )+' channels would change' )
+        for plug,now,wanted in Diff:
+            print( '    '+plug+' locked '+str(now[0])+' -> '+str(wanted[0]) )
+        return Diff
+    
+    SelList = om.MSelectionList()
+    for plug,now,wanted in Diff:
+        SelList.add( plug )
+    for i,(plug,now,wanted) in enumerate( Diff ):
+        Plug = SelList.getPlug( i )
+        # Unlock first, keyable and channel box can not change on a locked plug
+        Plug.isLocked = False
+        Plug.isKeyable = wanted[1]
+        Plug.isChannelBox = False
+        Plug.isLocked = wanted[0]
+    
+    return Diff
+
+
+# ---------------------------------------------------------------------------------------
+# Pivot Snapshot
+
+# Read the world matrix of every pivot/locator a builder needs in one API pass, instead of one cmds.xform per pivot
+# Returns { 'index': name -> row, 'matrices': (n,4,4) array, 'rotateOrders': (n,) array }, rows are Maya matrices (translate in row 3)
+def jly_snapshotPivots( names=[] ):
+    
+    # Put all the pivots in one selection list, skip repeats and missing names
+    SelList = om.MSelectionList()
+    Found = []
+    for name in dict.fromkeys( names ):
+        try:
+            SelList.add( name )
+        except RuntimeError:
+            print( 'WARNING - '+name+' does not exist, it is not in the pivot snapshot' )
+            continue
+        Found += [ name ]
+    
+    Matrices = np.empty( ( len(Found), 4, 4 ) )
+    RotateOrders = np.zeros( len(Found), dtype=int )
+    for i in range( len(Found) ):
+        Path = SelList.getDagPath( i )
+        Matrices[i] = np.array( list( Path.inclusiveMatrix() ) ).reshape( 4, 4 )
+        RotateOrders[i] = om.MFnDependencyNode( Path.node() ).findPlug( 'rotateOrder', False ).asShort()
+    
+    return { 'index': { name:i for i,name in enumerate(Found) }, 'matrices': Matrices, 'rotateOrders': RotateOrders }
+
+
+# World position of a pivot from the snapshot, same as cmds.xform( name, ws=True, q=True, t=True )
+def jly_snapPos( snapshot={}, name='' ):
+    
+    return snapshot['matrices'][ snapshot['index'][name], 3, :3 ].tolist()
+
+
+# World rotation of a pivot from the snapshot, same as cmds.xform( name, ws=True, q=True, ro=True )
+def jly_snapRot( snapshot={}, name='' ):
+    
+    i = snapshot['index'][name]
+    Rot = om.MTransformationMatrix( om.MMatrix( snapshot['matrices'][i].flatten().tolist() ) ).rotation()
+    # Express it in the pivot's own rotate order, like xform does
+    Rot.reorderIt( int( snapshot['rotateOrders'][i] ) )
+    
+    return [ np.degrees( Rot.x ), np.degrees( Rot.y ), np.degrees( Rot.z ) ]
+
+
+# ---------------------------------------------------------------------------------------
+# Pole Vector Solver
+
+# Limb chains: root, mid, end pivot, the pole name, and the way the pole goes when the limb is straight
+# The pole name is side+prefix+pole, it is not a node, it is added to a pivot snapshot by jly_addPoles
+jlyPoleChains = [
+    ( 'Shld_Piv', 'Elbow_Piv', 'Wrist_Piv', 'ElbowPole', (0,0,-1) ),
+    ( 'Hip_Piv', 'Knee_Piv', 'Ankle_Piv', 'KneePole', (0,0,1) ),
+]
+
+# Pole positions for many limbs at once, roots/mids/ends are (N,3) arrays, dist is one number or one per limb
+# The pole sits dist away from the root-end mid point, straight out towards the mid joint, on the limb plane
+# (where the old mid locator, point constrained between root and end and aimed at the end, put its pole child)
+def jly_solvePoles( roots=[], mids=[], ends=[], dist=20.0, fallback=(0,0,1) ):
+    
+    Roots = np.atleast_2d( np.asarray( roots, dtype=float ) )
+    Mids = np.atleast_2d( np.asarray( mids, dtype=float ) )
+    Ends = np.atleast_2d( np.asarray( ends, dtype=float ) )
+    Dist = np.broadcast_to( np.asarray( dist, dtype=float ), ( len(Roots), ) )
+    Fallback = np.broadcast_to( np.asarray( fallback, dtype=float ), Roots.shape )
+    
+    # Root to end axis, and the mid joint's offset from it
+    Axis = Ends - Roots
+    AxisLen = np.linalg.norm( Axis, axis=1 )
+    AxisLen[ AxisLen < 1e-9 ] = 1.0
+    AxisDir = Axis / AxisLen[:,None]
+    Center = ( Roots + Ends ) * 0.5
+    Out = Mids - Center
+    Out -= AxisDir * np.sum( Out*AxisDir, axis=1 )[:,None]
+    
+    # A straight limb has no plane: use the fallback direction, off the axis
+    OutLen = np.linalg.norm( Out, axis=1 )
+    Straight = OutLen < 1e-6
+    if Straight.any():
+        print( 'WARNING - '+str( int(Straight.sum()) )+' limb(s) are straight, their pole uses the fallback direction' )
+        Side = Fallback[Straight] - AxisDir[Straight] * np.sum( Fallback[Straight]*AxisDir[Straight], axis=1 )[:,None]
+        Out[Straight] = Side
+        OutLen[Straight] = np.linalg.norm( Side, axis=1 )
+    OutLen[ OutLen < 1e-9 ] = 1.0
+    
+    return Center + Out / OutLen[:,None] * Dist[:,None]
+
+
+# Add the pole of every limb chain in a pivot snapshot, all limbs solved in one jly_solvePoles call
+# Poles go in the snapshot as side+prefix+pole (e.g. 'L_ElbowPole'), so jly_snapPos reads them like pivots
+def jly_addPoles( snapshot={}, dist=20.0 ):
+    
+    Index = snapshot['index']
+    Rows = []
+    for root,mid,end,pole,fallback in jlyPoleChains:
+        for name in Index:
+            Scope = name[ :-len(root) ]
+            if name.endswith( root ) and Scope+mid in Index and Scope+end in Index:
+                Rows += [ ( Index[name], Index[Scope+mid], Index[Scope+end], Scope+pole, fallback ) ]
+    if not Rows:
+        return snapshot
+    
+    Positions = snapshot['matrices'][:,3,:3]
+    Poles = jly_solvePoles( Positions[ [ r[0] for r in Rows ] ], Positions[ [ r[1] for r in Rows ] ], Positions[ [ r[2] for r in Rows ] ], dist=dist, fallback=[ r[4] for r in Rows ] )
+    
+    # Poles have no rotation
+    PoleMatrices = np.tile( np.identity(4), ( len(Rows), 1, 1 ) )
+    PoleMatrices[:,3,:3] = Poles
+    Count = len( Index )
+    Snap = {
+        'index': dict( Index, **{ r[3]: Count+i for i,r in enumerate(Rows) } ),
+        'matrices': np.concatenate( [ snapshot['matrices'], PoleMatrices ] ),
+        'rotateOrders': np.concatenate( [ snapshot['rotateOrders'], np.zeros( len(Rows), dtype=int ) ] ),
+    }
+    
+    return Snap
+
+
+# Pivot group of each pole's limb, e.g. 'L_'+'ArmPiv_Grp'
+jlyPoleGroups = { 'ElbowPole': 'ArmPiv_Grp', 'KneePole': 'LegPiv_Grp' }
+
+# Solve the poles of every limb of every scope in one pass, before any limb is built: one snapshot of all the chain pivots
+# and pivot groups, one jly_solvePoles call (jly_addPoles). A scaleX -1 pivot group is set back to 1 by its builder
+# before it reads the pivots, so those poles are moved the same way, into the space the builder sees
+# Returns { side+prefix+pole: position }, e.g. { 'L_ElbowPole': [x,y,z] }, for the poles argument of the arm and leg builders
+def jly_limbPoles( scopes=['L_','R_'], dist=20.0 ):
+    
+    Names = [ scope+n for scope in scopes for chain in jlyPoleChains for n in chain[:3]+( jlyPoleGroups[ chain[3] ], ) ]
+    Snap = jly_addPoles( jly_snapshotPivots( Names ), dist=dist )
+    
+    # Scale -1 on the group's own X axis
+    Flip = np.diag( [ -1.0, 1.0, 1.0, 1.0 ] )
+    Poles = {}
+    for scope in scopes:
+        for chain in jlyPoleChains:
+            Pole = scope+chain[3]
+            Group = scope+jlyPoleGroups[ chain[3] ]
+            if Pole not in Snap['index']:
+                continue
+            Pos = np.append( Snap['matrices'][ Snap['index'][Pole], 3, :3 ], 1.0 )
+            if Group in Snap['index']:
+                G = Snap['matrices'][ Snap['index'][Group] ]
+                if np.linalg.det( G[:3,:3] ) < 0:
+                    Pos = Pos @ np.linalg.inv( G ) @ Flip @ G
+            Poles[ Pole ] = Pos[:3].tolist()
+    
+    return Poles
+
+
+# ---------------------------------------------------------------------------------------
+# Mirror Pivots
+
+# Symmetric mode: the R_ pivot groups keep scale 1, and the R_ pivots get world transforms mirrored from the L_ ones
+# Mirror across the YZ plane, keep a positive scale: flip the X column (position and axes), then negate the three axes
+# ( M' = N * M * S, N = diag(-1,-1,-1,1), S = diag(-1,1,1,1) ), done on all pivots at once
+jlyMirrorSign = np.outer( [-1.0,-1.0,-1.0,1.0], [-1.0,1.0,1.0,1.0] )
+
+# names: pivot names without the side, e.g. ['Clav_Piv','Shld_Piv', ...]
+# Pivots driven by constraints (aim pivots, up pivots) only get their free channels set
+def jly_mirrorPivots( srcSide='L_', dstSide='R_', prefix='', names=[] ):
+    
+    # Read the source pivots in one snapshot, and mirror every matrix in one step
+    Snap = jly_snapshotPivots( [ srcSide+prefix+n for n in names ] )
+    Mirrored = Snap['matrices'] * jlyMirrorSign
+    
+    # Parents first, so placing a parent pivot does not move a child pivot that is already placed
+    DstPivs = [ ( n, dstSide+prefix+n ) for n in names if srcSide+prefix+n in Snap['index'] and cmds.objExists( dstSide+prefix+n ) ]
+    DstPivs = sorted( DstPivs, key=lambda s: cmds.ls( s[1], long=True )[0].count('|') )
+    
+    for n,dst in DstPivs:
+        M = Mirrored[ Snap['index'][srcSide+prefix+n] ]
+        # Translate, if not driven or locked
+        if cmds.getAttr( dst+'.tx', settable=True ):
+            cmds.xform( dst, ws=True, t=M[3,:3].tolist() )
+        # Rotate, if not driven or locked, in the pivot's own rotate order
+        if cmds.getAttr( dst+'.rx', settable=True ):
+            Rot = om.MTransformationMatrix( om.MMatrix( M.flatten().tolist() ) ).rotation()
+            Rot.reorderIt( cmds.getAttr( dst+'.rotateOrder' ) )
+            cmds.xform( dst, ws=True, ro=[ np.degrees( Rot.x ), np.degrees( Rot.y ), np.degrees( Rot.z ) ] )
+    
+    return [ dst for n,dst in DstPivs ]
+
+
+# ---------------------------------------------------------------------------------------
+# Apply Pivot Spec
+
+# Batch builds (Biped_AutoRig_Batch_Build.py) describe a character variant with a spec, its pivots replace the creation script's numbers
+# spec['pivots']: { 'L_Shld_Piv': { 't':[x,y,z], 'ro':[x,y,z], 's':[x,y,z] }, ... } local values, same as the creation script's cmds.xform lines
+# pivGrp: only the pivots under these groups are set, call it after each block of pivots is placed
+def jly_applyPivotSpec( spec={}, pivGrp=[] ):
+    
+    Pivots = ( spec or {} ).get( 'pivots', {} )
+    if not Pivots:
+        return []
+    
+    # Every transform under the pivot groups, the groups themselves too
+    Nodes = cmds.ls( pivGrp, type='transform' ) + ( cmds.listRelatives( pivGrp, allDescendents=True, type='transform' ) or [] )
+    
+    Applied = []
+    for node in Nodes:
+        Values = Pivots.get( node.split('|')[-1] )
+        if not Values:
+            continue
+        # Only the channels the spec gives
+        Flags = { k:Values[k] for k in [ 't','ro','s' ] if k in Values }
+        cmds.xform( node, **Flags )
+        Applied += [ node ]
+    
+    return Applied
+
+
+# ---------------------------------------------------------------------------------------
+# Build Transactions
+
+# The creation script runs in steps (one per section): jly_beginStep, then the step in try: ... jly_endStep, finally: jly_abortStep
+# Inside a step every builder call is a module: if jly_beginModule( 'L_Arm', globals() ): ... jly_endModule( 'L_Arm', globals() )
+# While a module runs, every node it creates, every existing node it renames or reparents is recorded,
+# so when it fails only that module is undone (jly_rollbackStep), the modules finished before it stay.
+# Finished steps and modules are saved in the build log (with the script variables they made), a resumed run skips them
+# and builds the failed module again. Code of a step outside its modules is recorded the same way, as the step itself.
+# The open module is kept through importlib.reload, so the next run of the creation script can roll it back
+jlyBuildTxn = globals().get( 'jlyBuildTxn', {} )
+jlyBuildLog = globals().get( 'jlyBuildLog', { 'path': '', 'resume': False, 'steps': {}, 'done': [] } )
+
+# Callbacks: record created nodes, first name of renamed nodes, first parent of reparented nodes
+def jly_txnNodeAdded( node, clientData=None ):
+    jlyBuildTxn['created'] += [ om.MObjectHandle( node ) ]
+    jlyBuildTxn['createdSet'].add( om.MObjectHandle( node ).hashCode() )
+
+def jly_txnNameChanged( node, prevName, clientData=None ):
+    Key = om.MObjectHandle( node ).hashCode()
+    # New nodes get named right after they are made, only existing nodes count
+    if prevName and Key not in jlyBuildTxn['createdSet'] and Key not in jlyBuildTxn['renamed']:
+        jlyBuildTxn['renamed'][ Key ] = ( om.MObjectHandle( node ), prevName )
+
+def jly_txnParentRemoved( child, parent, clientData=None ):
+    Key = om.MObjectHandle( child.node() ).hashCode()
+    if Key not in jlyBuildTxn['createdSet'] and Key not in jlyBuildTxn['reparented']:
+        # An empty parent path is the world
+        ParentHandle = om.MObjectHandle( parent.node() ) if parent.length() else None
+        jlyBuildTxn['reparented'][ Key ] = ( om.MObjectHandle( child.node() ), ParentHandle )
+
+
+# Current name of a recorded node, full path for DAG nodes
+def jly_txnNodeName( handle=None ):
+    
+    Obj = handle.object()
+    if Obj.hasFn( om.MFn.kDagNode ):
+        return om.MDagPath.getAPathTo( Obj ).fullPathName()
+    return om.MFnDependencyNode( Obj ).name()
+
+
+# Start or resume the build log. path='': no log, failed modules are still rolled back
+# resume=True: keep the finished steps and modules of the log at path, the ones after them are built again
+def jly_startBuildLog( path='', resume=False ):
+    
+    jlyBuildLog['path'] = path
+    jlyBuildLog['resume'] = resume
+    jlyBuildLog['steps'] = {}
+    # What the finished modules of this run recorded, for jly_rollbackBuild (not saved in the log)
+    jlyBuildLog['done'] = []
+    if path and resume and os.path.isfile( path ):
+        with open( path ) as f:
+            jlyBuildLog['steps'] = json.load( f ).get( 'steps', {} )
+        print( 'Resuming build, finished steps: '+str( [ s for s,v in jlyBuildLog['steps'].items() if v['status'] == 'ok' ] ) )
+    
+    return jlyBuildLog
+
+
+def jly_saveBuildLog():
+    
+    if jlyBuildLog['path']:
+        with open( jlyBuildLog['path'], 'w' ) as f:
+            json.dump( { 'steps': jlyBuildLog['steps'] }, f, indent=2 )
+
+
+# Script variables that can go in the log: names, numbers, lists of them
+def jly_stepVars( scope={} ):
+    
+    Vars = {}
+    for k,v in scope.items():
+        if k.startswith( '_' ) or k in [ 'BatchSpec' ]:
+            continue
+        try:
+            Vars[ k ] = json.loads( json.dumps( v ) )
+        except (TypeError, ValueError):
+            continue
+    
+    return Vars
+
+
+# Start recording a new transaction in the open step: module='' for the step's own code
+def jly_openTxn( module='', scope={} ):
+    
+    jlyBuildTxn.update( { 'module': module, 'moduleStart': time.time(), 'created': [], 'createdSet': set(), 'renamed': {}, 'reparented': {},
+                          'moduleVars': jly_stepVars( scope ) if module else {} } )
+
+
+# Keep what the open transaction recorded, so jly_rollbackBuild can still undo it
+def jly_closeTxn():
+    
+    if jlyBuildTxn['created'] or jlyBuildTxn['renamed'] or jlyBuildTxn['reparented']:
+        jlyBuildLog['done'] += [ { k: jlyBuildTxn[k] for k in [ 'step', 'module', 'created', 'renamed', 'reparented' ] } ]
+    jlyBuildTxn['nodes'] += len( jlyBuildTxn['created'] )
+
+
+# Begin a step. Returns False if the log already has it finished (its variables are put back in scope), True if it has to run
+def jly_beginStep( step='', scope={} ):
+    
+    # The last run stopped in the middle of a step: undo its open module first
+    if jlyBuildTxn.get( 'step' ):
+        print( 'WARNING - step '+jlyBuildTxn['step']+' did not finish, rolling back its open module' )
+        jly_rollbackStep()
+    
+    # Finished in the logged run: skip it
+    Logged = jlyBuildLog['steps'].get( step ) or {}
+    if Logged.get( 'status' ) == 'ok':
+        scope.update( Logged['vars'] )
+        print( '========================= skipped '+step+' (finished in the build log)' )
+        return False
+    
+    jlyBuildTxn.clear()
+    jlyBuildTxn.update( { 'step': step, 'start': time.time(), 'nodes': 0, 'vars': jly_stepVars( scope ) } )
+    jly_openTxn()
+    jlyBuildTxn['callbacks'] = [
+        om.MDGMessage.addNodeAddedCallback( jly_txnNodeAdded, 'dependNode' ),
+        om.MNodeMessage.addNameChangedCallback( om.MObject(), jly_txnNameChanged ),
+        om.MDagMessage.addParentRemovedCallback( jly_txnParentRemoved ),
+    ]
+    # Modules the failed run finished in this step are kept, a resumed run skips them
+    jlyBuildLog['steps'][ step ] = { 'status': 'running', 'seconds': 0.0, 'nodes': 0, 'vars': {}, 'modules': Logged.get( 'modules', {} ) }
+    jly_saveBuildLog()
+    jly_openUndoChunk( step )
+    
+    return True
+
+
+# Begin a module (one builder call and the code that goes with it) in the open step
+# Returns False if the log already has it finished (its variables are put back in scope), True if it has to run
+def jly_beginModule( module='', scope={} ):
+    
+    if not jlyBuildTxn.get( 'step' ):
+        print( 'WARNING - module '+module+' is not in a step, it is not recorded' )
+        return True
+    Logged = jlyBuildLog['steps'][ jlyBuildTxn['step'] ]['modules'].get( module )
+    if Logged and Logged['status'] == 'ok':
+        scope.update( Logged['vars'] )
+        print( '========================= skipped '+module+' (finished in the build log)' )
+        return False
+    
+    # What the step did before the module is finished
+    jly_closeTxn()
+    jly_openTxn( module, scope )
+    
+    return True
+
+
+# End a module: keep what it recorded, save the variables it made or changed in the log
+def jly_endModule( module='', scope={} ):
+    
+    if jlyBuildTxn.get( 'module' ) != module:
+        print( 'WARNING - module '+module+' was not begun' )
+        return
+    Before = jlyBuildTxn['moduleVars']
+    Vars = { k:v for k,v in jly_stepVars( scope ).items() if k not in Before or Before[k] != v }
+    jlyBuildLog['steps'][ jlyBuildTxn['step'] ]['modules'][ module ] = { 'status': 'ok', 'seconds': round( time.time() - jlyBuildTxn['moduleStart'], 3 ), 'nodes': len( jlyBuildTxn['created'] ), 'vars': Vars }
+    jly_saveBuildLog()
+    jly_closeTxn()
+    jly_openTxn()
+
+
+# End a step: stop recording, save the variables the step made or changed in the log
+def jly_endStep( step='', scope={} ):
+    
+    if jlyBuildTxn.get( 'step' ) != step:
+        print( 'WARNING - step '+step+' was not begun' )
+        return
+    om.MMessage.removeCallbacks( jlyBuildTxn.pop( 'callbacks', [] ) )
+    jly_closeUndoChunk()
+    jly_closeTxn()
+    
+    Before = jlyBuildTxn['vars']
+    Vars = { k:v for k,v in jly_stepVars( scope ).items() if k not in Before or Before[k] != v }
+    Modules = jlyBuildLog['steps'][ step ]['modules']
+    jlyBuildLog['steps'][ step ] = { 'status': 'ok', 'seconds': round( time.time() - jlyBuildTxn['start'], 3 ), 'nodes': jlyBuildTxn['nodes'], 'vars': Vars, 'modules': Modules }
+    jly_saveBuildLog()
+    jlyBuildTxn.clear()
+
+
+# Undo what one transaction recorded: put reparented nodes back, delete the nodes it made, then give renamed nodes
+# their first names back (a new node may hold that name until it is deleted). Returns the deleted names
+def jly_rollbackTxn( txn={} ):
+    
+    # Reparented nodes go back first, so deleting the new nodes does not take them along
+    for child,parent in txn['reparented'].values():
+        if not child.isValid():
+            continue
+        ChildPath = jly_txnNodeName( child )
+        if parent is not None and parent.isValid() and parent.object().hasFn( om.MFn.kDagNode ):
+            ParentPath = jly_txnNodeName( parent )
+            if ( cmds.listRelatives( ChildPath, parent=True, fullPath=True ) or [''] )[0] != ParentPath:
+                cmds.parent( ChildPath, ParentPath )
+        elif cmds.listRelatives( ChildPath, parent=True ):
+            cmds.parent( ChildPath, world=True )
+    
+    # Delete the new nodes that are still there
+    Deleted = []
+    for node in txn['created']:
+        if not node.isValid():
+            continue
+        Name = jly_txnNodeName( node )
+        if cmds.objExists( Name ) and not cmds.lockNode( Name, q=True, lock=True )[0]:
+            cmds.delete( Name )
+            Deleted += [ Name ]
+    
+    # Renamed nodes get their first name back (e.g. _Jx back to _Jnt)
+    for node,prevName in txn['renamed'].values():
+        if node.isValid():
+            cmds.rename( jly_txnNodeName( node ), prevName )
+    
+    return Deleted
+
+
+# Undo the open module of the open step (or the step's own code if no module is open), the step is marked failed in the log
+# Modules the step finished before stay, in the scene and in the log
+def jly_rollbackStep():
+    
+    if not jlyBuildTxn.get( 'step' ):
+        return []
+    om.MMessage.removeCallbacks( jlyBuildTxn.pop( 'callbacks', [] ) )
+    jly_closeUndoChunk()
+    Step = jlyBuildTxn['step']
+    Module = jlyBuildTxn['module']
+    
+    Deleted = jly_rollbackTxn( jlyBuildTxn )
+    
+    Modules = jlyBuildLog['steps'].get( Step, {} ).get( 'modules', {} )
+    if Module:
+        Modules[ Module ] = { 'status': 'failed', 'seconds': round( time.time() - jlyBuildTxn['moduleStart'], 3 ), 'nodes': len( Deleted ), 'vars': {} }
+    jlyBuildLog['steps'][ Step ] = { 'status': 'failed', 'seconds': round( time.time() - jlyBuildTxn['start'], 3 ), 'nodes': jlyBuildTxn['nodes'], 'vars': {}, 'modules': Modules }
+    jly_saveBuildLog()
+    jlyBuildTxn.clear()
+    print( 'Rolled back '+( 'module '+Module+' of step '+Step if Module else 'step '+Step )+': '+str( len(Deleted) )+' nodes deleted' )
+    
+    return Deleted
+
+
+# Undo every module this run finished, last one first, they are marked rolled back in the log
+# Not called by the build, run it to take a whole failed build out of the scene
+def jly_rollbackBuild():
+    
+    Deleted = []
+    while jlyBuildLog['done']:
+        Txn = jlyBuildLog['done'].pop()
+        Deleted += jly_rollbackTxn( Txn )
+        Logged = jlyBuildLog['steps'].get( Txn['step'], {} )
+        jlyBuildLog['steps'][ Txn['step'] ] = dict( Logged, status='rolledBack', vars={} )
+        if Txn['module'] in Logged.get( 'modules', {} ):
+            Logged['modules'][ Txn['module'] ] = dict( Logged['modules'][ Txn['module'] ], status='rolledBack', vars={} )
+    jly_saveBuildLog()
+    print( 'Rolled back the build: '+str( len(Deleted) )+' nodes deleted' )
+    
+    return Deleted
+
+
+# Call it in the finally of every step: if the step did not get to jly_endStep it failed,
+# roll back its open module now (callbacks off, nodes deleted), the rest of the build stays for a resumed run
+def jly_abortStep( step='' ):
+    
+    if jlyBuildTxn.get( 'step' ) != step:
+        return []
+    print( 'ERROR - step '+step+' failed'+( ' in module '+jlyBuildTxn['module'] if jlyBuildTxn['module'] else '' )+', rolling it back' )
+    
+    return jly_rollbackStep()
+
+
+# ---------------------------------------------------------------------------------------
+# Build Undo
+
+# Undo while building: every setAttr, addAttr, connectAttr, parent, rename of the build goes on the undo queue
+# mode='keep': Maya default, every command is undoable on its own
+# mode='chunk': one undo chunk per build step, so one ctrl+z takes the cmds work of a whole step off
+# mode='off': undo is off while building, nothing goes on the queue (failed modules are still rolled back by jly_rollbackStep)
+# Limitation: the API work of a build is not on the undo queue in any mode. The schema attributes (jly_addAttrSchema)
+# and lock states (jly_applyLocks) go away with their nodes when ctrl+z deletes them, but the matrix wiring nodes
+# (jly_wireModules method='matrix') stay. jly_rollbackStep records every node, API or not, use it to take a module off
+# The state is kept through importlib.reload, so a chunk left open by a failed run is closed by the next run
+jlyBuildUndo = globals().get( 'jlyBuildUndo', { 'mode': 'keep', 'state': None, 'chunk': '', 'heapMB': 0.0 } )
+
+# Maya heap memory in MB: the whole heap (scene, plug-ins and the undo queue), not the undo queue alone
+def jly_heapMemory():
+    
+    return round( float( cmds.memory( heapMemory=True, megaByte=True ) ), 1 )
+
+
+# Start undo handling for a build, call it once before the first step
+def jly_startBuildUndo( mode='chunk' ):
+    
+    if mode not in [ 'keep', 'chunk', 'off' ]:
+        print( 'ERROR - undo mode '+str(mode)+' is not keep, chunk or off, using keep' )
+        mode = 'keep'
+    # A chunk or an off state left over by a failed run
+    jly_endBuildUndo()
+    
+    jlyBuildUndo.update( { 'mode': mode, 'state': cmds.undoInfo( q=True, state=True ), 'chunk': '', 'heapMB': jly_heapMemory() } )
+    # Turn undo off without flushing, the queue from before the build stays
+    if mode == 'off':
+        cmds.undoInfo( stateWithoutFlush=False )
+    print( 'Build undo mode: '+mode+', heap '+str( jlyBuildUndo['heapMB'] )+' MB' )
+    
+    return jlyBuildUndo
+
+
+# Open the undo chunk of a step (mode='chunk' only), jly_beginStep calls it
+def jly_openUndoChunk( step='' ):
+    
+    if jlyBuildUndo['mode'] != 'chunk':
+        return
+    jly_closeUndoChunk()
+    cmds.undoInfo( openChunk=True, chunkName=step )
+    jlyBuildUndo['chunk'] = step
+
+
+# Close the open undo chunk, jly_endStep and jly_rollbackStep call it
+def jly_closeUndoChunk():
+    
+    if jlyBuildUndo['chunk']:
+        cmds.undoInfo( closeChunk=True )
+        jlyBuildUndo['chunk'] = ''
+
+
+# End undo handling: close the chunk, put the undo state back, report the heap memory
+# The heap before and after the build includes the rig itself, only the heap just before and after flushUndo tells
+# what the undo queue held. flush=True: empty the undo queue too (batch builds, long sessions)
+# Returns { 'heapStartMB', 'heapEndMB', 'flushedMB' }, flushedMB is 0.0 without flush
+def jly_endBuildUndo( flush=False ):
+    
+    jly_closeUndoChunk()
+    if jlyBuildUndo['state'] is not None:
+        cmds.undoInfo( stateWithoutFlush=jlyBuildUndo['state'] )
+    
+    Report = { 'heapStartMB': jlyBuildUndo['heapMB'], 'heapEndMB': jly_heapMemory(), 'flushedMB': 0.0 }
+    if flush:
+        # Measured right around the flush, nothing else runs in between
+        HeapBefore = jly_heapMemory()
+        cmds.flushUndo()
+        Report['flushedMB'] = round( HeapBefore - jly_heapMemory(), 1 )
+    if jlyBuildUndo['state'] is not None:
+        print( 'Build undo ('+jlyBuildUndo['mode']+'): Maya heap '+str( Report['heapStartMB'] )+' MB before the build, '+str( Report['heapEndMB'] )+' MB after'
+               +( ', flushUndo freed '+str( Report['flushedMB'] )+' MB of heap' if flush else '' ) )
+    jlyBuildUndo.update( { 'mode': 'keep', 'state': None, 'chunk': '' } )
+    
+    return Report
+
 
 # ---------------------------------------------------------------------------------------
 # Create Single Pivot Rig (Cog/root pivot group)
@@ -45,11 +987,11 @@ def jly_makeBasePiv(name='RigName', radius=1.0, dpTime = 0.01 ):
     # Make a big master pivot grp to hold other pivots
     RootPivGrp = denUt.den_makeGrp( nodeName=name+'_Piv_Grp', pos=(0,0,0) )
     # Lock selected grp xyz attributes, except visibility
-    denUt.den_Lock(  1,1,1 , 1,1,1 , 1,1,1 , 0 )
+    jly_lock(  1,1,1 , 1,1,1 , 1,1,1 , 0 )
     # Make a base rig pivot grp for base rig
     BasePivGrp = denUt.den_makeGrp( nodeName='BasePiv_Grp', pos=(0,0,0) )
     # Lock selected grp xyz attributes, except visibility
-    denUt.den_Lock(  1,1,1 , 1,1,1 , 1,1,1 , 0 )
+    jly_lock(  1,1,1 , 1,1,1 , 1,1,1 , 0 )
     # Parent base pivot grp under the master root pivot grp
     BasePivGrp = cmds.parent( BasePivGrp, RootPivGrp )[0]
     # Make a locator to be Cog pivot, 1 meter up from the ground
@@ -57,11 +999,14 @@ def jly_makeBasePiv(name='RigName', radius=1.0, dpTime = 0.01 ):
     # Change display override color to color20(pink), do it on the Shape (not the object) so only the target gets the color
     denUt.den_ColorShape(20)
     # Lock all except translation
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
     # Parent Cog under base rig pivot grp
     cmds.parent( 'Cog_Piv', BasePivGrp )
     # Use DiagPause to show the building process
     denUt.den_DiagPause( seconds=dpTime )
+    # Lock and hide the channels in the lock table in one pass
+    jly_applyLocks( module=cmds.ls( RootPivGrp )[0] )
+    
     # Return the big master pivot grp
     return RootPivGrp
 
@@ -73,11 +1018,11 @@ def jly_makeBaseRig(label='abcdef',ctrlRadius=50.0, dpTime = 0.01 ):
     # Make a big master rig grp to hold other rig parts
     RootRigGrp = denUt.den_makeGrp( nodeName=label+'_Rig_Grp', pos=(0,0,0) )
     # Lock all the attributes, except visibility
-    denUt.den_Lock(  1,1,1 , 1,1,1 , 1,1,1 , 0 )    
+    jly_lock(  1,1,1 , 1,1,1 , 1,1,1 , 0 )    
     # Make a grp for the rig
     BaseRigGrp = denUt.den_makeGrp( nodeName='Base_Grp', pos=(0,0,0) )
     # Lock all the attributes, except visibility
-    denUt.den_Lock(  1,1,1 , 1,1,1 , 1,1,1 , 0 )
+    jly_lock(  1,1,1 , 1,1,1 , 1,1,1 , 0 )
     # Parent base rig grp under root rig grp
     BaseRigGrp = cmds.parent( BaseRigGrp, RootRigGrp )
     # Set 5 variables for every rig parts:
@@ -88,7 +1033,7 @@ def jly_makeBaseRig(label='abcdef',ctrlRadius=50.0, dpTime = 0.01 ):
     BaseGutsALL = [] 
     
     # Asking what's the translate value of cog pivot, and store in CogPos variable
-    CogPos = cmds.xform( 'Cog_Piv', ws=True, q=True, t=True )
+    CogPos = jly_snapPos( jly_snapshotPivots( ['Cog_Piv'] ), 'Cog_Piv' )
     
     # - Create 3 control circles:
     # Create world control
@@ -100,7 +1045,7 @@ def jly_makeBaseRig(label='abcdef',ctrlRadius=50.0, dpTime = 0.01 ):
     # Take the selected ctrl, adds a zero null above it to zero its transform, auto compensates for hierachies and parenting
     WorldCtrl = denUt.den_AddZeroNull()
     # Lock scale attribute
-    denUt.den_Lock(  0,0,0 , 0,0,0 , 1,1,1 , 0 )
+    jly_lock(  0,0,0 , 0,0,0 , 1,1,1 , 0 )
     # Capture and reset *
     WorldCtrl = cmds.ls( WorldCtrl )
     # Add it to the list of BaseCtrlsAll, 'BaseCtrlsALL += WorldCtrl' means 'BaseCtrlsALL = WorldCtrl+BaseCtrlsALL'
@@ -115,7 +1060,7 @@ def jly_makeBaseRig(label='abcdef',ctrlRadius=50.0, dpTime = 0.01 ):
     # Add 0 null
     WorldOffsetCtrl = denUt.den_AddZeroNull()
     # Lock scale attribute
-    denUt.den_Lock(  0,0,0 , 0,0,0 , 1,1,1 , 0 )
+    jly_lock(  0,0,0 , 0,0,0 , 1,1,1 , 0 )
     # Capture and reset *
     WorldOffsetCtrl = cmds.ls( WorldOffsetCtrl )
     # Add it to the list of BaseCtrlsAll
@@ -135,7 +1080,7 @@ def jly_makeBaseRig(label='abcdef',ctrlRadius=50.0, dpTime = 0.01 ):
     BaseCtrlsALL += AllCtrl
     
     # - Create cog control (ball)
-    CogCtrl = denUt.den_MakeBall( nodeName='Cog_Ctrl', pos=(0,0,0), radius=ctrlRadius*0.5, doT=False )
+    CogCtrl = jly_makeCachedCtrl( denUt.den_MakeBall, nodeName='Cog_Ctrl', pos=(0,0,0), radius=ctrlRadius*0.5, doT=False )
     # Transform the cog ball ctrl
     cmds.xform( t=CogPos )
     # Color the ctrl
@@ -150,76 +1095,34 @@ def jly_makeBaseRig(label='abcdef',ctrlRadius=50.0, dpTime = 0.01 ):
     BaseCtrlsALL += CogCtrl
     
     # - Add attributes to control visibility of rig parts 
-    # Global Scale:
-    # Add an attribute to control global scale
-    cmds.addAttr( AllCtrl[0], longName='Global_Scale', attributeType='float', defaultValue=1.0 )
-    # Make global scale attribute visible in channel box
-    cmds.setAttr ( AllCtrl[0]+'.Global_Scale', lock=False, channelBox=True )
+    # Add global scale, the show/hide switches for geo/ctrl/guts/drawStyle, and the 3 side colors in one go (jlyAllCtrlSchema)
+    jly_addAttrSchema( node=AllCtrl, schema=jlyAllCtrlSchema )
     # Connect global scale attribute to scaleXYZ
     cmds.connectAttr( AllCtrl[0]+'.Global_Scale', AllCtrl[0]+'.sx' )
     cmds.connectAttr( AllCtrl[0]+'.Global_Scale', AllCtrl[0]+'.sy' )
     cmds.connectAttr( AllCtrl[0]+'.Global_Scale', AllCtrl[0]+'.sz' )
     
-    # Show or hide geo/ctrl/guts/drawStyle groups:
-    # Add an attribute to control Render geo
-    cmds.addAttr( AllCtrl[0], longName='Show_Render_Geo', attributeType='enum', enumName=' off ---: --- on' )
-    # Make attribute visible in channel box
-    cmds.setAttr ( AllCtrl[0]+'.Show_Render_Geo', lock=False, channelBox=True )
-    # Add an attribute to control Proxy geo
-    cmds.addAttr( AllCtrl[0], longName='Show_Proxy_Geo', attributeType='enum', enumName=' off ---: --- on' )
-    cmds.setAttr ( AllCtrl[0]+'.Show_Proxy_Geo', 1, lock=False, channelBox=True )
-    # Add an attribute to control Box geo
-    cmds.addAttr( AllCtrl[0], longName='Show_Box_Geo', attributeType='enum', enumName=' off ---: --- on' )
-    cmds.setAttr ( AllCtrl[0]+'.Show_Box_Geo', 1, lock=False, channelBox=True )
-    # Add an attribute to control control group
-    cmds.addAttr( AllCtrl[0], longName='Show_Controls', attributeType='enum', enumName=' off ---: --- on' )
-    cmds.setAttr ( AllCtrl[0]+'.Show_Controls', 1, lock=False, channelBox=True )
-    # Add an attribute to control guts
-    cmds.addAttr( AllCtrl[0], longName='Show_Guts', attributeType='enum', enumName=' off ---: --- on' )
-    cmds.setAttr ( AllCtrl[0]+'.Show_Guts', lock=False, channelBox=True )
-    # Add an attribute to control draw style
-    cmds.addAttr(  AllCtrl[0], longName='Bone_Draw_Style', attributeType='enum', enumName='Bone:Multi-child as Box:None' )
-    cmds.setAttr (  AllCtrl[0]+'.Bone_Draw_Style', lock=False, channelBox=True )
-    
-    # Add 3 different custom color attributes to the AllCtrl (added in 'Extra Attributes')
-    # Add overall attribute to control Center color
-    cmds.addAttr(AllCtrl, ln="Center_Color", uac=True, at="float3")
-    # Add attributes for R, G, B
-    cmds.addAttr(AllCtrl, ln="Center_ColorR", at="float", parent="Center_Color")
-    cmds.addAttr(AllCtrl, ln="Center_ColorG", at="float", parent="Center_Color")
-    cmds.addAttr(AllCtrl, ln="Center_ColorB", at="float", parent="Center_Color")
-    # Add overall attribute to control Left color
-    cmds.addAttr(AllCtrl, ln="Left_Color", uac=True, at="float3")
-    # Add attributes for R, G, B
-    cmds.addAttr(AllCtrl, ln="Left_ColorR", at="float", parent="Left_Color")
-    cmds.addAttr(AllCtrl, ln="Left_ColorG", at="float", parent="Left_Color")
-    cmds.addAttr(AllCtrl, ln="Left_ColorB", at="float", parent="Left_Color")
-    # Add overall attribute to control Right color
-    cmds.addAttr(AllCtrl, ln="Right_Color", uac=True, at="float3")
-    # Add attributes for R, G, B
-    cmds.addAttr(AllCtrl, ln="Right_ColorR", at="float", parent="Right_Color")
-    cmds.addAttr(AllCtrl, ln="Right_ColorG", at="float", parent="Right_Color")
-    cmds.addAttr(AllCtrl, ln="Right_ColorB", at="float", parent="Right_Color")
-    # Set colors Center:yellow, Left:blue, Right:red (use [0] to extract from the list)
-    cmds.setAttr(AllCtrl[0] + ".Center_Color", 0.8, 0.8, 0.05, type="double3")
-    cmds.setAttr(AllCtrl[0] + ".Left_Color", 0, 0.3, 0.95, type="double3")
-    cmds.setAttr(AllCtrl[0] + ".Right_Color", 1, 0.03, 0.05, type="double3")
+    # - Display layers: toggling a switch only dirties one layer, the layer hides its members through drawOverride
+    # Only the stretchy proxy mesh shapes go in a layer. Control shapes carry their own color overrides, a layer would take
+    # over their drawOverride, so the module groups' Show_Controls drive them instead (see jly_addToDisplayLayers)
+    # Guts are not in a layer, Show_Guts drives the module groups' Show_Guts (see jlyWiringTable)
+    jly_makeDisplayLayers( allCtrl=AllCtrl[0] )
     
     # Connect control visibility to AllCtrl
     # for all string in the list, enumerate: each string goes into 's' variable, 'i' variable picks up the index of each string
     for i,s in enumerate(BaseCtrlsALL):
-        # find all shapes and make it invisible, not objects
-        shapes = cmds.listRelatives( s, shapes=True )
-        print( shapes )
-        for shape in shapes:
-            # do all except no.2 (the AllCtrl, stays visible)
-            if i != 2:
+        # World, WorldOffset and Cog (no.0, no.1, no.3) are parents of other controls, so hide their shapes only, not objects
+        # AllCtrl (no.2) stays visible
+        if i in [0,1,3]:
+            shapes = cmds.listRelatives( s, shapes=True )
+            for shape in shapes:
                 cmds.connectAttr( AllCtrl[0]+'.Show_Controls', shape+'.visibility' )
     
-    # Select AllCtrl
-    cmds.select( AllCtrl[0] )
     # Lock the scale of AllCtrl
-    denUt.den_Lock(  0,0,0 , 0,0,0 , 1,1,1 , 0 )
+    jly_lock(  0,0,0 , 0,0,0 , 1,1,1 , 0 , nodes=[ AllCtrl[0] ] )
+    
+    # Make the root metadata node, every module registers its outputs on it
+    jly_makeRigMeta( rigGrp=RootRigGrp, label=label )
     
     # Add spaceOut
     # Create empty group for CogSpaceOUT
@@ -233,86 +1136,456 @@ def jly_makeBaseRig(label='abcdef',ctrlRadius=50.0, dpTime = 0.01 ):
     # Add the created spaceOut to BaseSpaceOUTs list
     BaseSpaceOUTs += [CogSpaceOUT, AllSpaceOUT]
     
+    # Lock and hide the channels in the lock table in one pass
+    jly_applyLocks( module=cmds.ls( RootRigGrp )[0] )
+    
     # Return the top level root group node, SpaceINs, SpaceOUTs, BindJoints, CtrlsALL, GutsALL lists in order (same order for all body parts)
     return RootRigGrp, BaseSpaceINs, BaseSpaceOUTs, BaseBindJoints, BaseCtrlsALL, BaseGutsALL
 
 
+# ---------------------------------------------------------------------------------------
+# Add To Display Layers
+
+# Display layers made by jly_makeBaseRig: ( layer name, All_Ctrl switch that drives its visibility )
+jlyDisplayLayers = [ ('ProxyGeo_Layer','Show_Proxy_Geo') ]
+
+# Make the display layers and connect their visibility to the All_Ctrl switches, returns { switch: layer }
+# A switch that drives a layer already keeps it, so an imported base rig can run this again
+def jly_makeDisplayLayers( allCtrl='All_Ctrl' ):
+    
+    DisplayLayers = {}
+    for LayerName,SwitchAttr in jlyDisplayLayers:
+        Layer = cmds.listConnections( allCtrl+'.'+SwitchAttr, source=False, destination=True, type='displayLayer' )
+        if not Layer:
+            Layer = [ cmds.createDisplayLayer( name=LayerName, empty=True, noRecurse=True ) ]
+            # Connect the layer visibility to the AllCtrl switch
+            cmds.connectAttr( allCtrl+'.'+SwitchAttr, Layer[0]+'.visibility' )
+        DisplayLayers[ SwitchAttr ] = Layer[0]
+    
+    return DisplayLayers
+
+# Hook up the display switches of a module: control shapes follow the module group's Show_Controls (the All_Ctrl
+# drives it, see jlyWiringTable), proxy mesh shapes go in the proxy layer made by jly_makeBaseRig
+# Control shapes stay out of the layers: a layer drives drawOverride and would take over the shape colors
+# (den_ColorShape* overrides, Ctrl_Color). Only shapes are hidden, never what is parented under a control
+def jly_addToDisplayLayers( allCtrl='All_Ctrl', rigGrp='', ctrls=[], proxies=[] ):
+    
+    # Control shapes, the ones already driven (by the safety covers) are left alone
+    Shapes = cmds.listRelatives( cmds.ls( ctrls ), shapes=True, noIntermediate=True, fullPath=True ) if cmds.ls( ctrls ) else []
+    if Shapes and not ( rigGrp and cmds.attributeQuery( 'Show_Controls', node=rigGrp, exists=True ) ):
+        print( 'ERROR - '+str( rigGrp )+' has no Show_Controls switch, add the safety covers first' )
+        Shapes = []
+    for shape in Shapes:
+        if not cmds.listConnections( shape+'.visibility', source=True, destination=False ):
+            cmds.connectAttr( rigGrp+'.Show_Controls', shape+'.visibility' )
+    
+    # Proxy mesh shapes
+    Members = cmds.listRelatives( cmds.ls( proxies ), shapes=True, noIntermediate=True, fullPath=True ) if cmds.ls( proxies ) else []
+    if not Members:
+        return
+    # Find the layer from the AllCtrl switch, so a renamed layer still works
+    Layer = cmds.listConnections( allCtrl+'.Show_Proxy_Geo', source=False, destination=True, type='displayLayer' )
+    if not Layer:
+        print( 'ERROR - no display layer connected to '+allCtrl+'.Show_Proxy_Geo, build the base rig first' )
+        return
+    cmds.editDisplayLayerMembers( Layer[0], Members, noRecurse=True )
+
+
+# ---------------------------------------------------------------------------------------
+# Module Wiring
+
+# Wiring table: module kind -> the SpaceOUT each SpaceIN follows (in the builder's SpaceIN order), and the rig group
+# attributes driven by the AllCtrl. Kept in Biped_AutoRig_Tables.py with the module list
+# Ctrl_Color is driven by the AllCtrl color of the module side, see jlyWiringColors
+jlyWiringTable = jlyTables.jlyWiringTable
+
+# Module side -> AllCtrl color attribute for Ctrl_Color
+jlyWiringColors = jlyTables.jlyWiringColors
+
+
+# Turn the wiring table rows into connections, without touching the scene
+# rows: [ { 'kind':'Arm', 'side':'L_', 'spaceINs':L_ArmSpaceINs, 'rigGrp':L_ArmRigGrp[0] }, ... ]
+# spaceOUTs: variable name -> SpaceOUT, the creation script passes globals()
+# Returns ( [ (spaceOUT, spaceIN), ... ], [ (AllCtrl attr, rig group attr), ... ] ), duplicates removed, table order kept
+def jly_wiringPairs( rows=[], spaceOUTs={}, allCtrl='All_Ctrl', spaces=True, display=True ):
+
+    SpacePairs = []
+    DisplayPairs = []
+    for row in rows:
+        Table = jlyWiringTable.get( row['kind'] )
+        if not Table:
+            print( 'ERROR - no wiring table entry for module kind '+str( row['kind'] ) )
+            continue
+        Side = row.get( 'side', '' )
+
+        # SpaceINs, one per table entry
+        if spaces:
+            SpaceINs = row.get( 'spaceINs', [] )
+            if len( SpaceINs ) != len( Table['spaces'] ):
+                print( 'WARNING - '+Side+row['kind']+' has '+str(len(SpaceINs))+' spaceINs, the wiring table has '+str(len(Table['spaces'])) )
+            for spaceOUTName,spaceIN in zip( Table['spaces'], SpaceINs ):
+                spaceOUTName = spaceOUTName.replace( '{side}', Side )
+                SpaceOUT = spaceOUTs.get( spaceOUTName )
+                # den_AddSpaceOUTs returns a list
+                if isinstance( SpaceOUT, (list,tuple) ):
+                    SpaceOUT = SpaceOUT[0] if SpaceOUT else None
+                if not SpaceOUT:
+                    print( 'ERROR - '+spaceOUTName+' is not built yet, '+spaceIN+' is not wired' )
+                    continue
+                SpacePairs += [ ( SpaceOUT, spaceIN ) ]
+
+        # Display attributes, the AllCtrl attribute has the same name except for the color
+        if display and row.get( 'rigGrp' ):
+            for attr in Table['display']:
+                Source = jlyWiringColors.get( Side, 'Center_Color' ) if attr == 'Ctrl_Color' else attr
+                DisplayPairs += [ ( allCtrl+'.'+Source, row['rigGrp']+'.'+attr ) ]
+
+    return list( dict.fromkeys( SpacePairs ) ), list( dict.fromkeys( DisplayPairs ) )
+
+
+# Wire modules from the wiring table: SpaceINs follow their SpaceOUTs (translate, rotate, scale, offset kept like mo=True),
+# and the rig group display attributes are driven by the AllCtrl
+# method='constraint': parentConstraint + scaleConstraint per SpaceIN, like the rig has always been wired
+# method='matrix': one multMatrix + decomposeMatrix per SpaceIN, all nodes and connections made in one MDGModifier
+# Call it with display=False before the safety covers (the covers add the display attributes), and spaces=False after
+# Returns the nodes made
+def jly_wireModules( rows=[], spaceOUTs={}, allCtrl='All_Ctrl', method='constraint', spaces=True, display=True ):
+
+    SpacePairs, DisplayPairs = jly_wiringPairs( rows=rows, spaceOUTs=spaceOUTs, allCtrl=allCtrl, spaces=spaces, display=display )
+
+    # A SpaceIN that is already driven is not wired again (a module wired twice, or by hand)
+    Wired = []
+    for spaceOUT,spaceIN in SpacePairs:
+        # isDestination is also true when translate (the parent plug) is connected
+        if cmds.connectionInfo( spaceIN+'.translateX', isDestination=True ):
+            print( 'WARNING - '+spaceIN+' is already driven, skipped' )
+            continue
+        Wired += [ ( spaceOUT, spaceIN ) ]
+    # Same for the display attributes, and skip the ones the rig group does not have
+    Connects = []
+    for source,dest in DisplayPairs:
+        Node, Attr = dest.split( '.', 1 )
+        if not cmds.attributeQuery( Attr, node=Node, exists=True ):
+            print( 'WARNING - '+dest+' does not exist, add the safety covers first' )
+            continue
+        if cmds.connectionInfo( dest, isDestination=True ):
+            continue
+        Connects += [ ( source, dest ) ]
+
+    Made = []
+    if method == 'constraint':
+        for spaceOUT,spaceIN in Wired:
+            Made += cmds.parentConstraint( spaceOUT, spaceIN, mo=True )
+            Made += cmds.scaleConstraint( spaceOUT, spaceIN, mo=True )
+        for source,dest in Connects:
+            cmds.connectAttr( source, dest )
+        return Made
+
+    if Wired:
+        cmds.loadPlugin( 'matrixNodes', quiet=True )
+
+    # Read all the plugs first, then make everything in one modifier
+    SelList = om.MSelectionList()
+    for spaceOUT,spaceIN in Wired:
+        SelList.add( spaceOUT+'.worldMatrix[0]' )
+        SelList.add( spaceIN+'.worldMatrix[0]' )
+        SelList.add( spaceIN+'.parentInverseMatrix[0]' )
+        SelList.add( spaceIN+'.rotateOrder' )
+        for attr in [ 'translate', 'rotate', 'scale' ]:
+            SelList.add( spaceIN+'.'+attr )
+    PlugsPerPair = 7
+
+    DG = om.MDGModifier()
+    Nodes = []
+    for i,(spaceOUT,spaceIN) in enumerate( Wired ):
+        OutWorld, InWorld, InParentInv, InRotOrder, InT, InR, InS = [ SelList.getPlug( i*PlugsPerPair+j ) for j in range( PlugsPerPair ) ]
+        # Offset keeps the SpaceIN where it is now: InWorld = Offset * OutWorld
+        Offset = om.MFnMatrixData( InWorld.asMObject() ).matrix() * om.MFnMatrixData( OutWorld.asMObject() ).matrix().inverse()
+
+        Name = spaceIN.split( '|' )[-1]
+        MultObj = DG.createNode( 'multMatrix' )
+        DG.renameNode( MultObj, Name+'_Wire_MMtx' )
+        DecompObj = DG.createNode( 'decomposeMatrix' )
+        DG.renameNode( DecompObj, Name+'_Wire_DMtx' )
+        Mult = om.MFnDependencyNode( MultObj )
+        Decomp = om.MFnDependencyNode( DecompObj )
+
+        # matrixIn[0]: offset, [1]: SpaceOUT world, [2]: SpaceIN parent inverse, the result is the SpaceIN local matrix
+        MatrixIn = Mult.findPlug( 'matrixIn', False )
+        DG.newPlugValue( MatrixIn.elementByLogicalIndex(0), om.MFnMatrixData().create( Offset ) )
+        DG.connect( OutWorld, MatrixIn.elementByLogicalIndex(1) )
+        DG.connect( InParentInv, MatrixIn.elementByLogicalIndex(2) )
+        DG.connect( Mult.findPlug( 'matrixSum', False ), Decomp.findPlug( 'inputMatrix', False ) )
+        DG.connect( InRotOrder, Decomp.findPlug( 'inputRotateOrder', False ) )
+        DG.connect( Decomp.findPlug( 'outputTranslate', False ), InT )
+        DG.connect( Decomp.findPlug( 'outputRotate', False ), InR )
+        DG.connect( Decomp.findPlug( 'outputScale', False ), InS )
+        Nodes += [ MultObj, DecompObj ]
+
+    # Display attributes in the same modifier
+    for source,dest in Connects:
+        SelList = om.MSelectionList()
+        SelList.add( source )
+        SelList.add( dest )
+        DG.connect( SelList.getPlug(0), SelList.getPlug(1) )
+
+    DG.doIt()
+
+    for node in Nodes:
+        Made += [ om.MFnDependencyNode( node ).name() ]
+    print( 'Wired '+str(len(Wired))+' spaceINs and '+str(len(Connects))+' display attributes' )
+
+    return Made
+
+
+# ---------------------------------------------------------------------------------------
+# Rig Metadata
+
+# Every module registers its six outputs on a network node, connected with message attributes
+# The message connections follow renames and reparenting, so later tools never search the scene by name
+# Rig_Meta (made by jly_makeBaseRig) -> Modules[i] -> <Module>_Meta -> RigGrp, SpaceINs, SpaceOUTs, BindJoints, CtrlsALL, GutsALL
+jlyModuleMetaKeys = jlyTables.jlyModuleMetaKeys
+
+# Make the root metadata node, connect the root rig group to it
+# Module_Index is a JSON dict of module name -> Modules index, so a module is found without looping over the others
+def jly_makeRigMeta( rigGrp='RigName_Rig_Grp', label='RigName', rigMeta='Rig_Meta' ):
+    
+    RigMeta = cmds.createNode( 'network', name=rigMeta )
+    cmds.addAttr( RigMeta, longName='Rig_Label', dataType='string' )
+    cmds.setAttr( RigMeta+'.Rig_Label', label, type='string' )
+    cmds.addAttr( RigMeta, longName='Module_Index', dataType='string' )
+    cmds.setAttr( RigMeta+'.Module_Index', '{}', type='string' )
+    cmds.addAttr( RigMeta, longName='RigGrp', attributeType='message' )
+    cmds.addAttr( RigMeta, longName='Modules', attributeType='message', multi=True )
+    # Connect the root rig group
+    cmds.connectAttr( rigGrp+'.message', RigMeta+'.RigGrp' )
+    
+    return RigMeta
+
+
+# Register a module's outputs, call it right after the module is built (after twists, so renamed bind joints drop out)
+# rigRet: the six-element tuple returned by every jly_make* builder
+def jly_registerModule( moduleName='L_Arm', rigRet=(), builder='', rigMeta='Rig_Meta' ):
+    
+    if not cmds.objExists( rigMeta ):
+        print( 'ERROR - '+rigMeta+' does not exist, build the base rig first' )
+        return None
+    
+    # Read the module index
+    ModuleIndex = json.loads( cmds.getAttr( rigMeta+'.Module_Index' ) or '{}' )
+    # Registering the same module again replaces its metadata node, and keeps its index
+    if moduleName in ModuleIndex:
+        Index = ModuleIndex[ moduleName ]
+        OldMeta = cmds.listConnections( rigMeta+'.Modules['+str(Index)+']', source=True, destination=False )
+        if OldMeta:
+            cmds.delete( OldMeta )
+    else:
+        Index = max( list( ModuleIndex.values() )+[-1] )+1
+    
+    # Make the module metadata node
+    ModuleMeta = cmds.createNode( 'network', name=moduleName+'_Meta' )
+    cmds.addAttr( ModuleMeta, longName='Module_Name', dataType='string' )
+    cmds.setAttr( ModuleMeta+'.Module_Name', moduleName, type='string' )
+    cmds.addAttr( ModuleMeta, longName='Builder', dataType='string' )
+    cmds.setAttr( ModuleMeta+'.Builder', builder, type='string' )
+    
+    for i,key in enumerate( jlyModuleMetaKeys ):
+        cmds.addAttr( ModuleMeta, longName=key, attributeType='message', multi=True, indexMatters=False )
+        # RigGrp is a single name, the other five are lists
+        Items = rigRet[i] if i < len(rigRet) else []
+        if not isinstance( Items, (list,tuple) ):
+            Items = [ Items ]
+        # Skip empty names and nodes that are gone (twists rename the bind joints they replace)
+        Items = cmds.ls( [ s for s in Items if s ] )
+        # Connect in list order, the index keeps the order the builder returned
+        for j,s in enumerate( Items ):
+            cmds.connectAttr( s+'.message', ModuleMeta+'.'+key+'['+str(j)+']' )
+    
+    # Connect it to the root metadata node, and save the index
+    cmds.connectAttr( ModuleMeta+'.message', rigMeta+'.Modules['+str(Index)+']', force=True )
+    ModuleIndex[ moduleName ] = Index
+    cmds.setAttr( rigMeta+'.Module_Index', json.dumps( ModuleIndex ), type='string' )
+    
+    return ModuleMeta
+
+
+# Find a module's metadata node from its name, one index lookup
+def jly_getModuleMeta( moduleName='L_Arm', rigMeta='Rig_Meta' ):
+    
+    ModuleIndex = json.loads( cmds.getAttr( rigMeta+'.Module_Index' ) or '{}' )
+    if moduleName not in ModuleIndex:
+        print( 'WARNING - module '+moduleName+' is not registered on '+rigMeta )
+        return None
+    ModuleMeta = cmds.listConnections( rigMeta+'.Modules['+str(ModuleIndex[moduleName])+']', source=True, destination=False )
+    
+    return ModuleMeta[0] if ModuleMeta else None
+
+
+# Get a module's registered nodes, key is one of jlyModuleMetaKeys, returns the current names in the builder's order
+def jly_getModuleNodes( moduleName='L_Arm', key='BindJoints', rigMeta='Rig_Meta' ):
+    
+    ModuleMeta = jly_getModuleMeta( moduleName, rigMeta )
+    if not ModuleMeta:
+        return []
+    
+    # Walk the multi plug with the API: element order, then the source node of each element
+    SelList = om.MSelectionList()
+    SelList.add( ModuleMeta+'.'+key )
+    Plug = SelList.getPlug( 0 )
+    Nodes = []
+    for i in range( Plug.numElements() ):
+        Source = Plug.elementByPhysicalIndex( i ).source()
+        if Source.isNull:
+            continue
+        SourceObj = Source.node()
+        if SourceObj.hasFn( om.MFn.kDagNode ):
+            Nodes += [ om.MFnDagNode( SourceObj ).partialPathName() ]
+        else:
+            Nodes += [ om.MFnDependencyNode( SourceObj ).name() ]
+    
+    return Nodes
+
+
+# Get one key for several modules at once (all registered modules if modules is empty), e.g. every bind joint in the rig
+def jly_getRigNodes( key='BindJoints', modules=[], rigMeta='Rig_Meta' ):
+    
+    if not modules:
+        ModuleIndex = json.loads( cmds.getAttr( rigMeta+'.Module_Index' ) or '{}' )
+        # Registration order
+        modules = sorted( ModuleIndex, key=ModuleIndex.get )
+    
+    Nodes = []
+    for moduleName in modules:
+        Nodes += jly_getModuleNodes( moduleName, key, rigMeta )
+    
+    return Nodes
+
+
 # ---------------------------------------------------------------------------------------
 # Create Torso Pivots
 
 # Prefix: used for naming multuple sets of body parts, such as many pair of arms
-def jly_makeBipedTorsoPivs( prefix='', radius=2.0, dpTime = 0.01 ):
+# spineCount/neckCount: number of spine and neck guide pivots, must match the numbers used for the torso rig
+def jly_makeBipedTorsoPivs( prefix='', radius=2.0, spineCount=2, neckCount=1, dpTime = 0.01 ):
+    
+    # The spine and neck curves need at least one guide each
+    if spineCount < 1 or neckCount < 1:
+        raise ValueError( 'spineCount and neckCount must be 1 or more, got spineCount='+str(spineCount)+' neckCount='+str(neckCount) )
     
     # Create a root torso pivot group to hold all torso pivots
     TorsoPivGrp = denUt.den_makeGrp( nodeName=prefix+'TorsoPiv_Grp', pos=(0,0,0) )
     # Lock all the attributes, except visibility
-    denUt.den_Lock(  1,1,1 , 1,1,1 , 1,1,1 , 0 )
+    jly_lock(  1,1,1 , 1,1,1 , 1,1,1 , 0 )
     
     # Create locator for Pelvis pivot
     PelvisPiv = denUt.den_makeLoc( nodeName=prefix+'Pelvis_Piv', pos=(0, 100, 0), radius=radius )
     # Color the locator, and add DiagPause for display rig building process
     denUt.den_ColorShape(20); denUt.den_DiagPause( seconds=dpTime )
     # Lock all the attributes, except translate
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
     
-    # Create locator for Spine01 pivot
-    Spine01Piv = denUt.den_makeLoc( nodeName=prefix+'Spine01_Piv', pos=(0, 110, 0), radius=radius )
-    denUt.den_ColorShape(20); denUt.den_DiagPause( seconds=dpTime )
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
-    
-    # Create locator for Spine02 pivot
-    Spine02Piv = denUt.den_makeLoc( nodeName=prefix+'Spine02_Piv', pos=(0, 120, 0), radius=radius )
-    denUt.den_ColorShape(20); denUt.den_DiagPause( seconds=dpTime )
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    # Create locators for the Spine pivots, they are guides for the fitted spine curve, spread evenly between pelvis and chest
+    SpinePivs = []
+    for i in range( spineCount ):
+        SpinePiv = denUt.den_makeLoc( nodeName=prefix+'Spine'+str(i+1).zfill(2)+'_Piv', pos=(0, 100+30.0*(i+1)/(spineCount+1), 0), radius=radius )
+        denUt.den_ColorShape(20); denUt.den_DiagPause( seconds=dpTime )
+        jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+        SpinePivs += SpinePiv
     
     # Create locator for Chest pivot
     ChestPiv = denUt.den_makeLoc( nodeName=prefix+'Chest_Piv', pos=(0, 130, 0), radius=radius )
     denUt.den_ColorShape(20); denUt.den_DiagPause( seconds=dpTime )
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
     
-    # Create locator for Neck pivot
-    Neck01Piv = denUt.den_makeLoc( nodeName=prefix+'Neck01_Piv', pos=(0, 140, 0), radius=radius )
-    denUt.den_ColorShape(20); denUt.den_DiagPause( seconds=dpTime )
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    # Create locators for the Neck pivots, they are guides for the fitted neck curve, spread evenly between chest and head
+    NeckPivs = []
+    for i in range( neckCount ):
+        NeckPiv = denUt.den_makeLoc( nodeName=prefix+'Neck'+str(i+1).zfill(2)+'_Piv', pos=(0, 140+10.0*i/neckCount, 0), radius=radius )
+        denUt.den_ColorShape(20); denUt.den_DiagPause( seconds=dpTime )
+        jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+        NeckPivs += NeckPiv
     
     # Create locator for Head pivot
     HeadPiv = denUt.den_makeLoc( nodeName=prefix+'Head_Piv', pos=(0, 150, 0), radius=radius )
     denUt.den_ColorShape(20); denUt.den_DiagPause( seconds=dpTime )
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
     
     # Create locator for HeadEnd pivot
     HeadEndPiv = denUt.den_makeLoc( nodeName=prefix+'HeadEnd_Piv', pos=(0, 160, 0), radius=radius/2 )
     denUt.den_ColorShape(20); denUt.den_DiagPause( seconds=dpTime )
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
     
     # Create locator for Jaw pivot
     JawPiv = denUt.den_makeLoc( nodeName=prefix+'Jaw_Piv', pos=(0, 150, 5), radius=radius )
     denUt.den_ColorShape(20); denUt.den_DiagPause( seconds=dpTime )
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
     
     # Create locator for JawEnd pivot
     JawEndPiv = denUt.den_makeLoc( nodeName=prefix+'JawEnd_Piv', pos=(0, 150, 10), radius=radius/2 )
     denUt.den_ColorShape(20); denUt.den_DiagPause( seconds=dpTime )
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
     
     # Parent all created pivots under TorsoPivGrp
-    cmds.parent( PelvisPiv,Spine01Piv,Spine02Piv,ChestPiv,Neck01Piv,HeadPiv,HeadEndPiv,JawPiv,JawEndPiv,TorsoPivGrp )
+    cmds.parent( PelvisPiv,SpinePivs,ChestPiv,NeckPivs,HeadPiv,HeadEndPiv,JawPiv,JawEndPiv,TorsoPivGrp )
     # Put DP in the end of pivot creation to refresh orient
     denUt.den_DiagPause( seconds=dpTime )
+    # Lock and hide the channels in the lock table in one pass
+    jly_applyLocks( module=cmds.ls( TorsoPivGrp )[0] )
+    
     return TorsoPivGrp
 
 
+# ---------------------------------------------------------------------------------------
+# Fit Chain Positions On A Curve
+
+# Fit a smooth curve (Catmull-Rom) through the guide positions in one vectorized pass, and return points along it
+# guidePos: world positions of the guides in order, fractions: where to put the points, 0.0 = first guide, 1.0 = last guide (by curve length)
+def jly_fitChainPositions( guidePos=[], fractions=[], samples=32 ):
+    
+    # Put the guides in an array, one row per guide
+    Guides = np.array( guidePos, dtype=float )
+    # Put the fractions in an array too
+    Fractions = np.array( fractions, dtype=float )
+    # With a single guide there is no curve, every point sits on that guide
+    if len( Guides ) == 1:
+        return np.repeat( Guides, len(Fractions), axis=0 ).tolist()
+    
+    # Pad both ends by mirroring the next guide, so the curve starts and ends exactly on the first and last guide
+    Padded = np.vstack( [ 2*Guides[0]-Guides[1], Guides, 2*Guides[-1]-Guides[-2] ] )
+    # Every curve segment uses 4 neighbour points, line them up for all segments at once
+    P0 = Padded[:-3]; P1 = Padded[1:-2]; P2 = Padded[2:-1]; P3 = Padded[3:]
+    # Sample all segments at the same parameters, t has shape (samples, 1, 1) so it broadcasts over segments and xyz
+    t = np.linspace( 0.0, 1.0, samples, endpoint=False )[:,None,None]
+    # Catmull-Rom formula, result has shape (samples, segments, 3)
+    Curve = 0.5*( 2*P1 + (P2-P0)*t + (2*P0-5*P1+4*P2-P3)*t**2 + (3*P1-P0-3*P2+P3)*t**3 )
+    # Put the samples in curve order (segment by segment), and add the very last guide to close the curve
+    Curve = np.vstack( [ Curve.transpose(1,0,2).reshape(-1,3), Guides[-1:] ] )
+    
+    # Measure the length along the curve at every sample, normalized to 0~1
+    CurveLen = np.concatenate( [ [0.0], np.cumsum( np.linalg.norm( np.diff(Curve,axis=0), axis=1 ) ) ] )
+    CurveLen = CurveLen/CurveLen[-1]
+    # Find the point at each fraction of the length, for x, y and z
+    Points = np.stack( [ np.interp( Fractions, CurveLen, Curve[:,axis] ) for axis in range(3) ], axis=1 )
+    
+    return Points.tolist()
+
+
 # ---------------------------------------------------------------------------------------
 # Create Torso Rig
 
 # control radius: user can control ctrl size, list order - pelvis, chest, head, jaw
 # displayLocalAxis: check joint orient if correct
-def jly_makeBipedTorsoRig( prefix='', radius=3.0, ctrlRadius=(19.0,21.0,12.0,2.0), displayLocalAxis=False, dpTime = 0.01 ):
+# spineCount/neckCount: number of spine and neck joints, must match the numbers used for the torso pivots
+def jly_makeBipedTorsoRig( prefix='', radius=3.0, ctrlRadius=(19.0,21.0,12.0,2.0), displayLocalAxis=False, spineCount=2, neckCount=1, dpTime = 0.01 ):
+    
+    # The spline IK chains need at least one spine and one neck joint (SpineJoints[0] and NeckJoints[0] are used below)
+    if spineCount < 1 or neckCount < 1:
+        raise ValueError( 'spineCount and neckCount must be 1 or more, got spineCount='+str(spineCount)+' neckCount='+str(neckCount) )
     
     # Make a big master Torso rig group,to hold other groups 
     TorsoRigGrp = denUt.den_makeGrp( nodeName=prefix+'Torso_Grp', pos=(0,0,0) )
     # Lock all the attributes, except visibility
-    denUt.den_Lock(  1,1,1 , 1,1,1 , 1,1,1 , 0 )
+    jly_lock(  1,1,1 , 1,1,1 , 1,1,1 , 0 )
     
     # Set 5 variables for every rig parts:
     TorsoSpaceINs = []
@@ -328,26 +1601,40 @@ def jly_makeBipedTorsoRig( prefix='', radius=3.0, ctrlRadius=(19.0,21.0,12.0,2.0
     # Add SpaceIN to the list variable
     TorsoSpaceINs += TorsoSpaceIN
     
-    # Query all the pivots worldSpace position to build the rig, and store the result in a variable
-    PelvisPos = cmds.xform( prefix+'Pelvis_Piv', ws=True, q=True, t=True )
-    Spine01Pos = cmds.xform( prefix+'Spine01_Piv', ws=True, q=True, t=True )
-    Spine02Pos = cmds.xform( prefix+'Spine02_Piv', ws=True, q=True, t=True )
-    ChestPos = cmds.xform( prefix+'Chest_Piv', ws=True, q=True, t=True )
-    Neck01Pos = cmds.xform( prefix+'Neck01_Piv', ws=True, q=True, t=True )
-    HeadPos = cmds.xform( prefix+'Head_Piv', ws=True, q=True, t=True )
-    HeadEndPos = cmds.xform( prefix+'HeadEnd_Piv', ws=True, q=True, t=True )
-    JawPos = cmds.xform( prefix+'Jaw_Piv', ws=True, q=True, t=True )
-    JawEndPos = cmds.xform( prefix+'JawEnd_Piv', ws=True, q=True, t=True )
+    # Query all the pivots worldSpace position to build the rig in one snapshot, and store the result in variables
+    SpinePivs = [ prefix+'Spine'+str(i+1).zfill(2)+'_Piv' for i in range(spineCount) ]
+    NeckPivs = [ prefix+'Neck'+str(i+1).zfill(2)+'_Piv' for i in range(neckCount) ]
+    Snap = jly_snapshotPivots( [ prefix+'Pelvis_Piv', prefix+'Chest_Piv', prefix+'Head_Piv', prefix+'HeadEnd_Piv', prefix+'Jaw_Piv', prefix+'JawEnd_Piv' ]+SpinePivs+NeckPivs )
+    PelvisPos = jly_snapPos( Snap, prefix+'Pelvis_Piv' )
+    SpinePivPos = [ jly_snapPos( Snap, piv ) for piv in SpinePivs ]
+    ChestPos = jly_snapPos( Snap, prefix+'Chest_Piv' )
+    NeckPivPos = [ jly_snapPos( Snap, piv ) for piv in NeckPivs ]
+    HeadPos = jly_snapPos( Snap, prefix+'Head_Piv' )
+    HeadEndPos = jly_snapPos( Snap, prefix+'HeadEnd_Piv' )
+    JawPos = jly_snapPos( Snap, prefix+'Jaw_Piv' )
+    JawEndPos = jly_snapPos( Snap, prefix+'JawEnd_Piv' )
+    
+    # - Fit a curve through the pivots, and spread the spine/neck joints evenly along it
+    # Spine joints sit between pelvis and chest, the last entry is the middle of the curve (for the spine mid control)
+    SpineFractions = [ (i+1.0)/(spineCount+1) for i in range(spineCount) ] + [0.5]
+    SpinePositions = jly_fitChainPositions( [PelvisPos]+SpinePivPos+[ChestPos], SpineFractions )
+    SpineMidPos = SpinePositions.pop()
+    # Neck joints start on the first neck pivot and stop before the head
+    NeckFractions = [ float(i)/neckCount for i in range(neckCount) ]
+    NeckPositions = jly_fitChainPositions( NeckPivPos+[HeadPos], NeckFractions )
     
     # - Draw a chain of joints, parent them under SpaceIN
     # Select SpaceIN
     cmds.select( TorsoSpaceIN )
     # Create joint at the specific position
     PelvisJoint = denUt.den_makeJoint( nodeName=prefix+'Pelvis_Jnt', pos=(PelvisPos), radius=radius, leaveSelected=True ); denUt.den_DiagPause( seconds=dpTime )
-    Spine01Joint = denUt.den_makeJoint( nodeName=prefix+'Spine01_Jnt', pos=(Spine01Pos), radius=radius, leaveSelected=True ); denUt.den_DiagPause( seconds=dpTime )
-    Spine02Joint = denUt.den_makeJoint( nodeName=prefix+'Spine02_Jnt', pos=(Spine02Pos), radius=radius, leaveSelected=True ); denUt.den_DiagPause( seconds=dpTime )
+    SpineJoints = []
+    for i,SpinePos in enumerate( SpinePositions ):
+        SpineJoints += [ denUt.den_makeJoint( nodeName=prefix+'Spine'+str(i+1).zfill(2)+'_Jnt', pos=(SpinePos), radius=radius, leaveSelected=True ) ]; denUt.den_DiagPause( seconds=dpTime )
     ChestJoint = denUt.den_makeJoint( nodeName=prefix+'Chest_Jnt', pos=(ChestPos), radius=radius, leaveSelected=True ); denUt.den_DiagPause( seconds=dpTime )
-    Neck01Joint = denUt.den_makeJoint( nodeName=prefix+'Neck01_Jnt', pos=(Neck01Pos), radius=radius, leaveSelected=True ); denUt.den_DiagPause( seconds=dpTime )
+    NeckJoints = []
+    for i,NeckPos in enumerate( NeckPositions ):
+        NeckJoints += [ denUt.den_makeJoint( nodeName=prefix+'Neck'+str(i+1).zfill(2)+'_Jnt', pos=(NeckPos), radius=radius, leaveSelected=True ) ]; denUt.den_DiagPause( seconds=dpTime )
     HeadJoint = denUt.den_makeJoint( nodeName=prefix+'Head_Jnt', pos=(HeadPos), radius=radius, leaveSelected=True ); denUt.den_DiagPause( seconds=dpTime )
     HeadEndJoint = denUt.den_makeJoint( nodeName=prefix+'Head_end', pos=(HeadEndPos), radius=radius*0.4, leaveSelected=False ); denUt.den_DiagPause( seconds=dpTime )
     # Select HeadJoint, so when create JawJoint, the JawJoint will be parented under HeadJoint
@@ -355,15 +1642,13 @@ def jly_makeBipedTorsoRig( prefix='', radius=3.0, ctrlRadius=(19.0,21.0,12.0,2.0
     JawJoint = denUt.den_makeJoint( nodeName=prefix+'Jaw_Jnt', pos=(JawPos), radius=radius, leaveSelected=True ); denUt.den_DiagPause( seconds=dpTime )
     JawEndJoint = denUt.den_makeJoint( nodeName=prefix+'Jaw_end', pos=(JawEndPos), radius=radius*0.4, leaveSelected=True ); denUt.den_DiagPause( seconds=dpTime )
     
-    # Display local axis fot all joints, also can be made into a for loop *
+    # Capture torso joints in a list
+    TorsoBindJoints += [ PelvisJoint ] + SpineJoints + [ ChestJoint ] + NeckJoints + [ HeadJoint, JawJoint ]
+    
+    # Display local axis fot all joints
     if ( displayLocalAxis ):
-        cmds.setAttr( PelvisJoint+'.displayLocalAxis', 1 )
-        cmds.setAttr( Spine01Joint+'.displayLocalAxis', 1 )
-        cmds.setAttr( Spine02Joint+'.displayLocalAxis', 1 )
-        cmds.setAttr( ChestJoint+'.displayLocalAxis', 1 )
-        cmds.setAttr( Neck01Joint+'.displayLocalAxis', 1 )
-        cmds.setAttr( HeadJoint+'.displayLocalAxis', 1 )
-        cmds.setAttr( JawJoint+'.displayLocalAxis', 1 )
+        for jnt in TorsoBindJoints:
+            cmds.setAttr( jnt+'.displayLocalAxis', 1 )
     
     
     # Orient all the joints to what we want
@@ -371,40 +1656,29 @@ def jly_makeBipedTorsoRig( prefix='', radius=3.0, ctrlRadius=(19.0,21.0,12.0,2.0
     cmds.joint( PelvisJoint, e=True, oj='xyz', secondaryAxisOrient='zdown', ch=True, zso=True )
     cmds.joint( JawJoint, e=True, oj='xyz', secondaryAxisOrient='zdown', ch=True, zso=True )
     
-    # Add a single chain IK handles for body parts in between (joints Spine01, Spine02, Neck01)
-    # The other parts (Pelvis, Cheat, Head) will be 100% driven directly by their own controls, so no need of IK
-    # Select 2 objects
-    cmds.select( Spine01Joint, Spine02Joint )
-    # Create the IK handle between them
-    Spine01Handle = denUt.den_AddIKHandle('ikSCsolver',False)
-    cmds.select( Spine02Joint, ChestJoint )
-    Spine02Handle = denUt.den_AddIKHandle('ikSCsolver',False)
-    cmds.select( Neck01Joint, HeadJoint )
-    Neck01Handle = denUt.den_AddIKHandle('ikSCsolver',False)
-    
     # Create Pelvis control
-    PelvisCtrl = denUt.den_MakeBall(nodeName=prefix+'Pelvis_Ctrl',pos=(0,0,0),radius=ctrlRadius[0],doT=False)
+    PelvisCtrl = jly_makeCachedCtrl( denUt.den_MakeBall, nodeName=prefix+'Pelvis_Ctrl',pos=(0,0,0),radius=ctrlRadius[0],doT=False)
     # Move the control to line up with the pivot position
     cmds.xform( t=PelvisPos )
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     
     # Create Chest control
-    ChestCtrl = denUt.den_MakeBall(nodeName=prefix+'Chest_Ctrl',pos=(0,0,0),radius=ctrlRadius[1],doT=False)
+    ChestCtrl = jly_makeCachedCtrl( denUt.den_MakeBall, nodeName=prefix+'Chest_Ctrl',pos=(0,0,0),radius=ctrlRadius[1],doT=False)
     # Move the control to line up with the pivot position
     cmds.xform( t=ChestPos )
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     
     # Create Head control
-    HeadCtrl = denUt.den_MakeBall(nodeName=prefix+'Head_Ctrl',pos=(0,0,0),radius=ctrlRadius[2],doT=False)
+    HeadCtrl = jly_makeCachedCtrl( denUt.den_MakeBall, nodeName=prefix+'Head_Ctrl',pos=(0,0,0),radius=ctrlRadius[2],doT=False)
     # Move the control to line up with the pivot position
     cmds.xform( t=HeadPos )
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     
     # Create Jaw control
-    JawCtrl = denUt.den_MakeBall(nodeName=prefix+'Jaw_Ctrl',pos=(0,-6,10),radius=ctrlRadius[3],doT=True)
+    JawCtrl = jly_makeCachedCtrl( denUt.den_MakeBall, nodeName=prefix+'Jaw_Ctrl',pos=(0,-6,10),radius=ctrlRadius[3],doT=True)
     # Move the control to line up with the pivot position
     cmds.xform( t=JawPos )
     # Color the control
@@ -413,71 +1687,27 @@ def jly_makeBipedTorsoRig( prefix='', radius=3.0, ctrlRadius=(19.0,21.0,12.0,2.0
     # Add the 4 controls to the TorsoALL control list *I cleaned up :)*
     TorsoCtrlsALL += [PelvisCtrl,ChestCtrl,HeadCtrl,JawCtrl]
     
-    # ===============================================================================================
-    # - Just In Case Control:
-    # This for loop is here when character has more than one spine/neck joint
-    # Make a list of all spine joints
-    '''
-    VertJoints = [Spine02Joint]
-    print( VertJoints )
-    # Make a list for all spine controls
-    VertControls = []
-    for jx in VertJoints:
-        print( jx )
-        # Name the control and replace _Jnt with _Ctrl
-        CtrlName = jx.replace('_Jnt', '_Ctrl')
-        print( CtrlName )
-        # Create a spine control
-        Ctrl = denUt.den_MakeBall(nodeName=CtrlName,pos=(0,2,0),radius=0.3,doT=True)
-        # Color the control
-        denUt.den_ColorShapeRGB(rgb=(1,0,1))
-        # Parent under the joint
-        Ctrl = cmds.parent( Ctrl, jx, relative=True )
-        # Parent under Torso SpaceIN
-        Ctrl = cmds.parent( Ctrl, TorsoSpaceIN )
-        # Add 0 null
-        Ctrl = denUt.den_AddZeroNull()
-        # Lock scale attribute
-        denUt.den_Lock(  0,0,0 , 0,0,0 , 1,1,1 , 0 )
-        # Add the control to the list
-        VertControls += Ctrl
-        denUt.den_DiagPause( seconds=dpTime )
-    
-    # Add the controls to Torso controls list
-    TorsoCtrlsALL += VertControls
-    print( VertControls )
-    print( TorsoCtrlsALL )
-    
-    Spine02Ctrl = VertControls[0]
-    
-    '''
-    # ===============================================================================================
-    
-    # - Make the just-in-case control for spine. *I extract out of the loop :)*
-    # Name the control and replace _Jnt with _Ctrl
-    CtrlName = Spine02Joint.replace('_Jnt', '_Ctrl')
-    # Create a spine control
-    Ctrl = denUt.den_MakeBall(nodeName=CtrlName,pos=(0,2,0),radius=0.3,doT=True)
+    # - Make the spine mid control, it bends the middle of the spine curve, and always stays between pelvis and chest
+    SpineMidCtrl = jly_makeCachedCtrl( denUt.den_MakeBall, nodeName=prefix+'SpineMid_Ctrl',pos=(0,0,0),radius=ctrlRadius[0]*0.7,doT=False)
+    # Move the control to the middle of the spine curve
+    cmds.xform( t=SpineMidPos )
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
-    # Parent under the joint
-    Ctrl = cmds.parent( Ctrl, Spine02Joint, relative=True )
     # Parent under Torso SpaceIN
-    Ctrl = cmds.parent( Ctrl, TorsoSpaceIN )
+    SpineMidCtrl = cmds.parent( SpineMidCtrl, TorsoSpaceIN )
     # Add 0 null
-    Ctrl = denUt.den_AddZeroNull()
+    cmds.select( SpineMidCtrl )
+    SpineMidCtrl = denUt.den_AddZeroNull()
     # Lock scale attribute
-    denUt.den_Lock(  0,0,0 , 0,0,0 , 1,1,1 , 0 )
+    jly_lock(  0,0,0 , 0,0,0 , 1,1,1 , 0 )
+    # Find who the 0 null is for SpineMid
+    SpineMidCtrlZero = cmds.listRelatives( SpineMidCtrl, parent=True )
     # DP
     denUt.den_DiagPause( seconds=dpTime )
     # Add the controls to Torso controls list
-    TorsoCtrlsALL += Ctrl
-    print( Ctrl )
-    print( TorsoCtrlsALL )
-    Spine02Ctrl = Ctrl
+    TorsoCtrlsALL += SpineMidCtrl
     
-    # - Put locators (that is not a joint) for body parts which are spliting weight of 2 other parts- 
-    # -such as(spine1: pelvis+chest, spine2:chest+neck), as something to constrain to
+    # - Put locators (that is not a joint) for body parts which are driven by their own controls, as something to constrain to
     # Make a locator for the pelvis
     PelvisLoc = cmds.spaceLocator (n=prefix+'Pelvis_Loc')
     # Parent under PelvisJoint
@@ -499,13 +1729,69 @@ def jly_makeBipedTorsoRig( prefix='', radius=3.0, ctrlRadius=(19.0,21.0,12.0,2.0
     # Re-parent under HeadCtrl
     HeadLoc = cmds.parent( HeadLoc, HeadCtrl )
     
-    # - Re-parent some handle created earlier
-    # Make Spine01 IK goal point at Spine02, so it follows Spine02Ctrl
-    Spine01Handle = cmds.parent( Spine01Handle, Spine02Ctrl )
-    # Make Spine02 IK goal point at Chest, so it follows ChestCtrl
-    Spine02Handle = cmds.parent( Spine02Handle, ChestCtrl )
-    # Make Neck01 IK goal point at Head, so it follows HeadCtrl
-    Neck01Handle = cmds.parent( Neck01Handle, HeadCtrl )
+    # - Spline IK: one handle drives all the joints in between (spine joints, neck joints)
+    # The other parts (Pelvis, Chest, Head) will be 100% driven directly by their own controls
+    # Spine: from the first spine joint to the chest, neck: from the first neck joint to the head
+    # ccv/scv/ns: let Maya fit a simple 1 span curve (4 CVs) through the joints
+    SpineIKhandle = cmds.ikHandle( startJoint=SpineJoints[0], endEffector=ChestJoint, solver='ikSplineSolver', createCurve=True, simplifyCurve=True, numSpans=1, parentCurve=False, name=prefix+'Spine_Ikh' )
+    NeckIKhandle = cmds.ikHandle( startJoint=NeckJoints[0], endEffector=HeadJoint, solver='ikSplineSolver', createCurve=True, simplifyCurve=True, numSpans=1, parentCurve=False, name=prefix+'Neck_Ikh' )
+    # Rename the effectors and the curves
+    cmds.rename( SpineIKhandle[1], prefix+'Spine_Eff' )
+    cmds.rename( NeckIKhandle[1], prefix+'Neck_Eff' )
+    SpineCurve = cmds.rename( SpineIKhandle[2], prefix+'Spine_Crv' )
+    NeckCurve = cmds.rename( NeckIKhandle[2], prefix+'Neck_Crv' )
+    
+    # Make driver joints (not bind joints, so _Jx) for the curves, the curves get skinned to them
+    cmds.select( clear=True )
+    SpineBaseDrv = cmds.joint( n=prefix+'SpineBase_Jx', p=SpinePositions[0], radius=radius*0.5 )
+    cmds.select( clear=True )
+    SpineMidDrv = cmds.joint( n=prefix+'SpineMid_Jx', p=SpineMidPos, radius=radius*0.5 )
+    cmds.select( clear=True )
+    SpineTipDrv = cmds.joint( n=prefix+'SpineTip_Jx', p=ChestPos, radius=radius*0.5 )
+    cmds.select( clear=True )
+    NeckBaseDrv = cmds.joint( n=prefix+'NeckBase_Jx', p=NeckPositions[0], radius=radius*0.5 )
+    cmds.select( clear=True )
+    NeckTipDrv = cmds.joint( n=prefix+'NeckTip_Jx', p=HeadPos, radius=radius*0.5 )
+    
+    # Bind the curves to the drivers
+    SpineCurveSkin = cmds.skinCluster( SpineBaseDrv, SpineMidDrv, SpineTipDrv, SpineCurve, toSelectedBones=True, name=prefix+'Spine_Crv_skinCluster' )[0]
+    NeckCurveSkin = cmds.skinCluster( NeckBaseDrv, NeckTipDrv, NeckCurve, toSelectedBones=True, name=prefix+'Neck_Crv_skinCluster' )[0]
+    # Set the CV weights: the ends follow their own control 100%, the inner CVs split between the neighbours
+    cmds.skinPercent( SpineCurveSkin, SpineCurve+'.cv[0]', transformValue=[ (SpineBaseDrv,1.0) ] )
+    cmds.skinPercent( SpineCurveSkin, SpineCurve+'.cv[1]', transformValue=[ (SpineBaseDrv,0.5), (SpineMidDrv,0.5) ] )
+    cmds.skinPercent( SpineCurveSkin, SpineCurve+'.cv[2]', transformValue=[ (SpineMidDrv,0.5), (SpineTipDrv,0.5) ] )
+    cmds.skinPercent( SpineCurveSkin, SpineCurve+'.cv[3]', transformValue=[ (SpineTipDrv,1.0) ] )
+    cmds.skinPercent( NeckCurveSkin, NeckCurve+'.cv[0]', transformValue=[ (NeckBaseDrv,1.0) ] )
+    cmds.skinPercent( NeckCurveSkin, NeckCurve+'.cv[1]', transformValue=[ (NeckBaseDrv,0.7), (NeckTipDrv,0.3) ] )
+    cmds.skinPercent( NeckCurveSkin, NeckCurve+'.cv[2]', transformValue=[ (NeckBaseDrv,0.3), (NeckTipDrv,0.7) ] )
+    cmds.skinPercent( NeckCurveSkin, NeckCurve+'.cv[3]', transformValue=[ (NeckTipDrv,1.0) ] )
+    
+    # Parent the drivers, so they follow their controls (neck base follows the chest joint, same as the head control)
+    cmds.parent( SpineBaseDrv, PelvisCtrl )
+    cmds.parent( SpineMidDrv, SpineMidCtrl )
+    cmds.parent( SpineTipDrv, ChestCtrl )
+    cmds.parent( NeckBaseDrv, ChestJoint )
+    cmds.parent( NeckTipDrv, HeadCtrl )
+    
+    # Put the handles and curves under the torso group, the curves are skinned so they must not inherit transforms
+    cmds.parent( SpineIKhandle[0], NeckIKhandle[0], SpineCurve, NeckCurve, TorsoRigGrp )
+    cmds.setAttr( SpineCurve+'.inheritsTransform', 0 )
+    cmds.setAttr( NeckCurve+'.inheritsTransform', 0 )
+    
+    # Advanced twist: spread the twist from the start driver to the end driver
+    for Handle,StartDrv,EndDrv in [ (SpineIKhandle[0],SpineBaseDrv,SpineTipDrv), (NeckIKhandle[0],NeckBaseDrv,NeckTipDrv) ]:
+        cmds.setAttr( Handle+'.dTwistControlEnable', 1 )
+        # World up type 4: Object Rotation Up (Start/End)
+        cmds.setAttr( Handle+'.dWorldUpType', 4 )
+        # Joint Y axis points to the back (zdown), so use positive Y and world -Z as the up vectors
+        cmds.setAttr( Handle+'.dWorldUpAxis', 0 )
+        cmds.setAttr( Handle+'.dWorldUpVector', 0,0,-1 )
+        cmds.setAttr( Handle+'.dWorldUpVectorEnd', 0,0,-1 )
+        cmds.connectAttr( StartDrv+'.worldMatrix[0]', Handle+'.dWorldUpMatrix' )
+        cmds.connectAttr( EndDrv+'.worldMatrix[0]', Handle+'.dWorldUpMatrixEnd' )
+    
+    # Add the spline guts to the list
+    TorsoGutsALL += [ SpineIKhandle[0], NeckIKhandle[0], SpineCurve, NeckCurve, SpineBaseDrv, SpineMidDrv, SpineTipDrv, NeckBaseDrv, NeckTipDrv ]
     
     # Parent controls hierarchy
     JawCtrl = cmds.parent( JawCtrl, HeadCtrl )
@@ -518,24 +1804,24 @@ def jly_makeBipedTorsoRig( prefix='', radius=3.0, ctrlRadius=(19.0,21.0,12.0,2.0
     cmds.select( PelvisCtrl )
     PelvisCtrl = denUt.den_AddZeroNull()
     # Lock scale attribute
-    denUt.den_Lock(  0,0,0 , 0,0,0 , 1,1,1 , 0 )
+    jly_lock(  0,0,0 , 0,0,0 , 1,1,1 , 0 )
     # Add 0 null for the chest control
     cmds.select( ChestCtrl )
     ChestCtrl = denUt.den_AddZeroNull()
     # Lock scale attribute
-    denUt.den_Lock(  0,0,0 , 0,0,0 , 1,1,1 , 0 )
+    jly_lock(  0,0,0 , 0,0,0 , 1,1,1 , 0 )
     # Add 0 null for the head control
     cmds.select( HeadCtrl )
     HeadCtrl = denUt.den_AddZeroNull()
     # Lock scale attribute
-    denUt.den_Lock(  0,0,0 , 0,0,0 , 1,1,1 , 0 )
+    jly_lock(  0,0,0 , 0,0,0 , 1,1,1 , 0 )
     # Find who the 0 null is for Head
     HeadCtrlZero = cmds.listRelatives( HeadCtrl, parent=True )
     # Add 0 null for the jaw control
     cmds.select( JawCtrl )
     JawCtrl = denUt.den_AddZeroNull()
     # Lock scale attribute
-    denUt.den_Lock(  0,0,0 , 0,0,0 , 1,1,1 , 0 )
+    jly_lock(  0,0,0 , 0,0,0 , 1,1,1 , 0 )
     # Find who the 0 null is for Jaw
     JawCtrlZero = cmds.listRelatives( JawCtrl, parent=True )
     
@@ -553,29 +1839,18 @@ def jly_makeBipedTorsoRig( prefix='', radius=3.0, ctrlRadius=(19.0,21.0,12.0,2.0
     # Parent head ctrl0 to chest joint, so the head control follows chest joint
     cmds.parentConstraint( ChestJoint, HeadCtrlZero, mo=True )
     
-    # Split the influence of pelvis and chest controls in half, and make the small Vertebrae spine controls always inbetween pelvis and chest
-    cmds.parentConstraint( PelvisCtrl, ChestCtrl, prefix+'Spine02_CtrlZero', mo=True )
-    # Make 2 orient constraints on the joint, to split rotate/twist so all are even
-    # sc1: spine constraint 1, split the rotate between pelvis and spine02Ctrl, target is Spine01Handle
-    sc1 = cmds.orientConstraint( PelvisCtrl, prefix+'Spine02_Ctrl', Spine01Handle )
-    # sc2: spine constraint 2, split the rotate between spine02Ctrl and chest, target is Spine02Handle
-    sc2 = cmds.orientConstraint( prefix+'Spine02_Ctrl', ChestCtrl, Spine02Handle )
-    # nc1: neck constraint 1, split the rotate between chest and head, target is Neck01Handle
-    nc1 = cmds.orientConstraint( ChestLoc, HeadLoc, Neck01Handle, mo=True )
-    
+    # Split the influence of pelvis and chest controls in half, and make the spine mid control always inbetween pelvis and chest
+    SpineMidCon = cmds.parentConstraint( PelvisCtrl, ChestCtrl, SpineMidCtrlZero, mo=True )
     # Change the condtrain's InterpType: use Shortest, to reduce the chance of flip
-    for con in [ sc1, sc2, nc1 ]:
-        print( con )
-        cmds.setAttr( con[0]+'.interpType', 2 )
-    
-    
-    # Capture torso joints in a list
-    TorsoBindJoints += [ PelvisJoint, Spine01Joint, Spine02Joint, ChestJoint, Neck01Joint, HeadJoint, JawJoint ]
+    cmds.setAttr( SpineMidCon[0]+'.interpType', 2 )
     
     # Create SpaceOUTs
     TorsoSpaceOUTs += denUt.den_AddSpaceOUTs(TorsoBindJoints)
     print( TorsoSpaceOUTs )
     
+    # Lock and hide the channels in the lock table in one pass
+    jly_applyLocks( module=cmds.ls( TorsoRigGrp )[0] )
+    
     # Return the top level root group node, SpaceINs, SpaceOUTs, BindJoints, CtrlsALL, GutsALL lists in order
     return TorsoRigGrp, TorsoSpaceINs, TorsoSpaceOUTs, TorsoBindJoints, TorsoCtrlsALL, TorsoGutsALL
 
@@ -583,20 +1858,20 @@ def jly_makeBipedTorsoRig( prefix='', radius=3.0, ctrlRadius=(19.0,21.0,12.0,2.0
 # ---------------------------------------------------------------------------------------
 # Create Arm Pivots
 
-def jly_makeBipedArmPivs( side='L_', prefix='', name='Arm', radius=2.0, elbowDist=20.0, dpTime = 0.01 ):
+def jly_makeBipedArmPivs( side='L_', prefix='', name='Arm', radius=2.0, symmetric=False, dpTime = 0.01 ):
     
     # - Create arm pivots to match the character
     # Create a root arm pivot group to hold all arm pivots
     ArmPivGrp = denUt.den_makeGrp( nodeName=side+prefix+name+'Piv_Grp', pos=(0,0,0) )
     # Lock all attributes except X-scale, X-scale will be used to do mirror later
-    denUt.den_Lock(  1,1,1 , 1,1,1 , 0,1,1 , 0 )
+    jly_lock(  1,1,1 , 1,1,1 , 0,1,1 , 0 )
     
     # Create clavicle pivot
     ClavPiv = denUt.den_makeLoc( nodeName=side+prefix+'Clav_Piv', pos=(5, 150, 0), radius=radius ); denUt.den_DiagPause( seconds=dpTime )
     # Color the pivot
     denUt.den_ColorShape(20)
     # Lock all attribute except translate
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
     
     # Create shoulder pivot
     ShldPiv = denUt.den_makeLoc( nodeName=side+prefix+'Shld_Piv', pos=(20, 150, -5), radius=radius ); denUt.den_DiagPause( seconds=dpTime )
@@ -608,7 +1883,7 @@ def jly_makeBipedArmPivs( side='L_', prefix='', name='Arm', radius=2.0, elbowDis
     # Color the pivot
     denUt.den_ColorShape(20)
     # Lock all attribute except translate
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
     
     # Create wrist pivot
     WristPiv = denUt.den_makeLoc( nodeName=side+prefix+'Wrist_Piv', pos=(40, 95, 5), radius=radius ); denUt.den_DiagPause( seconds=dpTime )
@@ -626,65 +1901,45 @@ def jly_makeBipedArmPivs( side='L_', prefix='', name='Arm', radius=2.0, elbowDis
     # Color the pivot
     denUt.den_ColorShape(20)
     # Lock all attribute except translate
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
-    
-    # Create elbow mid locator
-    ElbowMidLoc = denUt.den_makeLoc( nodeName=side+prefix+'ElbowMid_Loc', radius=radius/2 )
-    # Color the pivot
-    denUt.den_ColorShape(2)
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
     
-    # Create elbow pole locator
-    ElbowPoleLoc = denUt.den_makeLoc( nodeName=side+prefix+'ElbowPole_Loc', pos=(0, elbowDist, 0), radius=radius )
-    # Color the pivot
-    denUt.den_ColorShape(9)
-    
-    # Parent ElbowMid Locator under ElbowPole locator
-    cmds.parent( ElbowPoleLoc,ElbowMidLoc, relative=True )
-    # Lock all attributes of ElbowPole Locator, except translate-Y, so it cannot be moved away from the triangle plane
-    denUt.den_Lock(  1,0,1 , 1,1,1 , 1,1,1 , 1 )
+    # The elbow pole is not a locator, it is solved from the shoulder, elbow, wrist pivots with all the other limbs (jly_limbPoles)
     
     # Make things not shift around when switching IK FK: solution is to put joint orient on a triangle
     # so here we build triangle with locators, allow use to move locator but won't break the triangle
     # 2 triangles: 1- scap01, scap02, shoulder; 2- shoulder, elbow, wrist
     
-    # Make ElbowMid Locator stays in between Shoulder Pivot and Wrist Pivot
-    cmds.pointConstraint( ShldPiv,WristPiv,ElbowMidLoc, maintainOffset=False )
-    # Make ElbowMid Locator aim at the wrist pivot, and use ElbowPiv as its up object. so it stays on the triangle plane
-    cmds.aimConstraint( WristPiv,ElbowMidLoc, maintainOffset=False, worldUpType='object', worldUpObject=ElbowPiv[0] )
-    cmds.select(ElbowMidLoc)
-    # Lock all attributes
-    denUt.den_Lock(  1,1,1 , 1,1,1 , 1,1,1 , 1 )
-    
     # Make Shoulder Pivot aim at elbow pivot, and use wrist as its up object, so the shoulder pivot stays on the triangle plane
     cmds.aimConstraint( ElbowPiv,ShldPiv, maintainOffset=False, worldUpType='object', worldUpObject=WristPiv[0] )
-    cmds.select(ShldPiv)
     # Lock all attributes except translate
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 , nodes=ShldPiv )
     
     # Make Scap01 Pivot aim at scap02 pivot, and use shoulder as its up object, so the scap01 pivot stays on the triangle plane
     cmds.aimConstraint( Scap02Piv,Scap01Piv, maintainOffset=False, worldUpType='object', worldUpObject=ShldPiv[0] )
-    cmds.select(Scap01Piv)
     # Lock all attributes except translate
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 , nodes=Scap01Piv )
     
-    # Make Wrist Pivot aim at the elbow pivot, and use L_ArmMid Locator as its up object, so the Wrist Pivot stays on the triangle plane, aimvector can flip it
-    cmds.aimConstraint( ElbowPiv,WristPiv, maintainOffset=False, worldUpType='object', worldUpObject=ElbowMidLoc[0], aimVector=(-1,0,0) )
-    cmds.select(WristPiv)
+    # Make Wrist Pivot aim at the elbow pivot, and use the shoulder pivot as its up object, so the Wrist Pivot stays on the triangle plane, aimvector can flip it
+    # (the shoulder is on the same line from the wrist as the shoulder-wrist mid point, so the up direction is the same)
+    cmds.aimConstraint( ElbowPiv,WristPiv, maintainOffset=False, worldUpType='object', worldUpObject=ShldPiv[0], aimVector=(-1,0,0) )
     # Lock all attributes except translate
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 , nodes=WristPiv )
     
     # Parent all pivot under root group ArmPivGrp
-    cmds.parent( ClavPiv,ShldPiv,ElbowPiv,WristPiv,Scap01Piv,Scap02Piv,ElbowMidLoc,ArmPivGrp )
+    cmds.parent( ClavPiv,ShldPiv,ElbowPiv,WristPiv,Scap01Piv,Scap02Piv,ArmPivGrp )
     
     # Clear selection
     cmds.select(clear=True)
     # DP refresh
     denUt.den_DiagPause( seconds=dpTime )
     
-    # If making right arm, mirror all pivots
-    if side == 'R_':
+    # If making right arm, mirror all pivots (symmetric: keep scale 1, jly_mirrorPivots places the pivots)
+    if side == 'R_' and not symmetric:
         cmds.setAttr( ArmPivGrp+'.scaleX', -1 )
     
+    # Lock and hide the channels in the lock table in one pass
+    jly_applyLocks( module=cmds.ls( ArmPivGrp )[0] )
+    
     return ArmPivGrp
 
 
@@ -692,7 +1947,7 @@ def jly_makeBipedArmPivs( side='L_', prefix='', name='Arm', radius=2.0, elbowDis
 # Create Arm Rig
 
 # Twist type: none/twist/ribbon, choose different way to do limb twist
-def jly_makeBipedArmRig( side='L_', prefix='', name='Arm', radius=2.0, ctrlRadius=10.0, displayLocalAxis=False, twistType='none', dpTime = 0.01 ):
+def jly_makeBipedArmRig( side='L_', prefix='', name='Arm', radius=2.0, ctrlRadius=10.0, displayLocalAxis=False, twistType='none', poleDist=20.0, poles={}, symmetric=False, dpTime = 0.01 ):
     
     # Input twist type
     if( twistType == 'none' ) or ( twistType == 'twist' ) or ( twistType == 'ribbon' ):
@@ -700,8 +1955,12 @@ def jly_makeBipedArmRig( side='L_', prefix='', name='Arm', radius=2.0, ctrlRadiu
     else:
         print( 'ERROR - twistType must be  \'none\' or \'twist\' or \'ribbon\' - nothing else will work' )
     
+    # Forget the handles an earlier build left in this scope, the arm registers its joints again
+    jly_clearHandles( side+prefix )
+    
     # If making right arm rig, set pivot group scaleX to 1, flip the pivot group to the left for good mirroring
-    if side == 'R_':
+    # Symmetric pivots are already mirrored with scale 1, build from them as they are
+    if side == 'R_' and not symmetric:
         cmds.setAttr( side+prefix+name+'Piv_Grp.scaleX', 1 )
     
     # DP refresh viewport
@@ -755,14 +2014,18 @@ def jly_makeBipedArmRig( side='L_', prefix='', name='Arm', radius=2.0, ctrlRadiu
     WristCtrlSpaceConstraint = cmds.parentConstraint( CogSpaceIN, WristCtrlSpace, weight=0 )
     WristCtrlSpaceConstraint = cmds.parentConstraint( AllSpaceIN, WristCtrlSpace, weight=0 )
         
-    # Query all pivots for their worldspace positions
-    ClavPos = cmds.xform( side+prefix+'Clav_Piv', ws=True, q=True, t=True )
-    ShldPos = cmds.xform( side+prefix+'Shld_Piv', ws=True, q=True, t=True )
-    ElbowPos = cmds.xform( side+prefix+'Elbow_Piv', ws=True, q=True, t=True )
-    WristPos = cmds.xform( side+prefix+'Wrist_Piv', ws=True, q=True, t=True )
-    ElbowPolePos = cmds.xform( side+prefix+'ElbowPole_Loc', ws=True, q=True, t=True )
-    Scap01Pos = cmds.xform( side+prefix+'Scap01_Piv', ws=True, q=True, t=True )
-    Scap02Pos = cmds.xform( side+prefix+'Scap02_Piv', ws=True, q=True, t=True )
+    # Query all pivots for their worldspace positions, one snapshot for the whole arm
+    Snap = jly_snapshotPivots( [ side+prefix+s for s in [ 'Clav_Piv', 'Shld_Piv', 'Elbow_Piv', 'Wrist_Piv', 'Scap01_Piv', 'Scap02_Piv' ] ] )
+    # The elbow pole comes solved with all the other limbs (poles from jly_limbPoles), a build on its own solves it from the snapshot
+    if side+prefix+'ElbowPole' not in poles:
+        Snap = jly_addPoles( Snap, dist=poleDist )
+    ClavPos = jly_snapPos( Snap, side+prefix+'Clav_Piv' )
+    ShldPos = jly_snapPos( Snap, side+prefix+'Shld_Piv' )
+    ElbowPos = jly_snapPos( Snap, side+prefix+'Elbow_Piv' )
+    WristPos = jly_snapPos( Snap, side+prefix+'Wrist_Piv' )
+    ElbowPolePos = poles.get( side+prefix+'ElbowPole' ) or jly_snapPos( Snap, side+prefix+'ElbowPole' )
+    Scap01Pos = jly_snapPos( Snap, side+prefix+'Scap01_Piv' )
+    Scap02Pos = jly_snapPos( Snap, side+prefix+'Scap02_Piv' )
     
     # Create all joints for the arm
     # Clear selection
@@ -777,6 +2040,9 @@ def jly_makeBipedArmRig( side='L_', prefix='', name='Arm', radius=2.0, ctrlRadiu
     ElbowJoint = cmds.joint( n=side+prefix+'Elbow_Jnt', p=(ElbowPos), radius=radius ); denUt.den_DiagPause( seconds=dpTime )
     # Create wrist joint at the correct postion
     WristJoint = cmds.joint( n=side+prefix+'Wrist_Jnt', p=(WristPos), radius=radius ); denUt.den_DiagPause( seconds=dpTime )
+    # Register the arm joints, the IK/FK chains and the twists look them up by role
+    for Role,Joint in [ ('Clav_Jnt',ClavJoint), ('Shld_Jnt',ShldJoint), ('Elbow_Jnt',ElbowJoint), ('Wrist_Jnt',WristJoint) ]:
+        jly_registerHandle( side+prefix, Role, Joint )
     
     # If displayLocalAxis=True, show all local axis for the joints
     if ( displayLocalAxis ):
@@ -839,20 +2105,14 @@ def jly_makeBipedArmRig( side='L_', prefix='', name='Arm', radius=2.0, ctrlRadiu
     Scap01Joint = cmds.parent( Scap01Joint, ArmSkelGrp )[0]
     
     # --- Create IK and FK joint chains for the arm ---
-    # Duplicate arm joints for to make IK joint chain
-    ShldJointIK = cmds.duplicate (ShldJoint, name=side+prefix+'Shld_IK' )[0]
-    # Rename joints to _IK
-    ElbowJointIK = cmds.rename (ShldJointIK+'|'+side+prefix+'Elbow_Jnt', side+prefix+'Elbow_IK' )
-    WristJointIK = cmds.rename (ElbowJointIK+'|'+side+prefix+'Wrist_Jnt', side+prefix+'Wrist_IK' )
-    # Duplicate arm joints for to make FK joint chain
-    ShldJointFK = cmds.duplicate (ShldJoint, name=side+prefix+'Shld_FK' )[0]
-    # Rename joints to _FK
-    ElbowJointFK = cmds.rename (ShldJointFK+'|'+side+prefix+'Elbow_Jnt', side+prefix+'Elbow_FK' )
-    WristJointFK = cmds.rename (ElbowJointFK+'|'+side+prefix+'Wrist_Jnt', side+prefix+'Wrist_FK' )
+    # Duplicate arm joints for to make IK joint chain, joints are renamed to _IK
+    ShldJointIK, ElbowJointIK, WristJointIK = jly_duplicateChain( side+prefix, 'Shld_Jnt', '_IK' )
+    # Duplicate arm joints for to make FK joint chain, joints are renamed to _FK
+    ShldJointFK, ElbowJointFK, WristJointFK = jly_duplicateChain( side+prefix, 'Shld_Jnt', '_FK' )
     
     # --- Create the controls and 0 nulls ---
     # Create shoulder IK control (cube)
-    ShldCtrl = denUt.den_MakeCube( nodeName=side+prefix+'Shld_Ctrl', pos=(0,0,0) ,radius=0.8*ctrlRadius, doT=False)
+    ShldCtrl = jly_makeCachedCtrl( denUt.den_MakeCube, nodeName=side+prefix+'Shld_Ctrl', pos=(0,0,0) ,radius=0.8*ctrlRadius, doT=False)
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     # Transform the control to the shoulder position
@@ -867,7 +2127,7 @@ def jly_makeBipedArmRig( side='L_', prefix='', name='Arm', radius=2.0, ctrlRadiu
     ArmCtrlsALL += ShldCtrl
     
     # Create shoulder FK control (spike), axis: -Z
-    ShldFKCtrl = denUt.den_MakeSpike( nodeName=side+prefix+'ShldFK_Ctrl', pos=(0,0,0) ,radius=ctrlRadius, doT=False, axis='-Z' )
+    ShldFKCtrl = jly_makeCachedCtrl( denUt.den_MakeSpike, nodeName=side+prefix+'ShldFK_Ctrl', pos=(0,0,0) ,radius=ctrlRadius, doT=False, axis='-Z' )
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     # Unlock control attributes before re-parent
@@ -879,7 +2139,7 @@ def jly_makeBipedArmRig( side='L_', prefix='', name='Arm', radius=2.0, ctrlRadiu
     # Add 0 null and store it in a variable
     ShldFKCtrl = denUt.den_AddZeroNull()
     # Lock all attribute except rotate and visibility
-    denUt.den_LockAttr(True,False,True,False)
+    jly_lockAttr(True,False,True,False)
     # Capture and store the 0 null in a variable
     ShldFKCtrlZero = cmds.listRelatives( ShldFKCtrl, parent=True, fullPath=True )
     # Connect rotate attribute of the joint to the control, so it gets exact rotate number
@@ -890,7 +2150,7 @@ def jly_makeBipedArmRig( side='L_', prefix='', name='Arm', radius=2.0, ctrlRadiu
     ArmCtrlsALL += ShldFKCtrl
     
     # Create Arm Utility Control (gear) (turn maya UI Move ctrl Tool Setting symmerty off when doing this)
-    ArmUtilCtrl = denUt.den_MakeGear( nodeName=side+prefix+name+'Util_Ctrl', pos=(4,12,0), radius=ctrlRadius*0.2, doT=False, Plane='XY' )
+    ArmUtilCtrl = jly_makeCachedCtrl( denUt.den_MakeGear, nodeName=side+prefix+name+'Util_Ctrl', pos=(4,12,0), radius=ctrlRadius*0.2, doT=False, Plane='XY' )
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     # Unlock control attributes before re-parent
@@ -898,18 +2158,14 @@ def jly_makeBipedArmRig( side='L_', prefix='', name='Arm', radius=2.0, ctrlRadiu
     # Parent utility gear control under shoulder control
     ArmUtilCtrl = cmds.parent( ArmUtilCtrl, ShldCtrl, relative=True )
     # Lock all attribute except visibility
-    denUt.den_LockAttr(True,True,True,False)
-    # Add attributes to the arm
-    cmds.addAttr( ArmUtilCtrl, longName=side+prefix+name+'_FK_IK', defaultValue=1.0, minValue=0.0, maxValue=1.0 )
-    cmds.setAttr( ArmUtilCtrl[0]+'.'+side+prefix+name+'_FK_IK', lock=False, keyable=True )
-    # Add attributes to the wrist
-    cmds.addAttr( ArmUtilCtrl, longName=side+prefix+'Wrist_FK_IK', defaultValue=0.0, minValue=0.0, maxValue=1.0 )
-    cmds.setAttr( ArmUtilCtrl[0]+'.'+side+prefix+'Wrist_FK_IK', lock=False, keyable=True )
+    jly_lockAttr(True,True,True,False)
+    # Add all the arm utility attributes in one go: arm and wrist FK_IK, IK wrist control spaces (jlyArmUtilSchema)
+    jly_addAttrSchema( node=ArmUtilCtrl, schema=jlyArmUtilSchema, side=side, prefix=prefix, name=name )
     # Add arm utility control to arm control group
     ArmCtrlsALL += ArmUtilCtrl
     
     # Create Elbow IK Control (pole)
-    ElbowCtrl = denUt.den_MakePole( nodeName=side+prefix+'Elbow_Ctrl', pos=(0,0,0) , radius=ctrlRadius*0.4, doT=False )
+    ElbowCtrl = jly_makeCachedCtrl( denUt.den_MakePole, nodeName=side+prefix+'Elbow_Ctrl', pos=(0,0,0) , radius=ctrlRadius*0.4, doT=False )
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     # Transform to the correct position
@@ -922,7 +2178,7 @@ def jly_makeBipedArmRig( side='L_', prefix='', name='Arm', radius=2.0, ctrlRadiu
     ArmCtrlsALL += ElbowCtrl
     
     # Create elbow FK Control (arrow)
-    ElbowFKCtrl = denUt.den_MakeArrowR( nodeName=side+prefix+'ElbowFK_Ctrl', pos=(0,-4,0), radius=ctrlRadius*0.4, doT=True, axis='-Y', flip=False )
+    ElbowFKCtrl = jly_makeCachedCtrl( denUt.den_MakeArrowR, nodeName=side+prefix+'ElbowFK_Ctrl', pos=(0,-4,0), radius=ctrlRadius*0.4, doT=True, axis='-Y', flip=False )
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     # Unlock control attributes before re-parent
@@ -934,14 +2190,14 @@ def jly_makeBipedArmRig( side='L_', prefix='', name='Arm', radius=2.0, ctrlRadiu
     # Add 0 null
     ElbowFKCtrl = denUt.den_AddZeroNull()
     # Lock all attribute except rotate and visibility
-    denUt.den_LockAttr(True,False,True,False)
+    jly_lockAttr(True,False,True,False)
     # Connect rotate attribute to ElbowJointFK
     cmds.connectAttr( ElbowFKCtrl[0]+'.rotate', ElbowJointFK+'.rotate' )
     # Add elbow FK control to arm control group
     ArmCtrlsALL += ElbowFKCtrl
     
     # Create wrist IK Control (ball)
-    WristCtrl = denUt.den_MakeBall( nodeName=side+prefix+'Wrist_Ctrl', pos=(0,0,0), radius=ctrlRadius*0.7, doT=False )
+    WristCtrl = jly_makeCachedCtrl( denUt.den_MakeBall, nodeName=side+prefix+'Wrist_Ctrl', pos=(0,0,0), radius=ctrlRadius*0.7, doT=False )
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     # Transform to the correct position
@@ -956,7 +2212,7 @@ def jly_makeBipedArmRig( side='L_', prefix='', name='Arm', radius=2.0, ctrlRadiu
     ArmCtrlsALL += WristCtrl
     
     # Create wrist FK Control (spike)
-    WristFKCtrl = denUt.den_MakeSpike( nodeName=side+prefix+'WristFK_Ctrl', pos=(0,0,0), radius=ctrlRadius, doT=False, axis='-Z' )
+    WristFKCtrl = jly_makeCachedCtrl( denUt.den_MakeSpike, nodeName=side+prefix+'WristFK_Ctrl', pos=(0,0,0), radius=ctrlRadius, doT=False, axis='-Z' )
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     # Unlock control attributes before re-parent
@@ -968,7 +2224,7 @@ def jly_makeBipedArmRig( side='L_', prefix='', name='Arm', radius=2.0, ctrlRadiu
     # Add 0 null
     WristFKCtrl = denUt.den_AddZeroNull()
     # Lock all attribute except rotate and visibility
-    denUt.den_LockAttr(True,False,True,False)
+    jly_lockAttr(True,False,True,False)
     # Change rotate order to make sense for wrist
     cmds.setAttr( WristFKCtrl[0]+'.rotateOrder', 1 )
     # Capture and store the 0 null in a variable
@@ -1000,28 +2256,12 @@ def jly_makeBipedArmRig( side='L_', prefix='', name='Arm', radius=2.0, ctrlRadiu
     # Orient constraint WristJoint to WristFKCtrl
     cmds.orientConstraint( WristFKCtrl, WristJoint )
     
-    # --- Create and connect attributes for IK Wrist control space switcher ---
-    # Add attributes to arm utility control for HeadSpace
-    cmds.addAttr( ArmUtilCtrl, longName=side+prefix+'HeadSpace', defaultValue=0.0, minValue=0.0, maxValue=1.0 )
-    # Set attribute lock and keyable value so it shows up in channel box
-    cmds.setAttr( ArmUtilCtrl[0]+'.'+side+prefix+'HeadSpace', lock=False, keyable=True )
+    # --- Connect attributes for IK Wrist control space switcher (added with jlyArmUtilSchema) ---
     # Connect attribute to the actual space switching constraint
     cmds.connectAttr( ArmUtilCtrl[0]+'.'+side+prefix+'HeadSpace', WristCtrlSpaceConstraint[0]+'.'+side+prefix+'Head_SpaceINW0' )
-    # Add attributes to arm utility control for ChestSpace
-    cmds.addAttr( ArmUtilCtrl, longName=side+prefix+'ChestSpace', defaultValue=1.0, minValue=0.0, maxValue=1.0 )
-    cmds.setAttr( ArmUtilCtrl[0]+'.'+side+prefix+'ChestSpace', lock=False, keyable=True )
     cmds.connectAttr( ArmUtilCtrl[0]+'.'+side+prefix+'ChestSpace', WristCtrlSpaceConstraint[0]+'.'+side+prefix+'Chest_SpaceINW1' )
-    # Add attributes to arm utility control for PelvisSpace
-    cmds.addAttr( ArmUtilCtrl, longName=side+prefix+'PelvisSpace', defaultValue=0.0, minValue=0.0, maxValue=1.0 )
-    cmds.setAttr( ArmUtilCtrl[0]+'.'+side+prefix+'PelvisSpace', lock=False, keyable=True )
     cmds.connectAttr( ArmUtilCtrl[0]+'.'+side+prefix+'PelvisSpace', WristCtrlSpaceConstraint[0]+'.'+side+prefix+'Pelvis_SpaceINW2' )
-    # Add attributes to arm utility control for CogSpace
-    cmds.addAttr( ArmUtilCtrl, longName=side+prefix+'CogSpace', defaultValue=0.0, minValue=0.0, maxValue=1.0 )
-    cmds.setAttr( ArmUtilCtrl[0]+'.'+side+prefix+'CogSpace', lock=False, keyable=True )
     cmds.connectAttr( ArmUtilCtrl[0]+'.'+side+prefix+'CogSpace', WristCtrlSpaceConstraint[0]+'.'+side+prefix+'Cog_SpaceINW3' )
-    # Add attributes to arm utility control for AllSpace
-    cmds.addAttr( ArmUtilCtrl, longName=side+prefix+'AllSpace', defaultValue=0.0, minValue=0.0, maxValue=1.0 )
-    cmds.setAttr( ArmUtilCtrl[0]+'.'+side+prefix+'AllSpace', lock=False, keyable=True )
     cmds.connectAttr( ArmUtilCtrl[0]+'.'+side+prefix+'AllSpace', WristCtrlSpaceConstraint[0]+'.'+side+prefix+'All_SpaceINW4' )
     
     # --- Create Arm FK_IK blending ---
@@ -1128,13 +2368,16 @@ def jly_makeBipedArmRig( side='L_', prefix='', name='Arm', radius=2.0, ctrlRadiu
         ArmCtrlsALL += ArmRibbonCtrlsALL
         
     
-    # Flip the right side arm back where it belongs
-    if side == 'R_':
+    # Flip the right side arm back where it belongs (symmetric: built in place, nothing to flip)
+    if side == 'R_' and not symmetric:
         # Mirror the arm rig top node
         cmds.setAttr( ArmRigGrp+'.scaleX', -1 )
         # Restore the mirroring on the pivot group
         cmds.setAttr( side+prefix+name+'Piv_Grp.scaleX', -1 )
     
+    # Lock and hide the channels in the lock table in one pass
+    jly_applyLocks( module=cmds.ls( ArmRigGrp )[0] )
+    
     # Return the top level root group node, SpaceINs, SpaceOUTs, BindJoints, CtrlsALL, GutsALL lists in order
     return ArmRigGrp, ArmSpaceINs, ArmSpaceOUTs, ArmBindJoints, ArmCtrlsALL, ArmGutsALL
 
@@ -1142,12 +2385,12 @@ def jly_makeBipedArmRig( side='L_', prefix='', name='Arm', radius=2.0, ctrlRadiu
 # ---------------------------------------------------------------------------------------
 # Create Leg Pivots
 
-def jly_makeBipedLegPivs( side='L_', prefix='', name='Leg', radius=2.0, kneeDist=20.0, footUpDist=10.0, dpTime = 0.01 ):
+def jly_makeBipedLegPivs( side='L_', prefix='', name='Leg', radius=2.0, footUpDist=10.0, symmetric=False, dpTime = 0.01 ):
     
     # Create a leg pivot group to hold all the pivots
     LegPivGrp = denUt.den_makeGrp( nodeName=side+prefix+name+'Piv_Grp' )
     # Lock all the attributes, except visibility and scale-X
-    denUt.den_Lock(  1,1,1 , 1,1,1 , 0,1,1 , 0 )
+    jly_lock(  1,1,1 , 1,1,1 , 0,1,1 , 0 )
     
     # Create locator for hip pivot
     denUt.den_makeLoc( nodeName='Hip_Piv', pos=(8.2, 98.9, 1.3), radius=radius ); denUt.den_DiagPause( seconds=dpTime )
@@ -1159,7 +2402,7 @@ def jly_makeBipedLegPivs( side='L_', prefix='', name='Leg', radius=2.0, kneeDist
     # Color the locator
     denUt.den_ColorShape(20)
     # Lock all the attributes, except translate
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
     
     # Create locator for ankle pivot 
     denUt.den_makeLoc( nodeName='Ankle_Piv', pos=(12.1, 12.8, -7), radius=radius ); denUt.den_DiagPause( seconds=dpTime )
@@ -1171,7 +2414,7 @@ def jly_makeBipedLegPivs( side='L_', prefix='', name='Leg', radius=2.0, kneeDist
     # Color the locator
     denUt.den_ColorShape(20)
     # Lock all the attributes, except translate
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
     
     # Create an empty group for ball sole pivot
     denUt.den_makeGrp ( 'BallSole_Piv', pos=(12.1, 1, 4.7) ); denUt.den_DiagPause( seconds=dpTime )
@@ -1208,9 +2451,8 @@ def jly_makeBipedLegPivs( side='L_', prefix='', name='Leg', radius=2.0, kneeDist
     cmds.connectAttr( 'Ball_Piv.translateX', 'BallSole_Piv.translateX' )
     cmds.connectAttr( 'Ball_Piv.translateZ', 'BallSole_Piv.translateZ' )
     cmds.connectAttr( 'Toe_Piv.translateY', 'BallSole_Piv.translateY' )
-    # Select and Lock all attributes for BallSole_Piv
-    cmds.select( 'BallSole_Piv' )
-    denUt.den_Lock(  1,1,1 , 1,1,1 , 1,1,1 , 1 )
+    # Lock all attributes for BallSole_Piv
+    jly_lock(  1,1,1 , 1,1,1 , 1,1,1 , 1 , nodes=[ 'BallSole_Piv' ] )
     
     # Connect Heel_Piv and Soles_Piv 's translateY to Toe_Piv's translateY, to maintain a flat foot plane
     cmds.connectAttr( 'Toe_Piv.translateY', 'Heel_Piv.translateY' )
@@ -1219,19 +2461,7 @@ def jly_makeBipedLegPivs( side='L_', prefix='', name='Leg', radius=2.0, kneeDist
     cmds.connectAttr( 'Toe_Piv.translateY', 'SoleLB_Piv.translateY' )
     cmds.connectAttr( 'Toe_Piv.translateY', 'SoleRB_Piv.translateY' )
     
-    # Create locator for KneeMid pivot
-    denUt.den_makeLoc( nodeName='KneeMid_Loc', radius=radius/2)
-    # Color the locator
-    denUt.den_ColorShape(2)
-    
-    # Create locator for KneePole pivot
-    denUt.den_makeLoc( nodeName='KneePole_Loc', radius=radius, pos=(0, kneeDist, 0) )
-    # Color the locator
-    denUt.den_ColorShape(9)
-    # Parent KneePole under KneeMid
-    cmds.parent( 'KneePole_Loc', 'KneeMid_Loc' )
-    # Lock KneePole attributes except translateY
-    denUt.den_Lock(  1,0,1 , 1,1,1 , 1,1,1 , 1 )
+    # The knee pole is not a locator, it is solved from the hip, knee, ankle pivots with all the other limbs (jly_limbPoles)
     
     # Create locator for AnkleUp pivot
     denUt.den_makeLoc( nodeName='AnkleUp_Loc', radius=radius/2, pos=(footUpDist, footUpDist, 0) )
@@ -1239,46 +2469,32 @@ def jly_makeBipedLegPivs( side='L_', prefix='', name='Leg', radius=2.0, kneeDist
     denUt.den_ColorShape(2)
     # Parent AnkleUp  under Ankle_Piv
     cmds.parent( 'AnkleUp_Loc', 'Ankle_Piv', relative=True )
-    # Lock KneePole attributes except translate X and Y
-    denUt.den_Lock(  0,0,1 , 1,1,1 , 1,1,1 , 1 )
-    
-    # Take the KneeMid_Loc, constrain to make it float between Hip_Piv and Ankle_Piv
-    LegMidLocPtCon = cmds.pointConstraint( 'Hip_Piv','Ankle_Piv','KneeMid_Loc' )[0]
-    # Aim KneeMid_Loc at Ankle_Piv, use Knee_Piv as its worldUpObject (keep IK solution in a flat triangle plane)
-    LegMidLocAimCon = cmds.aimConstraint( 'Ankle_Piv','KneeMid_Loc', worldUpType='object', worldUpObject='Knee_Piv' )[0]
-    # Lock all KneeMid_Loc attributes
-    cmds.select('KneeMid_Loc')
-    denUt.den_Lock(  1,1,1 , 1,1,1 , 1,1,1 , 1 )
+    # Lock AnkleUp_Loc attributes except translate X and Y
+    jly_lock(  0,0,1 , 1,1,1 , 1,1,1 , 1 , nodes=[ 'AnkleUp_Loc' ] )
     
     # Aim Hip_Piv at Knee_Piv, use Ankle_Piv as its worldUpObject 
     HipPivAimCon = cmds.aimConstraint( 'Knee_Piv','Hip_Piv', worldUpType='object', worldUpObject='Ankle_Piv' )[0]
     # Lock all Hip_Piv attributes, except translate
-    cmds.select('Hip_Piv')
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 , nodes=[ 'Hip_Piv' ] )
     
     # Aim Ankle_Piv at Ball_Piv, use Toe_Piv as its worldUpObject 
     AnklePivAimCon = cmds.aimConstraint( 'Ball_Piv','Ankle_Piv', worldUpType='object', worldUpObject='Toe_Piv' )[0]
     # Lock all Ankle_Piv attributes, except translate
-    cmds.select('Ankle_Piv')
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 , nodes=[ 'Ankle_Piv' ] )
     
     # Aim SoleLF_Piv's aim -Z axis towards SoleLB_Piv
     SoleLFPivAimCon = cmds.aimConstraint( 'SoleLB_Piv','SoleLF_Piv', aimVector=(0,0,-1), mo=False )[0]
-    cmds.select('SoleLF_Piv')
     
     # Aim SoleRF_Piv's aim -Z axis towards SoleRB_Piv
     SoleRFPivAimCon = cmds.aimConstraint( 'SoleRB_Piv','SoleRF_Piv', aimVector=(0,0,-1), mo=False )[0]
-    cmds.select('SoleRF_Piv')
     
     # Aim Toe_Piv's aim -Z axis towards Ball_Piv
     ToePivAimCon = cmds.aimConstraint( 'Ball_Piv','Toe_Piv', aimVector=(0,0,-1), mo=False )[0]
     # Lock all Toe_Piv attributes, except translate
-    cmds.select('Toe_Piv')
-    denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 , nodes=[ 'Toe_Piv' ] )
     
-    cmds.select( 'Heel_Piv', 'SoleLF_Piv', 'SoleRF_Piv', 'SoleLB_Piv', 'SoleRB_Piv' )
     # Lock all attributes, except translate X, Z
-    denUt.den_Lock(  0,1,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,1,0 , 1,1,1 , 1,1,1 , 1 , nodes=[ 'Heel_Piv', 'SoleLF_Piv', 'SoleRF_Piv', 'SoleLB_Piv', 'SoleRB_Piv' ] )
     
     # Rename pivots/locators with side and prefix
     cmds.rename( 'Hip_Piv', side+prefix+'Hip_Piv' )
@@ -1288,15 +2504,11 @@ def jly_makeBipedLegPivs( side='L_', prefix='', name='Leg', radius=2.0, kneeDist
     cmds.rename( 'BallSole_Piv', side+prefix+'BallSole_Piv' )
     cmds.rename( 'Toe_Piv', side+prefix+'Toe_Piv' )
     cmds.rename( 'Heel_Piv', side+prefix+'Heel_Piv' )
-    cmds.rename( 'KneeMid_Loc', side+prefix+'KneeMid_Loc' )
-    cmds.rename( 'KneePole_Loc', side+prefix+'KneePole_Loc' )
     cmds.rename( 'AnkleUp_Loc', side+prefix+'AnkleUp_Loc' )
     cmds.rename( 'SoleLF_Piv', side+prefix+'SoleLF_Piv' )
     cmds.rename( 'SoleRF_Piv', side+prefix+'SoleRF_Piv' )
     cmds.rename( 'SoleLB_Piv', side+prefix+'SoleLB_Piv' )
     cmds.rename( 'SoleRB_Piv', side+prefix+'SoleRB_Piv' )
-    cmds.rename( LegMidLocPtCon, side+prefix+LegMidLocPtCon )
-    cmds.rename( LegMidLocAimCon, side+prefix+LegMidLocAimCon )
     cmds.rename( HipPivAimCon, side+prefix+HipPivAimCon )
     cmds.rename( AnklePivAimCon, side+prefix+AnklePivAimCon )
     cmds.rename( SoleLFPivAimCon, side+prefix+SoleLFPivAimCon )
@@ -1305,28 +2517,27 @@ def jly_makeBipedLegPivs( side='L_', prefix='', name='Leg', radius=2.0, kneeDist
     
     # Parent all the pivots under LegPivGrp
     cmds.parent( side+prefix+'Hip_Piv', side+prefix+'Knee_Piv', side+prefix+'Ankle_Piv', side+prefix+'Ball_Piv', side+prefix+'BallSole_Piv', side+prefix+'Toe_Piv', LegPivGrp )
-    cmds.parent( side+prefix+'Heel_Piv', side+prefix+'SoleLF_Piv', side+prefix+'SoleLB_Piv', side+prefix+'SoleRF_Piv', side+prefix+'SoleRB_Piv', side+prefix+'KneeMid_Loc', LegPivGrp )
-    
-    # Lock all attributes of KneeMid_Loc
-    cmds.select(side+prefix+'KneeMid_Loc')
-    denUt.den_Lock(  1,1,1 , 1,1,1 , 1,1,1 , 1 )
+    cmds.parent( side+prefix+'Heel_Piv', side+prefix+'SoleLF_Piv', side+prefix+'SoleLB_Piv', side+prefix+'SoleRF_Piv', side+prefix+'SoleRB_Piv', LegPivGrp )
     
     # Clear selcetion
     cmds.select(clear=True)
     # DP refresh
     denUt.den_DiagPause( seconds=dpTime )
     
-    # If doing the right side, flip the root group to the other side by giveing scaleX -1
-    if side == 'R_':
+    # If doing the right side, flip the root group to the other side by giveing scaleX -1 (symmetric: keep scale 1)
+    if side == 'R_' and not symmetric:
         cmds.setAttr( LegPivGrp+'.scaleX', -1 )
     
+    # Lock and hide the channels in the lock table in one pass
+    jly_applyLocks( module=cmds.ls( LegPivGrp )[0] )
+    
     return LegPivGrp
 
 
 # ---------------------------------------------------------------------------------------
 # Create Leg Rig
 
-def jly_makeBipedLegRig( side='L_', prefix='', name='Leg', radius=2.0, ctrlRadius=15.0, displayLocalAxis=False, twistType='none', revKnee=False, dpTime = 0.01 ):
+def jly_makeBipedLegRig( side='L_', prefix='', name='Leg', radius=2.0, ctrlRadius=15.0, displayLocalAxis=False, twistType='none', revKnee=False, poleDist=20.0, poles={}, symmetric=False, dpTime = 0.01 ):
     
     # Input twist type
     if( twistType == 'none' ) or ( twistType == 'ribbon' ) or ( twistType == 'twist' ):
@@ -1334,11 +2545,17 @@ def jly_makeBipedLegRig( side='L_', prefix='', name='Leg', radius=2.0, ctrlRadiu
     else:
         print( 'ERROR - twistType must be  \'none\' or \'ribon\' or \'upcar\' - nothing else will work' )
     
+    # Forget the handles an earlier build left in this scope, the leg registers its joints again
+    # (the arm of the same side has its twists built before the leg, see jlyBipedModules)
+    jly_clearHandles( side+prefix )
+    
     # If making right leg rig, set pivot group scaleX to 1, flip the pivot group to the left for good mirroring
-    sideColor = 6
+    # Symmetric pivots are already mirrored with scale 1, build from them as they are
+    sideColor = jlyTables.jlySideColors['L_']
     if side == 'R_':
-        cmds.setAttr( side+prefix+name+'Piv_Grp.scaleX', 1 )
-        sideColor = 13
+        if not symmetric:
+            cmds.setAttr( side+prefix+name+'Piv_Grp.scaleX', 1 )
+        sideColor = jlyTables.jlySideColors['R_']
     # DP refresh viewport
     denUt.den_DiagPause( seconds=dpTime )
     
@@ -1382,20 +2599,24 @@ def jly_makeBipedLegRig( side='L_', prefix='', name='Leg', radius=2.0, ctrlRadiu
     # AllSpaceIN weight 1 as default
     AnkleCtrlSpaceConstraint = cmds.parentConstraint( AllSpaceIN, AnkleCtrlSpace, weight=1 )
     
-    # Query all pivots for their worldspace positions
-    HipPos = cmds.xform( side+prefix+'Hip_Piv', ws=True, q=True, t=True )
-    KneePos = cmds.xform( side+prefix+'Knee_Piv', ws=True, q=True, t=True )
-    AnklePos = cmds.xform( side+prefix+'Ankle_Piv', ws=True, q=True, t=True )
-    BallPos = cmds.xform( side+prefix+'Ball_Piv', ws=True, q=True, t=True )
-    ToePos = cmds.xform( side+prefix+'Toe_Piv', ws=True, q=True, t=True )
-    HeelPos = cmds.xform( side+prefix+'Heel_Piv', ws=True, q=True, t=True )
-    SoleLFPos = cmds.xform( side+prefix+'SoleLF_Piv', ws=True, q=True, t=True )
-    SoleLBPos = cmds.xform( side+prefix+'SoleLB_Piv', ws=True, q=True, t=True )
-    SoleRFPos = cmds.xform( side+prefix+'SoleRF_Piv', ws=True, q=True, t=True )
-    SoleRBPos = cmds.xform( side+prefix+'SoleLB_Piv', ws=True, q=True, t=True )
+    # Query all pivots for their worldspace positions, one snapshot for the whole leg
+    Snap = jly_snapshotPivots( [ side+prefix+s for s in [ 'Hip_Piv', 'Knee_Piv', 'Ankle_Piv', 'Ball_Piv', 'Toe_Piv', 'Heel_Piv', 'SoleLF_Piv', 'SoleLB_Piv', 'SoleRF_Piv' ] ] )
+    # The knee pole comes solved with all the other limbs (poles from jly_limbPoles), a build on its own solves it from the snapshot
+    if side+prefix+'KneePole' not in poles:
+        Snap = jly_addPoles( Snap, dist=poleDist )
+    HipPos = jly_snapPos( Snap, side+prefix+'Hip_Piv' )
+    KneePos = jly_snapPos( Snap, side+prefix+'Knee_Piv' )
+    AnklePos = jly_snapPos( Snap, side+prefix+'Ankle_Piv' )
+    BallPos = jly_snapPos( Snap, side+prefix+'Ball_Piv' )
+    ToePos = jly_snapPos( Snap, side+prefix+'Toe_Piv' )
+    HeelPos = jly_snapPos( Snap, side+prefix+'Heel_Piv' )
+    SoleLFPos = jly_snapPos( Snap, side+prefix+'SoleLF_Piv' )
+    SoleLBPos = jly_snapPos( Snap, side+prefix+'SoleLB_Piv' )
+    SoleRFPos = jly_snapPos( Snap, side+prefix+'SoleRF_Piv' )
+    SoleRBPos = jly_snapPos( Snap, side+prefix+'SoleLB_Piv' )
     # Caculate to get a flat BallSole Pivot position
     BallSolePos = [ BallPos[0], ToePos[1], BallPos[2] ]
-    KneePolePos = cmds.xform( side+prefix+'KneePole_Loc', ws=True, q=True, t=True )
+    KneePolePos = poles.get( side+prefix+'KneePole' ) or jly_snapPos( Snap, side+prefix+'KneePole' )
     
     # --- Create all joints for the leg ---
     # Clear selection
@@ -1410,6 +2631,9 @@ def jly_makeBipedLegRig( side='L_', prefix='', name='Leg', radius=2.0, ctrlRadiu
     BallJoint = cmds.joint( n=side+prefix+'Ball_Jnt', p=(BallPos), radius=radius ); denUt.den_DiagPause( seconds=dpTime )
     # Create toe joint at the correct postion
     ToeJoint = cmds.joint( n=side+prefix+'Toe_Jx', p=(ToePos), radius=radius ); denUt.den_DiagPause( seconds=dpTime )
+    # Register the leg joints, the IK/FK chains and the twists look them up by role
+    for Role,Joint in [ ('Hip_Jnt',HipJoint), ('Knee_Jnt',KneeJoint), ('Ankle_Jnt',AnkleJoint), ('Ball_Jnt',BallJoint), ('Toe_Jx',ToeJoint) ]:
+        jly_registerHandle( side+prefix, Role, Joint )
     
     # If displayLocalAxis=True, show all local axis for the joints
     if ( displayLocalAxis ):
@@ -1451,24 +2675,14 @@ def jly_makeBipedLegRig( side='L_', prefix='', name='Leg', radius=2.0, ctrlRadiu
     AnkleJoint = cmds.parent( AnkleJoint, KneeJoint )[0]
     
     # --- Create IK and FK joint chains for the leg ---
-    # Duplicate leg joints for to make IK joint chain
-    HipJointIK = cmds.duplicate (HipJoint, name=side+prefix+'Hip_IK' )[0]
-    # Rename joints to _IK
-    KneeJointIK = cmds.rename (HipJointIK+'|'+side+prefix+'Knee_Jnt', side+prefix+'Knee_IK' )
-    AnkleJointIK = cmds.rename (KneeJointIK+'|'+side+prefix+'Ankle_Jnt', side+prefix+'Ankle_IK' )
-    BallJointIK = cmds.rename (AnkleJointIK+'|'+side+prefix+'Ball_Jnt', side+prefix+'Ball_IK' )
-    ToeJointIK = cmds.rename (BallJointIK+'|'+side+prefix+'Toe_Jx', side+prefix+'Toe_IK' )
-    # Duplicate leg joints for to make FK joint chain
-    HipJointFK = cmds.duplicate (HipJoint, name=side+prefix+'Hip_FK' )[0]
-    # Rename joints to _FK
-    KneeJointFK = cmds.rename (HipJointFK+'|'+side+prefix+'Knee_Jnt', side+prefix+'Knee_FK' )
-    AnkleJointFK = cmds.rename (KneeJointFK+'|'+side+prefix+'Ankle_Jnt', side+prefix+'Ankle_FK' )
-    BallJointFK = cmds.rename (AnkleJointFK+'|'+side+prefix+'Ball_Jnt', side+prefix+'Ball_FK' )
-    ToeJointFK = cmds.rename (BallJointFK+'|'+side+prefix+'Toe_Jx', side+prefix+'Toe_FK' )
+    # Duplicate leg joints for to make IK joint chain, joints are renamed to _IK
+    HipJointIK, KneeJointIK, AnkleJointIK, BallJointIK, ToeJointIK = jly_duplicateChain( side+prefix, 'Hip_Jnt', '_IK' )
+    # Duplicate leg joints for to make FK joint chain, joints are renamed to _FK
+    HipJointFK, KneeJointFK, AnkleJointFK, BallJointFK, ToeJointFK = jly_duplicateChain( side+prefix, 'Hip_Jnt', '_FK' )
     
     # --- Create the controls and 0 nulls ---
     # Create Hip FK control (spike)
-    HipFKCtrl = denUt.den_MakeSpike( nodeName=side+prefix+'HipFK_Ctrl', radius=ctrlRadius, axis='+Z')
+    HipFKCtrl = jly_makeCachedCtrl( denUt.den_MakeSpike, nodeName=side+prefix+'HipFK_Ctrl', radius=ctrlRadius, axis='+Z')
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     # Unlock all attribute before re-parent
@@ -1480,7 +2694,7 @@ def jly_makeBipedLegRig( side='L_', prefix='', name='Leg', radius=2.0, ctrlRadiu
     # Add 0 null
     HipFKCtrl = denUt.den_AddZeroNull()
     # Lock all attribute except rotate and visibility
-    denUt.den_LockAttr(True,False,True,False)
+    jly_lockAttr(True,False,True,False)
     # Store the 0 null in a variable
     HipFKCtrlZero = cmds.listRelatives( HipFKCtrl, parent=True, fullPath=True )[0]
     # Connect rotate attribute of the joint to the Hip FK control, so it gets exact rotate number
@@ -1489,7 +2703,7 @@ def jly_makeBipedLegRig( side='L_', prefix='', name='Leg', radius=2.0, ctrlRadiu
     cmds.parentConstraint( LegCtrlGrp, HipFKCtrlZero, mo=True )
     
     # Create Leg Utility Control (gear) (turn maya UI Move ctrl Tool Setting symmerty off when doing this)
-    LegUtilCtrl = denUt.den_MakeGear( nodeName=side+prefix+name+'Util_Ctrl', pos=(ctrlRadius*0.5,0,ctrlRadius), radius=ctrlRadius*0.2, Plane='ZX')
+    LegUtilCtrl = jly_makeCachedCtrl( denUt.den_MakeGear, nodeName=side+prefix+name+'Util_Ctrl', pos=(ctrlRadius*0.5,0,ctrlRadius), radius=ctrlRadius*0.2, Plane='ZX')
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     # Unlock control attributes before re-parent
@@ -1499,16 +2713,12 @@ def jly_makeBipedLegRig( side='L_', prefix='', name='Leg', radius=2.0, ctrlRadiu
     # Parent utility gear control under LegCtrlGrp
     LegUtilCtrl = cmds.parent( LegUtilCtrl, LegCtrlGrp )
     # Lock all attribute except visibility
-    denUt.den_LockAttr(True,True,True,False)
-    # Add attributes to the leg
-    cmds.addAttr( LegUtilCtrl, longName=side+prefix+name+'_FK_IK', defaultValue=1.0, minValue=0.0, maxValue=1.0 )
-    cmds.setAttr( LegUtilCtrl[0]+'.'+side+prefix+name+'_FK_IK', lock=False, keyable=True )
-    # Add attributes to the ankle
-    cmds.addAttr( LegUtilCtrl, longName=side+prefix+'Ankle_FK_IK', defaultValue=0.0, minValue=0.0, maxValue=1.0 )
-    cmds.setAttr( LegUtilCtrl[0]+'.'+side+prefix+'Ankle_FK_IK', lock=False, keyable=True )
+    jly_lockAttr(True,True,True,False)
+    # Add all the leg utility attributes in one go: leg and ankle FK_IK, IK ankle control spaces (jlyLegUtilSchema)
+    jly_addAttrSchema( node=LegUtilCtrl, schema=jlyLegUtilSchema, side=side, prefix=prefix, name=name )
     
     # Create Knee Control (pole)
-    KneeCtrl = denUt.den_MakePole( nodeName=side+prefix+'Knee_Ctrl', radius=ctrlRadius*0.3 )
+    KneeCtrl = jly_makeCachedCtrl( denUt.den_MakePole, nodeName=side+prefix+'Knee_Ctrl', radius=ctrlRadius*0.3 )
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     # Transform to the correct position
@@ -1519,9 +2729,9 @@ def jly_makeBipedLegRig( side='L_', prefix='', name='Leg', radius=2.0, ctrlRadiu
     KneeCtrl = denUt.den_AddZeroNull()
     # If Reverse knee:
     if revKnee:
-        KneeFKCtrl = denUt.den_MakeArrowR( nodeName=side+prefix+'KneeFK_Ctrl', pos=(0,ctrlRadius*0.5,0), radius=ctrlRadius*0.3, doT=True, axis='+Y' )
+        KneeFKCtrl = jly_makeCachedCtrl( denUt.den_MakeArrowR, nodeName=side+prefix+'KneeFK_Ctrl', pos=(0,ctrlRadius*0.5,0), radius=ctrlRadius*0.3, doT=True, axis='+Y' )
     else:
-        KneeFKCtrl = denUt.den_MakeArrowR( nodeName=side+prefix+'KneeFK_Ctrl', pos=(0,-ctrlRadius*0.5,0), radius=ctrlRadius*0.3, doT=True, axis='-Y' )
+        KneeFKCtrl = jly_makeCachedCtrl( denUt.den_MakeArrowR, nodeName=side+prefix+'KneeFK_Ctrl', pos=(0,-ctrlRadius*0.5,0), radius=ctrlRadius*0.3, doT=True, axis='-Y' )
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     # Unlock control attributes before re-parent
@@ -1533,12 +2743,12 @@ def jly_makeBipedLegRig( side='L_', prefix='', name='Leg', radius=2.0, ctrlRadiu
     # Add 0 null
     KneeFKCtrl = denUt.den_AddZeroNull()
     # Lock all attribute except rotate and visibility
-    denUt.den_LockAttr(True,False,True,False)
+    jly_lockAttr(True,False,True,False)
     # Connect KneeFKCtrl rotate attribute to KneeJointFK so it gets exact rotate number
     cmds.connectAttr( KneeFKCtrl[0]+'.rotate', KneeJointFK+'.rotate' )
     
     # Create Ankle Control (ball)
-    AnkleCtrl = denUt.den_MakeBall( nodeName=side+prefix+'Ankle_Ctrl', radius=ctrlRadius*0.7 )
+    AnkleCtrl = jly_makeCachedCtrl( denUt.den_MakeBall, nodeName=side+prefix+'Ankle_Ctrl', radius=ctrlRadius*0.7 )
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     # Transform to the correct position
@@ -1553,7 +2763,7 @@ def jly_makeBipedLegRig( side='L_', prefix='', name='Leg', radius=2.0, ctrlRadiu
     AnkleCtrlZero = cmds.listRelatives( AnkleCtrl, parent=True, fullPath=True )[0]
     
     # Create Ankle FK Control (spike)
-    AnkleFKCtrl = denUt.den_MakeSpike( nodeName=side+prefix+'AnkleFK_Ctrl', radius=ctrlRadius*0.7, axis='+Z')
+    AnkleFKCtrl = jly_makeCachedCtrl( denUt.den_MakeSpike, nodeName=side+prefix+'AnkleFK_Ctrl', radius=ctrlRadius*0.7, axis='+Z')
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     # Unlock control attributes before re-parent
@@ -1565,14 +2775,14 @@ def jly_makeBipedLegRig( side='L_', prefix='', name='Leg', radius=2.0, ctrlRadiu
     # Add 0 null
     AnkleFKCtrl = denUt.den_AddZeroNull()
     # Lock all attribute except rotate and visibility
-    denUt.den_LockAttr(True,False,True,False)
+    jly_lockAttr(True,False,True,False)
     # Connect AnkleJointFK rotate attribute to AnkleFKCtrl so it gets exact rotate number
     cmds.connectAttr( AnkleFKCtrl[0]+'.rotate', AnkleJointFK+'.rotate' )
     # Capture and store the 0 null in a variable
     AnkleFKCtrlZero = cmds.listRelatives( AnkleFKCtrl, parent=True, fullPath=True )[0]
     
     # Create Ball FK Control (spike)
-    BallFKCtrl = denUt.den_MakeSpike(nodeName=side+prefix+'BallFK_Ctrl', radius=ctrlRadius*0.7, axis='-Z')
+    BallFKCtrl = jly_makeCachedCtrl( denUt.den_MakeSpike, nodeName=side+prefix+'BallFK_Ctrl', radius=ctrlRadius*0.7, axis='-Z')
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     # Unlock control attributes before re-parent
@@ -1584,57 +2794,25 @@ def jly_makeBipedLegRig( side='L_', prefix='', name='Leg', radius=2.0, ctrlRadiu
     # Add 0 null
     BallFKCtrl = denUt.den_AddZeroNull()
     # Lock all attribute except rotate and visibility
-    denUt.den_LockAttr(True,False,True,False)
+    jly_lockAttr(True,False,True,False)
     # Connect AnkleJointFK rotate attribute to AnkleFKCtrl so it gets exact rotate number
     cmds.connectAttr( BallFKCtrl[0]+'.rotate', BallJointFK+'.rotate' )
     # Capture and store the 0 null in a variable
     BallFKCtrlZero = cmds.listRelatives( BallFKCtrl, parent=True, fullPath=True )[0]
     
     # Create Foot Utility Control (gear) (turn maya UI Move ctrl Tool Setting symmerty off when doing this)
-    FootUtilCtrl = denUt.den_MakeGear( nodeName=side+prefix+'FootUtil_Ctrl', pos=(ctrlRadius*0.5,ctrlRadius*0.5,0), radius=ctrlRadius*0.2, Plane='XY')
+    FootUtilCtrl = jly_makeCachedCtrl( denUt.den_MakeGear, nodeName=side+prefix+'FootUtil_Ctrl', pos=(ctrlRadius*0.5,ctrlRadius*0.5,0), radius=ctrlRadius*0.2, Plane='XY')
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     # Parent utility gear control under ankle control
     FootUtilCtrl = cmds.parent( FootUtilCtrl, AnkleCtrl, relative=True )
-    # Add FootRock attributes to the control
-    cmds.addAttr( FootUtilCtrl, longName=side+prefix+'FootRock', defaultValue=0.0, minValue=-90.0, maxValue=90.0 )
-    cmds.setAttr( FootUtilCtrl[0]+'.'+side+prefix+'FootRock', lock=False, keyable=True )
-    # Add FootRoll attributes to the control
-    cmds.addAttr( FootUtilCtrl, longName=side+prefix+'FootRoll', defaultValue=0.0, minValue=-90.0, maxValue=90.0 )
-    cmds.setAttr( FootUtilCtrl[0]+'.'+side+prefix+'FootRoll', lock=False, keyable=True )
-    # Add FootPivot attributes to the control
-    cmds.addAttr( FootUtilCtrl, longName=side+prefix+'FootPivot', defaultValue=0.0, minValue=-90.0, maxValue=90.0 )
-    cmds.setAttr( FootUtilCtrl[0]+'.'+side+prefix+'FootPivot', lock=False, keyable=True )
-    # Add FootTwist attributes to the control
-    cmds.addAttr( FootUtilCtrl, longName=side+prefix+'FootTwist', defaultValue=0.0, minValue=-90.0, maxValue=90.0 )
-    cmds.setAttr( FootUtilCtrl[0]+'.'+side+prefix+'FootTwist', lock=False, keyable=True )
-    # Add HeelPivot attributes to the control
-    cmds.addAttr( FootUtilCtrl, longName=side+prefix+'HeelPivot', defaultValue=0.0, minValue=-90.0, maxValue=90.0 )
-    cmds.setAttr( FootUtilCtrl[0]+'.'+side+prefix+'HeelPivot', lock=False, keyable=True )
-    # Add ToeRoll attributes to the control
-    cmds.addAttr( FootUtilCtrl, longName=side+prefix+'ToeRoll', defaultValue=0.0, minValue=-90.0, maxValue=90.0 )
-    cmds.setAttr( FootUtilCtrl[0]+'.'+side+prefix+'ToeRoll', lock=False, keyable=True )
-    # Add ToePivot attributes to the control
-    cmds.addAttr( FootUtilCtrl, longName=side+prefix+'ToePivot', defaultValue=0.0, minValue=-90.0, maxValue=90.0 )
-    cmds.setAttr( FootUtilCtrl[0]+'.'+side+prefix+'ToePivot', lock=False, keyable=True )
-    # Add ToeBend attributes to the control
-    cmds.addAttr( FootUtilCtrl, longName=side+prefix+'ToeBend', defaultValue=0.0, minValue=-90.0, maxValue=90.0 )
-    cmds.setAttr( FootUtilCtrl[0]+'.'+side+prefix+'ToeBend', lock=False, keyable=True )
-    
-    # --- Create and connect attributes for Ankle control space switcher ---
-    # Add attributes to leg utility control for PelvisSpace
-    cmds.addAttr( LegUtilCtrl, longName=side+prefix+'PelvisSpace', defaultValue=0.0, minValue=0.0, maxValue=1.0 )
-    # Set attribute lock and keyable value so it shows up in channel box
-    cmds.setAttr( LegUtilCtrl[0]+'.'+side+prefix+'PelvisSpace', lock=False, keyable=True )
+    # Add the 8 foot roll attributes to the control in one go (jlyFootUtilSchema)
+    jly_addAttrSchema( node=FootUtilCtrl, schema=jlyFootUtilSchema, side=side, prefix=prefix )
+    
+    # --- Connect attributes for Ankle control space switcher (added with jlyLegUtilSchema) ---
     # Connect attribute to the actual space switching constraint
     cmds.connectAttr( LegUtilCtrl[0]+'.'+side+prefix+'PelvisSpace', AnkleCtrlSpaceConstraint[0]+'.'+side+prefix+'PelvisSpace_INW0' )
-    # Add attributes to leg utility control for CogSpace
-    cmds.addAttr( LegUtilCtrl, longName=side+prefix+'CogSpace', defaultValue=0.0, minValue=0.0, maxValue=1.0 )
-    cmds.setAttr( LegUtilCtrl[0]+'.'+side+prefix+'CogSpace', lock=False, keyable=True )
     cmds.connectAttr( LegUtilCtrl[0]+'.'+side+prefix+'CogSpace', AnkleCtrlSpaceConstraint[0]+'.'+side+prefix+'CogSpace_INW1' )
-    # Add attributes to leg utility control for AllSpace
-    cmds.addAttr( LegUtilCtrl, longName=side+prefix+'AllSpace', defaultValue=1.0, minValue=0.0, maxValue=1.0 )
-    cmds.setAttr( LegUtilCtrl[0]+'.'+side+prefix+'AllSpace', lock=False, keyable=True )
     cmds.connectAttr( LegUtilCtrl[0]+'.'+side+prefix+'AllSpace', AnkleCtrlSpaceConstraint[0]+'.'+side+prefix+'AllSpace_INW2' )
     
     # --- Create Leg FK_IK blending ---
@@ -1948,11 +3126,14 @@ def jly_makeBipedLegRig( side='L_', prefix='', name='Leg', radius=2.0, ctrlRadiu
         LegCtrlsALL += LegRibbonCtrlsALL
         
     
-    # Flip the right side leg back where it belongs
-    if side == 'R_':
+    # Flip the right side leg back where it belongs (symmetric: built in place, nothing to flip)
+    if side == 'R_' and not symmetric:
         cmds.setAttr( LegRigGrp+'.scaleX', -1 )
         cmds.setAttr( side+prefix+name+'Piv_Grp.scaleX', -1 )
     
+    # Lock and hide the channels in the lock table in one pass
+    jly_applyLocks( module=cmds.ls( LegRigGrp )[0] )
+    
     # Return theZZ top level root group node, SpaceINs, SpaceOUTs, BindJoints, CtrlsALL, GutsALL lists in order
     return LegRigGrp, LegSpaceINs, LegSpaceOUTs, LegBindJoints, LegCtrlsALL, LegGutsALL
 
@@ -1968,7 +3149,7 @@ def jly_makeBipedLegRig( side='L_', prefix='', name='Leg', radius=2.0, ctrlRadiu
 # ---------------------------------------------------------------------------------------
 # Create Hand Pivots
 
-def jly_makeBipedHandPivs2( side='L_', prefix='', name='Hand', radius=1.0, dpTime = 0.01 ):
+def jly_makeBipedHandPivs2( side='L_', prefix='', name='Hand', radius=1.0, symmetric=False, dpTime = 0.01 ):
     
     # - Create hand pivots to match the character
     # Create a root arm pivot group to hold all arm pivots
@@ -2046,37 +3227,39 @@ def jly_makeBipedHandPivs2( side='L_', prefix='', name='Hand', radius=1.0, dpTim
         # List all pivots associated with the current finger
         pivs = cmds.ls( fing+'*_Piv' )
         # Lock all attributes except translate and visibility
-        for piv in pivs:
-            cmds.select( piv )
-            denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 0 )
+        jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 0 , nodes=pivs )
     
     # Clear selecttion, avoid accident
     cmds.select(clear=True)
     # DP refresh
     denUt.den_DiagPause( seconds=dpTime )
     
-    # If making right hand, mirror all pivots
-    if side == 'R_':
+    # If making right hand, mirror all pivots (symmetric: keep scale 1)
+    if side == 'R_' and not symmetric:
         cmds.setAttr( HandPivGrp+'.scaleX', -1 )
     
     print( 'den_makeHandPivs -- done\n' )
     
+    # Lock and hide the channels in the lock table in one pass
+    jly_applyLocks( module=cmds.ls( HandPivGrp )[0] )
+    
     return HandPivGrp
 
 
 # ---------------------------------------------------------------------------------------
 # Create Hand Rig
 
-def jly_makeBipedHandRig2( side='L_', prefix='', name='Hand', radius=1.0, displayLocalAxis=False, dpTime = 0.01 ):
+def jly_makeBipedHandRig2( side='L_', prefix='', name='Hand', radius=1.0, displayLocalAxis=False, symmetric=False, dpTime = 0.01 ):
     
     # Initialize color for the left side
-    sideColor = 6
+    sideColor = jlyTables.jlySideColors['L_']
     # If doing the right side
     if side == 'R_':
-        # Set pivot group scaleX to 1, flip the pivot group to the left for good mirroring
-        cmds.setAttr( side+prefix+name+'Piv_Grp.scaleX', 1 )
+        # Set pivot group scaleX to 1, flip the pivot group to the left for good mirroring (symmetric pivots are already mirrored)
+        if not symmetric:
+            cmds.setAttr( side+prefix+name+'Piv_Grp.scaleX', 1 )
         # and change color
-        sideColor = 13
+        sideColor = jlyTables.jlySideColors['R_']
     
     # Create 5 variables to store components of the hand rig (SpaceINs, SpaceOUTs, BindJoints, Controls, and Guts)
     HandSpaceINs = []
@@ -2102,6 +3285,9 @@ def jly_makeBipedHandRig2( side='L_', prefix='', name='Hand', radius=1.0, displa
     HandCtrlGrp = denUt.den_makeGrp( nodeName=side+prefix+name+'Ctrl_Grp' )
     HandCtrlGrp = cmds.parent( HandCtrlGrp, WristSpaceIN )
     
+    # Query every finger pivot for their worldspace positions, one snapshot for the whole hand (thumb has no 00 pivot)
+    Snap = jly_snapshotPivots( [ fing+s for fing in fingList for s in [ '00_Piv', '01_Piv', '02_Piv', '03_Piv', 'End_Piv' ] if not ( fing == side+prefix+'Thumb' and s == '00_Piv' ) ] )
+    
     # Loop through each fingers
     for fing in fingList:
         if fing == side+prefix+'Thumb':
@@ -2111,7 +3297,7 @@ def jly_makeBipedHandRig2( side='L_', prefix='', name='Hand', radius=1.0, displa
         else:
             # - Create the palm joints for fingers that is not a thumb
             # Query pivot 00 for their worldspace positions
-            fing00Pos = cmds.xform( fing+'00_Piv', ws=True, q=True, t=True )
+            fing00Pos = jly_snapPos( Snap, fing+'00_Piv' )
             # Clear selection
             cmds.select( clear=True )
             # Create 00 joint at the correct postion
@@ -2131,7 +3317,7 @@ def jly_makeBipedHandRig2( side='L_', prefix='', name='Hand', radius=1.0, displa
             
             # - Create the controls and 0 nulls
             # Create finger FK control (spike)
-            fing00Ctrl = denUt.den_MakeSpike( nodeName=fing+'00_Ctrl', radius=3*radius, axis='-Y' )
+            fing00Ctrl = jly_makeCachedCtrl( denUt.den_MakeSpike, nodeName=fing+'00_Ctrl', radius=3*radius, axis='-Y' )
             # Color the control
             denUt.den_ColorShapeRGB(rgb=(1,0,1))
             # Unlock control attributes before re-parent
@@ -2143,7 +3329,7 @@ def jly_makeBipedHandRig2( side='L_', prefix='', name='Hand', radius=1.0, displa
             # Add 0 null
             fing00Ctrl = denUt.den_AddZeroNull()
             # Lock all attribute except rotate and visibility
-            denUt.den_LockAttr(True,False,True,False)
+            jly_lockAttr(True,False,True,False)
             # Connect control 00 Rotate to joint 00
             cmds.connectAttr( fing00Ctrl[0]+'.rotate', fing00Joint+'.rotate' )
             # Update finger skeleton and control parent
@@ -2151,10 +3337,10 @@ def jly_makeBipedHandRig2( side='L_', prefix='', name='Hand', radius=1.0, displa
             fingCtrlParent = fing00Ctrl
             
         # Query the rest of the pivot for their worldspace positions
-        fing01Pos = cmds.xform( fing+'01_Piv', ws=True, q=True, t=True )
-        fing02Pos = cmds.xform( fing+'02_Piv', ws=True, q=True, t=True )
-        fing03Pos = cmds.xform( fing+'03_Piv', ws=True, q=True, t=True )
-        fingEndPos = cmds.xform( fing+'End_Piv', ws=True, q=True, t=True )
+        fing01Pos = jly_snapPos( Snap, fing+'01_Piv' )
+        fing02Pos = jly_snapPos( Snap, fing+'02_Piv' )
+        fing03Pos = jly_snapPos( Snap, fing+'03_Piv' )
+        fingEndPos = jly_snapPos( Snap, fing+'End_Piv' )
         
         # Create finger joint 01 at the correct postion
         cmds.select( clear=True )
@@ -2206,7 +3392,7 @@ def jly_makeBipedHandRig2( side='L_', prefix='', name='Hand', radius=1.0, displa
         
         # - Create the controls and 0 nulls
         # Create finger FK control (spike) for fing01
-        fing01Ctrl = denUt.den_MakeSpike( nodeName=fing+'01_Ctrl', radius=3*radius, axis='-Y' )
+        fing01Ctrl = jly_makeCachedCtrl( denUt.den_MakeSpike, nodeName=fing+'01_Ctrl', radius=3*radius, axis='-Y' )
         # Color the control
         denUt.den_ColorShapeRGB(rgb=(1,0,1))
         # Unlock control attributes before re-parent
@@ -2218,12 +3404,12 @@ def jly_makeBipedHandRig2( side='L_', prefix='', name='Hand', radius=1.0, displa
         # Add 0 null
         fing01Ctrl = denUt.den_AddZeroNull()
         # Lock all attribute except rotate and visibility
-        denUt.den_LockAttr(True,False,True,False)
+        jly_lockAttr(True,False,True,False)
         # DP refresh
         denUt.den_DiagPause( seconds=dpTime )
         
         # Create finger FK control (spike) for fing02
-        fing02Ctrl = denUt.den_MakeSpike( nodeName=fing+'02_Ctrl', radius=3*radius, axis='-Y' )
+        fing02Ctrl = jly_makeCachedCtrl( denUt.den_MakeSpike, nodeName=fing+'02_Ctrl', radius=3*radius, axis='-Y' )
         # Color the control
         denUt.den_ColorShapeRGB(rgb=(1,0,1))
         # Unlock control attributes before re-parent
@@ -2235,12 +3421,12 @@ def jly_makeBipedHandRig2( side='L_', prefix='', name='Hand', radius=1.0, displa
         # Add 0 null
         fing02Ctrl = denUt.den_AddZeroNull()
         # Lock all attribute except rotate and visibility
-        denUt.den_LockAttr(True,False,True,False)
+        jly_lockAttr(True,False,True,False)
         # DP refresh
         denUt.den_DiagPause( seconds=dpTime )
         
         # Create finger FK control (spike) for fing03
-        fing03Ctrl = denUt.den_MakeSpike( nodeName=fing+'03_Ctrl', radius=3*radius, axis='-Y' )
+        fing03Ctrl = jly_makeCachedCtrl( denUt.den_MakeSpike, nodeName=fing+'03_Ctrl', radius=3*radius, axis='-Y' )
         # Color the control
         denUt.den_ColorShapeRGB(rgb=(1,0,1))
         # Unlock control attributes before re-parent
@@ -2252,7 +3438,7 @@ def jly_makeBipedHandRig2( side='L_', prefix='', name='Hand', radius=1.0, displa
         # Add 0 null
         fing03Ctrl = denUt.den_AddZeroNull()
         # Lock all attribute except rotate and visibility
-        denUt.den_LockAttr(True,False,True,False)
+        jly_lockAttr(True,False,True,False)
         # DP refresh
         denUt.den_DiagPause( seconds=dpTime )
         
@@ -2271,11 +3457,14 @@ def jly_makeBipedHandRig2( side='L_', prefix='', name='Hand', radius=1.0, displa
             HandBindJoints += [ fing00Joint, fing01Joint, fing02Joint, fing03Joint ]
             HandCtrlsALL += [ fing00Ctrl[0], fing01Ctrl[0], fing02Ctrl[0], fing03Ctrl[0] ]
     
-    # Flip the right side hand back where it belongs
-    if side == 'R_':
+    # Flip the right side hand back where it belongs (symmetric: built in place, nothing to flip)
+    if side == 'R_' and not symmetric:
         cmds.setAttr( HandRigGrp+'.scaleX', -1 )
         cmds.setAttr( side+prefix+name+'Piv_Grp.scaleX', -1 )
     
+    # Lock and hide the channels in the lock table in one pass
+    jly_applyLocks( module=cmds.ls( HandRigGrp )[0] )
+    
     # Return the top level group node, SpaceINs, SpaceOUTs, BindJoints, CtrlsALL, GutsALL lists in order
     return HandRigGrp, HandSpaceINs, HandSpaceOUTs, HandBindJoints, HandCtrlsALL, HandGutsALL
 
@@ -2286,10 +3475,10 @@ def jly_makeBipedHandRig2( side='L_', prefix='', name='Hand', radius=1.0, displa
 def jly_makeTwists( side='L_', prefix='', name='Arm', radius=2.0, Joints=['Shld','Elbow','Wrist'], ctrlPos=(-10,0,-10), ctrlUpVec=(0,0,-1), displayLocalAxis=True, dpTime = 0.01 ):
     
     # Initialize color for the left side
-    sideColor = 6
+    sideColor = jlyTables.jlySideColors['L_']
     # If doing the right side, change color
     if side == 'R_':
-        sideColor = 13
+        sideColor = jlyTables.jlySideColors['R_']
     
     # Assign prefix for twist group
     TwistRigGrp = ''
@@ -2307,10 +3496,14 @@ def jly_makeTwists( side='L_', prefix='', name='Arm', radius=2.0, Joints=['Shld'
     ThirdName = side+prefix+Joints[2]
     
     # Find first joint, its parent, and the 2nd(elbow) and 3rd joint(wrist)
-    FirstJoint = cmds.ls( FirstName+'_Jnt' )[0]
+    # Use the handles the limb registered, a name search could pick another character's joint
+    FirstJoint = jly_getHandleName( side+prefix, Joints[0]+'_Jnt' )
+    SecondJoint = jly_getHandleName( side+prefix, Joints[1]+'_Jnt' )
+    ThirdJoint = jly_getHandleName( side+prefix, Joints[2]+'_Jnt' )
+    if not ( FirstJoint and SecondJoint and ThirdJoint ):
+        print( 'ERROR - '+FirstName+'_Jnt, '+SecondName+'_Jnt and '+ThirdName+'_Jnt are not registered, build their limb in this Maya session before its twists' )
+        return TwistRigGrp, TwistSpaceINs, TwistSpaceOUTs, TwistBindJoints, TwistCtrlsALL, TwistGutsALL
     FirstParent = cmds.listRelatives( FirstJoint, parent=True, fullPath=True )[0]
-    SecondJoint = cmds.ls( SecondName+'_Jnt' )[0]
-    ThirdJoint = cmds.ls( ThirdName+'_Jnt' )[0]
     
     # Print warning, should not have existing arm rig with saftycover
     print( '\nden_makeTwists -- WARNING -- Twist does not build a separate rig part, but modifies the existing limb.' )
@@ -2351,7 +3544,7 @@ def jly_makeTwists( side='L_', prefix='', name='Arm', radius=2.0, Joints=['Shld'
     # Upcar hold the up for the shoulder, to keep it out of the way of the elbow
     FirstUpCarJoint = cmds.duplicate( FirstRestJoint, n=FirstName+'UpCar_Jx' )[0]
     # Make a pole control for upCtrl
-    FirstTwist01UpCtrl = denUt.den_MakePole( nodeName=FirstName+'Twist01Up_Ctrl' )
+    FirstTwist01UpCtrl = jly_makeCachedCtrl( denUt.den_MakePole, nodeName=FirstName+'Twist01Up_Ctrl' )
     # Color the control
     denUt.den_ColorShapeRGB(rgb=(1,0,1))
     # Position the control
@@ -2436,14 +3629,13 @@ def jly_makeTwists( side='L_', prefix='', name='Arm', radius=2.0, Joints=['Shld'
     
     
     # - Rename all bind joints and hide proxy geo which are no longer needed
-    # Create a new name for the first bind joint by replacing 'Jnt' with 'Jx'
-    NewFirstJointName = FirstJoint.replace('Jnt','Jx')
-    # List the objects matching FirstJoint to handle them
-    FirstBindJoint = cmds.ls( FirstJoint )
-    if FirstBindJoint != []:
-        # Rename the found bind joint to the new name if it exists
-        FirstBindJoint = cmds.rename( FirstBindJoint, NewFirstJointName )
-        print( 'den_makeTwists ---------', FirstBindJoint, 'renamed to', NewFirstJointName )
+    # Create a new name for the first bind joint by replacing 'Jnt' with 'Jx' (short name, the handle may give a path)
+    NewFirstJointName = FirstJoint.split('|')[-1].replace('Jnt','Jx')
+    # Rename the bind joint to the new name, register it under its new role
+    FirstBindJoint = cmds.rename( FirstJoint, NewFirstJointName )
+    jly_registerHandle( side+prefix, Joints[0]+'_Jx', FirstBindJoint )
+    jlyNodeHandles.pop( (side+prefix, Joints[0]+'_Jnt'), None )
+    print( 'den_makeTwists ---------', FirstBindJoint, 'renamed to', NewFirstJointName )
     # List the proxy mesh associated with FirstJoint, typically constructed from its name
     FirstProxy = cmds.ls( denUt.den_SplitAt(FirstJoint,'_',2)[0]+'_Mesh' )
     if FirstProxy != []:
@@ -2452,13 +3644,12 @@ def jly_makeTwists( side='L_', prefix='', name='Arm', radius=2.0, Joints=['Shld'
         print( 'den_makeTwists ---------', FirstProxy[0], 'visibility set to 0' )
     
     # Create a new name for the second bind joint by replacing 'Jnt' with 'Jx'
-    NewSecondJointName = SecondJoint.replace('Jnt','Jx')
-    # List the objects matching SecondJoint to handle them
-    SecondBindJoint = cmds.ls( SecondJoint )
-    if SecondBindJoint != []:
-        # Rename the found bind joint to the new name if it exists
-        SecondBindJoint = cmds.rename( SecondBindJoint, NewSecondJointName )
-        print( 'den_makeTwists ---------', SecondBindJoint, 'renamed to', NewSecondJointName )
+    NewSecondJointName = SecondJoint.split('|')[-1].replace('Jnt','Jx')
+    # Rename the bind joint to the new name, register it under its new role
+    SecondBindJoint = cmds.rename( SecondJoint, NewSecondJointName )
+    jly_registerHandle( side+prefix, Joints[1]+'_Jx', SecondBindJoint )
+    jlyNodeHandles.pop( (side+prefix, Joints[1]+'_Jnt'), None )
+    print( 'den_makeTwists ---------', SecondBindJoint, 'renamed to', NewSecondJointName )
     # List the proxy mesh associated with SecondJoint, constructed from its name
     SecondProxy = cmds.ls( denUt.den_SplitAt(SecondJoint,'_',2)[0]+'_Mesh' )
     if SecondProxy != []:
@@ -2497,7 +3688,7 @@ def jly_makeAngleSplitter( name='L_Seat02', firstJnt='L_HipRest_Jx', secondJnt='
     
     cmds.select( SplitLoc, SplitJnt )
     # Lock all attribute except translate and rotate
-    denUt.den_Lock(  0,0,0 , 0,0,0 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 0,0,0 , 1,1,1 , 1 )
     
     # Set the split joint translate value to be 'radius', so joint dont overlap
     cmds.setAttr( SplitJnt+'.t', 0, radius, 0 )
@@ -2509,19 +3700,22 @@ def jly_makeAngleSplitter( name='L_Seat02', firstJnt='L_HipRest_Jx', secondJnt='
     cmds.orientConstraint( firstJnt, secondJnt, SplitLoc )
     cmds.select( SplitLoc, SplitJnt )
     # Lock all attributes
-    denUt.den_Lock(  1,1,1 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  1,1,1 , 1,1,1 , 1,1,1 , 1 )
     cmds.select( clear=True )
     
+    # Lock and hide the channels in the lock table in one pass
+    jly_applyLocks( module=cmds.ls( SplitJnt )[0] )
+    
     return SplitJnt
 
 # ---------------------------------------------------------------------------------------
 # Create Half Muscle Pivots
 
-def jly_makeHalfMusclePivs( side='L_', prefix='', name='Foo', radius=1.0, dpTime=0.01 ):
+def jly_makeHalfMusclePivs( side='L_', prefix='', name='Foo', radius=1.0, symmetric=False, dpTime=0.01 ):
     # Create a pivot group
     MusclePivGrp = denUt.den_makeGrp( nodeName=side+prefix+name+'Piv_Grp', pos=(0,0,0) )
     # Lock all attributes except X scale and visibility
-    denUt.den_Lock(  1,1,1 , 1,1,1 , 0,1,1 , 0 )
+    jly_lock(  1,1,1 , 1,1,1 , 0,1,1 , 0 )
     # Create a pivot for the root of the half muscle
     RootPiv = denUt.den_makeLoc( nodeName=side+prefix+name+'Root_Piv', pos=(2*radius, 0, 2*radius), radius=radius )
     # Color the pivot
@@ -2541,34 +3735,36 @@ def jly_makeHalfMusclePivs( side='L_', prefix='', name='Foo', radius=1.0, dpTime
     cmds.orientConstraint( RootPiv,TipPiv, maintainOffset=False )
     
     # Lock the attributes except translate, to prevent pivots moving
-    cmds.select( RootPiv ); denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
-    cmds.select( RootUpPiv ); denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
-    cmds.select( TipPiv ); denUt.den_Lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 )
+    jly_lock(  0,0,0 , 1,1,1 , 1,1,1 , 1 , nodes=RootPiv+RootUpPiv+TipPiv )
     # Parent the pivots under root MusclePivGrp
     cmds.parent( RootPiv,RootUpPiv,TipPiv,MusclePivGrp )
     # DP refresh
     denUt.den_DiagPause( seconds=dpTime )
     
-    # If doing right side, flip the right side back where it belongs
-    if side == 'R_':
+    # If doing right side, flip the right side back where it belongs (symmetric: keep scale 1)
+    if side == 'R_' and not symmetric:
         cmds.setAttr( MusclePivGrp+'.scaleX', -1 )
     
+    # Lock and hide the channels in the lock table in one pass
+    jly_applyLocks( module=cmds.ls( MusclePivGrp )[0] )
+    
     return MusclePivGrp
 
 
 # ---------------------------------------------------------------------------------------
 # Create Half Muscle Rig
 
-def jly_makeHalfMuscleRig( side='L_', prefix='', name='foo', radius=1.0, dpTime=0.01 ):
+def jly_makeHalfMuscleRig( side='L_', prefix='', name='foo', radius=1.0, symmetric=False, dpTime=0.01 ):
     
     # Set the left side color = 6
-    sideColor = 6
+    sideColor = jlyTables.jlySideColors['L_']
     # If doing the right side
     if side == 'R_':
-        # Set pivot group scaleX to 1, flip the pivot group to the left for good mirroring
-        cmds.setAttr( side+prefix+name+'Piv_Grp.scaleX', 1 )
+        # Set pivot group scaleX to 1, flip the pivot group to the left for good mirroring (symmetric pivots are already mirrored)
+        if not symmetric:
+            cmds.setAttr( side+prefix+name+'Piv_Grp.scaleX', 1 )
         # and change color
-        sideColor = 13
+        sideColor = jlyTables.jlySideColors['R_']
     # DP refresh
     denUt.den_DiagPause( seconds=0.1 )
     
@@ -2592,10 +3788,11 @@ def jly_makeHalfMuscleRig( side='L_', prefix='', name='foo', radius=1.0, dpTime=
     MuscleSpaceINs += [ RootSpaceIN, TipSpaceIN ]
     
     # Get world position and rotation of Root and Tip pivots, capture them in variables    
-    RootPos = cmds.xform( side+prefix+name+'Root_Piv', ws=True, q=True, t=True )
-    RootRot = cmds.xform( side+prefix+name+'Root_Piv', ws=True, q=True, ro=True )
-    TipPos = cmds.xform( side+prefix+name+'Tip_Piv', ws=True, q=True, t=True )
-    TipRot = cmds.xform( side+prefix+name+'Tip_Piv', ws=True, q=True, ro=True )
+    Snap = jly_snapshotPivots( [ side+prefix+name+'Root_Piv', side+prefix+name+'Tip_Piv' ] )
+    RootPos = jly_snapPos( Snap, side+prefix+name+'Root_Piv' )
+    RootRot = jly_snapRot( Snap, side+prefix+name+'Root_Piv' )
+    TipPos = jly_snapPos( Snap, side+prefix+name+'Tip_Piv' )
+    TipRot = jly_snapRot( Snap, side+prefix+name+'Tip_Piv' )
     
     # Create locators for the root and tip
     RootLoc = denUt.den_makeLoc ( nodeName=side+prefix+name+'_RLoc', radius=radius )
@@ -2658,19 +3855,19 @@ def jly_makeHalfMuscleRig( side='L_', prefix='', name='foo', radius=1.0, dpTime=
     Mesh = cmds.ls( side+prefix+name+'_Mesh' )
     # Duplicate the mesh for display
     DispMesh = cmds.duplicate( Mesh, name=side+prefix+name+'_DispMesh' )
-    # If doing right side, flip the display mesh
-    if side == 'R_':
+    # If doing right side, flip the display mesh (symmetric: the rig group is not flipped, so the mesh is not either)
+    if side == 'R_' and not symmetric:
         cmds.xform( DispMesh, s=( -1.0, 1.0, 1.0 ) )
         cmds.makeIdentity( DispMesh, apply=True, preserveNormals=True )
     # Parent the display mesh to the joint
     DispMesh = cmds.parent( DispMesh, Joint )
-    # Connect visibility to a control attribute
-    cmds.connectAttr( 'All_Ctrl.Show_Proxy_Geo', DispMesh[0]+'Shape.visibility' )
+    # Put the display mesh in the proxy geo layer, so Show_Proxy_Geo hides it
+    jly_addToDisplayLayers( allCtrl='All_Ctrl', proxies=DispMesh )
     # Hide the original mesh
     cmds.setAttr( Mesh[0]+'.visibility', 0 )
     
-    # If doing the right side, flip the root group to the other side by giveing scaleX -1
-    if side == 'R_':
+    # If doing the right side, flip the root group to the other side by giveing scaleX -1 (symmetric: built in place)
+    if side == 'R_' and not symmetric:
         cmds.setAttr( MuscleRigGrp+'.scaleX', -1 )
         cmds.setAttr( side+prefix+name+'Piv_Grp.scaleX', -1 )
     
@@ -2681,7 +3878,7 @@ def jly_makeHalfMuscleRig( side='L_', prefix='', name='foo', radius=1.0, dpTime=
 # ---------------------------------------------------------------------------------------
 # Create Eye Pivots
 
-def jly_makeEyePiv( side='L_', prefix='', radius=1.0, dpTime = 0.01 ):
+def jly_makeEyePiv( side='L_', prefix='', radius=1.0, symmetric=False, dpTime = 0.01 ):
     # Create a eye pivot group to hold all the pivots
     EyePivGrp = denUt.den_makeGrp( nodeName=side+prefix+'EyePiv_Grp' )
     # Create locator for eye pivot
@@ -2689,8 +3886,8 @@ def jly_makeEyePiv( side='L_', prefix='', radius=1.0, dpTime = 0.01 ):
     # Parent eye pivots under EyePivGrp
     cmds.parent( EyeCenterPiv, EyePivGrp )
     
-    # If doing the right side, flip the root group to the other side by giveing scaleX -1
-    if side == 'R_':
+    # If doing the right side, flip the root group to the other side by giveing scaleX -1 (symmetric: keep scale 1)
+    if side == 'R_' and not symmetric:
         cmds.setAttr( EyePivGrp+'.scaleX', -1 )
     
     return EyePivGrp
@@ -2699,15 +3896,16 @@ def jly_makeEyePiv( side='L_', prefix='', radius=1.0, dpTime = 0.01 ):
 # ---------------------------------------------------------------------------------------
 # Create Eye Rig
 
-def jly_makeEyeRig( side='L_', prefix='', name='Eye', radius=1.0, ctrlRadius=6.0, displayLocalAxis=False, dpTime = 0.01 ):
+def jly_makeEyeRig( side='L_', prefix='', name='Eye', radius=1.0, ctrlRadius=6.0, displayLocalAxis=False, symmetric=False, dpTime = 0.01 ):
     # Initialize color for the left side
-    sideColor = 6
+    sideColor = jlyTables.jlySideColors['L_']
     # If doing the right side
     if side == 'R_':
-        # Set pivot group scaleX to 1, flip the pivot group to the left for good mirroring
-        cmds.setAttr( side+prefix+name+'Piv_Grp.scaleX', 1 )
+        # Set pivot group scaleX to 1, flip the pivot group to the left for good mirroring (symmetric pivots are already mirrored)
+        if not symmetric:
+            cmds.setAttr( side+prefix+name+'Piv_Grp.scaleX', 1 )
         # and change color
-        sideColor = 13
+        sideColor = jlyTables.jlySideColors['R_']
     
     # DP refresh
     denUt.den_DiagPause( seconds=dpTime )
@@ -2729,8 +3927,9 @@ def jly_makeEyeRig( side='L_', prefix='', name='Eye', radius=1.0, ctrlRadius=6.0
     EyeSpaceINs += EyeSpaceIN
     
     # Query pivots for their worldspace positions
-    EyePos = cmds.xform( side+prefix+name+'_Piv', ws=True, q=True, t=True )
-    EyeRot = cmds.xform( side+prefix+name+'_Piv', ws=True, q=True, ro=True )
+    Snap = jly_snapshotPivots( [ side+prefix+name+'_Piv' ] )
+    EyePos = jly_snapPos( Snap, side+prefix+name+'_Piv' )
+    EyeRot = jly_snapRot( Snap, side+prefix+name+'_Piv' )
     # Make a locator to be eye pivot
     EyeLoc = denUt.den_makeLoc( nodeName=side+prefix+name+'_Loc', pos=EyePos, rot=EyeRot, radius=radius )
     # Parent under EyeSpaceIN
@@ -2746,7 +3945,7 @@ def jly_makeEyeRig( side='L_', prefix='', name='Eye', radius=1.0, ctrlRadius=6.0
     
     # - Create the controls and 0 nulls
     # Create eye FK control (spike)
-    EyeCtrl = denUt.den_MakeSpike( nodeName=side+prefix+name+'_Ctrl', pos=(0,0,ctrlRadius), radius=ctrlRadius*0.3, axis='+Z' )
+    EyeCtrl = jly_makeCachedCtrl( denUt.den_MakeSpike, nodeName=side+prefix+name+'_Ctrl', pos=(0,0,ctrlRadius), radius=ctrlRadius*0.3, axis='+Z' )
     # Parent the control under EyeLoc
     EyeCtrl = cmds.parent( EyeCtrl, EyeLoc, relative=True )
     # Color the control
@@ -2756,8 +3955,8 @@ def jly_makeEyeRig( side='L_', prefix='', name='Eye', radius=1.0, ctrlRadius=6.0
     # Connect control Rotate attribute to the joint
     cmds.connectAttr( EyeCtrl[0]+'.rotate', EyeJnt+'.rotate' )
     
-    # Flip the right side eye back where it belongs
-    if side == 'R_':
+    # Flip the right side eye back where it belongs (symmetric: built in place, nothing to flip)
+    if side == 'R_' and not symmetric:
         cmds.setAttr( EyeRigGrp+'.scaleX', -1 )
         cmds.setAttr( side+prefix+name+'Piv_Grp.scaleX', -1 )
     
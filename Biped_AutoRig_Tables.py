@@ -0,0 +1,220 @@
+# ---------------------------------------------------------------------------------------
+# Biped Auto-Rig Tool – Shared Tables
+# Developed by Arrow Lyu
+#
+# ---------------------------------------------------------------------------------------
+# The data both rig builds read: the default pivot layout of the character, the control attribute schemas,
+# the module list, the module wiring and the metadata keys. Plain Python, no Maya import,
+# so the Maya builders (Biped_AutoRig_Python_Tool.py, Biped_AutoRig_Creation.py) and the offline
+# compiler (Biped_AutoRig_MA_Compiler.py) read the same numbers and names instead of keeping copies.
+#
+# How to Use:
+# 1. Change a pivot number, a schema entry or a module here, both builds pick it up.
+# 2. jly_pivotSpec() gives the default pivots in the batch spec format ( { 'pivots': { name: { 't', 'ro', 's' } } } ),
+#    the creation script puts the pivots in place with it (jlyBR.jly_applyPivotSpec).
+#
+# =======================
+#
+# Happy rigging!
+# ---------------------------------------------------------------------------------------
+# (c) 2025 by Arrow Lyu. All rights reserved. For portfolio and educational use only.
+# ---------------------------------------------------------------------------------------
+
+
+
+# ---------------------------------------------------------------------------------------
+# Default Pivots
+
+# Pivot layout of the character (RigSuitMan), object space values of the center and L_ pivots
+# 'ro' left out is ( 0, 0, 0 ), 's' left out is ( 1, 1, 1 ). The R_ pivots use the L_ numbers:
+# the R_ pivot group mirrors them (scaleX -1), or jly_mirrorPivots computes them in symmetric mode
+jlyDefaultPivots = {
+    # Torso (the spine and neck pivots are spread along jlySpineGuides / jlyNeckGuides)
+    'Cog_Piv': { 't': ( 0.0, 100.0, 0.0 ) },
+    'Pelvis_Piv': { 't': ( 0.0, 103.38795808512201, -1.6771380450789835 ) },
+    'Chest_Piv': { 't': ( 0.0, 138.5741583265994, -0.6758536188602378 ) },
+    'Head_Piv': { 't': ( 0.0, 173.38963432813995, 2.952921757981326 ) },
+    'HeadEnd_Piv': { 't': ( 0.0, 191.7653077198163, 5.306798825299326 ) },
+    'Jaw_Piv': { 't': ( 0.0, 172.27654366577747, 6.184404422294352 ) },
+    'JawEnd_Piv': { 't': ( 0.0, 167.63148872248527, 15.004553695587806 ) },
+    # Arm
+    'L_Clav_Piv': { 't': ( 1.9135768586143171, 153.72120871220972, 8.111426611008746 ) },
+    'L_Shld_Piv': { 't': ( 17.53802266762109, 155.15684653162617, 1.7796898630562212 ), 'ro': ( 86.74712240873176, -0.7694259632853707, -48.345528000997085 ) },
+    'L_Elbow_Piv': { 't': ( 37.9558915859689, 132.20363758393628, 2.19225858830389 ) },
+    'L_Wrist_Piv': { 't': ( 53.38627565861546, 116.50632068585766, 21.774206955784923 ), 'ro': ( 85.64473902980747, -41.6571505323795, -45.491322807411514 ) },
+    'L_Scap01_Piv': { 't': ( -1.5201945535034973, 153.65927057639274, 8.433975250892258 ), 'ro': ( 84.851587064278, 63.52300106372328, 0.6807021253204542 ) },
+    'L_Scap02_Piv': { 't': ( 6.294676078407078, 153.75211946313178, -7.257108077849578 ) },
+    # Leg and foot
+    'L_Hip_Piv': { 't': ( 11.620753002549673, 100.753737395051, 3.9544591343279754 ), 'ro': ( -88.52304623900268, -0.8868921966587131, -84.11921586316016 ) },
+    'L_Knee_Piv': { 't': ( 16.42263871967709, 54.13393918809286, 4.679971642013455 ) },
+    'L_Ankle_Piv': { 't': ( 21.24613479575349, 8.05050525592242, 2.431744496222167 ), 'ro': ( 104.97051935197712, -67.76898056802453, -90.00000000000004 ) },
+    'L_Ball_Piv': { 't': ( 21.24613479575349, 2.464627006420442, 16.098366494160746 ) },
+    'L_Toe_Piv': { 't': ( 20.76061572470766, 1.3057221824458058, 23.73293275485289 ), 'ro': ( 8.614298014201049, -3.6388161010887714, -4.916414241727251e-13 ) },
+    'L_Heel_Piv': { 't': ( 21.769001487649007, 1.3057221824458058, -3.453600374570645 ) },
+    'L_SoleLF_Piv': { 't': ( 27.396744312354766, 1.3057221824458058, 11.921488389961274 ), 'ro': ( 0.0, 9.260658719175954, 0.0 ) },
+    'L_SoleLB_Piv': { 't': ( 25.24613479575349, 1.3057221824458058, -1.268282959177832 ) },
+    'L_SoleRF_Piv': { 't': ( 16.460615724707658, 1.3057221824458058, 17.296835228910673 ), 'ro': ( 0.0, -6.959773856000521, 0.0 ) },
+    'L_SoleRB_Piv': { 't': ( 18.715937506270244, 1.3057221824458058, -1.1785116100387256 ) },
+    # Hand
+    'L_Thumb01_Piv': { 't': ( 51.71137641234973, 116.67312339099023, 25.47348478558281 ), 'ro': ( -39.8947625982986, -56.7071204730737, -139.69666169500059 ) },
+    'L_ThumbUp_Piv': { 't': ( 50.61892662939668, 112.77676853236433, 27.130738845970797 ), 'ro': ( 59.99999999999997, -45.0, -14.99999999999999 ), 's': ( 0.9999999999999999, 0.9999999999999999, 1.0 ) },
+    'L_Thumb02_Piv': { 't': ( 49.84159973362872, 115.08725015066152, 29.206922483763012 ), 'ro': ( -65.16551994656963, -59.7807693076043, -103.81640978662007 ), 's': ( 0.9999999999999999, 0.9999999999999998, 1.0 ) },
+    'L_Thumb03_Piv': { 't': ( 49.46725087378105, 113.56505674194602, 31.898163185147368 ), 'ro': ( -64.69972428037357, -53.13635279232142, -120.07544019579171 ), 's': ( 0.9999999999999999, 1.0, 1.0 ) },
+    'L_ThumbEnd_Piv': { 't': ( 48.38854217529297, 111.70234680175781, 34.768829345703125 ), 'ro': ( -64.69972428037356, -53.13635279232141, -120.07544019579171 ), 's': ( 0.9999999999999999, 1.0, 1.0 ) },
+    'L_Index00_Piv': { 't': ( 53.11217181564158, 116.35131052005582, 25.169589426763334 ), 'ro': ( -163.20764601717653, -53.14415903054522, -58.44823530851284 ) },
+    'L_Index01_Piv': { 't': ( 55.85566049304257, 111.88340965424453, 32.163807306201015 ), 'ro': ( -151.1153688866354, -52.37332637851746, -81.70082426908142 ) },
+    'L_IndexUp_Piv': { 't': ( 50.91209817069331, 112.68522955879091, 25.893032850590785 ) },
+    'L_Index02_Piv': { 't': ( 56.09724894478808, 110.22721421398224, 34.33508900593874 ), 'ro': ( -141.78687737524504, -45.59022253636459, -87.57930149847931 ), 's': ( 0.9999999999999999, 0.9999999999999999, 1.0 ) },
+    'L_Index03_Piv': { 't': ( 56.16706874836903, 108.57562498422541, 36.02256660006212 ), 'ro': ( -146.678766414907, -49.241913059489484, -87.72076112116369 ), 's': ( 0.9999999999999998, 0.9999999999999998, 1.0 ) },
+    'L_IndexEnd_Piv': { 't': ( 56.24721908569336, 106.56185913085938, 38.36083984375 ), 'ro': ( -146.678766414907, -49.241913059489484, -87.72076112116369 ), 's': ( 0.9999999999999998, 0.9999999999999998, 1.0 ) },
+    'L_Middle00_Piv': { 't': ( 53.97385484156486, 115.66627974904733, 24.363047927627623 ), 'ro': ( -169.13414785334268, -43.077182690240036, -53.89993174294101 ) },
+    'L_Middle01_Piv': { 't': ( 57.71381603759647, 110.53752561989282, 30.2982432726056 ), 'ro': ( -153.40929727682982, -35.562552030712396, -73.47222049996613 ) },
+    'L_MiddleUp_Piv': { 't': ( 51.80051335914538, 112.5044113932926, 24.60345724698563 ) },
+    'L_Middle02_Piv': { 't': ( 58.48052025704356, 107.95377637904734, 32.22508643074421 ), 'ro': ( -158.36914463314463, -39.69260778997632, -81.26585805108078 ), 's': ( 0.9999999999999999, 0.9999999999999999, 1.0 ) },
+    'L_Middle03_Piv': { 't': ( 58.834759587662376, 105.64800211748822, 34.16132810373252 ), 'ro': ( -155.0268339033137, -37.91685497559025, -75.99918428740959 ), 's': ( 0.9999999999999998, 0.9999999999999998, 1.0 ) },
+    'L_MiddleEnd_Piv': { 't': ( 59.41785430908203, 103.30947875976562, 36.0386962890625 ), 'ro': ( -155.0268339033137, -37.91685497559025, -75.99918428740959 ), 's': ( 0.9999999999999998, 0.9999999999999998, 1.0 ) },
+    'L_Ring00_Piv': { 't': ( 54.70150197275118, 114.82538416767329, 23.317512681466592 ), 'ro': ( -174.72754819309498, -35.72643492198604, -54.266451383062105 ) },
+    'L_Ring01_Piv': { 't': ( 58.59129438074794, 109.4188483845535, 28.10816684443967 ), 'ro': ( -161.60162176541613, -29.516775317149524, -66.42089073389057 ) },
+    'L_RingUp_Piv': { 't': ( 52.207937704461514, 112.13473502420376, 23.432303443751273 ) },
+    'L_Ring02_Piv': { 't': ( 59.573154690029234, 107.16922347769484, 29.497838595520502 ), 'ro': ( -160.65430757191137, -29.409672477180404, -79.34808539913094 ), 's': ( 0.9999999999999999, 0.9999999999999999, 1.0 ) },
+    'L_Ring03_Piv': { 't': ( 60.0404100890381, 104.68491772180138, 30.922779748730708 ), 'ro': ( -162.10051752624923, -30.390227141532673, -70.92975066317837 ), 's': ( 0.9999999999999998, 0.9999999999999998, 1.0 ) },
+    'L_RingEnd_Piv': { 't': ( 60.90991973876953, 102.1697006225586, 32.48352813720703 ), 'ro': ( -162.10051752624923, -30.390227141532673, -70.92975066317837 ), 's': ( 0.9999999999999998, 0.9999999999999998, 1.0 ) },
+    'L_Pinky00_Piv': { 't': ( 55.29434242769428, 114.07596515951221, 22.03170453360608 ), 'ro': ( 179.8180535342594, -30.231911543857347, -56.19667909736308 ) },
+    'L_Pinky01_Piv': { 't': ( 58.823111322830115, 108.80541397473681, 25.728024356363626 ), 'ro': ( -159.25472453652614, -17.077191250498828, -73.3804017704521 ) },
+    'L_PinkyUp_Piv': { 't': ( 52.91119101537268, 111.6406823718575, 22.45058460054719 ) },
+    'L_Pinky02_Piv': { 't': ( 59.38698173624223, 106.91630870633279, 26.333666752369446 ), 'ro': ( -166.12065070456956, -22.241230425556083, -76.52805035424907 ), 's': ( 0.9999999999999999, 0.9999999999999999, 1.0 ) },
+    'L_Pinky03_Piv': { 't': ( 59.831176896900054, 105.06210412760035, 27.1133646901398 ), 'ro': ( -171.4316384297003, -25.845440927685893, -80.28008960246207 ), 's': ( 0.9999999999999998, 0.9999999999999998, 1.0 ) },
+    'L_PinkyEnd_Piv': { 't': ( 60.16964340209961, 103.08612823486328, 28.084463119506836 ), 'ro': ( -171.4316384297003, -25.845440927685893, -80.28008960246206 ), 's': ( 0.9999999999999998, 0.9999999999999998, 1.0 ) },
+    # Half muscles
+    'L_Thigh01Root_Piv': { 't': ( 8.18672105889799, 110.15641829480403, 13.103315251041547 ), 'ro': ( 80.22597469797739, -0.751229063837106, -85.93709126984183 ) },
+    'L_Thigh01RootUp_Piv': { 't': ( 9.189463122997797, 109.87594373477955, 18.799406069430134 ) },
+    'L_Thigh01Tip_Piv': { 't': ( 10.977568868750481, 70.8654319656375, 13.619803428649902 ), 'ro': ( 80.23664311099986, -0.7855102308340269, -85.75133089662721 ) },
+    'L_Thigh02Root_Piv': { 't': ( 16.749150510793726, 110.83746545085914, 4.540830423921371 ), 'ro': ( -0.004690867708520119, -0.24460102484470458, -83.25934289867274 ) },
+    'L_Thigh02RootUp_Piv': { 't': ( 23.16639078928144, 111.4714300203224, 4.540830423921371 ) },
+    'L_Thigh02Tip_Piv': { 't': ( 21.261876064455148, 72.65630080180334, 4.704964927668026 ), 'ro': ( -0.006320025973459553, -0.2559955114369971, -82.94377116162292 ) },
+    # Eye, at the center of the eyeball geometry and lined up with the iris
+    'L_Eye_Piv': { 't': ( 3.32915752436325, 178.8296774824052, 13.760299417461985 ), 'ro': ( 2.0, 3.0, -1.244 ) },
+}
+
+# Spine and neck guide points, pelvis to chest and neck to head
+# The SpineCount/NeckCount pivots are spread along a curve through them (jlyBR.jly_fitChainPositions)
+jlySpineGuides = [ ( 0.0, 103.38795808512201, -1.6771380450789835 ), ( 0.0, 108.80793579101143, -0.2610264357851122 ), ( 0.0, 122.45119722615232, 1.1869691761274055 ), ( 0.0, 138.5741583265994, -0.6758536188602378 ) ]
+jlyNeckGuides = [ ( 0.0, 160.9683284221534, -0.4008357973861294 ), ( 0.0, 173.38963432813995, 2.952921757981326 ) ]
+
+
+# Default pivots in the batch spec format, every channel filled in, the R_ pivots get the L_ numbers
+def jly_pivotSpec():
+
+    Pivots = {}
+    for name,values in jlyDefaultPivots.items():
+        Values = { 't': values['t'], 'ro': values.get( 'ro', ( 0.0, 0.0, 0.0 ) ), 's': values.get( 's', ( 1.0, 1.0, 1.0 ) ) }
+        Pivots[ name ] = Values
+        if name.startswith( 'L_' ):
+            Pivots[ 'R_'+name[2:] ] = dict( Values )
+
+    return { 'pivots': Pivots }
+
+
+# ---------------------------------------------------------------------------------------
+# Attribute Schemas
+
+# An attribute schema is a list of attribute entries for one control, all of them are added in one go
+# Entry keys: name, type ('double', 'float', 'enum', 'float3'), default, min, max, enum ('a:b:c'), keyable, channelBox,
+# children (float3 only, list of child entries), usedAsColor (float3 only)
+# Names can use {side}, {prefix} and {name}, they are filled in when the schema is added
+
+# All_Ctrl: global scale, display switches and the side colors
+jlyAllCtrlSchema = [
+    { 'name': 'Global_Scale', 'type': 'float', 'default': 1.0, 'channelBox': True },
+    { 'name': 'Show_Render_Geo', 'type': 'enum', 'enum': ' off ---: --- on', 'default': 0, 'channelBox': True },
+    { 'name': 'Show_Proxy_Geo', 'type': 'enum', 'enum': ' off ---: --- on', 'default': 1, 'channelBox': True },
+    { 'name': 'Show_Box_Geo', 'type': 'enum', 'enum': ' off ---: --- on', 'default': 1, 'channelBox': True },
+    { 'name': 'Show_Controls', 'type': 'enum', 'enum': ' off ---: --- on', 'default': 1, 'channelBox': True },
+    { 'name': 'Show_Guts', 'type': 'enum', 'enum': ' off ---: --- on', 'default': 0, 'channelBox': True },
+    { 'name': 'Bone_Draw_Style', 'type': 'enum', 'enum': 'Bone:Multi-child as Box:None', 'default': 0, 'channelBox': True },
+    # Center:yellow, Left:blue, Right:red
+    { 'name': 'Center_Color', 'type': 'float3', 'usedAsColor': True, 'default': (0.8, 0.8, 0.05) },
+    { 'name': 'Left_Color', 'type': 'float3', 'usedAsColor': True, 'default': (0.0, 0.3, 0.95) },
+    { 'name': 'Right_Color', 'type': 'float3', 'usedAsColor': True, 'default': (1.0, 0.03, 0.05) },
+]
+
+# Arm utility control: FK/IK blends and the IK wrist control spaces
+jlyArmUtilSchema = [
+    { 'name': '{side}{prefix}{name}_FK_IK', 'type': 'double', 'default': 1.0, 'min': 0.0, 'max': 1.0, 'keyable': True },
+    { 'name': '{side}{prefix}Wrist_FK_IK', 'type': 'double', 'default': 0.0, 'min': 0.0, 'max': 1.0, 'keyable': True },
+    { 'name': '{side}{prefix}HeadSpace', 'type': 'double', 'default': 0.0, 'min': 0.0, 'max': 1.0, 'keyable': True },
+    { 'name': '{side}{prefix}ChestSpace', 'type': 'double', 'default': 1.0, 'min': 0.0, 'max': 1.0, 'keyable': True },
+    { 'name': '{side}{prefix}PelvisSpace', 'type': 'double', 'default': 0.0, 'min': 0.0, 'max': 1.0, 'keyable': True },
+    { 'name': '{side}{prefix}CogSpace', 'type': 'double', 'default': 0.0, 'min': 0.0, 'max': 1.0, 'keyable': True },
+    { 'name': '{side}{prefix}AllSpace', 'type': 'double', 'default': 0.0, 'min': 0.0, 'max': 1.0, 'keyable': True },
+]
+
+# Leg utility control: FK/IK blends and the IK ankle control spaces
+jlyLegUtilSchema = [
+    { 'name': '{side}{prefix}{name}_FK_IK', 'type': 'double', 'default': 1.0, 'min': 0.0, 'max': 1.0, 'keyable': True },
+    { 'name': '{side}{prefix}Ankle_FK_IK', 'type': 'double', 'default': 0.0, 'min': 0.0, 'max': 1.0, 'keyable': True },
+    { 'name': '{side}{prefix}PelvisSpace', 'type': 'double', 'default': 0.0, 'min': 0.0, 'max': 1.0, 'keyable': True },
+    { 'name': '{side}{prefix}CogSpace', 'type': 'double', 'default': 0.0, 'min': 0.0, 'max': 1.0, 'keyable': True },
+    { 'name': '{side}{prefix}AllSpace', 'type': 'double', 'default': 1.0, 'min': 0.0, 'max': 1.0, 'keyable': True },
+]
+
+# Foot utility control: foot roll attributes, all -90 to 90 degrees
+jlyFootUtilSchema = [
+    { 'name': '{side}{prefix}'+attr, 'type': 'double', 'default': 0.0, 'min': -90.0, 'max': 90.0, 'keyable': True }
+    for attr in [ 'FootRock', 'FootRoll', 'FootPivot', 'FootTwist', 'HeelPivot', 'ToeRoll', 'ToePivot', 'ToeBend' ] ]
+
+# Control colors (Maya index colors) by side: center yellow, left blue, right red
+jlySideColors = { '': 17, 'L_': 6, 'R_': 13 }
+
+
+# ---------------------------------------------------------------------------------------
+# Modules
+
+# Every module of the biped, in build and registration order: ( module name, kind, builder )
+# The kind is the row of jlyWiringTable (Twist and Seat modules are not wired, Base has no SpaceINs)
+jlyBipedModules = [
+    ( 'Base', 'Base', 'jly_makeBaseRig' ),
+    ( 'Torso', 'Torso', 'jly_makeBipedTorsoRig' ),
+    ( 'L_Arm', 'Arm', 'jly_makeBipedArmRig' ),
+    ( 'L_ArmTwist', 'Twist', 'jly_makeTwists' ),
+    ( 'R_Arm', 'Arm', 'jly_makeBipedArmRig' ),
+    ( 'R_ArmTwist', 'Twist', 'jly_makeTwists' ),
+    ( 'L_Leg', 'Leg', 'jly_makeBipedLegRig' ),
+    ( 'L_LegTwist', 'Twist', 'jly_makeTwists' ),
+    ( 'R_Leg', 'Leg', 'jly_makeBipedLegRig' ),
+    ( 'R_LegTwist', 'Twist', 'jly_makeTwists' ),
+    ( 'L_Hand', 'Hand', 'jly_makeBipedHandRig2' ),
+    ( 'R_Hand', 'Hand', 'jly_makeBipedHandRig2' ),
+    ( 'L_Seat02', 'Seat', 'jly_makeAngleSplitter' ),
+    ( 'R_Seat02', 'Seat', 'jly_makeAngleSplitter' ),
+    ( 'L_Thigh01', 'HalfMuscle', 'jly_makeHalfMuscleRig' ),
+    ( 'L_Thigh02', 'HalfMuscle', 'jly_makeHalfMuscleRig' ),
+    ( 'R_Thigh01', 'HalfMuscle', 'jly_makeHalfMuscleRig' ),
+    ( 'R_Thigh02', 'HalfMuscle', 'jly_makeHalfMuscleRig' ),
+    ( 'L_Eye', 'Eye', 'jly_makeEyeRig' ),
+    ( 'R_Eye', 'Eye', 'jly_makeEyeRig' ),
+]
+
+# Wiring table: module kind -> the SpaceOUT each SpaceIN follows (in the builder's SpaceIN order), and the rig group
+# attributes driven by the AllCtrl. SpaceOUTs are the creation script's variable names, {side} is the module side
+# Ctrl_Color is driven by the AllCtrl color of the module side, see jlyWiringColors
+jlyWiringTable = {
+    'Torso':      { 'spaces': [ 'CogSpaceOUT' ],
+                    'display': [ 'Show_Controls', 'Show_Guts', 'Bone_Draw_Style', 'Ctrl_Color' ] },
+    'Arm':        { 'spaces': [ 'HeadSpaceOUT', 'ChestSpaceOUT', 'PelvisSpaceOUT', 'CogSpaceOUT', 'AllSpaceOUT' ],
+                    'display': [ 'Show_Controls', 'Show_Guts', 'Bone_Draw_Style', 'Ctrl_Color' ] },
+    'Leg':        { 'spaces': [ 'PelvisSpaceOUT', 'CogSpaceOUT', 'AllSpaceOUT' ],
+                    'display': [ 'Show_Controls', 'Show_Guts', 'Bone_Draw_Style', 'Ctrl_Color' ] },
+    'Hand':       { 'spaces': [ '{side}WristSpaceOUT' ],
+                    'display': [ 'Show_Controls', 'Show_Guts', 'Bone_Draw_Style', 'Ctrl_Color' ] },
+    'HalfMuscle': { 'spaces': [ '{side}HipRest_Jx_SpaceOUT', '{side}HipTwist03_Jnt_SpaceOUT' ],
+                    'display': [ 'Show_Controls', 'Show_Guts', 'Bone_Draw_Style' ] },
+    'Eye':        { 'spaces': [ 'HeadSpaceOUT' ],
+                    'display': [ 'Show_Controls', 'Show_Guts', 'Bone_Draw_Style', 'Ctrl_Color' ] },
+}
+
+# Module side -> AllCtrl color attribute for Ctrl_Color
+jlyWiringColors = { '':'Center_Color', 'L_':'Left_Color', 'R_':'Right_Color' }
+
+# Module metadata keys: Rig_Meta -> Modules[i] -> <Module>_Meta -> one multi message per key, in the builders' return order
+jlyModuleMetaKeys = [ 'RigGrp', 'SpaceINs', 'SpaceOUTs', 'BindJoints', 'CtrlsALL', 'GutsALL' ]